@@ -0,0 +1,111 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# Benchmark for the per-call overhead of in-process backends. Small circuits are
+# dispatched to VirtualBackends, which do not simulate them. The QASM route serializes
+# the circuit and parses it again, while the object route receives the QuantumCircuit
+# directly. The Qrisp backends work on the Qrisp circuit, the Qiskit backends convert
+# it to a Qiskit circuit (like the QiskitBackend).
+#
+# Usage: python benchmarks/backend_call_overhead.py [qubit_amounts...]
+
+import sys
+import time
+
+from qrisp import QuantumCircuit
+from qrisp.interface import VirtualBackend, convert_to_qiskit
+
+
+def build_circuit(qubit_amount, layers=5):
+    qc = QuantumCircuit(qubit_amount, qubit_amount)
+    for j in range(layers):
+        for i in range(qubit_amount):
+            qc.h(i)
+            qc.rz(0.1 * (i + j), i)
+        for i in range(qubit_amount - 1):
+            qc.cx(i, i + 1)
+    qc.measure(qc.qubits, qc.clbits)
+    return qc
+
+
+def qrisp_qasm_run_func(qasm_str, shots=None, token=""):
+    qc = QuantumCircuit.from_qasm_str(qasm_str)
+    return {"0" * len(qc.clbits): shots}
+
+
+def qrisp_circuit_run_func(qc, shots=None, token=""):
+    return {"0" * len(qc.clbits): shots}
+
+
+def qiskit_qasm_run_func(qasm_str, shots=None, token=""):
+    from qiskit import QuantumCircuit as QiskitQuantumCircuit
+
+    qiskit_qc = QiskitQuantumCircuit.from_qasm_str(qasm_str)
+
+    new_qiskit_qc = QiskitQuantumCircuit(len(qiskit_qc.qubits), len(qiskit_qc.clbits))
+    for instr in qiskit_qc:
+        new_qiskit_qc.append(
+            instr.operation,
+            [qiskit_qc.qubits.index(qb) for qb in instr.qubits],
+            [qiskit_qc.clbits.index(cb) for cb in instr.clbits],
+        )
+
+    return {"0" * new_qiskit_qc.num_clbits: shots}
+
+
+def qiskit_circuit_run_func(qc, shots=None, token=""):
+    qiskit_qc = convert_to_qiskit(qc)
+    return {"0" * qiskit_qc.num_clbits: shots}
+
+
+def time_calls(backend, qc, repetitions):
+    backend.run(qc, 1000)
+    t0 = time.time()
+    for i in range(repetitions):
+        backend.run(qc, 1000)
+    return (time.time() - t0) / repetitions
+
+
+if __name__ == "__main__":
+    qubit_amounts = [int(x) for x in sys.argv[1:]] or [2, 5, 10, 20]
+
+    backend_pairs = {
+        "Qrisp": (
+            VirtualBackend(qrisp_qasm_run_func),
+            VirtualBackend(circuit_run_func=qrisp_circuit_run_func),
+        ),
+        "Qiskit": (
+            VirtualBackend(qiskit_qasm_run_func),
+            VirtualBackend(circuit_run_func=qiskit_circuit_run_func),
+        ),
+    }
+
+    for qubit_amount in qubit_amounts:
+        qc = build_circuit(qubit_amount)
+        repetitions = max(10, 2000 // len(qc.data))
+
+        for name, (qasm_backend, circuit_backend) in backend_pairs.items():
+            qasm_time = time_calls(qasm_backend, qc, repetitions)
+            circuit_time = time_calls(circuit_backend, qc, repetitions)
+
+            print(
+                f"{name:>6}, {qubit_amount:>3} qubits, {len(qc.data):>4} gates: "
+                f"QASM {1000 * qasm_time:7.3f} ms/call, "
+                f"object {1000 * circuit_time:7.3f} ms/call "
+                f"(speed-up {qasm_time / circuit_time:7.2f}x)"
+            )
@@ -0,0 +1,100 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# Benchmark for the batched execution of circuits. A Hamiltonian with several
+# measurement groups is evaluated on a backend server, which answers every job with
+# a fixed latency (emulating a remote hardware queue). Submitting the circuits one
+# at a time costs one round-trip per circuit, while the batch is posted completely
+# before the results are polled. Additionally, the default simulator is timed for
+# sequential and batched execution of the same circuits.
+#
+# Usage: python benchmarks/batch_execution.py [latency_in_seconds] [port]
+
+import sys
+import time
+
+from qrisp import QuantumVariable, h, ry, cx
+from qrisp.default_backend import def_backend
+from qrisp.interface import VirtualBackend
+from qrisp.operators import X, Y, Z
+
+
+if __name__ == "__main__":
+    latency = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+
+    def circuit_run_func(qc, shots=None, token=""):
+        time.sleep(latency)
+        return def_backend.run(qc, shots)
+
+    remote_backend = VirtualBackend(circuit_run_func=circuit_run_func, port=port)
+
+    qv = QuantumVariable(4)
+    h(qv)
+    for i in range(4):
+        ry(0.2 * i, qv[i])
+    for i in range(3):
+        cx(qv[i], qv[i + 1])
+
+    H = sum(
+        Z(i) * Z(i + 1) + X(i) * Z(i + 1) + Y(i) * X(i + 1) + X(i) + 0.5 * Y(i)
+        for i in range(3)
+    )
+
+    compiled_qc = qv.qs.compile()
+    from qrisp.operators.qubit.measurement import QubitOperatorMeasurement
+
+    measurement_data = QubitOperatorMeasurement(H)
+    qc_list, shots_list = measurement_data.get_measurement_circuits(
+        compiled_qc, compiled_qc.qubits[: qv.size], 0.01
+    )
+    batch = []
+    for qc, shots in zip(qc_list, shots_list):
+        qc = qc.copy()
+        qc.measure(qc.qubits[: qv.size], [qc.add_clbit() for i in range(qv.size)])
+        batch.append((qc, shots))
+
+    print(f"{len(batch)} measurement circuits, latency {latency} s per job")
+
+    t0 = time.time()
+    for qc, shots in batch:
+        remote_backend.run(qc, shots)
+    sequential_time = time.time() - t0
+
+    t0 = time.time()
+    remote_backend.run_batch(batch)
+    batch_time = time.time() - t0
+
+    print(
+        f"Backend server: sequential {sequential_time:6.3f} s, "
+        f"batch {batch_time:6.3f} s (speed-up {sequential_time / batch_time:5.2f}x)"
+    )
+
+    t0 = time.time()
+    for qc, shots in batch:
+        def_backend.run(qc, shots)
+    sequential_time = time.time() - t0
+
+    t0 = time.time()
+    def_backend.run_batch(batch)
+    batch_time = time.time() - t0
+
+    print(
+        f"Default simulator: sequential {sequential_time:6.3f} s, "
+        f"batch {batch_time:6.3f} s (speed-up {sequential_time / batch_time:5.2f}x)"
+    )
@@ -0,0 +1,84 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the batched evaluation of a parametrized QAOA circuit.
+# Compares evaluating a list of parameter vectors one at a time with
+# ParametricSimulation.run against the stacked statevector evolution of
+# ParametricSimulation.run_batch.
+#
+# Usage:
+#     python benchmarks/batched_parametric_simulation.py \
+#         [node_amount] [depth] [batch_size]
+
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+from qrisp import QuantumVariable
+from qrisp.qaoa import maxcut_problem
+from qrisp.simulator import ParametricSimulation
+
+
+if __name__ == "__main__":
+    node_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    batch_size = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+
+    G = nx.erdos_renyi_graph(node_amount, 0.5, seed=1)
+    qarg = QuantumVariable(node_amount)
+    qc, symbols = maxcut_problem(G).compile_circuit(qarg, depth)
+
+    for i in range(node_amount):
+        qc.measure(qarg.reg[i], qc.add_clbit())
+
+    sim = ParametricSimulation(qc)
+
+    rng = np.random.default_rng(0)
+    subs_dic_list = [
+        {symbols[i]: x for i, x in enumerate(rng.random(len(symbols)))}
+        for _ in range(batch_size)
+    ]
+
+    # Warm-up (computes the unitaries of the parameter free groups)
+    sim.run(subs_dic_list[0])
+
+    t0 = time.perf_counter()
+    sequential_res = [sim.run(subs_dic) for subs_dic in subs_dic_list]
+    t_sequential = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batched_res = sim.run_batch(subs_dic_list)
+    t_batched = time.perf_counter() - t0
+
+    max_deviation = max(
+        abs(res_0[k] - res_1.get(k, 0))
+        for res_0, res_1 in zip(batched_res, sequential_res)
+        for k in res_0
+    )
+
+    print(f"QAOA MaxCut: {node_amount} nodes, depth {depth}, batch size {batch_size}")
+    for label, duration in [("Sequential", t_sequential), ("Batched", t_batched)]:
+        print(
+            f"{label + ' evaluation:':22s} "
+            f"{1000*duration/batch_size:.1f} ms/parameter vector"
+        )
+    print(f"Speed-up:              {t_sequential/t_batched:.1f}x")
+    print(f"Max. probability deviation: {max_deviation:.2e}")
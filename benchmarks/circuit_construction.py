@@ -0,0 +1,63 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the construction of large circuits. Gates are appended to a
+# QuantumCircuit with many qubits and to a QuantumSession (through a
+# QuantumVariable). Since the operands of each appended gate are validated
+# against the qubits of the circuit, the construction time should only depend
+# on the amount of gates but not on the amount of qubits.
+#
+# Usage: python benchmarks/circuit_construction.py [qubit_amount] [gate_amount]
+
+import sys
+import time
+
+from qrisp import QuantumCircuit, QuantumVariable, cx, h
+
+
+def build_circuit(qubit_amount, gate_amount):
+    qc = QuantumCircuit(qubit_amount)
+    qubits = qc.qubits
+    for i in range(gate_amount // 2):
+        qc.h(qubits[i % qubit_amount])
+        qc.cx(qubits[i % qubit_amount], qubits[(i + 1) % qubit_amount])
+    return qc
+
+
+def build_session(qubit_amount, gate_amount):
+    qv = QuantumVariable(qubit_amount)
+    for i in range(gate_amount // 2):
+        h(qv[i % qubit_amount])
+        cx(qv[i % qubit_amount], qv[(i + 1) % qubit_amount])
+    return qv.qs
+
+
+if __name__ == "__main__":
+    qubit_amount = int(float(sys.argv[1])) if len(sys.argv) > 1 else 500
+    gate_amount = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**5
+
+    builders = [("QuantumCircuit", build_circuit), ("QuantumSession", build_session)]
+    for name, build in builders:
+        t0 = time.time()
+        build(qubit_amount, gate_amount)
+        duration = time.time() - t0
+        print(
+            f"{name:>14}: {qubit_amount} qubits, {gate_amount} gates "
+            f"in {duration:.3f} s ({gate_amount / duration:.0f} gates/s)"
+        )
@@ -0,0 +1,97 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the Clifford simulator. The first part samples a repetition code
+# memory experiment, i.e. a GHZ state encoded on the data qubits followed by 
+# several rounds of parity measurements (with resets of the ancillas), using 
+# the CliffordBackend. The second part simulates the same experiment as a Jasp 
+# program using stimulate, where the ancillas are allocated and deallocated in 
+# every round.
+#
+# Usage: python benchmarks/clifford_simulation.py [distance] [rounds] [shots]
+
+import sys
+import time
+
+from qrisp import QuantumCircuit, QuantumFloat, QuantumBool, h, cx, measure, reset
+from qrisp.interface import CliffordBackend
+from qrisp.jasp import jrange, stimulate
+
+
+def repetition_code_circuit(distance, rounds):
+    qc = QuantumCircuit(2*distance - 1, (distance - 1)*rounds + distance)
+    data, ancillas = qc.qubits[:distance], qc.qubits[distance:]
+    
+    qc.h(data[0])
+    for i in range(distance - 1):
+        qc.cx(data[i], data[i + 1])
+    
+    clbits = iter(qc.clbits)
+    for r in range(rounds):
+        for i in range(distance - 1):
+            qc.cx(data[i], ancillas[i])
+            qc.cx(data[i + 1], ancillas[i])
+        for i in range(distance - 1):
+            qc.measure(ancillas[i], next(clbits))
+            qc.reset(ancillas[i])
+    
+    for i in range(distance):
+        qc.measure(data[i], next(clbits))
+    
+    return qc
+
+
+@stimulate
+def repetition_code_main(distance, rounds):
+    data = QuantumFloat(distance)
+    h(data[0])
+    for i in jrange(distance - 1):
+        cx(data[i], data[i + 1])
+    
+    for r in jrange(rounds):
+        for i in jrange(distance - 1):
+            anc = QuantumBool()
+            cx(data[i], anc[0])
+            cx(data[i + 1], anc[0])
+            measure(anc)
+            reset(anc)
+            anc.delete()
+    
+    return measure(data[0])
+
+
+if __name__ == "__main__":
+    distance = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    shots = int(sys.argv[3]) if len(sys.argv) > 3 else 10000
+    
+    qc = repetition_code_circuit(distance, rounds)
+    backend = CliffordBackend(rng = 0)
+    
+    start = time.perf_counter()
+    counts = backend.run(qc, shots)
+    print(
+        f"circuit sampling ({len(qc.qubits)} qubits, {len(qc.data)} operations, "
+        f"{shots} shots): {time.perf_counter() - start:.2f} s"
+    )
+    
+    start = time.perf_counter()
+    repetition_code_main(distance, rounds)
+    duration = time.perf_counter() - start
+    print(f"stimulate ({distance} data qubits, {rounds} rounds): {duration:.2f} s")
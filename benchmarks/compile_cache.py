@@ -0,0 +1,83 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+
+# Benchmark for the compile cache. A QuantumSession is compiled repeatedly (as
+# happens for instance when several QuantumVariables of the same session are
+# measured) with and without the compile cache. Furthermore, the cost of
+# determining the key after appending a gate is measured.
+#
+# Usage: python benchmarks/compile_cache.py [gate_amounts...]
+
+import sys
+import time
+
+from qrisp import QuantumVariable, cx, h, t
+from qrisp import enable_compile_cache, disable_compile_cache, get_compile_cache_info
+from qrisp.core.compile_cache import compilation_key
+
+
+def session(gate_amount, qubit_amount=20):
+    qv = QuantumVariable(qubit_amount)
+    h(qv)
+    for i in range(gate_amount // 2):
+        cx(qv[i % qubit_amount], qv[(i + 1) % qubit_amount])
+        t(qv[(i + 1) % qubit_amount])
+    return qv.qs
+
+
+def time_compilations(qs, repetitions):
+    t0 = time.time()
+    for i in range(repetitions):
+        qs.compile()
+    return (time.time() - t0) / repetitions
+
+
+if __name__ == "__main__":
+    gate_amounts = [int(float(x)) for x in sys.argv[1:]] or [10**3, 10**4, 10**5]
+    repetitions = 5
+
+    # Warm up the numba functions
+    session(10**3).compile()
+
+    for gate_amount in gate_amounts:
+        qs = session(gate_amount)
+
+        disable_compile_cache()
+        uncached_time = time_compilations(qs, repetitions)
+
+        enable_compile_cache()
+        t0 = time.time()
+        qs.compile()
+        miss_time = time.time() - t0
+        cached_time = time_compilations(qs, repetitions)
+
+        # Key computation after appending a single gate
+        t(qs.qubits[0])
+        t0 = time.time()
+        compilation_key(qs)
+        update_time = time.time() - t0
+
+        print(
+            f"{len(qs.data):>8} gates: uncached {uncached_time:8.3f} s, "
+            f"first (miss) {miss_time:8.3f} s, cached {cached_time:8.4f} s, "
+            f"key update {1e3 * update_time:.2f} ms, "
+            f"{get_compile_cache_info()}"
+        )
+        disable_compile_cache()
@@ -0,0 +1,73 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the exact expectation value evaluation of QubitOperators on the
+# default simulator (precision = 0). The exact mode simulates the state once and
+# evaluates every group of commuting terms on a copy of the final QuantumState. The
+# sampling mode performs a full simulation per group.
+#
+# Usage: python benchmarks/exact_expectation_value.py [qubit_amount] [term_amount]
+
+import random
+import sys
+import time
+
+from qrisp import QuantumVariable, ry, cx
+from qrisp.operators import X, Y, Z
+from qrisp.operators.qubit.measurement import QubitOperatorMeasurement
+from qrisp.simulator import set_quiet_mode
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    term_amount = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    set_quiet_mode(True)
+    random.seed(0)
+
+    # Random Hamiltonian consisting of Pauli strings
+    H = 0
+    for _ in range(term_amount):
+        term = 1
+        for i in range(n):
+            term = term * random.choice([lambda i: 1, X, Y, Z])(i)
+        H += random.random() * term
+
+    measurement_data = QubitOperatorMeasurement(H)
+
+    qv = QuantumVariable(n)
+    for layer in range(3):
+        for i in range(n):
+            ry(random.random(), qv[i])
+        for i in range(n - 1):
+            cx(qv[i], qv[i + 1])
+
+    print(
+        f"{n} qubits, {len(H.terms_dict)} terms, "
+        f"{len(measurement_data.groups)} groups"
+    )
+
+    results = {}
+    for label, precision in [("exact", 0), ("sampling", 0.01)]:
+        t0 = time.perf_counter()
+        results[label] = H.get_measurement(
+            qv, precision=precision, measurement_data=measurement_data
+        )
+        duration = time.perf_counter() - t0
+        print(f"{label:10s} {duration:8.3f} s   expectation value {results[label]:.6f}")
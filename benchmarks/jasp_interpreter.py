@@ -0,0 +1,87 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the evaluation of loop-heavy hybrid programs by the Jasp
+# simulator. The first program performs a loop, which in every iteration 
+# allocates an ancilla, measures it and applies a classically controlled
+# operation. The second program is a repeat-until-success routine with a low
+# success probability, i.e. many iterations. The Jaspr is traced once and 
+# simulated several times, such that the timings show the cost of the
+# interpretation and simulation (the first simulation includes the compilation
+# of the Jaspr).
+#
+# Usage: python benchmarks/jasp_interpreter.py [iterations] [rus_qubits]
+
+import sys
+import time
+
+from qrisp import QuantumFloat, QuantumBool, h, rz, x, measure, reset, control
+from qrisp.jasp import make_jaspr, jrange, RUS, simulate_jaspr
+
+
+def loop_main(n):
+    qf = QuantumFloat(4)
+    for i in jrange(n):
+        anc = QuantumBool()
+        h(anc)
+        rz(0.1*i, anc)
+        b = measure(anc)
+        with control(b):
+            x(qf[i % 4])
+        reset(anc)
+        anc.delete()
+    return measure(qf)
+
+
+def create_rus_main(rus_qubits):
+    
+    @RUS
+    def trial():
+        qf = QuantumFloat(rus_qubits)
+        h(qf)
+        return measure(qf) == 0, qf
+    
+    def rus_main():
+        qf = trial()
+        return measure(qf)
+    
+    return rus_main
+
+
+def time_simulation(jaspr, *args, repetitions = 3):
+    timings = []
+    for i in range(repetitions):
+        start = time.perf_counter()
+        simulate_jaspr(jaspr, *args, rng = i)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rus_qubits = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    
+    jaspr = make_jaspr(loop_main)(1)
+    timings = time_simulation(jaspr, iterations)
+    timings = ", ".join(f"{t:.2f} s" for t in timings)
+    print(f"loop ({iterations} iterations): {timings}")
+    
+    jaspr = make_jaspr(create_rus_main(rus_qubits))()
+    timings = time_simulation(jaspr)
+    print(f"RUS ({rus_qubits} qubits): " + ", ".join(f"{t:.2f} s" for t in timings))
@@ -0,0 +1,91 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the trace cache of the Jasp evaluation tools. A classical
+# parameter scan evaluates a jaspified and a terminal sampling function for
+# several parameter values. Without the cache, every call traces the function
+# into a new Jaspr. With the cache, only the first call is traced and the
+# remaining calls only perform the simulation.
+#
+# Usage: python benchmarks/jaspr_cache.py [scan_size] [qubits]
+
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumFloat, h, ry, cx, measure
+from qrisp.jasp import (
+    jaspify,
+    terminal_sampling,
+    set_jaspr_cache_size,
+    clear_jaspr_cache,
+    get_jaspr_cache_info,
+)
+
+
+def state_prep(theta, n):
+    qf = QuantumFloat(n)
+    h(qf[0])
+    for i in range(1, n):
+        cx(qf[i-1], qf[i])
+        ry(theta*i, qf[i])
+    return qf
+
+
+def scan(scan_size, n):
+    
+    @jaspify
+    def main(theta):
+        return measure(state_prep(theta, n))
+    
+    @terminal_sampling
+    def sampling_main(theta):
+        return state_prep(theta, n)
+    
+    thetas = np.linspace(0, np.pi, scan_size)
+    
+    start = time.perf_counter()
+    for theta in thetas:
+        main(theta)
+    jaspify_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for theta in thetas:
+        sampling_main(theta)
+    sampling_time = time.perf_counter() - start
+    
+    return jaspify_time, sampling_time
+
+
+if __name__ == "__main__":
+    scan_size = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    
+    print(f"{'cache':>10}{'jaspify (s)':>16}{'terminal_sampling (s)':>24}")
+    
+    set_jaspr_cache_size(0)
+    jaspify_time, sampling_time = scan(scan_size, n)
+    print(f"{'disabled':>10}{jaspify_time:>16.2f}{sampling_time:>24.2f}")
+    
+    set_jaspr_cache_size(128)
+    clear_jaspr_cache()
+    jaspify_time, sampling_time = scan(scan_size, n)
+    print(f"{'enabled':>10}{jaspify_time:>16.2f}{sampling_time:>24.2f}")
+    print(get_jaspr_cache_info())
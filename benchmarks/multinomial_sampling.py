@@ -0,0 +1,78 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the sampling stage of the simulator. The previous implementation
+# drew every shot individually and built a histogram over the outcome indices. The
+# counts are now drawn from a single multinomial distribution.
+#
+# Usage: python benchmarks/multinomial_sampling.py [qubit_amount]
+
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumCircuit
+from qrisp.simulator import run, sample_counts, set_quiet_mode
+
+
+# The previous sampling stage
+def histogram_sampling(probs, shots, rng):
+    samples = rng.choice(len(probs), shots, p=probs)
+    hist = np.histogram(samples, np.arange(np.max(samples) + 2))[0]
+    indices = np.nonzero(hist)[0]
+    return indices, hist[indices]
+
+
+def measure_time(function, repetitions=3):
+    t0 = time.time()
+    for _ in range(repetitions):
+        function()
+    return (time.time() - t0) / repetitions
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    set_quiet_mode(True)
+    rng = np.random.default_rng(0)
+
+    # Random distribution over 2**n outcomes
+    probs = rng.random(2**n)
+    probs = probs / np.sum(probs)
+
+    print(f"Sampling from {2**n} outcomes")
+    print(f"{'shots':>10} {'histogram':>12} {'multinomial':>12} {'speedup':>8}")
+    for shots in [10**3, 10**4, 10**5, 10**6, 10**7]:
+        t_hist = measure_time(lambda: histogram_sampling(probs, shots, rng))
+        t_mult = measure_time(lambda: sample_counts(probs, shots, rng))
+        print(
+            f"{shots:>10} {t_hist:>10.4f} s {t_mult:>10.4f} s "
+            f"{t_hist / t_mult:>7.2f}x"
+        )
+
+    # End-to-end measurement of a uniform superposition
+    qc = QuantumCircuit(n, n)
+    qc.h(list(range(n)))
+    qc.measure(list(range(n)), list(range(n)))
+
+    print(f"\nrun on {n} qubits in uniform superposition")
+    for shots in [10**3, 10**5, 10**7]:
+        t_run = measure_time(lambda: run(qc, shots, rng=rng), repetitions=1)
+        print(f"{shots:>10} {t_run:>10.4f} s")
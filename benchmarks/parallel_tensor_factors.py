@@ -0,0 +1,94 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the parallel execution of independent tensor factors.
+# Simulates a circuit consisting of several independent blocks of entangled qubits
+# (similar to the parallel ancilla blocks of QIRO sub-instances) with the
+# sequential, the thread pool and the process pool scheduler.
+#
+# Usage:
+#     python benchmarks/parallel_tensor_factors.py [block_amount] [block_size] [depth]
+
+import os
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumCircuit
+import qrisp.simulator.parallel_execution as pe
+
+
+def block_circuit(block_amount, block_size, depth, seed=0):
+    rng = np.random.default_rng(seed)
+    n = block_amount * block_size
+    qc = QuantumCircuit(n, n)
+
+    for d in range(depth):
+        for b in range(block_amount):
+            for i in range(block_size):
+                qc.rx(rng.random(), b * block_size + i)
+                qc.rz(rng.random(), b * block_size + i)
+            for i in range(block_size - 1):
+                qc.cx(b * block_size + i, b * block_size + i + 1)
+
+    # Measure only a single qubit per block to keep the result small
+    qc.measure([b * block_size for b in range(block_amount)], range(block_amount))
+
+    return qc
+
+
+if __name__ == "__main__":
+    block_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    block_size = int(sys.argv[2]) if len(sys.argv) > 2 else 14
+    depth = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    qc = block_circuit(block_amount, block_size, depth)
+
+    print(
+        f"{block_amount} blocks of {block_size} qubits, depth {depth}, "
+        f"{os.cpu_count()} CPUs"
+    )
+
+    # Warm-up (numba compilation)
+    block_circuit(2, 2, 1).run()
+
+    timings = {}
+    results = {}
+    for executor_type, max_workers in [
+        ("thread", 1),
+        ("thread", block_amount),
+        ("process", block_amount),
+    ]:
+        pe.executor_type = executor_type
+        pe.max_workers = max_workers
+
+        t0 = time.perf_counter()
+        results[(executor_type, max_workers)] = qc.run()
+        timings[(executor_type, max_workers)] = time.perf_counter() - t0
+
+    reference = results[("thread", 1)]
+    for key, duration in timings.items():
+        label = "sequential" if key[1] == 1 else f"{key[0]} pool ({key[1]} workers)"
+        deviation = max(abs(reference[k] - results[key].get(k, 0)) for k in reference)
+        speed_up = timings[("thread", 1)] / duration
+        print(
+            f"{label:28s} {duration:8.3f} s   speed-up {speed_up:4.2f}x   "
+            f"max. deviation {deviation:.1e}"
+        )
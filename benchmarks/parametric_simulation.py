@@ -0,0 +1,82 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the repeated evaluation of a parametrized QAOA circuit.
+# Compares the conventional pipeline of get_measurement (binding, gate fusion,
+# transpilation and the full simulator preprocessing for every parameter vector)
+# with a ParametricSimulation, which performs the preprocessing once.
+#
+# Usage: python benchmarks/parametric_simulation.py [node_amount] [depth] [evaluations]
+
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+from qrisp import QuantumVariable
+from qrisp.core.compilation import combine_single_qubit_gates
+from qrisp.default_backend import def_backend
+from qrisp.misc import get_measurement_from_qc
+from qrisp.qaoa import maxcut_problem
+from qrisp.simulator import ParametricSimulation
+
+
+def conventional_evaluation(qc, qubits, subs_dic):
+    bound_qc = combine_single_qubit_gates(qc.bind_parameters(subs_dic)).transpile()
+    return get_measurement_from_qc(bound_qc, qubits, def_backend)
+
+
+if __name__ == "__main__":
+    node_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    evaluations = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    G = nx.erdos_renyi_graph(node_amount, 0.5, seed=1)
+    qarg = QuantumVariable(node_amount)
+    qc, symbols = maxcut_problem(G).compile_circuit(qarg, depth)
+
+    rng = np.random.default_rng(0)
+    parameter_list = [
+        {symbols[i]: x for i, x in enumerate(rng.random(len(symbols)))}
+        for _ in range(evaluations)
+    ]
+
+    t0 = time.perf_counter()
+    for subs_dic in parameter_list:
+        conventional_evaluation(qc.copy(), qarg.reg, subs_dic)
+    t_conventional = (time.perf_counter() - t0) / evaluations
+
+    t0 = time.perf_counter()
+    measured_qc = qc.copy()
+    for i in range(node_amount):
+        measured_qc.measure(qarg.reg[i], measured_qc.add_clbit())
+    sim = ParametricSimulation(measured_qc)
+    t_setup = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for subs_dic in parameter_list:
+        sim.run(subs_dic)
+    t_parametric = (time.perf_counter() - t0) / evaluations
+
+    print(f"QAOA MaxCut: {node_amount} nodes, depth {depth}, {evaluations} evaluations")
+    print(f"Conventional pipeline: {1000*t_conventional:.1f} ms/evaluation")
+    print(f"ParametricSimulation:  {1000*t_parametric:.1f} ms/evaluation "
+          f"(one-time setup {1000*t_setup:.1f} ms)")
+    print(f"Speed-up:              {t_conventional/t_parametric:.1f}x")
@@ -0,0 +1,95 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the OpenQASM conversion. A circuit consisting of standard gates and a
+# repeatedly appended composite gate is converted to an OpenQASM 2 string and parsed
+# back. For comparison, the conversion via Qiskit is timed for circuits of up to
+# 10^5 gates (larger circuits take very long).
+#
+# Usage: python benchmarks/qasm_throughput.py [gate_amounts...]
+
+import sys
+import time
+
+from qrisp import QuantumCircuit
+from qrisp.interface import convert_from_qiskit, convert_to_qiskit
+from qrisp.interface.converter.qasm_converter import convert_from_qasm, convert_to_qasm
+
+
+def build_circuit(gate_amount, qubit_amount=50):
+    composite_qc = QuantumCircuit(2)
+    composite_qc.h(0)
+    composite_qc.cx(0, 1)
+    composite_qc.rz(0.25, 1)
+    composite_gate = composite_qc.to_gate("composite")
+
+    qc = QuantumCircuit(qubit_amount, qubit_amount)
+    qubits = qc.qubits
+    for i in range(gate_amount // 4):
+        qc.h(qubits[i % qubit_amount])
+        qc.cx(qubits[i % qubit_amount], qubits[(i + 1) % qubit_amount])
+        qc.rz(0.001 * i, qubits[(i + 2) % qubit_amount])
+        qc.append(
+            composite_gate, [qubits[(i + 3) % qubit_amount], qubits[i % qubit_amount]]
+        )
+    qc.measure(qc.qubits, qc.clbits)
+    return qc
+
+
+def qiskit_roundtrip(qc):
+    from qiskit import QuantumCircuit as QiskitQuantumCircuit
+    from qiskit.qasm2 import dumps
+
+    t0 = time.time()
+    qasm_str = dumps(convert_to_qiskit(qc))
+    emit_time = time.time() - t0
+
+    t0 = time.time()
+    convert_from_qiskit(QiskitQuantumCircuit.from_qasm_str(qasm_str))
+    parse_time = time.time() - t0
+
+    return emit_time, parse_time
+
+
+if __name__ == "__main__":
+    gate_amounts = [int(float(x)) for x in sys.argv[1:]] or [10**5, 10**6]
+
+    for gate_amount in gate_amounts:
+        qc = build_circuit(gate_amount)
+
+        t0 = time.time()
+        qasm_str = convert_to_qasm(qc)
+        emit_time = time.time() - t0
+
+        t0 = time.time()
+        parsed_qc = convert_from_qasm(qasm_str)
+        parse_time = time.time() - t0
+
+        print(
+            f"{len(qc.data):>8} gates: emit {emit_time:7.3f} s "
+            f"({len(qc.data) / emit_time:9.0f} gates/s), parse {parse_time:7.3f} s "
+            f"({len(parsed_qc.data) / parse_time:9.0f} gates/s)"
+        )
+
+        if gate_amount <= 10**5:
+            emit_time, parse_time = qiskit_roundtrip(qc)
+            print(
+                f"{'via Qiskit':>14}: "
+                f"emit {emit_time:7.3f} s, parse {parse_time:7.3f} s"
+            )
@@ -0,0 +1,74 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the qubit allocation stage of the qompiler. A QuantumSession with
+# a given amount of gates is compiled, where the gates act on a register of data
+# qubits and on many ancilla qubits, which are allocated and deallocated in
+# blocks (one ancilla lifetime per 300 gates, i.e. thousands of lifetimes for
+# 10^6 gates). The compile time should scale linearly in the amount of gates.
+#
+# Usage: python benchmarks/qompiler_allocation.py [gate_amounts...]
+
+import sys
+import time
+
+from qrisp import QuantumVariable, cx, t, h
+
+
+def ancilla_session(gate_amount, data_qubits=20, ancillae_per_block=10, rounds=100):
+    data = QuantumVariable(data_qubits)
+    h(data)
+
+    # Every ancilla receives 3 gates per round
+    block_amount = max(1, gate_amount // (3 * rounds * ancillae_per_block))
+
+    for k in range(block_amount):
+        anc = QuantumVariable(ancillae_per_block)
+        for r in range(rounds):
+            for i in range(ancillae_per_block):
+                cx(data[(k + r + i) % data_qubits], anc[i])
+                t(anc[i])
+                cx(anc[i], data[(k + r + i + 1) % data_qubits])
+        anc.delete()
+
+    return data.qs
+
+
+if __name__ == "__main__":
+    gate_amounts = [int(float(x)) for x in sys.argv[1:]] or [10**4, 10**5, 10**6]
+
+    # Warm up the numba functions
+    ancilla_session(10**3).compile()
+
+    for gate_amount in gate_amounts:
+        t0 = time.time()
+        qs = ancilla_session(gate_amount)
+        build_time = time.time() - t0
+
+        t0 = time.time()
+        qc = qs.compile()
+        compile_time = time.time() - t0
+
+        print(
+            f"{len(qs.data):>8} gates, {len(qs.qubits)} qubits: "
+            f"compile time {compile_time:8.3f} s "
+            f"({1e6 * compile_time / len(qs.data):.2f} us/gate, "
+            f"{qc.num_qubits()} compiled qubits), "
+            f"session construction {build_time:.3f} s"
+        )
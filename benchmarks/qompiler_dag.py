@@ -0,0 +1,80 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the array based DAG of the compilation pipeline. A multiplication
+# of two n-bit QuantumFloats is compiled and the time to build the DAG of the
+# transpiled circuit is compared between the networkx based PermeabilityGraph
+# (including the conversion into the CSR format, which was required by the numba
+# based algorithms) and the ArrayDAG, which produces the CSR arrays directly.
+#
+# Usage: python benchmarks/qompiler_dag.py [bit_sizes...]
+
+import sys
+import time
+
+import networkx as nx
+import numpy as np
+
+from qrisp import QuantumFloat, transpile
+from qrisp.permeability import PermeabilityGraph, ArrayDAG
+
+
+def multiplication_session(n):
+    a = QuantumFloat(n)
+    b = QuantumFloat(n)
+    a[:] = 3
+    b[:] = 5
+    c = a * b
+    return c.qs
+
+
+if __name__ == "__main__":
+    bit_sizes = [int(x) for x in sys.argv[1:]] or [8, 16, 24]
+
+    # Warm up the numba functions
+    multiplication_session(3).compile()
+
+    for n in bit_sizes:
+        qs = multiplication_session(n)
+
+        t0 = time.time()
+        compiled_qc = qs.compile()
+        compile_time = time.time() - t0
+
+        qc = transpile(qs.copy())
+
+        t0 = time.time()
+        G = PermeabilityGraph(qc, remove_artificials=True)
+        sprs_mat = nx.to_scipy_sparse_array(G, format="csr")
+        nx_time = time.time() - t0
+
+        t0 = time.time()
+        dag = ArrayDAG(qc, remove_artificials=True)
+        array_time = time.time() - t0
+
+        assert np.array_equal(sprs_mat.indptr, dag.indptr)
+        assert np.array_equal(sprs_mat.indices, dag.indices)
+
+        print(f"{n}-bit multiplication ({len(qc.data)} gates, {len(dag)} DAG nodes)")
+        print(
+            f"compile time:                    {compile_time:.3f} s "
+            f"({compiled_qc.num_qubits()} qubits)"
+        )
+        print(f"PermeabilityGraph + CSR export:  {nx_time:.3f} s")
+        print(f"ArrayDAG:                        {array_time:.3f} s")
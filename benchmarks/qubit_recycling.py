@@ -0,0 +1,76 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the qubit allocation of the Jasp simulator. Both programs
+# allocate and deallocate an ancilla in every iteration of a loop. In the first
+# program the ancilla is (reversibly) entangled with a persistent qubit and
+# uncomputed, in the second program the ancilla is measured and reset before 
+# deallocation. Since deallocated simulator qubits are recycled, the size of 
+# the simulator state stays bounded by the peak amount of live qubits instead 
+# of growing with the number of iterations.
+#
+# Usage: python benchmarks/qubit_recycling.py [iterations]
+
+import sys
+import time
+
+from qrisp import QuantumFloat, QuantumBool, h, cx, measure, reset
+from qrisp.jasp import make_jaspr, jrange, simulate_jaspr
+
+
+def uncomputation_main(n):
+    qf = QuantumFloat(2)
+    h(qf)
+    for i in jrange(n):
+        anc = QuantumBool()
+        cx(qf[0], anc[0])
+        cx(qf[0], anc[0])
+        anc.delete()
+    return measure(qf)
+
+
+def measurement_main(n):
+    qf = QuantumFloat(2)
+    h(qf)
+    for i in jrange(n):
+        anc = QuantumBool()
+        cx(qf[0], anc[0])
+        measure(anc)
+        reset(anc)
+        anc.delete()
+    return measure(qf)
+
+
+def time_simulation(jaspr, *args, repetitions = 2):
+    timings = []
+    for i in range(repetitions):
+        start = time.perf_counter()
+        simulate_jaspr(jaspr, *args, rng = i)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 10**4
+    
+    for main in [uncomputation_main, measurement_main]:
+        jaspr = make_jaspr(main)(1)
+        timings = time_simulation(jaspr, iterations)
+        timings = ", ".join(f"{t:.2f} s" for t in timings)
+        print(f"{main.__name__} ({iterations} iterations): {timings}")
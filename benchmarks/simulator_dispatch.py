@@ -0,0 +1,92 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# Micro-benchmark for the per-gate dispatch overhead of the simulator main loops.
+# Compares the legacy operand resolution (qc.qubits.index for every operand) with
+# the integer instruction tape generated by generate_instruction_tape.
+#
+# Usage: python benchmarks/simulator_dispatch.py [qubit_amount] [gate_amount]
+
+import gc
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumCircuit
+from qrisp.simulator.simulator import generate_instruction_tape
+
+
+def build_circuit(n, gate_amount, seed=0):
+    rng = np.random.default_rng(seed)
+    qc = QuantumCircuit(n)
+    for i in range(gate_amount):
+        a, b = rng.choice(n, 2, replace=False)
+        if i % 3:
+            qc.cx(int(a), int(b))
+        else:
+            qc.h(int(a))
+    return qc
+
+
+def legacy_dispatch(qc):
+    res = []
+    for instr in qc.data:
+        res.append((instr.op, [qc.qubits.index(qb) for qb in instr.qubits]))
+    return res
+
+
+def tape_dispatch(qc):
+    return generate_instruction_tape(qc)
+
+
+def benchmark(func, qc, repetitions=3):
+    # Similar to timeit, the garbage collector is disabled during the measurement
+    # to prevent collection cycles of the (large) circuit from dominating the timing
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repetitions):
+            t0 = time.perf_counter()
+            func(qc)
+            timings.append(time.perf_counter() - t0)
+    finally:
+        gc.enable()
+    return min(timings)
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    gate_amount = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+
+    qc = build_circuit(n, gate_amount)
+
+    t_legacy = benchmark(legacy_dispatch, qc)
+    t_tape = benchmark(tape_dispatch, qc)
+
+    print(f"Circuit: {n} qubits, {gate_amount} gates")
+    print(
+        f"qubits.index resolution: {t_legacy:.3f}s "
+        f"({1e9*t_legacy/gate_amount:.0f} ns/gate)"
+    )
+    print(
+        f"Instruction tape:        {t_tape:.3f}s "
+        f"({1e9*t_tape/gate_amount:.0f} ns/gate)"
+    )
+    print(f"Speed-up:                {t_legacy/t_tape:.1f}x")
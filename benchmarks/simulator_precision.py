@@ -0,0 +1,86 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the precision modes of the built-in simulator.
+# A Heisenberg chain is evolved with a Trotterized time evolution. The deviation
+# of the single precision statevector from the double precision statevector and the
+# drift of the norm quantify the accumulated floating point error.
+#
+# Usage: python benchmarks/simulator_precision.py [qubit_amount] [steps]
+
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumVariable, ry
+from qrisp.operators import X, Y, Z
+from qrisp.simulator import numerics_config
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+
+    H = sum(X(i)*X(i+1) + Y(i)*Y(i+1) + 0.5*Z(i)*Z(i+1) for i in range(n - 1))
+    U = H.trotterization()
+
+    angles = np.random.default_rng(0).random(n) * np.pi
+
+    # The unitaries are cached on the Operation objects, so the circuit is created
+    # after the precision has been set
+    def create_circuit():
+        qv = QuantumVariable(n)
+        for i in range(n):
+            ry(angles[i], qv[i])
+        U(qv, t=5.0, steps=steps)
+        return qv.qs.compile()
+
+    statevectors = {}
+    for precision in ["complex64", "complex128"]:
+        numerics_config.set_precision(precision)
+
+        qc = create_circuit()
+
+        if precision == "complex64":
+            print(
+                f"Heisenberg chain: {n} qubits, {steps} Trotter steps, "
+                f"{len(qc.data)} gates"
+            )
+
+        # Warm-up
+        create_circuit().statevector_array()
+
+        t0 = time.perf_counter()
+        statevectors[precision] = qc.statevector_array().astype(np.complex128)
+        duration = time.perf_counter() - t0
+
+        norm_drift = abs(np.linalg.norm(statevectors[precision]) - 1)
+        print(
+            f"{precision:10s} {duration:8.3f} s   "
+            f"{len(qc.data)/duration:10.0f} gates/s   norm drift {norm_drift:.2e}"
+        )
+
+    numerics_config.set_precision("complex64")
+
+    deviation = np.linalg.norm(statevectors["complex64"] - statevectors["complex128"])
+    print(
+        "Deviation of the complex64 statevector from the complex128 statevector: "
+        f"{deviation:.2e}"
+    )
@@ -0,0 +1,87 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the quiet mode of the simulator.
+# Simulates many small circuits (as they appear in optimizer loops) with and
+# without the progress bar.
+#
+# Usage: python benchmarks/simulator_quiet_mode.py [circuit_amount] [qubit_amount]
+
+import contextlib
+import gc
+import io
+import sys
+import time
+
+import numpy as np
+
+from qrisp import QuantumCircuit
+from qrisp.simulator import run, set_quiet_mode
+
+
+def random_circuit(n, depth, rng):
+    qc = QuantumCircuit(n, n)
+    for d in range(depth):
+        for i in range(n):
+            qc.ry(rng.random(), i)
+        for i in range(d % 2, n - 1, 2):
+            qc.cx(i, i + 1)
+    qc.measure(range(n), range(n))
+    return qc
+
+
+def simulate_all(circuits):
+    gc.disable()
+    t0 = time.perf_counter()
+    for qc in circuits:
+        run(qc, None)
+    duration = time.perf_counter() - t0
+    gc.enable()
+    return duration
+
+
+if __name__ == "__main__":
+    circuit_amount = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    rng = np.random.default_rng(0)
+    circuits = [random_circuit(n, 4, rng) for _ in range(circuit_amount)]
+
+    # Warm-up
+    simulate_all(circuits[:10])
+
+    print(f"Simulating {circuit_amount} circuits with {n} qubits")
+
+    # The output of the progress bar is captured to keep the terminal clean
+    set_quiet_mode(False)
+    with contextlib.redirect_stdout(io.StringIO()):
+        t_progress = simulate_all(circuits)
+
+    set_quiet_mode(True)
+    t_quiet = simulate_all(circuits)
+
+    set_quiet_mode(None)
+
+    print(f"With progress bar: {1e6*t_progress/circuit_amount:8.1f} us/circuit")
+    print(f"Quiet mode:        {1e6*t_quiet/circuit_amount:8.1f} us/circuit")
+    saved_overhead = 1e6 * (t_progress - t_quiet) / circuit_amount
+    print(
+        f"Saved overhead:    {saved_overhead:8.1f} us/circuit "
+        f"({t_progress/t_quiet:.2f}x)"
+    )
@@ -0,0 +1,101 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the cache of simulated quantum states. Several QuantumVariables of
+# the same QuantumSession are measured and the expectation values of several
+# Hamiltonians are evaluated with and without the state cache. With the cache, the
+# circuit is simulated once and every further query is answered by measuring the
+# cached QuantumState.
+#
+# Usage: python benchmarks/state_cache.py [qubits_per_variable] [variable_amount]
+
+import random
+import sys
+import time
+
+from qrisp import QuantumFloat, cx, ry, multi_measurement
+from qrisp.operators import X, Z
+from qrisp.operators.hamiltonian_tools import multi_hamiltonian_measurement
+from qrisp.simulator import (
+    enable_state_cache,
+    disable_state_cache,
+    get_state_cache_info,
+    set_quiet_mode,
+)
+
+
+def prepare(n, variable_amount):
+    random.seed(0)
+    qf_list = [QuantumFloat(n) for _ in range(variable_amount)]
+    for i in range(variable_amount):
+        for j in range(n):
+            ry(random.random() * 3, qf_list[i][j])
+        if i:
+            for j in range(n):
+                cx(qf_list[i - 1][j], qf_list[i][j])
+    return qf_list
+
+
+def measure(qf_list, hamiltonians):
+    results = [qf.get_measurement() for qf in qf_list]
+    results.append(multi_measurement(qf_list[:2]))
+    results.append(multi_hamiltonian_measurement(hamiltonians, qf_list[0]))
+    return results
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    variable_amount = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    set_quiet_mode(True)
+
+    hamiltonians = [Z(i) * Z(i + 1) + 0.5 * X(i) for i in range(n - 1)]
+
+    qf_list = prepare(n, variable_amount)
+    t0 = time.time()
+    uncached_results = measure(qf_list, hamiltonians)
+    uncached_time = time.time() - t0
+
+    enable_state_cache()
+    try:
+        qf_list = prepare(n, variable_amount)
+        t0 = time.time()
+        cached_results = measure(qf_list, hamiltonians)
+        cached_time = time.time() - t0
+        info = get_state_cache_info()
+    finally:
+        disable_state_cache()
+
+    # The measurement results agree up to the rounding of the probabilities
+    for i in range(len(uncached_results) - 1):
+        for outcome, prob in uncached_results[i].items():
+            assert abs(cached_results[i].get(outcome, 0) - prob) < 1e-4
+    for x, y in zip(cached_results[-1], uncached_results[-1]):
+        assert abs(x - y) < 1e-4
+
+    print(
+        f"{variable_amount} variables with {n} qubits, "
+        f"{len(hamiltonians)} Hamiltonians"
+    )
+    print(f"without cache: {uncached_time:.3f} s")
+    print(
+        f"with cache:    {cached_time:.3f} s "
+        f"({info['misses']} simulations, {info['hits']} cache hits)"
+    )
+    print(f"speedup:       {uncached_time / cached_time:.2f}x")
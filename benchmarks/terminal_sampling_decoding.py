@@ -0,0 +1,70 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+# Benchmark for the decoding of the measurement results in terminal sampling.
+# A QuantumFloat is brought into uniform superposition such that every outcome
+# is sampled, which means that the decoder has to be evaluated for 2**n distinct
+# measurement results. The timings include the simulation and the decoding for
+# the dictionary (exact probabilities), expectation value and array modes.
+#
+# Usage: python benchmarks/terminal_sampling_decoding.py [qubit_amounts ...]
+
+import sys
+import time
+
+from qrisp import QuantumFloat, h
+from qrisp.jasp import terminal_sampling, expectation_value, sample, jaspify
+
+
+def uniform_float(n):
+    def state_prep():
+        qf = QuantumFloat(n, -3)
+        h(qf)
+        return qf
+    return state_prep
+
+
+if __name__ == "__main__":
+    qubit_amounts = [int(n) for n in sys.argv[1:]] or [10, 14, 17]
+    
+    print(f"{'qubits':>8}{'dict (s)':>12}{'ev (s)':>12}{'array (s)':>12}")
+    for n in qubit_amounts:
+        state_prep = uniform_float(n)
+        
+        start = time.perf_counter()
+        terminal_sampling(state_prep)()
+        dict_time = time.perf_counter() - start
+        
+        @jaspify(terminal_sampling = True)
+        def ev_main():
+            return expectation_value(state_prep, 10*2**n)()
+        
+        start = time.perf_counter()
+        ev_main()
+        ev_time = time.perf_counter() - start
+        
+        @jaspify(terminal_sampling = True)
+        def array_main():
+            return sample(state_prep, 10*2**n)()
+        
+        start = time.perf_counter()
+        array_main()
+        array_time = time.perf_counter() - start
+        
+        print(f"{n:>8}{dict_time:>12.2f}{ev_time:>12.2f}{array_time:>12.2f}")
@@ -0,0 +1,92 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+
+# Benchmark for the transpiler. Two circuits containing nested arithmetic
+# (multiplications, which are built from adders, which are in turn built from
+# QFTs and controlled phase gates) are transpiled into elementary gates:
+#
+#   - "session": A QuantumSession where every multiplication creates new
+#     definition circuits.
+#   - "shared": A circuit where the same multiplication gate is applied
+#     repeatedly, i.e. the definitions are shared between the occurrences.
+#
+# The throughput is reported in transpiled gates per second. The garbage collector
+# is disabled during the measurement, since otherwise the (randomly occuring) full
+# collections of the interpreter heap dominate the timings.
+#
+# Usage: python benchmarks/transpile_throughput.py [multiplication_amounts...]
+
+import gc
+import sys
+import time
+
+from qrisp import QuantumCircuit, QuantumFloat, h, transpile
+
+
+def arithmetic_session(multiplication_amount, size=5):
+    a = QuantumFloat(size)
+    b = QuantumFloat(size)
+    h(a)
+    h(b)
+
+    for i in range(multiplication_amount):
+        c = a * b
+        a += c
+
+    return a.qs
+
+
+def shared_definition_circuit(multiplication_amount, size=5):
+    a = QuantumFloat(size)
+    b = QuantumFloat(size)
+    c = a * b
+    mul_gate = a.qs.to_gate("mul")
+
+    qc = QuantumCircuit(mul_gate.num_qubits + multiplication_amount)
+    for i in range(multiplication_amount):
+        qc.append(mul_gate, qc.qubits[i : i + mul_gate.num_qubits])
+
+    return qc
+
+
+if __name__ == "__main__":
+    multiplication_amounts = [int(x) for x in sys.argv[1:]] or [10, 100]
+    repetitions = 3
+
+    for multiplication_amount in multiplication_amounts:
+        for name, qc in [
+            ("session", arithmetic_session(multiplication_amount)),
+            ("shared", shared_definition_circuit(multiplication_amount)),
+        ]:
+            gc.collect()
+            gc.disable()
+            t0 = time.time()
+            for i in range(repetitions):
+                transpiled_qc = transpile(qc)
+            transpile_time = (time.time() - t0) / repetitions
+            gc.enable()
+
+            print(
+                f"{name:>7}, {multiplication_amount:>4} multiplications: "
+                f"{len(qc.data):>6} instructions -> "
+                f"{len(transpiled_qc.data):>8} gates, "
+                f"transpile time {transpile_time:.3f} s "
+                f"({len(transpiled_qc.data) / transpile_time:,.0f} gates/s)"
+            )
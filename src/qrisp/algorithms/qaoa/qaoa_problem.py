@@ -471,10 +471,25 @@ class QAOAProblem:
 
                 dt = np.linspace(0.1, 1, steps)
 
-                energy = []
+                # The parameters for all dt values are evaluated in a single batch
+                subs_dic_list = []
                 for dt_ in dt:      
                     theta = self.computeParams(p, dt_)
-                    energy_ = optimization_wrapper(theta, qarg, qc, symbols, mes_kwargs)
+                    subs_dic_list.append(
+                        {symbols[i] : theta[i] for i in range(len(symbols))}
+                    )
+                
+                res_dic_list = qarg.get_measurement_batch(
+                    subs_dic_list, precompiled_qc = qc, **mes_kwargs
+                )
+                
+                energy = []
+                for res_dic in res_dic_list:
+                    energy_ = self.cl_cost_function(res_dic)
+                    
+                    if self.callback:
+                        self.optimization_costs.append(energy_)
+                    
                     energy.append(energy_)
             
                 idx = np.argmin(energy)
@@ -878,25 +893,63 @@ class QAOAProblem:
         
         for p in depth_range:
             for s in shot_range:
+                
+                # The circuit is compiled once for every depth and the final samples
+                # of the optimized parameters are evaluated as a single batch
+                qarg = qarg_prep()
+                compiled_qc, symbols = self.compile_circuit(
+                    qarg, depth = p, init_type = init_type
+                )
+                circuit_depth = compiled_qc.depth()
+                qubit_amount = compiled_qc.num_qubits()
+                
+                temp_mes_kwargs = dict(mes_kwargs)
+                temp_mes_kwargs["shots"] = s
+                
+                subs_dic_list = []
+                runtimes = []
+                iterations = []
+                
                 for it in iter_range:
                     for k in range(repetitions):
                             
                         start_time = time.time()
                         
-                        temp_mes_kwargs = dict(mes_kwargs)
-                        temp_mes_kwargs["shots"] = s
-                        counts = self.run(qarg_prep, depth = p, max_iter = it, mes_kwargs = temp_mes_kwargs, init_type = init_type, optimizer = optimizer, options = options)
-                        final_time = time.time() - start_time
+                        temp_options = dict(options)
+                        temp_options["maxiter"] = it
                         
-                        compiled_qc, _ = self.compile_circuit(qarg_prep(), depth = p)
+                        # Delete callback
+                        self.optimization_params = []
+                        self.optimization_costs = []
                         
-                        data_dict["layer_depth"].append(p)
-                        data_dict["circuit_depth"].append(compiled_qc.depth())
-                        data_dict["qubit_amount"].append(compiled_qc.num_qubits())
-                        data_dict["shots"].append(s)
-                        data_dict["iterations"].append(it)
-                        data_dict["counts"].append(counts)
-                        data_dict["runtime"].append(final_time)
+                        opt_theta, opt_res = self.optimization_routine(qarg_prep, 
+                                                                       p, 
+                                                                       temp_mes_kwargs, 
+                                                                       init_type,
+                                                                       None,
+                                                                       optimizer,
+                                                                       temp_options)
+                        
+                        runtimes.append(time.time() - start_time)
+                        iterations.append(it)
+                        subs_dic_list.append(
+                            {symbols[i] : opt_theta[i] for i in range(len(symbols))}
+                        )
+                
+                start_time = time.time()
+                counts_list = qarg.get_measurement_batch(
+                    subs_dic_list, precompiled_qc = compiled_qc, **temp_mes_kwargs
+                )
+                sampling_time = (time.time() - start_time)/len(counts_list)
+                
+                for i in range(len(counts_list)):
+                    data_dict["layer_depth"].append(p)
+                    data_dict["circuit_depth"].append(circuit_depth)
+                    data_dict["qubit_amount"].append(qubit_amount)
+                    data_dict["shots"].append(s)
+                    data_dict["iterations"].append(iterations[i])
+                    data_dict["counts"].append(counts_list[i])
+                    data_dict["runtime"].append(runtimes[i] + sampling_time)
                         
                         
         return QAOABenchmark(data_dict, optimal_solution, self.cl_cost_function)
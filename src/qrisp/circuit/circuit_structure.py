@@ -0,0 +1,105 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# This module determines the structure of QuantumCircuits, i.e. a hashable
+# representation of the operations (including their parameters and definitions)
+# and the qubit/clbit indices of the instructions. In contrast to the hash of a
+# circuit, two circuits with equal structure are guaranteed to be equal, such that
+# the structure can be used as the key of caches.
+
+# Since in-place modifications of the Operations of a circuit are not tracked
+# (see modification_tracking.py), the structure is not memoized on the circuit but
+# determined on every call. Definitions, which are shared by several instructions,
+# are processed only once per call.
+
+
+class CircuitStructure:
+    __slots__ = ("structure", "hash_value")
+
+    def __init__(self, structure):
+        self.structure = structure
+        # Raises a TypeError if the circuit contains unhashable parameters
+        self.hash_value = hash(structure)
+
+    def __hash__(self):
+        return self.hash_value
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if not isinstance(other, CircuitStructure):
+            return False
+        return self.hash_value == other.hash_value and self.structure == other.structure
+
+
+# Returns the structure of an Operation. The dictionary definition_structures
+# contains the structures of the definitions, which have already been processed.
+def operation_structure(op, definition_structures):
+    definition = op.definition
+    if definition is not None:
+        try:
+            definition = definition_structures[id(definition)]
+        except KeyError:
+            structure = circuit_structure(definition, definition_structures)
+            definition_structures[id(definition)] = structure
+            definition = structure
+
+    base_operation = getattr(op, "base_operation", None)
+    if base_operation is not None:
+        base_operation = operation_structure(base_operation, definition_structures)
+
+    return (
+        type(op),
+        op.name,
+        op.num_qubits,
+        op.num_clbits,
+        tuple(op.params),
+        getattr(op, "method", None),
+        str(getattr(op, "ctrl_state", None)),
+        tuple(op.permeability.items()),
+        op.is_qfree,
+        base_operation,
+        definition,
+    )
+
+
+# Returns the structure of a QuantumCircuit as a CircuitStructure object, i.e. the
+# structure of the Operation and the indices of the qubits and clbits of each
+# instruction. Raises a TypeError if the circuit contains unhashable parameters
+# (for instance tracers).
+def circuit_structure(qc, definition_structures=None):
+    if definition_structures is None:
+        definition_structures = {}
+
+    qubit_index_dic = {qb: j for j, qb in enumerate(qc.qubits)}
+    clbit_index_dic = {cb: j for j, cb in enumerate(qc.clbits)}
+
+    instructions = tuple(
+        [
+            (
+                operation_structure(instr.op, definition_structures),
+                tuple([qubit_index_dic[qb] for qb in instr.qubits]),
+                tuple([clbit_index_dic[cb] for cb in instr.clbits]),
+            )
+            for instr in qc.data
+        ]
+    )
+
+    return CircuitStructure(
+        (len(qc.qubits), len(qc.clbits), len(instructions), instructions)
+    )
@@ -0,0 +1,98 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# This module provides the version counters of QuantumCircuits, such that
+# information derived from a circuit (like its hash) can be memoized and reused
+# as long as the circuit has not been modified.
+
+# The data, qubits and clbits lists of a QuantumCircuit are TrackedDataLists.
+# Every modification of such a list increases its version counter, except for
+# appending, because memoized results can usually be extended incrementally. The
+# version of a circuit consists of its lists together with their version counters
+# and lengths. Memoized results store the version of the circuit they have been
+# derived from and are valid as long as the circuit has the same version.
+
+# Note that only the lists of the circuit are tracked. In-place modifications of
+# the Instructions or Operations contained in a circuit are not registered. Such
+# modifications should be performed by replacing the instruction instead
+# (i.e. qc.data[i] = Instruction(...)).
+
+
+# Creates a list method, which increases the version counter before executing the
+# original method
+def tracked_method(name):
+    method = getattr(list, name)
+
+    def tracked_method(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    tracked_method.__name__ = name
+    return tracked_method
+
+
+class TrackedDataList(list):
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self.version = 0
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+
+for name in [
+    "__setitem__",
+    "__delitem__",
+    "__imul__",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+    "clear",
+]:
+    setattr(TrackedDataList, name, tracked_method(name))
+
+
+# Returns the version of a QuantumCircuit or None if the lists of the circuit are
+# not tracked
+def circuit_version(qc):
+    res = (qc.data, qc.qubits, qc.clbits)
+    for bits in res:
+        if type(bits) is not TrackedDataList:
+            return None
+    return tuple([(bits, bits.version, len(bits)) for bits in res])
+
+
+# Checks whether the circuit still has the given version. If allow_appends is set
+# to True, the circuit may also have been extended through appending.
+def version_is_current(version, qc, allow_appends=False):
+    if version is None:
+        return False
+
+    for (bits, bits_version, length), current_bits in zip(
+        version, (qc.data, qc.qubits, qc.clbits)
+    ):
+        if bits is not current_bits or bits.version != bits_version:
+            return False
+        if length != len(bits) and not allow_appends:
+            return False
+
+    return True
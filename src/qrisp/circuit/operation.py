@@ -159,6 +159,8 @@ class Operation:
         """
 
         res = copy.copy(self)
+        # The copy receives its own parameter list
+        res.params = list(self.params)
         if self.definition:
             copied_definition = self.definition.copy()
         else:
@@ -205,12 +207,17 @@ class Operation:
                [0.+0.j, 0.+0.j, 0.+0.j, 0.+1.j]], dtype=complex64)
         """
 
+        from qrisp.simulator import numerics_config
+
         if self.name == "barrier":
-            from qrisp.simulator.unitary_management import np_dtype
-            return np.eye(2**self.num_qubits, dtype = np_dtype)
+            return np.eye(2**self.num_qubits, dtype = numerics_config.dtype)
 
-        # Check if the unitary is already available
-        if hasattr(self, "unitary"):
+        # Check if the unitary is already available. Unitaries calculated from the
+        # definition are recalculated if the precision of the simulator has been
+        # increased in the meantime.
+        if hasattr(self, "unitary") and (
+            self.definition is None or numerics_config.is_current_unitary(self.unitary)
+        ):
             if decimals == -1:
                 return self.unitary
             else:
@@ -425,6 +432,12 @@ class Operation:
         
         res = self.copy()
         res.params = new_params
+        
+        # Remove the (symbolic) unitaries that might have been cached on the unbound
+        # operation
+        for attr in ["unitary", "unitary_array"]:
+            if attr in res.__dict__:
+                delattr(res, attr)
 
         if res.definition is not None:
             res.definition = res.definition.bind_parameters(subs_dic)
@@ -528,7 +541,11 @@ class U3Gate(Operation):
 
     # Method to calculate the unitary matrix
     def get_unitary(self, decimals=-1):
-        if hasattr(self, "unitary"):
+        from qrisp.simulator import numerics_config
+
+        if hasattr(self, "unitary") and numerics_config.is_current_unitary(
+            self.unitary
+        ):
             if decimals != -1:
                 return np.around(self.unitary, decimals)
             else:
@@ -606,6 +623,18 @@ class PauliGate(U3Gate):
         self.name = name
         self.params = []
 
+    # The Pauli matrices are exact in every precision. They are therefore converted
+    # instead of being recalculated if the precision has been increased.
+    def get_unitary(self, decimals=-1):
+        from qrisp.simulator import numerics_config
+
+        if hasattr(self, "unitary") and not numerics_config.is_current_unitary(
+            self.unitary
+        ):
+            self.unitary = self.unitary.astype(numerics_config.dtype)
+
+        return U3Gate.get_unitary(self, decimals)
+
     def inverse(self):
         return PauliGate(self.name)
 
@@ -829,6 +858,9 @@ class PTControlledOperation(Operation):
         res.base_operation = self.base_operation.bind_parameters(subs_dic)
         res.params = res.base_operation.params
         res.abstract_params = set(self.base_operation.params) - set(subs_dic.keys())
+        
+        if "unitary" in res.__dict__:
+            del res.unitary
 
         return res
 
@@ -867,7 +899,11 @@ class ControlledOperation(PTControlledOperation):
     # the unitary of the base operation.
 
     def get_unitary(self, decimals=-1):
-        if hasattr(self, "unitary"):
+        from qrisp.simulator import numerics_config
+
+        if hasattr(self, "unitary") and numerics_config.is_current_unitary(
+            self.unitary
+        ):
             if decimals != -1:
                 return np.around(self.unitary, decimals)
             else:
@@ -22,6 +22,11 @@ import sympy
 
 import qrisp.circuit.standard_operations as ops
 from qrisp.circuit import Clbit, Instruction, Operation, Qubit
+from qrisp.circuit.modification_tracking import (
+    TrackedDataList,
+    circuit_version,
+    version_is_current,
+)
 
 # Class to describe quantum circuits
 # The naming of the attributes is rather similar to the qiskit equivalent
@@ -209,9 +214,9 @@ class QuantumCircuit:
     xla_mode = 0
 
     def __init__(self, num_qubits=0, num_clbits=0, name=None):
-        object.__setattr__(self, "data", [])
-        object.__setattr__(self, "qubits", [])
-        object.__setattr__(self, "clbits", [])
+        object.__setattr__(self, "data", TrackedDataList())
+        object.__setattr__(self, "qubits", TrackedDataList())
+        object.__setattr__(self, "clbits", TrackedDataList())
 
         self.abstract_params = set()
 
@@ -233,6 +238,13 @@ class QuantumCircuit:
                 f"Tried to initialize QuantumCircuit with type {type(num_clbits)}"
             )
 
+    # The data, qubits and clbits lists are stored as TrackedDataLists, such that
+    # their modifications are tracked (see modification_tracking.py)
+    def __setattr__(self, name, value):
+        if name in ["data", "qubits", "clbits"] and type(value) is list:
+            value = TrackedDataList(value)
+        object.__setattr__(self, name, value)
+
     # Method to add qubit objects to the circuit
     def add_qubit(self, qubit=None):
         """
@@ -308,6 +320,41 @@ class QuantumCircuit:
 
         return self.clbits[-1]
 
+    # The membership of qubits/clbits in this circuit is tracked by an index, such
+    # that appending operations doesn't need to scan the complete bit lists. The
+    # index is a set of the bit objects (i.e. it is not affected by renaming bits).
+    # It is stored together with the bit list it has been built for and updated
+    # incrementally if bits have been appended. If the list has been replaced or
+    # modified otherwise (see modification_tracking.py), the index is rebuilt.
+    def get_qubit_membership(self):
+        return self.get_bit_membership("qubit_membership", self.qubits)
+
+    def get_clbit_membership(self):
+        return self.get_bit_membership("clbit_membership", self.clbits)
+
+    def get_bit_membership(self, attr_name, bits):
+        if type(bits) is not TrackedDataList:
+            return set(bits)
+
+        membership = self.__dict__.get(attr_name)
+
+        if (
+            membership is not None
+            and membership[0] is bits
+            and membership[1] == bits.version
+        ):
+            bit_set = membership[3]
+            if membership[2] < len(bits):
+                bit_set.update(bits[membership[2] :])
+            else:
+                return bit_set
+        else:
+            bit_set = set(bits)
+
+        object.__setattr__(self, attr_name, (bits, bits.version, len(bits), bit_set))
+
+        return bit_set
+
     # Method to transform the given circuit into an operation object
     def to_op(self, name=None):
         """
@@ -495,9 +542,9 @@ class QuantumCircuit:
 
         res = QuantumCircuit()
 
-        object.__setattr__(res, "data", list(self.data))
-        object.__setattr__(res, "qubits", list(self.qubits))
-        object.__setattr__(res, "clbits", list(self.clbits))
+        object.__setattr__(res, "data", TrackedDataList(self.data))
+        object.__setattr__(res, "qubits", TrackedDataList(self.qubits))
+        object.__setattr__(res, "clbits", TrackedDataList(self.clbits))
 
         try:
             res.abstract_params = set(self.abstract_params)
@@ -1054,7 +1101,8 @@ class QuantumCircuit:
         Parameters
         ----------
         formatted : bool, optional
-            Return formatted Qasm string. The default is False.
+            Deprecated. This argument has no effect and will be removed in a later
+            release of Qrisp. The default is False.
         filename : string, optional
             Save Qasm to file with name ‘filename’. The default is None.
         encoding : TYPE, optional
@@ -1066,22 +1114,27 @@ class QuantumCircuit:
         Returns
         -------
         string
-            The OPENQASM string.
+            The OPENQASM string. If the circuit contains features that can only be
+            expressed in OpenQASM 3 (like abstract parameters or conditions on
+            multiple classical bits), an OpenQASM 3 string is returned.
 
         """
-        qiskit_qc = self.to_qiskit()
+        from qrisp.interface.converter.qasm_converter import (
+            Qasm2ExportError,
+            convert_to_qasm,
+            write_qasm,
+        )
+
+        if formatted:
+            warn_formatted_deprecation()
+
         try:
-            return qiskit_qc.qasm(formatted, filename, encoding)
-        except:
-            from qiskit.qasm2 import dumps, QASM2ExportError
-            try:
-                return dumps(qiskit_qc)
-            except (QASM2ExportError, TypeError):
-                from qiskit.qasm3 import dumps
-                from qiskit import transpile
-                transpiled_qiskit_qc = transpile(qiskit_qc, basis_gates = ["x", "y", "z", "h", "s", "t", "s_dg", "t_dg", "cx", "cz", "rz"])
-                return dumps(qiskit_qc)
-            
+            qasm_str = convert_to_qasm(self, 2)
+        except Qasm2ExportError:
+            qasm_str = convert_to_qasm(self, 3)
+
+        return write_qasm(qasm_str, filename, encoding)
+
     def to_qasm3(self, formatted=False, filename=None, encoding=None):
         """
         Returns the `OpenQASM <https://en.wikipedia.org/wiki/OpenQASM>`_ string of self.
@@ -1089,7 +1142,8 @@ class QuantumCircuit:
         Parameters
         ----------
         formatted : bool, optional
-            Return formatted Qasm string. The default is False.
+            Deprecated. This argument has no effect and will be removed in a later
+            release of Qrisp. The default is False.
         filename : string, optional
             Save Qasm to file with name ‘filename’. The default is None.
         encoding : TYPE, optional
@@ -1104,10 +1158,13 @@ class QuantumCircuit:
             The OPENQASM string.
 
         """
-        qiskit_qc = self.to_qiskit()
-        from qiskit.qasm3 import dumps
-        return dumps(qiskit_qc)
-    
+        from qrisp.interface.converter.qasm_converter import convert_to_qasm, write_qasm
+
+        if formatted:
+            warn_formatted_deprecation()
+
+        return write_qasm(convert_to_qasm(self, 3), filename, encoding)
+
     def qasm(self, **kwargs):
         return self.to_qasm2(**kwargs)
         
@@ -1223,12 +1280,25 @@ class QuantumCircuit:
         """
         
         if epsilon is None:
-            transpiled_qc = self.transpile()
             
+            # Collect the elementary operations of the transpiled circuit. Since the
+            # precision only depends on the parameters, each definition circuit
+            # has to be visited only once.
+            elementary_ops = []
+            visited_definitions = set()
+            circuit_stack = [self]
+            while circuit_stack:
+                qc = circuit_stack.pop()
+                for instr in qc.data:
+                    if instr.op.definition:
+                        if id(instr.op.definition) not in visited_definitions:
+                            visited_definitions.add(id(instr.op.definition))
+                            circuit_stack.append(instr.op.definition)
+                    else:
+                        elementary_ops.append(instr.op)
             
             max_circuit_prec = 15
-            for instr in transpiled_qc.data:
-                op = instr.op
+            for op in elementary_ops:
                 
                 for par in op.params:
                     
@@ -1497,9 +1567,9 @@ class QuantumCircuit:
             )
 
         # Building up the list of identifiers seems to slow down this function
-        # We therefore check first if the qubit objects match and if this is not the
-        # case we check if the identifiers match
-        if not set(qubits).issubset(set(self.qubits)):
+        # We therefore check first if the qubit objects match (using the membership
+        # index) and if this is not the case we check if the identifiers match
+        if not self.get_qubit_membership().issuperset(qubits):
             op_identifiers = [qb.identifier for qb in qubits]
             qc_identifiers = [qb.identifier for qb in self.qubits]
 
@@ -1517,10 +1587,11 @@ class QuantumCircuit:
         if len(set([cb.identifier for cb in clbits])) != len(clbits):
             raise Exception("Duplicate clbit arguments")
 
-        if not set([cb.identifier for cb in clbits]).issubset(
-            set([cb.identifier for cb in self.clbits])
-        ):
-            raise Exception("Instruction Clbits not present in circuit")
+        if not self.get_clbit_membership().issuperset(clbits):
+            if not set([cb.identifier for cb in clbits]).issubset(
+                set([cb.identifier for cb in self.clbits])
+            ):
+                raise Exception("Instruction Clbits not present in circuit")
 
         # Log which abstract parameters have been added to the circuit
         try:
@@ -1654,51 +1725,60 @@ class QuantumCircuit:
 
         return statevector_sim(self)
 
+    # The hash is a weighted sum over the hashes of the instructions. Since this sum
+    # can be extended if instructions are appended, the hash is computed
+    # incrementally: The partial sum is stored together with the version of the
+    # circuit (see modification_tracking.py). As long as the circuit has only been
+    # extended through appending, only the new instructions have to be hashed.
+    # Otherwise the hash is recomputed. The hashes of definitions are memoized the
+    # same way because they are circuits themselves. Note that in-place
+    # modifications of the Operations of the circuit are not tracked.
     def __hash__(self):
-        from hashlib import sha256
-
-        res = 0
-
-        def hash_(x):
-            temp = str(x).encode("utf-8")
-            hex_value = sha256(temp).hexdigest()
-            return int(hex_value, 16)
-
-        transpiled_qc = self
+        qubits = self.qubits
+        data = self.data
 
-        n = len(self.qubits)
-        for i in range(len(transpiled_qc.data)):
-            instr = transpiled_qc.data[i]
+        hash_state = self.__dict__.get("hash_state")
 
-            qubit_indices = {}
-
-            for j in range(n):
-                try:
-                    qubit_indices[instr.qubits.index(self.qubits[j])] = j
-                except ValueError:
-                    pass
-
-            qubit_indices = [qubit_indices[j] for j in range(len(instr.qubits))]
+        res = 0
+        start = 0
+        if hash_state is not None:
+            version, partial_res = hash_state
+            if version_is_current(version, self, allow_appends=True):
+                res = partial_res
+                start = version[0][2]
+                if start == len(data):
+                    return hash(res * len(qubits) ** 2)
+
+        if start < len(data):
+            qubit_index_dic = {qb: j for j, qb in enumerate(qubits)}
+
+            for i in range(start, len(data)):
+                instr = data[i]
+                op = instr.op
 
-            index_hash = hash(tuple(qubit_indices))
+                index_hash = hash(tuple([qubit_index_dic[qb] for qb in instr.qubits]))
 
-            params = []
-            for j in range(len(instr.op.params)):
-                p = hash((instr.op.params[j], i))
-                params.append(p)
+                params = []
+                for j in range(len(op.params)):
+                    p = hash((op.params[j], i))
+                    params.append(p)
 
-            param_hash = hash(tuple(params))
+                param_hash = hash(tuple(params))
 
-            if instr.op.definition:
-                op_hash = hash(instr.op.definition)
-            else:
-                op_hash = hash(instr.op.name)
+                if op.definition:
+                    op_hash = hash(op.definition)
+                else:
+                    op_hash = hash(op.name)
 
-            res += hash((index_hash, param_hash, op_hash)) * (i + 1) ** 2
+                res += hash((index_hash, param_hash, op_hash)) * (i + 1) ** 2
 
-        res *= len(self.qubits) ** 2
+        version = circuit_version(self)
+        if version is not None:
+            object.__setattr__(self, "hash_state", (version, res))
+        else:
+            self.__dict__.pop("hash_state", None)
 
-        return hash(res)
+        return hash(res * len(qubits) ** 2)
 
     @classmethod
     def from_qasm_str(self, qasm_string):
@@ -1717,13 +1797,9 @@ class QuantumCircuit:
 
         """
         
-        from qiskit import QuantumCircuit
-        
-        qiskit_qc = QuantumCircuit().from_qasm_str(qasm_string)
-        
-        from qrisp import QuantumCircuit
-        
-        return QuantumCircuit.from_qiskit(qiskit_qc)
+        from qrisp.interface.converter.qasm_converter import convert_from_qasm
+
+        return convert_from_qasm(qasm_string)
     
     @classmethod
     def from_qasm_file(self, filename):
@@ -1741,13 +1817,10 @@ class QuantumCircuit:
             The corresponding QuantumCircuit.
 
         """
-        from qiskit import QuantumCircuit
-        
-        qiskit_qc = QuantumCircuit().from_qasm_file(filename)
-        
-        from qrisp import QuantumCircuit
-        
-        return QuantumCircuit.from_qiskit(qiskit_qc)
+        with open(filename, "r") as f:
+            qasm_string = f.read()
+
+        return QuantumCircuit.from_qasm_str(qasm_string)
     
 
     @classmethod
@@ -2440,3 +2513,11 @@ def convert_to_cb_list(input, circuit=None, top_level=True):
 
     return result
 
+
+def warn_formatted_deprecation():
+    import warnings
+
+    warnings.warn(
+        "DeprecationWarning: The formatted argument has no effect and will no longer "
+        "be supported in a later release of Qrisp."
+    )
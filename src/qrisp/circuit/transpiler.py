@@ -50,14 +50,10 @@ def transpile(qc, transpilation_level=np.inf, transpile_predicate=None, **kwargs
                 transpiled_qc.add_clbit(Clbit(cb.identifier))
 
         translation_dic = {
-            qc.qubits[i].identifier: transpiled_qc.qubits[i]
-            for i in range(len(qc.qubits))
+            id(qc.qubits[i]): transpiled_qc.qubits[i] for i in range(len(qc.qubits))
         }
         translation_dic.update(
-            {
-                qc.clbits[i].identifier: transpiled_qc.clbits[i]
-                for i in range(len(qc.clbits))
-            }
+            {id(qc.clbits[i]): transpiled_qc.clbits[i] for i in range(len(qc.clbits))}
         )
 
         if transpile_predicate is None:
@@ -87,57 +83,131 @@ def transpile(qc, transpilation_level=np.inf, transpile_predicate=None, **kwargs
             return qrisp_qc
 
 
+# This function appends the dissolved instructions of transpilation_qc to target_qc.
+# The translation_dic maps the ids of the Qubit/Clbit objects of transpilation_qc to
+# the Qubit/Clbit objects of target_qc.
+
+# Since the same definition circuits (for instance of adders, QFTs or mcx gates)
+# often appear many times in a circuit, the dissolved form of a definition is
+# stored as a template once it is encountered for the second time. A template is a
+# list of Instructions acting on the qubit/clbit indices of the definition circuit,
+# such that further occurrences of the definition only require remapping these
+# indices. The templates dictionary is keyed by the id of the definition and the
+# transpilation level (and also holds a reference to the definition such that the
+# id remains valid during the transpilation).
 def transpile_inner(
         transpilation_qc,
         target_qc,
         translation_dic,
         transpile_predicate,
         transpilation_level=0,
+        templates=None,
 ):
-    for i in range(len(transpilation_qc.data)):
-        instr = transpilation_qc.data[i]
-        if instr.op.definition:
-            if transpile_predicate(transpilation_level, instr.op):
-                definition = instr.op.definition
+    if templates is None:
+        templates = {}
+
+    identifier_translation_dic = None
+    target_data = target_qc.data
+
+    for instr in transpilation_qc.data:
+        try:
+            qubits = [translation_dic[id(qb)] for qb in instr.qubits]
+            clbits = [translation_dic[id(cb)] for cb in instr.clbits]
+        except KeyError:
+            # Instructions might contain (equivalent) Qubit objects which are not
+            # identical to the Qubits of the circuit. In this case we translate via
+            # the identifier.
+            if identifier_translation_dic is None:
+                identifier_translation_dic = identifier_translation(
+                    transpilation_qc, translation_dic
+                )
+            qubits = [identifier_translation_dic[qb.identifier] for qb in instr.qubits]
+            clbits = [identifier_translation_dic[cb.identifier] for cb in instr.clbits]
+
+        op = instr.op
+
+        if op.definition and transpile_predicate(transpilation_level, op):
+            definition = op.definition
+            key = (id(definition), transpilation_level + 1)
+
+            try:
+                template = templates[key][1]
+            except KeyError:
+                # First occurrence: Dissolve the definition directly
+                templates[key] = (definition, None)
 
                 new_translation_dic = {
-                    definition.qubits[j].identifier: translation_dic[
-                        instr.qubits[j].identifier
-                    ]
-                    for j in range(len(instr.qubits))
+                    id(definition.qubits[j]): qubits[j] for j in range(len(qubits))
                 }
-
                 new_translation_dic.update(
-                    {
-                        definition.clbits[j].identifier: translation_dic[
-                            instr.clbits[j].identifier
-                        ]
-                        for j in range(len(instr.clbits))
-                    }
+                    {id(definition.clbits[j]): clbits[j] for j in range(len(clbits))}
                 )
 
                 transpile_inner(
-                    instr.op.definition,
+                    definition,
                     target_qc,
                     new_translation_dic,
                     transpile_predicate,
                     transpilation_level + 1,
+                    templates,
                 )
                 continue
 
-        if not isinstance(instr.op, Operation):
-            op = Operation(init_op=instr.op)
-        else:
-            op = instr.op
+            if template is None:
+                template = create_template(
+                    definition, transpile_predicate, transpilation_level + 1, templates
+                )
+                templates[key] = (definition, template)
+
+            for template_instr in template:
+                target_data.append(
+                    Instruction(
+                        template_instr.op,
+                        [qubits[j] for j in template_instr.qubits],
+                        [clbits[j] for j in template_instr.clbits],
+                    )
+                )
+            continue
 
-        target_qc.data.append(
-            Instruction(
-                op,
-                [translation_dic[qb.identifier] for qb in instr.qubits],
-                [translation_dic[cb.identifier] for cb in instr.clbits],
-            )
-        )
-        # target_qc.append()
+        if not isinstance(op, Operation):
+            op = Operation(init_op=op)
+
+        target_data.append(Instruction(op, qubits, clbits))
+
+
+# Creates the template of a definition circuit, i.e. the dissolved definition
+# acting on the qubit/clbit indices instead of Qubit/Clbit objects.
+def create_template(definition, transpile_predicate, transpilation_level, templates):
+    from qrisp.circuit import QuantumCircuit
+
+    template_qc = QuantumCircuit()
+
+    translation_dic = {
+        id(definition.qubits[j]): j for j in range(len(definition.qubits))
+    }
+    translation_dic.update(
+        {id(definition.clbits[j]): j for j in range(len(definition.clbits))}
+    )
+
+    transpile_inner(
+        definition,
+        template_qc,
+        translation_dic,
+        transpile_predicate,
+        transpilation_level,
+        templates,
+    )
+
+    return template_qc.data
+
+
+# Creates a translation dictionary based on the identifiers of the Qubit/Clbit
+# objects of a circuit from a translation dictionary based on their ids
+def identifier_translation(qc, translation_dic):
+    res = {}
+    for b in qc.qubits + qc.clbits:
+        res[b.identifier] = translation_dic[id(b)]
+    return res
 
 
 def extend(qc_0, qc_1, translation_dic="id"):
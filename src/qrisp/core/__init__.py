@@ -23,3 +23,8 @@ from qrisp.core.quantum_session import QuantumSession
 from qrisp.core.quantum_array import QuantumArray, OutcomeArray
 from qrisp.core.quantum_dictionary import QuantumDictionary
 from qrisp.core.gate_application_functions import *
+from qrisp.core.compile_cache import (
+    enable_compile_cache,
+    disable_compile_cache,
+    get_compile_cache_info,
+)
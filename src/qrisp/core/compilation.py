@@ -16,12 +16,20 @@
 ********************************************************************************/
 """
 
+import heapq
+from collections import deque
+
 import numpy as np
-import networkx as nx
 
 from qrisp.circuit import QuantumCircuit, Operation, Qubit, PTControlledOperation, ControlledOperation, transpile, Instruction, fast_append, RXGate, RYGate, RZGate, PGate, GPhaseGate
-from qrisp.misc import get_depth_dic, retarget_instructions
+from qrisp.misc import (
+    get_depth_dic,
+    get_depth_signature,
+    apply_depth_signature,
+    retarget_instructions,
+)
 from qrisp.permeability import optimize_allocations, parallelize_qc, lightcone_reduction
+from qrisp.permeability.permeability_dag import csr_topological_sort
 
 # The purpose of this function is to dynamically (de)allocate qubits when they are
 # needed or not needed anymore. The qompiler function knows when a qubit is ready to
@@ -51,6 +59,47 @@ def qompiler(
     compile_mcm=False,
     gate_speed = None,
     use_dirty_anc_for_mcx_recomp=True
+):
+    from qrisp.core.compile_cache import (
+        compile_cache_active,
+        compilation_key,
+        get_compiled_qc,
+        insert_compiled_qc,
+    )
+    
+    compilation_args = (
+        workspace,
+        disable_uncomputation,
+        intended_measurements,
+        cancel_qfts,
+        compile_mcm,
+        gate_speed,
+        use_dirty_anc_for_mcx_recomp,
+    )
+    
+    # If the compile cache is enabled, we look up whether a session with the same
+    # structure has already been compiled with the same arguments
+    if compile_cache_active(disable_uncomputation):
+        key = compilation_key(qs, *compilation_args)
+        if key is not None:
+            qc = get_compiled_qc(key, qs)
+            if qc is None:
+                qc = uncached_qompiler(qs, *compilation_args)
+                insert_compiled_qc(key, qc, qs)
+            return qc
+    
+    return uncached_qompiler(qs, *compilation_args)
+
+
+def uncached_qompiler(
+    qs,
+    workspace=0,
+    disable_uncomputation=True,
+    intended_measurements=[],
+    cancel_qfts=True,
+    compile_mcm=False,
+    gate_speed = None,
+    use_dirty_anc_for_mcx_recomp=True
 ):
     if len(qs.data) == 0:
         return QuantumCircuit(0)
@@ -228,10 +277,13 @@ def qompiler(
         # the compiled circuit
         translation_dic = {}
 
-        # This list contains the Qubits which are currently not allocated
-        free_qb_list = list(qc.qubits)
-
-        allocated_qb_list = []
+        # This heap contains the Qubits which are currently not allocated. To pick a
+        # good allocation, the heap is keyed by the depth of the corresponding Qubit.
+        # Note that we add the identifier in order to prevent non-deterministic
+        # behavior. The depth of a free Qubit doesn't change until it is allocated
+        # again, so the key is determined once when the Qubit is pushed.
+        free_qb_heap = [(0, qb.identifier, qb) for qb in qc.qubits]
+        heapq.heapify(free_qb_heap)
 
         # This list contains the clbits used for mcm mcx compilation
         mcm_clbits = []
@@ -239,11 +291,11 @@ def qompiler(
         depth_dic = {b: 0 for b in qc.qubits + qc.clbits}
         
         # We now iterate through the data of the preprocessed QuantumCircuit
-        data_list = list(reordered_qc.data)
+        data_list = deque(reordered_qc.data)
         
         while data_list:
             
-            instr = data_list.pop(0)
+            instr = data_list.popleft()
             
             if instr.op.name == "barrier":
                 continue
@@ -251,23 +303,16 @@ def qompiler(
             # Check if any of the involved qubits need an allocation
             for qb in instr.qubits:
                 if qb not in translation_dic:
-                    # To pick a good allocation, we determine the depth dic and sort the
-                    # available Qubits by their corresponding depth. Note that we add
-                    # the identifier in order to prevent non-deterministic behavior
-                    
-                    alloc_cost = lambda x: (str(depth_dic[x]).zfill(20) + x.identifier)
-                    
-                    free_qb_list.sort(key = alloc_cost)
-                    
-                    translation_dic[qb] = free_qb_list.pop(0)
-
-                    allocated_qb_list.append(qb)
+                    # Allocate the free Qubit with the least depth
+                    translation_dic[qb] = heapq.heappop(free_qb_heap)[2]
 
             if instr.op.name == "qb_dealloc":
                 # For the deallocation, we simply remove the qubits from the translation
-                # dict and append it to the free_qb_list
-                free_qb_list.append(translation_dic[instr.qubits[0]])
-                allocated_qb_list.remove(instr.qubits[0])
+                # dict and push it to the free_qb_heap
+                free_qb = translation_dic[instr.qubits[0]]
+                heapq.heappush(
+                    free_qb_heap, (depth_dic[free_qb], free_qb.identifier, free_qb)
+                )
 
                 qc.append(
                     instr.op, [translation_dic[qb] for qb in instr.qubits], instr.clbits
@@ -290,7 +335,7 @@ def qompiler(
                 # mcx gate with an implementation that is better fit to suit the amount
                 # of available ancillae. We first determine the free ancillae
 
-                clean_ancillae = list(free_qb_list)
+                clean_ancillae = [entry[2] for entry in free_qb_heap]
                 clean_ancillae.sort(
                     key=lambda x: depth_dic[x] + qc.qubits.index(x) * 1e-5
                 )
@@ -319,7 +364,7 @@ def qompiler(
                         use_mcm = (compile_mcm != None)
                     )
                     
-                    data_list = compiled_mcx_data + data_list
+                    data_list.extendleft(reversed(compiled_mcx_data))
                     continue
     
                     # We now append the data
@@ -586,20 +631,17 @@ def combine_single_qubit_gates(qc):
 def update_depth_dic(instruction, depth_dic, depth_indicator = None):
     
     if depth_indicator is None:
-        depth_indicator = lambda x : 1
+        depth_indicator = unit_depth_indicator
     
+    # Operations with a definition are treated via their (cached) depth signature,
+    # which describes the depth of the transpiled Operation
     if instruction.op.definition:
-        qc = QuantumCircuit()
-        qc.qubits = instruction.qubits
-        qc.clbits = instruction.clbits
-        qc.append(instruction)
-        instr_list = qc.transpile().data
-    else:
-        instr_list = [instruction]
-
-    # Assign each bit in the circuit a unique integer
-    # to index into op_stack.
-    # If no bits, return 0
+        bits = instruction.qubits + instruction.clbits
+        signature = get_depth_signature(instruction.op, depth_indicator)
+        levels = apply_depth_signature(signature, [depth_dic[b] for b in bits])
+        for b, level in zip(bits, levels):
+            depth_dic[b] = level
+        return
 
     # Here we are playing a modified version of
     # Tetris where we stack gates, but multi-qubit
@@ -612,24 +654,22 @@ def update_depth_dic(instruction, depth_dic, depth_indicator = None):
     # They are transpiler and simulator directives.
     # The max stack height is the circuit depth.
 
-    for instr in instr_list:
-        if instr.op.name in ["qb_alloc", "qb_dealloc", "gphase"]:
-            continue
-        qargs = instr.qubits
-        cargs = instr.clbits
+    if instruction.op.name in ["qb_alloc", "qb_dealloc", "gphase"]:
+        return
+    
+    qargs = instruction.qubits
+    cargs = instruction.clbits
 
-        levels = []
-        # If count then add one to stack heights
+    max_level = max([depth_dic[b] for b in qargs + cargs]) + depth_indicator(
+        instruction.op
+    )
 
-        for b in qargs + cargs:
-            # Add to the stacks of the qubits and
-            # cbits used in the gate.
-            levels.append(depth_dic[b] + depth_indicator(instr.op))
+    for b in qargs + cargs:
+        depth_dic[b] = max_level
 
-        max_level = max(levels)
 
-        for b in qargs + cargs:
-            depth_dic[b] = max_level
+def unit_depth_indicator(op):
+    return 1
 
 
 # REWORK required: Instead of detecting a QFT by the gate name, a much more robust
@@ -852,61 +892,82 @@ def fuse_operations(op_a, op_b, gphase_array):
         
     return None
 
+# Cancels/fuses adjacent instructions, which are inverse to each other (or can be
+# combined into a single instruction). For this we build up the DAG of the circuit,
+# where the nodes are represented by integers (the index of the instruction or -i-1
+# for the initialization of the i-th qubit). The DAG is stored in the dictionary
+# pred_dic, which maps each node to a dictionary {predecessor : [qubits]} describing
+# the incoming edges.
 def cancel_inverses(qc):
-    G = nx.DiGraph()
     qubit_dic = {}
-    edge_dic = {}
+    pred_dic = {}
     
     gphase_array = [0]
     for i in range(qc.num_qubits()):
         qubit_dic[qc.qubits[i]] = -i - 1
-        G.add_node(-i-1)
+        pred_dic[-i-1] = {}
     
     data_list = list(qc.data)
     for i in range(len(data_list)):
         
-        G.add_node(i)
         instr = data_list[i]
         
-        predecessors = set()
+        in_edges = {}
+        pred_dic[i] = in_edges
+        
         for qb in instr.qubits:
             
-            predecessors.add(qubit_dic[qb])
+            pred = qubit_dic[qb]
             
-            if not G.has_edge(qubit_dic[qb], i):
-                G.add_edge(qubit_dic[qb], i)
-                edge_dic[(qubit_dic[qb], i)] = []
+            if pred in in_edges:
+                in_edges[pred].append(qb)
+            else:
+                in_edges[pred] = [qb]
             
-            edge_dic[(qubit_dic[qb], i)].append(qb)
             qubit_dic[qb] = i
         
-        predecessors = list(predecessors)
-        
-        if len(predecessors) == 1:
-            pred = predecessors[0]
+        if len(in_edges) == 1:
+            pred = next(iter(in_edges))
             if pred < 0:
                 continue
             fused_gate = fuse_instructions(data_list[pred], data_list[i], gphase_array)
             if fused_gate is not None:
                 if fused_gate == 1:
-                    for edge in G.in_edges(pred):
-                        for qb in edge_dic[edge]:
-                            qubit_dic[qb] = edge[0]
-                        del edge_dic[edge]
-                    G.remove_node(pred)
+                    for source, qubits in pred_dic[pred].items():
+                        for qb in qubits:
+                            qubit_dic[qb] = source
+                    del pred_dic[pred]
                 else:
                     data_list[pred] = fused_gate
                     
-                    for edge in G.in_edges(i):
-                        for qb in edge_dic[edge]:
-                            qubit_dic[qb] = edge[0]
-                        del edge_dic[edge]
+                    for qb in in_edges[pred]:
+                        qubit_dic[qb] = pred
                     
-                G.remove_node(i)
+                del pred_dic[i]
     
     qc_new = qc.clearcopy()
     
-    topo_sort = list(nx.topological_sort(G))
+    # Convert the DAG into the CSR format (with sorted successors) and
+    # perform the topological sort
+    node_ids = list(pred_dic.keys())
+    node_positions = {node_ids[j] : j for j in range(len(node_ids))}
+    
+    sources = []
+    targets = []
+    for j in range(len(node_ids)):
+        for source in pred_dic[node_ids[j]]:
+            if source in node_positions:
+                sources.append(node_positions[source])
+                targets.append(j)
+    
+    sources = np.array(sources, dtype = np.int32)
+    targets = np.array(targets, dtype = np.int32)
+    order = np.lexsort((targets, sources))
+    indptr = np.zeros(len(node_ids) + 1, dtype = np.int32)
+    np.cumsum(np.bincount(sources, minlength = len(node_ids)), out = indptr[1:])
+    
+    topo_sort = [node_ids[j] for j in csr_topological_sort(indptr, targets[order])]
+    
     with fast_append(3):
         for i in topo_sort:
             if i < 0:
@@ -0,0 +1,300 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+from collections import OrderedDict
+
+from qrisp.circuit import Clbit, Instruction, QuantumCircuit, Qubit
+from qrisp.circuit.circuit_structure import circuit_structure
+from qrisp.circuit.modification_tracking import TrackedDataList
+
+# This module contains the cache for compiled QuantumSessions. If the cache is
+# enabled, the result of the qompiler is stored, such that compiling the same
+# QuantumSession again (for instance for several measurements or for resource
+# estimation of a session that is built repeatedly) returns a copy of the cached
+# circuit instead of running the compilation pipeline another time.
+# The cache is content addressed, i.e. it is keyed on the structure of the session
+# together with the compilation keyword arguments. This implies that
+# two separately constructed but identical sessions share the cached circuit.
+# The cache uses a least recently used eviction strategy, bounded by the amount
+# of cached circuits.
+
+
+class CompileCache:
+    def __init__(self, max_size):
+        # The maximum amount of cached circuits
+        self.max_size = max_size
+
+        self.circuits = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            entry = self.circuits[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.circuits.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def insert(self, key, entry):
+        if key in self.circuits:
+            del self.circuits[key]
+
+        self.circuits[key] = entry
+
+        # Evict the least recently used circuits
+        while len(self.circuits) > self.max_size:
+            self.circuits.popitem(last=False)
+
+    def clear(self):
+        self.circuits.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# The compile cache (None if the cache is disabled)
+compile_cache = None
+
+
+def enable_compile_cache(max_size=128):
+    """
+    Enables the cache for compiled QuantumSessions.
+
+    If the cache is enabled, the result of
+    :meth:`compile <qrisp.QuantumSession.compile>` is stored together with the
+    structure of the QuantumSession and the compilation keyword arguments.
+    Compiling a session with the same structure and the same arguments again
+    returns a copy of the cached :ref:`QuantumCircuit`. Note that the
+    ``gate_speed`` function is compared by identity. If the amount of cached
+    circuits exceeds ``max_size``, the least recently used circuits are evicted.
+
+    Compilations with ``disable_uncomputation = False`` are not cached.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        The maximum amount of cached circuits. The default is 128.
+
+    Examples
+    --------
+
+    >>> from qrisp import QuantumFloat, h, cx
+    >>> from qrisp import enable_compile_cache, disable_compile_cache
+    >>> from qrisp import get_compile_cache_info
+    >>> enable_compile_cache()
+    >>> a = QuantumFloat(3)
+    >>> b = QuantumFloat(3)
+    >>> h(a)
+    >>> cx(a, b)
+    >>> qc_0 = a.qs.compile()
+    >>> qc_1 = a.qs.compile()
+    >>> get_compile_cache_info()
+    {'hits': 1, 'misses': 1, 'cached_circuits': 1}
+    >>> disable_compile_cache()
+
+    """
+    global compile_cache
+    compile_cache = CompileCache(max_size)
+
+
+def disable_compile_cache():
+    """
+    Disables (and clears) the cache for compiled QuantumSessions.
+    """
+    global compile_cache
+    compile_cache = None
+
+
+def get_compile_cache_info():
+    """
+    Returns the statistics of the cache for compiled QuantumSessions.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the amount of cache hits and misses and the amount
+        of cached circuits. If the cache is disabled, None is returned.
+
+    """
+    if compile_cache is None:
+        return None
+
+    return {
+        "hits": compile_cache.hits,
+        "misses": compile_cache.misses,
+        "cached_circuits": len(compile_cache.circuits),
+    }
+
+
+# Determines whether the compile cache is used for the given compilation
+def compile_cache_active(disable_uncomputation):
+    return compile_cache is not None and disable_uncomputation
+
+
+# Returns the key of a compilation for the compile cache. The key contains the
+# structure of the session data, in which the qubits and clbits are identified by
+# their position. Together with the identifiers of the qubits and clbits,
+# identically constructed sessions therefore receive the same key. Since the
+# structure is compared on every lookup, sessions with colliding hashes are never
+# confused. If the key can not be determined (for instance because of traced
+# parameters), None is returned.
+def compilation_key(qs, *compilation_args):
+    if not all(isinstance(instr, Instruction) for instr in qs.data):
+        return None
+
+    try:
+        structure = circuit_structure(qs)
+    except TypeError:
+        return None
+
+    qubit_identifiers = tuple([qb.identifier for qb in qs.qubits])
+    clbit_identifiers = tuple([cb.identifier for cb in qs.clbits])
+
+    qv_structure = tuple(
+        [(qv.name, tuple([qb.identifier for qb in qv.reg])) for qv in qs.qv_list]
+    )
+
+    args = []
+    for arg in compilation_args:
+        if isinstance(arg, list):
+            arg = tuple([getattr(qb, "identifier", qb) for qb in arg])
+        args.append(arg)
+
+    key = (
+        structure,
+        qubit_identifiers,
+        clbit_identifiers,
+        qv_structure,
+        tuple(args),
+    )
+
+    try:
+        hash(key)
+    except TypeError:
+        return None
+
+    return key
+
+
+# Returns the cached compilation result of the given key (retargeted to the qubits of
+# the given session) or None if the key is not cached.
+def get_compiled_qc(key, qs):
+    entry = compile_cache.get(key)
+    if entry is None:
+        return None
+    return retarget_compiled_qc(entry, qs)
+
+
+# Returns copies of the given Operations. Operations which appear several times are
+# copied only once, such that the copies are shared the same way.
+def copy_operations(ops):
+    copies = {}
+    res = []
+    for op in ops:
+        try:
+            res.append(copies[id(op)])
+        except KeyError:
+            op_copy = op.copy()
+            copies[id(op)] = op_copy
+            res.append(op_copy)
+    return res
+
+
+# Stores a compilation result in the cache. The circuit is stored in terms of qubit
+# and clbit indices and the Operations are copied, such that modifications of the
+# returned circuits do not affect the cache.
+def insert_compiled_qc(key, qc, qs):
+    session_qubit_positions = {qb: i for i, qb in enumerate(qs.qubits)}
+    session_clbit_positions = {cb: i for i, cb in enumerate(qs.clbits)}
+
+    # For each qubit/clbit of the compiled circuit we store the identifier and the
+    # position of the corresponding session qubit/clbit (None for workspace qubits or
+    # clbits that have been added during the compilation)
+    qubit_info = [(qb.identifier, session_qubit_positions.get(qb)) for qb in qc.qubits]
+    clbit_info = [(cb.identifier, session_clbit_positions.get(cb)) for cb in qc.clbits]
+
+    qubit_indices = {qb: i for i, qb in enumerate(qc.qubits)}
+    clbit_indices = {cb: i for i, cb in enumerate(qc.clbits)}
+
+    ops = copy_operations([instr.op for instr in qc.data])
+
+    instructions = [
+        (
+            ops[i],
+            [qubit_indices[qb] for qb in instr.qubits],
+            [clbit_indices[cb] for cb in instr.clbits],
+        )
+        for i, instr in enumerate(qc.data)
+    ]
+
+    entry = (qubit_info, clbit_info, instructions, set(qc.abstract_params))
+
+    compile_cache.insert(key, entry)
+
+
+# Creates a QuantumCircuit from a cache entry. The circuit acts on fresh Qubit
+# objects. Qubits which represent a session qubit receive the hash value of that
+# qubit (as the qompiler does), such that the compiled circuit can be addressed with
+# the qubits of the session. Clbits of the session are reused. The circuit contains
+# copies of the cached Operations.
+def retarget_compiled_qc(entry, qs):
+    qubit_info, clbit_info, instructions, abstract_params = entry
+
+    qubits = []
+    for identifier, pos in qubit_info:
+        qb = Qubit(identifier)
+        if pos is not None:
+            qb.hash_value = qs.qubits[pos].hash_value
+        qubits.append(qb)
+
+    clbits = []
+    for identifier, pos in clbit_info:
+        if pos is None:
+            clbits.append(Clbit(identifier))
+        else:
+            clbits.append(qs.clbits[pos])
+
+    ops = copy_operations([instr[0] for instr in instructions])
+
+    res = QuantumCircuit()
+
+    object.__setattr__(res, "qubits", TrackedDataList(qubits))
+    object.__setattr__(res, "clbits", TrackedDataList(clbits))
+    object.__setattr__(
+        res,
+        "data",
+        TrackedDataList(
+            [
+                Instruction(
+                    op,
+                    [qubits[i] for i in qubit_indices],
+                    [clbits[i] for i in clbit_indices],
+                )
+                for op, (_, qubit_indices, clbit_indices) in zip(ops, instructions)
+            ]
+        ),
+    )
+
+    res.abstract_params = set(abstract_params)
+
+    return res
@@ -618,35 +618,178 @@ class QuantumArray:
         # Copy circuit in over to prevent modification
         # from qrisp.quantum_network import QuantumNetworkClient
 
+        # If the circuit is only evaluated for different parameters on the default
+        # simulator, the preprocessing of the simulator can be reused
+        from qrisp.default_backend import DefaultBackend
+
+        if (
+            precompiled_qc is not None
+            and subs_dic
+            and circuit_preprocessor is None
+            and isinstance(backend, DefaultBackend)
+        ):
+            from qrisp.simulator.parametric_simulation import get_parametric_measurement
+
+            counts = get_parametric_measurement(precompiled_qc, qubits, subs_dic, shots)
+
+        else:
+            if precompiled_qc is None:
+                if compile:
+                    from qrisp.simulator.state_cache import state_cache_active
+
+                    if state_cache_active(backend):
+                        qc = qompiler(self.qs, **compilation_kwargs)
+                    else:
+                        qc = qompiler(
+                            self.qs, intended_measurements=qubits, **compilation_kwargs
+                        )
+                else:
+                    qc = self.qs.copy()
+
+                # Transpile circuit
+                qc = transpile(qc)
+            else:
+                qc = precompiled_qc.copy()
+
+            # Bind parameters
+            if subs_dic:
+                qc = qc.bind_parameters(subs_dic)
+                from qrisp.core.compilation import combine_single_qubit_gates
+
+                qc = combine_single_qubit_gates(qc)
+
+            # Execute user specified circuit_preprocessor
+            if circuit_preprocessor is not None:
+                qc = circuit_preprocessor(qc)
+
+            from qrisp.misc import get_measurement_from_qc
+        
+            counts = get_measurement_from_qc(qc, qubits, backend, shots)
+
+        # Insert outcome labels (if available and hashable)
+        return self.decode_counts(counts)
+
+    def get_measurement_batch(
+        self,
+        subs_dic_list,
+        backend=None,
+        shots=None,
+        compile=True,
+        compilation_kwargs={},
+        circuit_preprocessor=None,
+        precompiled_qc=None,
+    ):
+        """
+        Method to acquire the measurement results for a list of parameter
+        specifications. The semantics are similar to the :meth:`get_measurement_batch
+        <qrisp.QuantumVariable.get_measurement_batch>` method of QuantumVariable.
+
+        Parameters
+        ----------
+        subs_dic_list : list[dict]
+            A list of dictionaries of sympy symbols and floats to specify the abstract
+            parameters.
+        backend : BackendClient, optional
+            The backend on which to evaluate the quantum circuit. The default can be
+            specified in the file default_backend.py.
+        shots : integer, optional
+            The amount of shots to evaluate the circuit. The default is given by
+            the backend used.
+        compile : bool, optional
+            Boolean indicating if the .compile method of the underlying QuantumSession
+            should be called before. The default is True.
+        compilation_kwargs  : dict, optional
+            Keyword arguments for the compile method. For more details check
+            :meth:`QuantumSession.compile <qrisp.QuantumSession.compile>`.
+            The default is ``{}``.
+        circuit_preprocessor : Python function, optional
+            A function which recieves a QuantumCircuit and returns one, which is applied
+            after compilation and parameter substitution. The default is None.
+        precompiled_qc : QuantumCircuit, optional
+            A precompiled QuantumCircuit containing the abstract parameters. The default
+            is None.
+
+        Returns
+        -------
+        list[dict]
+            A list of the measurement results in the order of ``subs_dic_list``.
+
+        """
+
+        if check_for_tracing_mode():
+            raise Exception(
+                "Tried to get_measurement from QuantumArray in tracing mode"
+            )
+
+        if backend is None:
+            if self.qs.backend is None:
+                from qrisp.default_backend import def_backend
+
+                backend = def_backend
+            else:
+                backend = self.qs.backend
+
+        if len(self.qs.env_stack) != 0:
+            raise Exception("Tried to get measurement within open environment")
+
+        qubits = sum([qv.reg for qv in self.flatten()[::-1]], [])
+
         if precompiled_qc is None:
             if compile:
-                qc = qompiler(
+                precompiled_qc = qompiler(
                     self.qs, intended_measurements=qubits, **compilation_kwargs
                 )
             else:
-                qc = self.qs.copy()
+                precompiled_qc = self.qs.copy()
 
             # Transpile circuit
-            qc = transpile(qc)
-        else:
-            qc = precompiled_qc.copy()
+            precompiled_qc = transpile(precompiled_qc)
+
+        from qrisp.default_backend import DefaultBackend
+
+        if circuit_preprocessor is None and isinstance(backend, DefaultBackend):
+            from qrisp.simulator.parametric_simulation import (
+                get_parametric_measurement_batch,
+            )
 
-        # Bind parameters
-        if subs_dic:
-            qc = qc.bind_parameters(subs_dic)
-            from qrisp.core.compilation import combine_single_qubit_gates
+            counts_list = get_parametric_measurement_batch(
+                precompiled_qc, qubits, subs_dic_list, shots
+            )
 
-            qc = combine_single_qubit_gates(qc)
+            return [self.decode_counts(counts) for counts in counts_list]
 
-        # Execute user specified circuit_preprocessor
-        if circuit_preprocessor is not None:
-            qc = circuit_preprocessor(qc)
+        # The circuits of all parameter specifications are executed as a single batch
+        from qrisp.misc import get_parametric_measurements_from_qc
 
-        from qrisp.misc import get_measurement_from_qc
-        
-        counts = get_measurement_from_qc(qc, qubits, backend, shots)
+        counts_list = get_parametric_measurements_from_qc(
+            precompiled_qc,
+            qubits,
+            subs_dic_list,
+            backend,
+            shots,
+            circuit_preprocessor,
+        )
+
+        return [self.decode_counts(counts) for counts in counts_list]
+
+    def decode_counts(self, counts):
+        """
+        Turns a dictionary of measured integers (as returned by a backend) into a
+        dictionary of OutcomeArrays (using the :meth:`decoder
+        <qrisp.QuantumArray.decoder>`) sorted by probability.
+
+        Parameters
+        ----------
+        counts : dict
+            A dictionary of integers and their measurement probabilities.
+
+        Returns
+        -------
+        dict
+            The dictionary of OutcomeArrays and their measurement probabilities.
+
+        """
 
-        # Insert outcome labels (if available and hashable)
         new_counts_dic = {}
         for key in counts.keys():
             outcome_label = self.decoder(key)
@@ -317,7 +317,7 @@ class QuantumSession(QuantumCircuit):
             pass
             # self.reset(qubits)
             
-        if not set(qubits).issubset(set(self.qubits)):
+        if not self.get_qubit_membership().issuperset(qubits):
             raise Exception(
                 "Tried to free up qubits not registered in this quantum session"
             )
@@ -987,41 +987,226 @@ class QuantumVariable:
         if self.size == 0:
             return {"": 1.0}
 
+        # If the circuit is only evaluated for different parameters on the default
+        # simulator, the preprocessing of the simulator can be reused
+        from qrisp.default_backend import DefaultBackend
+
+        if (
+            precompiled_qc is not None
+            and subs_dic
+            and circuit_preprocessor is None
+            and isinstance(backend, DefaultBackend)
+        ):
+            from qrisp.simulator.parametric_simulation import get_parametric_measurement
+
+            counts = get_parametric_measurement(
+                precompiled_qc, self.reg, subs_dic, shots
+            )
+
+        else:
+            if precompiled_qc is None:
+                if compile:
+                    from qrisp.simulator.state_cache import state_cache_active
+
+                    # If the state cache is enabled, the whole session is compiled
+                    # (instead of the light cone of the measured qubits), such that
+                    # the simulated state can be reused for other measurements
+                    if state_cache_active(backend):
+                        qc = qompiler(self.qs, **compilation_kwargs)
+                    else:
+                        qc = qompiler(
+                            self.qs,
+                            intended_measurements=self.reg,
+                            **compilation_kwargs,
+                        )
+                else:
+                    qc = self.qs.copy()
+            else:
+                qc = precompiled_qc.copy()
+
+            # Bind parameters
+            if subs_dic:
+                qc = qc.bind_parameters(subs_dic)
+                from qrisp.core.compilation import combine_single_qubit_gates
+
+                qc = combine_single_qubit_gates(qc)
+
+            # Copy circuit in over to prevent modification
+            # from qrisp.quantum_network import QuantumNetworkClient
+
+            # if isinstance(backend, QuantumNetworkClient):
+            #     self.qs.data = []
+            #     shots = 1
+
+            # Execute user specified circuit_preprocessor
+            if circuit_preprocessor is not None:
+                qc = circuit_preprocessor(qc)
+
+            qc = qc.transpile()
+
+            from qrisp.misc import get_measurement_from_qc
+
+            counts = get_measurement_from_qc(qc, self.reg, backend, shots)
+
+        # Insert outcome labels (if available and hashable)
+        counts = self.decode_counts(counts)
+
+        if plot:
+            outcome_labels = []
+            for i in range(2**self.size):
+                temp = self.decoder(i)
+
+                try:
+                    hash(temp)
+                except TypeError:
+                    raise Exception(
+                        "Outcome value " + str(self.decoder(i)) + " is not hashable"
+                    )
+
+                outcome_labels.append(temp)
+
+            plot_histogram(outcome_labels, counts, filename)
+            plt.show()
+
+        # Return dictionary of measurement results
+        return counts
+    
+    def get_measurement_batch(
+        self,
+        subs_dic_list,
+        backend=None,
+        shots=None,
+        compile=True,
+        compilation_kwargs={},
+        circuit_preprocessor=None,
+        precompiled_qc=None,
+    ):
+        r"""
+        Method to acquire the measurement results for a list of parameter
+        specifications. This is useful for variational algorithms, where many parameter
+        values can be evaluated independently (for instance for gradient free
+        optimizers or parameter initialization heuristics).
+
+        The circuit is compiled only once. If the default simulator is used, the
+        statevectors of all parameter specifications are evolved simultaneously.
+        Otherwise, the circuits are submitted to the backend as a single batch.
+
+        Parameters
+        ----------
+        subs_dic_list : list[dict]
+            A list of dictionaries of Sympy symbols and floats to specify the
+            :ref:`abstract parameters<QuantumCircuit>`.
+        backend : BackendClient, optional
+            The backend on which to evaluate the quantum circuit. The default can be
+            specified in the file default_backend.py.
+        shots : integer, optional
+            The amount of shots to evaluate the circuit. The default is given by
+            the backend it runs on.
+        compile : bool, optional
+            Boolean indicating if the .compile method of the underlying QuantumSession
+            should be called before. The default is True.
+        compilation_kwargs  : dict, optional
+            Keyword arguments for the compile method. For more details check
+            :meth:`QuantumSession.compile <qrisp.QuantumSession.compile>`. The default
+            is ``{}``.
+        circuit_preprocessor : Python function, optional
+            A function which recieves a QuantumCircuit and returns one, which is applied
+            after compilation and parameter substitution. The default is None.
+        precompiled_qc : QuantumCircuit, optional
+            A precompiled QuantumCircuit containing the abstract parameters. The default
+            is None.
+
+        Returns
+        -------
+        list[dict]
+            A list of the measurement results in the order of ``subs_dic_list``.
+
+        Examples
+        --------
+
+        >>> from sympy import Symbol
+        >>> from qrisp import QuantumFloat, ry
+        >>> import numpy as np
+        >>> phi = Symbol("phi")
+        >>> qf = QuantumFloat(1)
+        >>> ry(phi, qf)
+        >>> qf.get_measurement_batch([{phi : 0}, {phi : np.pi}])
+        [{0: 1.0}, {1: 1.0}]
+        """
+
+        if backend is None:
+            if self.qs.backend is None:
+                from qrisp.default_backend import def_backend
+
+                backend = def_backend
+            else:
+                backend = self.qs.backend
+
+        if len(self.qs.env_stack) != 0:
+            raise Exception("Tried to get measurement within open environment")
+
+        if self.is_deleted():
+            raise Exception("Tried to get measurement from deleted QuantumVariable")
+
         if precompiled_qc is None:
             if compile:
-                qc = qompiler(
+                precompiled_qc = qompiler(
                     self.qs, intended_measurements=self.reg, **compilation_kwargs
                 )
             else:
-                qc = self.qs.copy()
-        else:
-            qc = precompiled_qc.copy()
+                precompiled_qc = self.qs.copy()
 
-        # Bind parameters
-        if subs_dic:
-            qc = qc.bind_parameters(subs_dic)
-            from qrisp.core.compilation import combine_single_qubit_gates
+        from qrisp.default_backend import DefaultBackend
 
-            qc = combine_single_qubit_gates(qc)
+        if (
+            circuit_preprocessor is None
+            and isinstance(backend, DefaultBackend)
+            and self.size != 0
+        ):
+            from qrisp.simulator.parametric_simulation import (
+                get_parametric_measurement_batch,
+            )
 
-        # Copy circuit in over to prevent modification
-        # from qrisp.quantum_network import QuantumNetworkClient
+            counts_list = get_parametric_measurement_batch(
+                precompiled_qc, self.reg, subs_dic_list, shots
+            )
 
-        # if isinstance(backend, QuantumNetworkClient):
-        #     self.qs.data = []
-        #     shots = 1
+            return [self.decode_counts(counts) for counts in counts_list]
 
-        # Execute user specified circuit_preprocessor
-        if circuit_preprocessor is not None:
-            qc = circuit_preprocessor(qc)
+        if self.size == 0:
+            return [{"": 1.0} for subs_dic in subs_dic_list]
 
-        qc = qc.transpile()
+        # The circuits of all parameter specifications are executed as a single batch
+        from qrisp.misc import get_parametric_measurements_from_qc
 
-        from qrisp.misc import get_measurement_from_qc
+        counts_list = get_parametric_measurements_from_qc(
+            precompiled_qc,
+            self.reg,
+            subs_dic_list,
+            backend,
+            shots,
+            circuit_preprocessor,
+        )
 
-        counts = get_measurement_from_qc(qc, self.reg, backend, shots)
+        return [self.decode_counts(counts) for counts in counts_list]
 
-        # Insert outcome labels (if available and hashable)
+    def decode_counts(self, counts):
+        """
+        Turns a dictionary of measured integers (as returned by a backend) into a
+        dictionary of outcome labels (using the :meth:`decoder
+        <qrisp.QuantumVariable.decoder>`) sorted by probability.
+
+        Parameters
+        ----------
+        counts : dict
+            A dictionary of integers and their measurement probabilities.
+
+        Returns
+        -------
+        dict
+            The dictionary of outcome labels and their measurement probabilities.
+
+        """
         try:
             new_counts_dic = {}
 
@@ -1048,26 +1233,8 @@ class QuantumVariable:
 
             counts.sorted(key=lambda x: x[1])
 
-        if plot:
-            outcome_labels = []
-            for i in range(2**self.size):
-                temp = self.decoder(i)
-
-                try:
-                    hash(temp)
-                except TypeError:
-                    raise Exception(
-                        "Outcome value " + str(self.decoder(i)) + " is not hashable"
-                    )
-
-                outcome_labels.append(temp)
-
-            plot_histogram(outcome_labels, counts, filename)
-            plt.show()
-
-        # Return dictionary of measurement results
         return counts
-    
+
     def most_likely(self, **kwargs):
         """
         Performs a measurement and returns the most likely outcome.
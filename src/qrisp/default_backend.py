@@ -18,7 +18,7 @@
 
 
 from qrisp.interface import VirtualBackend, QiskitBackend
-from qrisp.simulator.simulator import run
+from qrisp.simulator.simulator import run, run_batch
 from qrisp import QuantumCircuit
 
 
@@ -26,5 +26,14 @@ class DefaultBackend:
     def run(self, qc, shots=None, token=""):
         return run(qc, shots, token)
 
+    # The simulator lives in the same process and therefore receives the circuit
+    # object directly
+    def run_circuit(self, qc, shots=None, token=""):
+        return run(qc, shots, token)
+
+    # Simulates a list of (QuantumCircuit, shots) tuples in a worker pool
+    def run_batch(self, batch, token=""):
+        return run_batch(batch, token)
+
 
 def_backend = DefaultBackend()
@@ -18,6 +18,7 @@
 
 from qrisp.interface.qunicorn import *
 from qrisp.interface.virtual_backend import *
+from qrisp.interface.clifford_backend import *
 from qrisp.interface.converter import *
 from qrisp.interface.docker_backends import *
 from qrisp.interface.provider_backends import *
\ No newline at end of file
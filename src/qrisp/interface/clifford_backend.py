@@ -0,0 +1,67 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+from qrisp.interface.virtual_backend import VirtualBackend
+
+
+class CliffordBackend(VirtualBackend):
+    """
+    This class provides a backend, which executes Clifford circuits using the 
+    stabilizer tableau simulator of Qrisp (``qrisp.simulator.CliffordTableau``).
+    The shots are sampled at once by propagating Pauli frames through the 
+    circuit, which allows the sampling of circuits with thousands of qubits.
+    
+    Besides the usual Clifford gates, every (at most two qubit) gate with a 
+    Clifford unitary and every composite gate that decomposes into Clifford gates
+    is supported. Circuits containing other gates raise an Exception.
+
+    Parameters
+    ----------
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The seed or random number generator for the sampling. The default is 
+        None, which uses the global numpy random state.
+    port : int, optional
+        The port on which to listen. The default is None.
+
+    Examples
+    --------
+
+    We sample a GHZ state of 1000 qubits:
+
+    >>> from qrisp import QuantumVariable, h, cx
+    >>> from qrisp.interface import CliffordBackend
+    >>> qv = QuantumVariable(1000)
+    >>> h(qv[0])
+    >>> for i in range(1, 1000): cx(qv[0], qv[i])
+    >>> res = qv.get_measurement(backend = CliffordBackend(), shots = 1000)
+    >>> sorted(res.keys()) == ["0"*1000, "1"*1000]
+    True
+
+    """
+
+    def __init__(self, rng = None, port = None):
+        
+        from qrisp.simulator import get_rng, run_clifford
+        
+        rng = get_rng(rng)
+        
+        def run_circuit(qc, shots = None, token = ""):
+            return run_clifford(qc, shots, token, rng = rng)
+        
+        super().__init__(port = port, circuit_run_func = run_circuit)
@@ -20,3 +20,8 @@ from qrisp.interface.converter.qiskit_converter import *
 from qrisp.interface.converter.pytket_converter import *
 from qrisp.interface.converter.pennylane_converter import *
 from qrisp.interface.converter.qulacs_converter import *
+from qrisp.interface.converter.qasm_converter import (
+    Qasm2ExportError,
+    convert_from_qasm,
+    convert_to_qasm,
+)
@@ -0,0 +1,952 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+# This file contains a native OpenQASM emitter (for OpenQASM 2 and 3) and a native
+# OpenQASM 2 parser. Both work directly on the Qrisp QuantumCircuit data structure,
+# i.e. no detour via Qiskit is required.
+
+import re
+
+import numpy as np
+from sympy import Expr
+
+from qrisp.circuit import (
+    ClControlledOperation,
+    Clbit,
+    ControlledOperation,
+    Instruction,
+    QuantumCircuit,
+    Qubit,
+)
+
+
+# Gates of the standard include files (qelib1.inc for OpenQASM 2 and stdgates.inc for
+# OpenQASM 3) that can be emitted directly. The dictionaries map the name of the Qrisp
+# operation to the name of the gate and indicate whether the parameters of the
+# operation are part of the gate call.
+qasm2_gates = {
+    "x": ("x", False),
+    "y": ("y", False),
+    "z": ("z", False),
+    "h": ("h", False),
+    "s": ("s", False),
+    "s_dg": ("sdg", False),
+    "t": ("t", False),
+    "t_dg": ("tdg", False),
+    "sx": ("sx", False),
+    "sx_dg": ("sxdg", False),
+    "id": ("id", False),
+    "swap": ("swap", False),
+    "rx": ("rx", True),
+    "ry": ("ry", True),
+    "rz": ("rz", True),
+    "p": ("p", True),
+    "u1": ("u1", True),
+    "u3": ("u3", True),
+    "cp": ("cp", True),
+    "rxx": ("rxx", True),
+    "rzz": ("rzz", True),
+}
+
+qasm3_gates = dict(qasm2_gates)
+qasm3_gates["sx_dg"] = ("inv @ sx", False)
+del qasm3_gates["rxx"]
+del qasm3_gates["rzz"]
+
+# Controlled versions of the standard gates. The dictionaries map the name of the base
+# operation to a dictionary, which maps the amount of controls to the gate name.
+qasm2_controlled_gates = {
+    "x": {1: "cx", 2: "ccx"},
+    "y": {1: "cy"},
+    "z": {1: "cz"},
+    "h": {1: "ch"},
+    "p": {1: "cp"},
+    "u1": {1: "cu1"},
+    "rx": {1: "crx"},
+    "ry": {1: "cry"},
+    "rz": {1: "crz"},
+    "sx": {1: "csx"},
+    "u3": {1: "cu3"},
+    "swap": {1: "cswap"},
+}
+
+qasm3_controlled_gates = {
+    "x": {1: "cx", 2: "ccx"},
+    "y": {1: "cy"},
+    "z": {1: "cz"},
+    "h": {1: "ch"},
+    "p": {1: "cp"},
+    "rx": {1: "crx"},
+    "ry": {1: "cry"},
+    "rz": {1: "crz"},
+    "swap": {1: "cswap"},
+}
+
+# Base gates, which can be controlled with the ctrl/negctrl modifiers of OpenQASM 3
+# without changing the semantics (the u gates differ by a global phase).
+qasm3_modifiable_gates = {
+    "x", "y", "z", "h", "s", "s_dg", "t", "t_dg", "sx", "sx_dg", "swap", "rx", "ry",
+    "rz", "p",
+}
+
+reserved_names = {
+    "OPENQASM", "include", "qreg", "creg", "gate", "opaque", "measure", "reset",
+    "barrier", "if", "pi", "sin", "cos", "tan", "exp", "ln", "sqrt", "U", "CX",
+    "qubit", "bit", "input", "output", "ctrl", "negctrl", "inv", "pow", "gphase",
+    "let", "def", "for", "while", "in", "float", "int", "uint", "angle", "bool",
+    "duration", "stretch", "const", "box", "delay", "return", "break", "continue",
+    "end", "true", "false", "im", "euler", "tau", "defcal", "cal", "extern", "array",
+    "complex", "switch", "case", "default", "mutable", "readonly", "void", "else",
+    "phase", "cphase", "cu", "u", "u0", "u2", "c3x", "c4x", "rccx", "rc3x",
+    "c3sqrtx", "stdgates", "qelib1",
+}
+for gate_dic in [qasm2_gates, qasm3_gates]:
+    reserved_names.update(name for name, _ in gate_dic.values())
+for gate_dic in [qasm2_controlled_gates, qasm3_controlled_gates]:
+    for names in gate_dic.values():
+        reserved_names.update(names.values())
+
+
+# Raised if a QuantumCircuit contains features (like abstract parameters or
+# conditions on multiple classical bits), which can only be expressed in OpenQASM 3
+class Qasm2ExportError(Exception):
+    pass
+
+
+def convert_to_qasm(qc, version=2):
+    """
+    Returns the OpenQASM string of a QuantumCircuit.
+
+    Parameters
+    ----------
+    qc : QuantumCircuit
+        The QuantumCircuit to convert.
+    version : int, optional
+        The OpenQASM version (2 or 3). The default is 2.
+
+    Raises
+    ------
+    Qasm2ExportError
+        The QuantumCircuit contains features that can only be expressed in
+        OpenQASM 3.
+    Exception
+        The QuantumCircuit contains an operation that can't be expressed in the
+        requested OpenQASM version.
+
+    Returns
+    -------
+    str
+        The OpenQASM string.
+
+    """
+    return QasmEmitter(version).emit(qc)
+
+
+# Writes the OpenQASM string to a file (if a filename is given)
+def write_qasm(qasm_str, filename=None, encoding=None):
+    if filename is not None:
+        with open(filename, "w", encoding=encoding) as f:
+            f.write(qasm_str)
+    return qasm_str
+
+
+class QasmEmitter:
+    # The emitter performs a single pass over the instructions of the circuit.
+    # Operations with a definition are declared as gates once per definition object,
+    # i.e. repeatedly appended gates are declared only once. Definitions containing
+    # non-unitary operations can't be declared and are inlined instead.
+    def __init__(self, version=2):
+        if version not in [2, 3]:
+            raise Exception(f"OpenQASM version {version} is not supported")
+
+        self.version = version
+
+        if version == 2:
+            self.gates = qasm2_gates
+            self.controlled_gates = qasm2_controlled_gates
+        else:
+            self.gates = qasm3_gates
+            self.controlled_gates = qasm3_controlled_gates
+
+        self.used_names = set(reserved_names)
+        self.declarations = []
+        self.declared_gates = {}
+        self.unitary_definitions = {}
+        self.input_parameters = []
+
+    def emit(self, qc):
+        qubit_args = {}
+        for qb in qc.qubits:
+            qubit_args[qb] = self.unique_name(qb.identifier, "q_") + "[0]"
+
+        clbit_args = {}
+        for cb in qc.clbits:
+            clbit_args[cb] = self.unique_name(cb.identifier, "c_") + "[0]"
+
+        lines = []
+        for instr in qc.data:
+            self.emit_instruction(
+                instr.op,
+                [qubit_args[qb] for qb in instr.qubits],
+                [clbit_args[cb] for cb in instr.clbits],
+                lines,
+            )
+
+        if self.version == 2:
+            header = ["OPENQASM 2.0;", 'include "qelib1.inc";']
+            header += self.declarations
+            header += [f"qreg {arg[:-3]}[1];" for arg in qubit_args.values()]
+            header += [f"creg {arg[:-3]}[1];" for arg in clbit_args.values()]
+        else:
+            header = ["OPENQASM 3.0;", 'include "stdgates.inc";']
+            header += [f"input float[64] {name};" for name in self.input_parameters]
+            header += self.declarations
+            header += [f"qubit[1] {arg[:-3]};" for arg in qubit_args.values()]
+            header += [f"bit[1] {arg[:-3]};" for arg in clbit_args.values()]
+
+        return "\n".join(header + lines) + "\n"
+
+    # Turns an identifier into a valid and unused OpenQASM name
+    def unique_name(self, identifier, prefix):
+        name = re.sub(r"\W", "_", identifier)
+
+        if not name or not "a" <= name[0] <= "z":
+            name = prefix + name
+
+        if name in self.used_names or re.fullmatch(r"q\d+", name):
+            i = 1
+            while name + "_" + str(i) in self.used_names:
+                i += 1
+            name = name + "_" + str(i)
+
+        self.used_names.add(name)
+        return name
+
+    def format_params(self, params):
+        if not params:
+            return ""
+        return "(" + ",".join([self.format_param(p) for p in params]) + ")"
+
+    def format_param(self, p):
+        if isinstance(p, Expr):
+            if not p.free_symbols:
+                p = float(p)
+            elif self.version == 2:
+                raise Qasm2ExportError(
+                    f"Abstract parameter {p} can not be represented in OpenQASM 2"
+                )
+            else:
+                for symb in p.free_symbols:
+                    name = str(symb)
+                    if name not in self.input_parameters:
+                        if not re.fullmatch(r"[A-Za-z_]\w*", name):
+                            raise Exception(
+                                f"Abstract parameter {name} is no valid identifier"
+                            )
+                        self.input_parameters.append(name)
+                        self.used_names.add(name)
+                return str(p)
+
+        if isinstance(p, complex) or np.iscomplexobj(p):
+            raise Exception(f"Complex parameter {p} can not be represented in OpenQASM")
+
+        res = repr(float(p))
+
+        if "e" in res and "." not in res:
+            res = res.replace("e", ".0e")
+        elif res in ["inf", "-inf", "nan"]:
+            raise Exception(f"Parameter {res} can not be represented in OpenQASM")
+
+        return res
+
+    def emit_instruction(self, op, qargs, cargs, lines, inline=False):
+        name = op.name
+
+        if isinstance(op, ControlledOperation):
+            if self.is_controllable(op):
+                self.emit_controlled(
+                    op.base_operation.name,
+                    op.base_operation.params,
+                    op.ctrl_state,
+                    qargs,
+                    lines,
+                )
+            else:
+                self.emit_definition(op, qargs, cargs, lines, inline)
+
+        elif name in ["cx", "cy", "cz"]:
+            self.emit_controlled(name[1], [], op.ctrl_state, qargs, lines)
+
+        elif name in self.gates:
+            gate_name, has_params = self.gates[name]
+            params = self.format_params(op.params) if has_params else ""
+            lines.append(f"{gate_name}{params} {','.join(qargs)};")
+
+        elif name == "measure":
+            if self.version == 2:
+                lines.append(f"measure {qargs[0]} -> {cargs[0]};")
+            else:
+                lines.append(f"{cargs[0]} = measure {qargs[0]};")
+
+        elif name == "reset":
+            lines.append(f"reset {qargs[0]};")
+
+        elif name == "barrier":
+            lines.append(f"barrier {','.join(qargs)};")
+
+        elif name in ["qb_alloc", "qb_dealloc", "gphase"]:
+            # Allocation gates have no effect on the circuit and the global phase is
+            # not observable
+            pass
+
+        elif isinstance(op, ClControlledOperation):
+            self.emit_cl_controlled(op, qargs, cargs, lines)
+
+        else:
+            self.emit_definition(op, qargs, cargs, lines, inline)
+
+    # Emits an operation using its definition. The definition is either declared as a
+    # gate or (if it contains non-unitary operations) inlined.
+    def emit_definition(self, op, qargs, cargs, lines, inline):
+        definition = op.definition
+
+        if definition is None:
+            raise Exception(
+                f"Could not convert operation {op.name} to OpenQASM {self.version}"
+            )
+
+        if not inline and self.is_unitary(definition):
+            gate_name = self.declare_gate(op)
+            lines.append(f"{gate_name} {','.join(qargs)};")
+            return
+
+        qubit_dic = dict(zip(definition.qubits, qargs))
+        clbit_dic = dict(zip(definition.clbits, cargs))
+        for instr in definition.data:
+            self.emit_instruction(
+                instr.op,
+                [qubit_dic[qb] for qb in instr.qubits],
+                [clbit_dic[cb] for cb in instr.clbits],
+                lines,
+                inline,
+            )
+
+    # Determines whether a ControlledOperation can be expressed using the standard
+    # controlled gates (or the control modifiers of OpenQASM 3)
+    def is_controllable(self, op):
+        base_name = op.base_operation.name
+        num_ctrl = len(op.controls)
+
+        if num_ctrl in self.controlled_gates.get(base_name, {}):
+            return True
+        return self.version == 3 and base_name in qasm3_modifiable_gates
+
+    def emit_controlled(self, base_name, params, ctrl_state, qargs, lines):
+        num_ctrl = len(ctrl_state)
+        params = self.format_params(params)
+        gate_name = self.controlled_gates.get(base_name, {}).get(num_ctrl)
+
+        if self.version == 3 and (gate_name is None or "0" in ctrl_state):
+            # Use the control modifiers, where consecutive controls of the same
+            # kind are grouped
+            modifiers = []
+            i = 0
+            while i < num_ctrl:
+                j = i
+                while j < num_ctrl and ctrl_state[j] == ctrl_state[i]:
+                    j += 1
+                modifier = "ctrl" if ctrl_state[i] == "1" else "negctrl"
+                if j - i > 1:
+                    modifier += f"({j - i})"
+                modifiers.append(modifier + " @ ")
+                i = j
+
+            base_gate_name = self.gates[base_name][0]
+            lines.append(
+                f"{''.join(modifiers)}{base_gate_name}{params} {','.join(qargs)};"
+            )
+            return
+
+        # Negative controls are realized by conjugating with X gates
+        negated_controls = [qargs[i] for i in range(num_ctrl) if ctrl_state[i] == "0"]
+
+        for arg in negated_controls:
+            lines.append(f"x {arg};")
+        lines.append(f"{gate_name}{params} {','.join(qargs)};")
+        for arg in negated_controls:
+            lines.append(f"x {arg};")
+
+    def emit_cl_controlled(self, op, qargs, cargs, lines):
+        control_args = cargs[: op.num_control]
+
+        body = []
+        self.emit_instruction(
+            op.base_op, qargs, cargs[op.num_control :], body, inline=True
+        )
+
+        if self.version == 2:
+            if op.num_control != 1:
+                raise Qasm2ExportError(
+                    "OpenQASM 2 only supports conditions on a single classical bit"
+                )
+            condition = f"if({control_args[0][:-3]}=={op.ctrl_state}) "
+            for line in body:
+                if line.startswith("if"):
+                    raise Qasm2ExportError(
+                        "OpenQASM 2 does not support nested conditions"
+                    )
+                lines.append(condition + line)
+        else:
+            conditions = []
+            for i in range(op.num_control):
+                if op.ctrl_state[i] == "1":
+                    conditions.append(control_args[i])
+                else:
+                    conditions.append("!" + control_args[i])
+            lines.append(f"if ({' && '.join(conditions)}) {{")
+            lines.extend(["  " + line for line in body])
+            lines.append("}")
+
+    # Determines whether a definition contains only unitary operations (i.e. whether
+    # it can be declared as a gate)
+    def is_unitary(self, definition):
+        key = id(definition)
+        if key in self.unitary_definitions:
+            return self.unitary_definitions[key][1]
+
+        res = True
+        for instr in definition.data:
+            op = instr.op
+            if op.num_clbits or op.name in ["measure", "reset"]:
+                res = False
+            elif op.definition is not None and op.name not in self.gates:
+                res = self.is_unitary(op.definition)
+            if not res:
+                break
+
+        # The definition is stored to prevent its id from being reused
+        self.unitary_definitions[key] = (definition, res)
+        return res
+
+    def declare_gate(self, op):
+        definition = op.definition
+        key = id(definition)
+
+        if key in self.declared_gates:
+            return self.declared_gates[key][1]
+
+        qargs = ["q" + str(i) for i in range(len(definition.qubits))]
+        qubit_dic = dict(zip(definition.qubits, qargs))
+
+        body = []
+        for instr in definition.data:
+            self.emit_instruction(
+                instr.op, [qubit_dic[qb] for qb in instr.qubits], [], body
+            )
+
+        gate_name = self.unique_name(op.name, "gate_")
+        self.declarations.append(f"gate {gate_name} {','.join(qargs)} {{")
+        self.declarations.extend(["  " + line for line in body])
+        self.declarations.append("}")
+
+        self.declared_gates[key] = (definition, gate_name)
+        return gate_name
+
+
+def convert_from_qasm(qasm_str):
+    """
+    Parses an OpenQASM string into a QuantumCircuit. OpenQASM 2 strings are parsed
+    natively, OpenQASM 3 strings are parsed using Qiskit.
+
+    Parameters
+    ----------
+    qasm_str : str
+        A string obeying the OpenQASM specification.
+
+    Raises
+    ------
+    Exception
+        The string could not be parsed.
+
+    Returns
+    -------
+    QuantumCircuit
+        The corresponding QuantumCircuit.
+
+    """
+    if re.match(r"\s*(//[^\n]*\s*)*OPENQASM\s+3", qasm_str):
+        from qiskit.qasm3 import loads
+        from qrisp.interface.converter.qiskit_converter import convert_from_qiskit
+
+        return convert_from_qiskit(loads(qasm_str))
+
+    return Qasm2Parser().parse(qasm_str)
+
+
+statement_pattern = re.compile(r"\s*(gate\s[^{]*\{[^}]*\}|[^;{}]*;)")
+gate_call_pattern = re.compile(r"([A-Za-z_]\w*)\s*(?:\((.*)\))?\s*(.*)$", re.S)
+condition_pattern = re.compile(r"if\s*\(\s*(\w+)\s*==\s*(\d+)\s*\)\s*(.*)$", re.S)
+register_pattern = re.compile(r"(qreg|creg)\s+([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]\s*$")
+argument_pattern = re.compile(r"([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?$")
+gate_declaration_pattern = re.compile(
+    r"gate\s+([A-Za-z_]\w*)\s*(?:\(([^)]*)\))?\s*([^{]*)\{([^}]*)\}$", re.S
+)
+token_pattern = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eE][-+]?\d+)?|\.\d+(?:[eE][-+]?\d+)?)"
+    r"|([A-Za-z_]\w*)|(\*\*|.))"
+)
+
+
+class Qasm2Parser:
+    # The parser processes the string statement by statement. Each statement is
+    # dispatched on its first word. Operations are created once per gate name and
+    # parameter values and then shared between the instructions. Since the parser
+    # creates the bits of the circuit itself, the instructions are appended to the
+    # data without running the argument validation of QuantumCircuit.append.
+    def __init__(self):
+        self.qc = QuantumCircuit()
+        self.registers = {}
+        self.argument_cache = {}
+        self.operation_cache = {}
+        self.gate_declarations = {}
+
+    def parse(self, qasm_str):
+        qasm_str = re.sub(r"//[^\n]*", "", qasm_str)
+
+        data = self.qc.data
+        pos = 0
+        while True:
+            match = statement_pattern.match(qasm_str, pos)
+            if match is None or match.end() == pos:
+                break
+            pos = match.end()
+            statement = match.group(1)[:-1].strip()
+
+            if statement.startswith("gate") and match.group(1).endswith("}"):
+                self.declare_gate(match.group(1))
+                continue
+
+            condition = None
+            if statement.startswith("if"):
+                condition_match = condition_pattern.match(statement)
+                if condition_match is None:
+                    raise Exception(f"Could not parse statement {statement}")
+                condition = (
+                    condition_match.group(1),
+                    int(condition_match.group(2)),
+                )
+                statement = condition_match.group(3)
+
+            gate_call = gate_call_pattern.match(statement)
+            if gate_call is None:
+                if statement:
+                    raise Exception(f"Could not parse statement {statement}")
+                continue
+
+            name, params, args = gate_call.groups()
+
+            if name in ["OPENQASM", "include"]:
+                if name == "OPENQASM" and not statement.split()[1].startswith("2"):
+                    raise Exception("Only OpenQASM 2 strings can be parsed natively")
+                continue
+
+            if name in ["qreg", "creg"]:
+                self.declare_register(statement)
+                continue
+
+            if name == "opaque":
+                raise Exception("Opaque gates are not supported")
+
+            if name == "measure":
+                qargs, cargs = args.split("->")
+                qubits = self.get_bits(qargs)
+                clbits = self.get_bits(cargs)
+                operands = self.broadcast([qubits, clbits])
+                op = self.get_operation("measure", ())
+                for qb, cb in operands:
+                    self.append(data, op, [qb], [cb], condition)
+                continue
+
+            if name == "barrier":
+                qubits = [qb for arg in args.split(",") for qb in self.get_bits(arg)]
+                op = self.get_operation("barrier", (len(qubits),))
+                self.append(data, op, qubits, [], condition)
+                continue
+
+            operands = self.broadcast([self.get_bits(arg) for arg in args.split(",")])
+
+            if params:
+                params = tuple(
+                    [evaluate_expression(p, {}) for p in split_params(params)]
+                )
+            else:
+                params = ()
+
+            ops = self.get_operation(name, params)
+
+            for qubits in operands:
+                if isinstance(ops, list):
+                    for op, indices in ops:
+                        self.append(
+                            data, op, [qubits[i] for i in indices], [], condition
+                        )
+                else:
+                    self.append(data, ops, list(qubits), [], condition)
+
+        if qasm_str[pos:].strip():
+            raise Exception(f"Could not parse {qasm_str[pos:].strip()[:50]}")
+
+        return self.qc
+
+    def append(self, data, op, qubits, clbits, condition):
+        if len(qubits) != op.num_qubits:
+            raise Exception(
+                f"Provided incorrect amount ({len(qubits)}) of qubits for operation "
+                f"{op.name} (requires {op.num_qubits})"
+            )
+
+        if len(set(qubits)) != len(qubits):
+            raise Exception(f"Duplicate qubit arguments for operation {op.name}")
+
+        if condition is not None:
+            control_clbits = self.registers[condition[0]]
+            op = op.c_if(len(control_clbits), condition[1])
+            clbits = control_clbits + clbits
+
+        data.append(Instruction(op, qubits, clbits))
+
+    def declare_register(self, statement):
+        match = register_pattern.match(statement)
+        if match is None:
+            raise Exception(f"Could not parse register declaration {statement}")
+
+        kind, name, size = match.group(1), match.group(2), int(match.group(3))
+
+        if name in self.registers:
+            raise Exception(f"Register {name} is declared twice")
+
+        bits = []
+        for i in range(size):
+            identifier = name if size == 1 else name + "." + str(i)
+            if kind == "qreg":
+                bits.append(self.qc.add_qubit(Qubit(identifier)))
+            else:
+                bits.append(self.qc.add_clbit(Clbit(identifier)))
+
+        self.registers[name] = bits
+
+    # Returns the list of bits described by an argument (i.e. either a single bit or
+    # a complete register)
+    def get_bits(self, arg):
+        try:
+            return self.argument_cache[arg]
+        except KeyError:
+            pass
+
+        match = argument_pattern.match(arg.strip())
+        if match is None or match.group(1) not in self.registers:
+            raise Exception(f"Unknown argument {arg.strip()}")
+
+        register = self.registers[match.group(1)]
+
+        if match.group(2) is None:
+            res = list(register)
+        else:
+            index = int(match.group(2))
+            if index >= len(register):
+                raise Exception(f"Index {index} out of range for {match.group(1)}")
+            res = [register[index]]
+
+        self.argument_cache[arg] = res
+        return res
+
+    # Broadcasts the register arguments of a statement
+    @staticmethod
+    def broadcast(arguments):
+        size = max([len(arg) for arg in arguments])
+
+        if size == 1:
+            return [[arg[0] for arg in arguments]]
+
+        for arg in arguments:
+            if len(arg) not in [1, size]:
+                raise Exception("Registers of different sizes in a single statement")
+
+        return [
+            [arg[i] if len(arg) > 1 else arg[0] for arg in arguments]
+            for i in range(size)
+        ]
+
+    # Returns the Operation corresponding to a gate name and parameter values. For
+    # some gates a list of (Operation, qubit indices) tuples is returned instead.
+    def get_operation(self, name, params):
+        key = (name, params)
+        try:
+            return self.operation_cache[key]
+        except KeyError:
+            pass
+
+        if name in self.gate_declarations:
+            op = self.instantiate_gate(name, params)
+        elif name in qelib1_operations:
+            num_params, constructor = qelib1_operations[name]
+            if len(params) != num_params:
+                raise Exception(
+                    f"Gate {name} requires {num_params} parameters "
+                    f"({len(params)} given)"
+                )
+            op = constructor(*params)
+        else:
+            raise Exception(f"Unknown gate {name}")
+
+        self.operation_cache[key] = op
+        return op
+
+    def declare_gate(self, declaration):
+        match = gate_declaration_pattern.match(declaration.strip())
+        if match is None:
+            raise Exception(f"Could not parse gate declaration {declaration}")
+
+        name, params, qargs, body = match.groups()
+
+        params = [p.strip() for p in params.split(",")] if params else []
+        qargs = [q.strip() for q in qargs.split(",")]
+
+        statements = []
+        for statement in body.split(";"):
+            statement = statement.strip()
+            if not statement:
+                continue
+            gate_call = gate_call_pattern.match(statement)
+            if gate_call is None:
+                raise Exception(f"Could not parse statement {statement} in {name}")
+            gate_name, gate_params, gate_args = gate_call.groups()
+            gate_params = split_params(gate_params) if gate_params else []
+            gate_args = [qargs.index(arg.strip()) for arg in gate_args.split(",")]
+            statements.append((gate_name, gate_params, gate_args))
+
+        self.gate_declarations[name] = (params, qargs, statements)
+
+    def instantiate_gate(self, name, params):
+        param_names, qargs, statements = self.gate_declarations[name]
+
+        if len(params) != len(param_names):
+            raise Exception(
+                f"Gate {name} requires {len(param_names)} parameters "
+                f"({len(params)} given)"
+            )
+
+        variables = dict(zip(param_names, params))
+
+        definition = QuantumCircuit(len(qargs))
+        for gate_name, gate_params, gate_args in statements:
+            qubits = [definition.qubits[i] for i in gate_args]
+
+            if gate_name == "barrier":
+                definition.append(self.get_operation("barrier", (len(qubits),)), qubits)
+                continue
+
+            gate_params = tuple(
+                [evaluate_expression(p, variables) for p in gate_params]
+            )
+            ops = self.get_operation(gate_name, gate_params)
+
+            if isinstance(ops, list):
+                for op, indices in ops:
+                    definition.append(op, [qubits[i] for i in indices])
+            else:
+                definition.append(ops, qubits)
+
+        return definition.to_gate(name)
+
+
+def split_params(params):
+    # Splits a parameter list at the commas that are not enclosed in parentheses
+    res = []
+    depth = 0
+    start = 0
+    for i, c in enumerate(params):
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "," and depth == 0:
+            res.append(params[start:i])
+            start = i + 1
+    res.append(params[start:])
+    return res
+
+
+expression_functions = {
+    "sin": np.sin,
+    "cos": np.cos,
+    "tan": np.tan,
+    "exp": np.exp,
+    "ln": np.log,
+    "sqrt": np.sqrt,
+}
+
+
+def evaluate_expression(expr, variables):
+    # Evaluates an OpenQASM 2 parameter expression using a recursive descent parser
+    try:
+        return float(expr)
+    except ValueError:
+        pass
+
+    tokens = []
+    for number, identifier, symbol in token_pattern.findall(expr):
+        if number:
+            tokens.append(("number", float(number)))
+        elif identifier:
+            tokens.append(("identifier", identifier))
+        elif symbol.strip():
+            tokens.append(("symbol", symbol))
+    tokens.append(("end", None))
+
+    pos = [0]
+
+    def peek():
+        return tokens[pos[0]]
+
+    def take(expected=None):
+        token = tokens[pos[0]]
+        if expected is not None and token[1] != expected:
+            raise Exception(f"Could not parse expression {expr}")
+        pos[0] += 1
+        return token
+
+    def parse_sum():
+        res = parse_product()
+        while peek()[1] in ["+", "-"]:
+            if take()[1] == "+":
+                res = res + parse_product()
+            else:
+                res = res - parse_product()
+        return res
+
+    def parse_product():
+        res = parse_power()
+        while peek()[1] in ["*", "/"]:
+            if take()[1] == "*":
+                res = res * parse_power()
+            else:
+                res = res / parse_power()
+        return res
+
+    def parse_power():
+        res = parse_unary()
+        if peek()[1] in ["^", "**"]:
+            take()
+            res = res ** parse_power()
+        return res
+
+    def parse_unary():
+        if peek()[1] == "-":
+            take()
+            return -parse_unary()
+        if peek()[1] == "+":
+            take()
+            return parse_unary()
+        return parse_atom()
+
+    def parse_atom():
+        kind, value = take()
+        if kind == "number":
+            return value
+        if kind == "identifier":
+            if value == "pi":
+                return np.pi
+            if value in variables:
+                return variables[value]
+            if value in expression_functions:
+                take("(")
+                res = parse_sum()
+                take(")")
+                return float(expression_functions[value](res))
+            raise Exception(f"Unknown identifier {value} in expression {expr}")
+        if value == "(":
+            res = parse_sum()
+            take(")")
+            return res
+        raise Exception(f"Could not parse expression {expr}")
+
+    res = parse_sum()
+    if peek()[0] != "end":
+        raise Exception(f"Could not parse expression {expr}")
+    return float(res)
+
+
+def create_qelib1_operations():
+    import qrisp.circuit.standard_operations as ops
+
+    def cu(theta, phi, lam, gamma):
+        return [
+            (ops.PGate(gamma), [0]),
+            (ops.u3Gate(theta, phi, lam).control(1), [0, 1]),
+        ]
+
+    return {
+        "U": (3, ops.u3Gate),
+        "CX": (0, ops.CXGate),
+        "u3": (3, ops.u3Gate),
+        "u": (3, ops.u3Gate),
+        "u2": (2, lambda phi, lam: ops.u3Gate(np.pi / 2, phi, lam)),
+        "u1": (1, ops.U1Gate),
+        "u0": (1, lambda gamma: ops.IDGate()),
+        "id": (0, ops.IDGate),
+        "p": (1, ops.PGate),
+        "x": (0, ops.XGate),
+        "y": (0, ops.YGate),
+        "z": (0, ops.ZGate),
+        "h": (0, ops.HGate),
+        "s": (0, ops.SGate),
+        "sdg": (0, lambda: ops.SGate().inverse()),
+        "t": (0, ops.TGate),
+        "tdg": (0, lambda: ops.TGate().inverse()),
+        "sx": (0, ops.SXGate),
+        "sxdg": (0, ops.SXDGGate),
+        "rx": (1, ops.RXGate),
+        "ry": (1, ops.RYGate),
+        "rz": (1, ops.RZGate),
+        "rxx": (1, ops.RXXGate),
+        "rzz": (1, ops.RZZGate),
+        "swap": (0, ops.SwapGate),
+        "cx": (0, ops.CXGate),
+        "cy": (0, ops.CYGate),
+        "cz": (0, ops.CZGate),
+        "ch": (0, lambda: ops.HGate().control(1)),
+        "ccx": (0, lambda: ops.MCXGate(2)),
+        "c3x": (0, lambda: ops.MCXGate(3)),
+        "c4x": (0, lambda: ops.MCXGate(4)),
+        "cswap": (0, lambda: ops.SwapGate().control(1)),
+        "crx": (1, lambda theta: ops.RXGate(theta).control(1)),
+        "cry": (1, lambda theta: ops.RYGate(theta).control(1)),
+        "crz": (1, lambda theta: ops.RZGate(theta).control(1)),
+        "cp": (1, ops.CPGate),
+        "cu1": (1, ops.CPGate),
+        "csx": (0, lambda: ops.SXGate().control(1)),
+        "cu3": (3, lambda theta, phi, lam: ops.u3Gate(theta, phi, lam).control(1)),
+        "cu": (4, cu),
+        "measure": (0, ops.Measurement),
+        "reset": (0, ops.Reset),
+        "barrier": (1, ops.Barrier),
+    }
+
+
+qelib1_operations = create_qelib1_operations()
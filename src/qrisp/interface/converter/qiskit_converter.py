@@ -161,19 +161,19 @@ def create_qiskit_instruction(op, params=[]):
     
     if op.name == "cx":
         if hasattr(op, "ctrl_state"):
-            qiskit_ins = qsk_gates.XGate().control(ctrl_state=op.ctrl_state)
+            qiskit_ins = qsk_gates.CXGate(ctrl_state=op.ctrl_state)
         else:
-            qiskit_ins = qsk_gates.XGate().control()
+            qiskit_ins = qsk_gates.CXGate()
     elif op.name == "cz":
         if hasattr(op, "ctrl_state"):
-            qiskit_ins = qsk_gates.ZGate().control(ctrl_state=op.ctrl_state)
+            qiskit_ins = qsk_gates.CZGate(ctrl_state=op.ctrl_state)
         else:
-            qiskit_ins = qsk_gates.ZGate().control()
+            qiskit_ins = qsk_gates.CZGate()
     elif op.name == "cy":
         if hasattr(op, "ctrl_state"):
-            qiskit_ins = qsk_gates.YGate().control(ctrl_state=op.ctrl_state)
+            qiskit_ins = qsk_gates.CYGate(ctrl_state=op.ctrl_state)
         else:
-            qiskit_ins = qsk_gates.YGate().control()
+            qiskit_ins = qsk_gates.CYGate()
 
     elif issubclass(op.__class__, ControlledOperation) and "gphase" not in op.name:
         base_name = op.base_operation.name
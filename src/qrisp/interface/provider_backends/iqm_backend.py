@@ -83,13 +83,13 @@ def IQMBackend(api_token, device_instance):
         )
 
 
-    def run_func_iqm(qasm_str, shots=None, token=""):
+    # Create the method to run Qiskit circuits
+    def run_qiskit_circuit_iqm(qc, shots=None):
         if shots is None:
             shots = 1000
         server_url = "https://cocos.resonance.meetiqm.com/" + device_instance
 
         backend = IQMProvider(server_url, token=api_token).get_backend()
-        qc = qiskit.QuantumCircuit.from_qasm_str(qasm_str)
         qc_transpiled = transpile_to_IQM(qc, backend)
 
         job = backend.run(qc_transpiled, shots=shots)
@@ -103,4 +103,14 @@ def IQMBackend(api_token, device_instance):
 
         return new_counts
 
-    return VirtualBackend(run_func_iqm)
+    def run_func_iqm(qasm_str, shots=None, token=""):
+        qc = qiskit.QuantumCircuit.from_qasm_str(qasm_str)
+        return run_qiskit_circuit_iqm(qc, shots)
+
+    # Qrisp QuantumCircuits are converted directly, skipping the QASM serialization
+    def circuit_run_func_iqm(qc, shots=None, token=""):
+        from qrisp.interface.converter import convert_to_qiskit
+
+        return run_qiskit_circuit_iqm(convert_to_qiskit(qc), shots)
+
+    return VirtualBackend(run_func_iqm, circuit_run_func=circuit_run_func_iqm)
@@ -61,10 +61,28 @@ class QiskitBackend(VirtualBackend):
                 import qiskit_aer as Aer
                 backend = Aer.AerSimulator()
 
-        # Create the run method
-        def run(qasm_str, shots=None, token=""):
+        # Create the method to run Qiskit circuits
+        def run_qiskit_circuit(qiskit_qc, shots=None):
             if shots is None:
                 shots = 100000
+
+            from qiskit import transpile
+
+            qiskit_qc = transpile(qiskit_qc, backend=backend)
+            # Run Circuit on the Qiskit backend
+            qiskit_result = backend.run(qiskit_qc, shots=shots).result().get_counts()
+            # Remove the spaces in the qiskit result keys
+            result_dic = {}
+            import re
+
+            for key in qiskit_result.keys():
+                counts_string = re.sub(r"\W", "", key)
+                result_dic[counts_string] = qiskit_result[key]
+
+            return result_dic
+
+        # Create the run method for QASM strings
+        def run(qasm_str, shots=None, token=""):
             # Convert to qiskit
             from qiskit import QuantumCircuit
 
@@ -79,20 +97,14 @@ class QiskitBackend(VirtualBackend):
                     [qiskit_qc.clbits.index(cb) for cb in instr.clbits],
                 )
 
-            from qiskit import transpile
+            return run_qiskit_circuit(new_qiskit_qc, shots)
 
-            qiskit_qc = transpile(new_qiskit_qc, backend=backend)
-            # Run Circuit on the Qiskit backend
-            qiskit_result = backend.run(qiskit_qc, shots=shots).result().get_counts()
-            # Remove the spaces in the qiskit result keys
-            result_dic = {}
-            import re
-
-            for key in qiskit_result.keys():
-                counts_string = re.sub(r"\W", "", key)
-                result_dic[counts_string] = qiskit_result[key]
+        # Create the run method for QuantumCircuit objects, which skips the
+        # QASM serialization
+        def run_circuit(qc, shots=None, token=""):
+            from qrisp.interface.converter import convert_to_qiskit
 
-            return result_dic
+            return run_qiskit_circuit(convert_to_qiskit(qc), shots)
 
         # Call VirtualBackend constructor
         if isinstance(backend.name, str):
@@ -100,7 +112,7 @@ class QiskitBackend(VirtualBackend):
         else:
             name = backend.name()
 
-        super().__init__(run, port=port)
+        super().__init__(run, port=port, circuit_run_func=run_circuit)
 
 def VirtualQiskitBackend(*args, **kwargs):
     import warnings
@@ -155,14 +167,10 @@ class QiskitRuntimeBackend(VirtualBackend):
         session = Session(service, backend)
         sampler = Sampler(session=session)
 
-        # Create the run method
-        def run(qasm_str, shots=None, token=""):
+        # Create the method to run Qiskit circuits
+        def run_qiskit_circuit(qiskit_qc, shots=None):
             if shots is None:
                 shots = 100000
-            # Convert to qiskit
-            from qiskit import QuantumCircuit
-
-            qiskit_qc = QuantumCircuit.from_qasm_str(qasm_str)
 
             from qiskit import transpile
 
@@ -188,7 +196,21 @@ class QiskitRuntimeBackend(VirtualBackend):
 
             return result_dic
 
-        super().__init__(run, port=port)
+        # Create the run method for QASM strings
+        def run(qasm_str, shots=None, token=""):
+            # Convert to qiskit
+            from qiskit import QuantumCircuit
+
+            return run_qiskit_circuit(QuantumCircuit.from_qasm_str(qasm_str), shots)
+
+        # Create the run method for QuantumCircuit objects, which skips the
+        # QASM serialization
+        def run_circuit(qc, shots=None, token=""):
+            from qrisp.interface.converter import convert_to_qiskit
+
+            return run_qiskit_circuit(convert_to_qiskit(qc), shots)
+
+        super().__init__(run, port=port, circuit_run_func=run_circuit)
 
     def close_session(self):
         """
@@ -77,6 +77,35 @@ class BackendClient:
         
     #Executes 
     def run(self, qc, shots):
+        return self.run_batch([(qc, shots)])[0]
+    
+    #Executes a list of (QuantumCircuit, shots) tuples. All jobs are posted
+    #before the results are polled, such that the server can process the whole 
+    #batch without waiting for further requests.
+    def run_batch(self, batch):
+        
+        job_ids = [self.post_job(qc, shots) for qc, shots in batch]
+        
+        results = {}
+        
+        while len(results) < len(job_ids):
+            
+            for job_id in job_ids:
+                if job_id in results:
+                    continue
+                
+                job_results = self.get_job_results(job_id)
+                
+                if job_results is not None:
+                    results[job_id] = job_results
+            
+            if len(results) < len(job_ids):
+                time.sleep(0.1)
+        
+        return [results[job_id] for job_id in job_ids]
+    
+    #Deploys the circuit and posts the job. Returns the id of the job.
+    def post_job(self, qc, shots):
         qasm_str = qc.qasm()
         
         deployment_data = {
@@ -111,31 +140,29 @@ class BackendClient:
             }
         
         job_post_response = requests.post(f'{self.api_endpoint}/jobs', json = job_data, verify = False)
-        if deployment_response.status_code == 422:
+        if job_post_response.status_code == 422:
             raise Exception(f'Unprocessable quantum ciruict (status code: {job_post_response.status_code})')
-        elif deployment_response.status_code != 201:
+        elif job_post_response.status_code != 201:
             raise Exception(f'Failed to post job (status code: {job_post_response.status_code})')
         
-        job_id = job_post_response.json()["id"]
-        
-        job_running = True
-        
-
-        while True:
+        return job_post_response.json()["id"]
+    
+    #Returns the results of the job or None if the job is still running
+    def get_job_results(self, job_id):
         
-            job_get_response = requests.get(f'{self.api_endpoint}/jobs/{job_id}', json = job_data, verify = False)
-            
-            if job_get_response.status_code != 201:
-                raise Exception(f'Quantum circuit execution failed: {job_get_response.json()["message"]}')
-            
-            job_state = job_get_response.json()["state"]
+        job_get_response = requests.get(
+            f'{self.api_endpoint}/jobs/{job_id}', verify = False
+        )
         
-            if job_state == "finished":
-                break
-                
-            time.sleep(0.1)
-            
+        if job_get_response.status_code != 201:
+            raise Exception(
+                'Quantum circuit execution failed: '
+                f'{job_get_response.json()["message"]}'
+            )
         
-        results = job_get_response.json()["results"][0]["results"]
+        job_state = job_get_response.json()["state"]
+    
+        if job_state != "finished":
+            return None
         
-        return results
+        return job_get_response.json()["results"][0]["results"]
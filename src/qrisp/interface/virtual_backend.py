@@ -34,14 +34,17 @@ class VirtualBackend(BackendClient):
 
     Parameters
     ----------
-    run_func : function
-        A function that recieves a QuantumCircuit, an integer specifiying the amount of
+    run_func : function, optional
+        A function that recieves a QASM string, an integer specifiying the amount of
         shots and a token in the form of a string. It returns the counts as a dictionary
         of bitstrings.
-    name : str, optional
-        A name for the virtual backend. The default is None.
     port : int, optional
         The port on which to listen. The default is None.
+    circuit_run_func : function, optional
+        A function with the same signature as ``run_func``, that recieves the
+        QuantumCircuit object instead of a QASM string. If given, circuits are
+        executed without serialization, as long as no port is specified.
+        The default is None.
 
     Examples
     --------
@@ -87,16 +90,49 @@ class VirtualBackend(BackendClient):
     cb_2: 1/════════════╩═
     {4: 1.0}
 
+    Backends living in the same process can skip the QASM serialization by
+    specifying a ``circuit_run_func``. ::
+
+        def circuit_run_func(qc, shots = None, token = ""):
+            if shots is None:
+                shots = 1000
+            print(qc)
+            return {"0"*len(qc.clbits) : shots}
+
+    >>> example_backend = VirtualBackend(circuit_run_func = circuit_run_func)
+    >>> qf = QuantumFloat(2)
+    >>> qf.get_measurement(backend = example_backend)
+          ┌─┐   
+    qf.0: ┤M├───
+          └╥┘┌─┐
+    qf.1: ─╫─┤M├
+           ║ └╥┘
+    cb_0: ═╩══╬═
+              ║ 
+    cb_1: ════╩═
+    {0: 1.0}
+
     """
 
-    def __init__(self, run_func, port=None):
+    def __init__(self, run_func=None, port=None, circuit_run_func=None):
 
         from qrisp.interface import BackendServer
 
+        if run_func is None and circuit_run_func is None:
+            raise Exception(
+                "Tried to create VirtualBackend without run_func or circuit_run_func"
+            )
+
         self.port = port
+        self.circuit_run_func = circuit_run_func
         if port is None:
             self.run_func = run_func
         else:
+            # Circuits sent to the server arrive as QASM strings, so a circuit
+            # level function has to be wrapped into a QASM parsing function
+            if run_func is None:
+                run_func = create_qasm_run_func(circuit_run_func)
+            self.run_func = run_func
             # Create BackendServer
             self.backend_server = BackendServer(run_func, "localhost", port=port)
             # Run the server (runs in the background)
@@ -122,7 +158,69 @@ class VirtualBackend(BackendClient):
             A dictionary containing the measurement results.
 
         """
-        if self.port is None:
+        return self.run_circuit(qc, shots, token)
+
+    def run_circuit(self, qc, shots=None, token=""):
+        """
+        Executes a QuantumCircuit without serializing it, if the backend lives
+        in the same process.
+
+        If a ``circuit_run_func`` has been specified, the QuantumCircuit object is
+        handed over directly. Otherwise the circuit is serialized to QASM and
+        passed to ``run_func``. Backends listening on a port always receive QASM.
+
+        Parameters
+        ----------
+        qc : QuantumCircuit
+            The QuantumCircuit to run.
+        shots : int, optional
+            The amount of shots to perform.
+        token : str, optional
+            A token for authentication at the backend. The default is "".
+
+        Returns
+        -------
+        res : dict
+            A dictionary containing the measurement results.
+
+        """
+        if self.port is not None:
+            return BackendClient.run(self, qc, shots)
+        elif self.circuit_run_func is not None:
+            return self.circuit_run_func(qc, shots, token)
+        else:
             return self.run_func(qc.qasm(), shots, token)
+
+    def run_batch(self, batch, token=""):
+        """
+        Executes a list of circuits. Backends listening on a port receive all
+        circuits before the results are retrieved.
+
+        Parameters
+        ----------
+        batch : list[tuple[QuantumCircuit, int]]
+            A list of QuantumCircuits and the corresponding amount of shots.
+        token : str, optional
+            A token for authentication at the backend. The default is "".
+
+        Returns
+        -------
+        list[dict]
+            The measurement results in the order of the batch.
+
+        """
+        if self.port is not None:
+            return BackendClient.run_batch(self, batch)
         else:
-            return super().run(qc, shots)
\ No newline at end of file
+            return [self.run_circuit(qc, shots, token) for qc, shots in batch]
+
+
+# Wraps a function receiving QuantumCircuits into a function receiving QASM strings
+def create_qasm_run_func(circuit_run_func):
+
+    def run_func(qasm_str, shots=None, token=""):
+        from qrisp.circuit import QuantumCircuit
+
+        return circuit_run_func(QuantumCircuit.from_qasm_str(qasm_str), shots, token)
+
+    return run_func
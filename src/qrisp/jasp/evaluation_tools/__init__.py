@@ -21,3 +21,8 @@ from qrisp.jasp.evaluation_tools.terminal_sampling import *
 from qrisp.jasp.evaluation_tools.jaspification import *
 from qrisp.jasp.evaluation_tools.catalyst_qjit import *
 from qrisp.jasp.evaluation_tools.profiler import *
+from qrisp.jasp.evaluation_tools.jaspr_cache import (
+    set_jaspr_cache_size,
+    clear_jaspr_cache,
+    get_jaspr_cache_info,
+)
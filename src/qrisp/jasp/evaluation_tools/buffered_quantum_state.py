@@ -16,43 +16,99 @@
 ********************************************************************************/
 """
 
-import numpy as np
-
 from qrisp.circuit import QuantumCircuit, XGate
-from qrisp.simulator import QuantumState, advance_quantum_state, gen_res_dict
+from qrisp.simulator import (
+    QuantumState,
+    TensorFactor,
+    CliffordTableau,
+    advance_quantum_state,
+    sample_counts,
+    get_rng,
+)
 
 class BufferedQuantumState:
     
-    def __init__(self, simulator = "qrisp"):
+    def __init__(self, simulator = "qrisp", rng = None):
+        
+        # The random number generator for measurements and sampling
+        # (see qrisp.simulator.rng_management)
+        self.rng = get_rng(rng)
         
         if simulator == "qrisp":
             self.quantum_state = QuantumState(n = 0)
+        elif simulator == "clifford":
+            self.quantum_state = CliffordTableau()
         elif simulator == "stim":
             import stim
-            self.quantum_state = stim.TableauSimulator()
+            if rng is None:
+                self.quantum_state = stim.TableauSimulator()
+            else:
+                seed = int(self.rng.integers(2**63))
+                self.quantum_state = stim.TableauSimulator(seed = seed)
         else:
-            raise Exception("Don't know simulator {simulator}")
+            raise Exception(f"Don't know simulator {simulator}")
         self.buffer_qc = QuantumCircuit(0)
         self.deallocated_qubits = []
         self.simulator = simulator
         self.qubit_to_index_dict = {}
         self.qubit_counter = 0
+        
+        # Simulator indices of deallocated qubits. These qubits have been reset
+        # to |0> and are handed out again by add_qubit, such that the size of 
+        # the simulator state is bounded by the peak amount of live qubits
+        # instead of growing with every allocation.
+        self.free_indices = []
+        
+        # The amount of deallocations in the buffer, which have not been 
+        # applied yet (and therefore haven't been returned to free_indices)
+        self.pending_deallocations = 0
     
     def add_qubit(self):
-        if self.simulator == "qrisp":
-            self.quantum_state.add_qubit()
+        
+        # If there are no free indices but the buffer contains deallocations,
+        # we apply the buffer to make the deallocated indices available.
+        if not self.free_indices and self.pending_deallocations:
+            self.apply_buffer()
+        
+        if self.free_indices:
+            index = self.free_indices.pop()
+        else:
+            if self.simulator in ["qrisp", "clifford"]:
+                self.quantum_state.add_qubit()
+            index = self.qubit_counter
+            self.qubit_counter += 1
+        
         qb = self.buffer_qc.add_qubit()
-        self.qubit_to_index_dict[qb] = self.qubit_counter
-        self.qubit_counter += 1
+        self.qubit_to_index_dict[qb] = index
         return qb
     
     def append(self, op, qubits):
+        if op.name == "qb_dealloc":
+            self.pending_deallocations += 1
         self.buffer_qc.append(op, qubits)
             
     def apply_buffer(self):
         
         if self.simulator == "qrisp":
-            self.quantum_state = advance_quantum_state(self.buffer_qc.copy(), self.quantum_state, self.deallocated_qubits, self.qubit_to_index_dict)
+            if len(self.buffer_qc.data) == self.pending_deallocations:
+                # The buffer contains only deallocations (which is the case if
+                # add_qubit flushes the buffer), so we can skip the simulator
+                # and disentangle the qubits directly.
+                for instr in self.buffer_qc.data:
+                    index = self.qubit_to_index_dict[instr.qubits[0]]
+                    self.quantum_state.disentangle(index, warning = True)
+            else:
+                self.quantum_state = advance_quantum_state(
+                    self.buffer_qc.copy(),
+                    self.quantum_state,
+                    self.deallocated_qubits,
+                    self.qubit_to_index_dict,
+                    self.rng,
+                )
+        elif self.simulator == "clifford":
+            for instr in self.buffer_qc.data:
+                qubit_indices = [self.qubit_to_index_dict[qb] for qb in instr.qubits]
+                self.quantum_state.apply_operation(instr.op, qubit_indices)
         else:
             for instr in self.buffer_qc.data:
                 qubit_indices = [self.qubit_to_index_dict[qb] for qb in instr.qubits]
@@ -81,17 +137,40 @@ class BufferedQuantumState:
         for instr in self.buffer_qc.data:
             if instr.op.name == "qb_dealloc":
                 self.buffer_qc.qubits.remove(instr.qubits[0])
-                del self.qubit_to_index_dict[instr.qubits[0]]
+                index = self.qubit_to_index_dict.pop(instr.qubits[0])
+                self.reset_index(index)
+                self.free_indices.append(index)
         
+        self.pending_deallocations = 0
         self.buffer_qc = self.buffer_qc.clearcopy()
     
+    def reset_index(self, index):
+        # Resets the simulator qubit with the given index to the |0> state
+        # such that it can be handed out again by add_qubit.
+        if self.simulator == "qrisp":
+            if len(self.quantum_state.tensor_factors[index].qubits) > 1:
+                # The qubit could not be disentangled during the deallocation
+                # (faulty uncomputation), so we collapse it.
+                self.quantum_state.measure(index, keep_res = False, rng = self.rng)
+            # Replace the factor of the (now disentangled) qubit by |0>
+            self.quantum_state.tensor_factors[index] = TensorFactor([index])
+        elif self.simulator == "clifford":
+            self.quantum_state.reset(index, rng = self.rng)
+        else:
+            self.quantum_state.reset(index)
+    
     def measure(self, qubit):
         self.apply_buffer()
+        index = self.qubit_to_index_dict[qubit[0]]
         if self.simulator == "qrisp":
-            meas_res, self.quantum_state = self.quantum_state.measure(self.qubit_to_index_dict[qubit[0]], keep_res = True)
+            meas_res, self.quantum_state = self.quantum_state.measure(
+                index, keep_res = True, rng = self.rng
+            )
             return meas_res
+        elif self.simulator == "clifford":
+            return self.quantum_state.measure(index, rng = self.rng)
         elif self.simulator == "stim":
-            return self.quantum_state.measure(self.qubit_to_index_dict[qubit[0]])
+            return self.quantum_state.measure(index)
     
     def reset(self, qubit):
         
@@ -103,25 +182,28 @@ class BufferedQuantumState:
             self.buffer_qc.append(XGate(), qubit)
             
     def copy(self):
-        res = BufferedQuantumState()
+        res = BufferedQuantumState(rng = self.rng)
+        res.simulator = self.simulator
         res.buffer_qc = self.buffer_qc.copy()
         res.deallocated_qubits = list(self.deallocated_qubits)
         res.quantum_state = self.quantum_state.copy()
         res.qubit_to_index_dict = dict(self.qubit_to_index_dict)
         res.qubit_counter = self.qubit_counter
+        res.free_indices = list(self.free_indices)
+        res.pending_deallocations = self.pending_deallocations
         return res
     
-    def multi_measure(self, qubits, shots):
+    def multi_measure(self, qubits, shots, rng=None):
+        if rng is None:
+            rng = self.rng
         self.apply_buffer()
         qubit_indices = [self.qubit_to_index_dict[qb] for qb in qubits]
         mes_ints, probs = self.quantum_state.multi_measure(qubit_indices)
         
         if shots is not None and shots != 0:
-            samples = np.random.choice(len(mes_ints), int(shots), p=probs)
-            
-            samples = gen_res_dict(samples)
+            indices, counts = sample_counts(probs, shots, rng)
             res = {}
-            for k, v in samples.items():
+            for k, v in zip(indices, counts):
                 res[mes_ints[k]] = v
             return res
         else:
@@ -17,7 +17,7 @@
 """
 
 from jax.tree_util import tree_flatten, tree_unflatten
-from qrisp.jasp.jasp_expression import make_jaspr
+from qrisp.jasp.evaluation_tools.jaspr_cache import get_jaspr
 
 def qjit(function):
     """
@@ -69,15 +69,8 @@ def qjit(function):
     
     def jitted_function(*args):
         
-        if not hasattr(function, "jaspr_dict"):
-            function.jaspr_dict = {}
+        jaspr = get_jaspr(function, args)
         
-        args = list(args)
-        
-        signature = tuple([type(arg) for arg in args])
-        if not signature in function.jaspr_dict:
-            function.jaspr_dict[signature] = make_jaspr(function)(*args)
-        
-        return function.jaspr_dict[signature].qjit(*args, function_name = function.__name__)
+        return jaspr.qjit(*args, function_name = function.__name__)
     
     return jitted_function
\ No newline at end of file
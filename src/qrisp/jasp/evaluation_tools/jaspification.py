@@ -19,16 +19,24 @@
 from functools import lru_cache
 
 import jax
+from jax.core import Literal
 from jax.tree_util import tree_flatten, tree_unflatten
 
-from qrisp.jasp.interpreter_tools import extract_invalues, insert_outvalues, eval_jaxpr
+from qrisp.jasp.interpreter_tools import (
+    extract_invalues,
+    insert_outvalues,
+    eval_jaxpr,
+    compile_jaxpr,
+)
 from qrisp.jasp.evaluation_tools.buffered_quantum_state import BufferedQuantumState
+from qrisp.jasp.evaluation_tools.jaspr_cache import get_jaspr
 from qrisp.jasp.primitives import OperationPrimitive, AbstractQuantumCircuit, AbstractQubitArray, AbstractQubit
 from qrisp.core import recursive_qv_search
 from qrisp.circuit import fast_append
+from qrisp.simulator import get_rng
 
 
-def jaspify(func = None, terminal_sampling = False):
+def jaspify(func = None, terminal_sampling = False, rng = None):
     """
     This simulator is the established Qrisp simulator linked to the Jasp infrastructure.
     Among a variety of simulation tricks, the simulator can leverage state sparsity,
@@ -49,6 +57,12 @@ def jaspify(func = None, terminal_sampling = False):
         Whether to leverage the terminal sampling strategy. Significantly fast 
         for all sampling tasks but can yield incorrect results in some situations.
         Check out :ref:`terminal_sampling` form more details. The default is False.
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The seed or random number generator for the measurement outcomes. If a
+        seed is given, every call of the simulation yields the same results. For
+        independent streams (for instance to distribute simulations over several
+        processes) use :func:`qrisp.simulator.spawn_rngs`. The default is None,
+        which uses the global numpy random state.
 
     Returns
     -------
@@ -127,16 +141,7 @@ def jaspify(func = None, terminal_sampling = False):
         func = None
     
     if func is None:
-        return lambda x : jaspify(x, terminal_sampling = terminal_sampling)
-    
-    from qrisp.jasp import make_jaspr
-    
-    treedef_container = []
-    def tracing_function(*args):
-        res = func(*args)
-        flattened_values, tree_def = tree_flatten(res)
-        treedef_container.append(tree_def)
-        return flattened_values
+        return lambda x : jaspify(x, terminal_sampling = terminal_sampling, rng = rng)
     
     def return_function(*args):
         # To prevent "accidental deletion" induced non-determinism we set the 
@@ -145,32 +150,44 @@ def jaspify(func = None, terminal_sampling = False):
             garbage_collection = "manual"
         else:
             garbage_collection = "auto"
-        jaspr = make_jaspr(tracing_function, garbage_collection = garbage_collection)(*args)
-        jaspr_res = simulate_jaspr(jaspr, *args, terminal_sampling = terminal_sampling)
+        jaspr, out_tree = get_jaspr(
+            func, args, garbage_collection = garbage_collection, flatten_output = True
+        )
+        jaspr_res = simulate_jaspr(
+            jaspr, *args, terminal_sampling = terminal_sampling, rng = rng
+        )
         if isinstance(jaspr_res, tuple):
-            jaspr_res = tree_unflatten(treedef_container[0], jaspr_res)
+            jaspr_res = tree_unflatten(out_tree, jaspr_res)
         if len(recursive_qv_search(jaspr_res)):
             raise Exception("Tried to jaspify function returning a QuantumVariable")
         return jaspr_res
     return return_function
 
 
-def stimulate(func = None):
+def stimulate(func = None, rng = None):
     """
-    This function leverages the 
-    `Stim simulator <https://github.com/quantumlib/Stim?tab=readme-ov-file>`_
-    to evaluate a Jasp-traceable function containing only Clifford gates.
-    Stim is a popular tool to simulate quantum error correction codes.
+    This function evaluates a Jasp-traceable function containing only Clifford 
+    gates using the stabilizer tableau simulator of Qrisp 
+    (``qrisp.simulator.CliffordTableau``). Similar to the popular
+    `Stim simulator <https://github.com/quantumlib/Stim?tab=readme-ov-file>`_,
+    this allows the simulation of quantum error correction codes with thousands 
+    of qubits.
     
     .. note::
         
-        To use this simulator, you need stim installed, which can be achieved via
-        ``pip install stim``.
+        Besides the usual Clifford gates (X, Y, Z, H, S, S_dg, SX, CX, CY, CZ,
+        SWAP, ...) every (at most two qubit) gate with a Clifford unitary 
+        (for instance ``rz(np.pi/2)``) and every composite gate that 
+        decomposes into Clifford gates is supported. To use the Stim simulator 
+        instead, call ``simulate_jaspr(jaspr, *args, simulator = "stim")``.
     
     Parameters
     ----------
     func : callable
         The function to simulate.
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The seed or random number generator for the measurement outcomes. The 
+        default is None, which uses the global numpy random state.
 
     Returns
     -------
@@ -226,40 +243,43 @@ def stimulate(func = None):
 
     """
     
-    from qrisp.jasp import make_jaspr
-    
-    treedef_container = []
-    def tracing_function(*args):
-        res = func(*args)
-        flattened_values, tree_def = tree_flatten(res)
-        treedef_container.append(tree_def)
-        return flattened_values
+    if func is None:
+        return lambda x : stimulate(x, rng = rng)
     
     def return_function(*args):
-        jaspr = make_jaspr(tracing_function)(*args)
-        jaspr_res = simulate_jaspr(jaspr, *args, simulator = "stim")
+        jaspr, out_tree = get_jaspr(func, args, flatten_output = True)
+        jaspr_res = simulate_jaspr(jaspr, *args, simulator = "clifford", rng = rng)
         if isinstance(jaspr_res, tuple):
-            jaspr_res = tree_unflatten(treedef_container[0], jaspr_res)
+            jaspr_res = tree_unflatten(out_tree, jaspr_res)
         if len(recursive_qv_search(jaspr_res)):
             raise Exception("Tried to simulate function returning a QuantumVariable")
         return jaspr_res
     return return_function
 
 
-def simulate_jaspr(jaspr, *args, terminal_sampling = False, simulator = "qrisp"):
+def simulate_jaspr(
+    jaspr, *args, terminal_sampling = False, simulator = "qrisp", rng = None
+):
     
     from qrisp.alg_primitives.mcx_algs.circuit_library import gidney_qc
     
     if len(jaspr.outvars) == 1:
         return None
     
-    if simulator == "stim":
+    if simulator in ["stim", "clifford"]:
         if terminal_sampling:
-            raise Exception("Terminal sampling with stim is currently not implemented")
+            raise Exception(
+                f"Terminal sampling with the {simulator} simulator is currently not "
+                "implemented"
+            )
     elif not simulator == "qrisp":
         raise Exception(f"Don't know simulator {simulator}")
     
-    args =  list(tree_flatten(args)[0]) + [BufferedQuantumState(simulator)]
+    # All quantum states of the simulation draw from the same random number
+    # generator (see qrisp.simulator.rng_management)
+    rng = get_rng(rng)
+    
+    args =  list(tree_flatten(args)[0]) + [BufferedQuantumState(simulator, rng)]
             
     def eqn_evaluator(eqn, context_dic):
         
@@ -277,7 +297,10 @@ def simulate_jaspr(jaspr, *args, terminal_sampling = False, simulator = "qrisp")
                 from qrisp.jasp.interpreter_tools import terminal_sampling_evaluator
                 
                 if function_name in translation_dic:
-                    terminal_sampling_evaluator(translation_dic[function_name])(eqn, context_dic, eqn_evaluator = eqn_evaluator)
+                    evaluator = terminal_sampling_evaluator(
+                        translation_dic[function_name], rng
+                    )
+                    evaluator(eqn, context_dic, eqn_evaluator = eqn_evaluator)
                     return
             
             invalues = extract_invalues(eqn, context_dic)
@@ -321,18 +344,102 @@ def simulate_jaspr(jaspr, *args, terminal_sampling = False, simulator = "qrisp")
             
             
         elif eqn.primitive.name == "jasp.quantum_kernel":
-            insert_outvalues(eqn, context_dic, BufferedQuantumState(simulator))
+            insert_outvalues(eqn, context_dic, BufferedQuantumState(simulator, rng))
         else:
             return True
     
+    runtime = SimulationRuntime(simulator, rng, terminal_sampling, eqn_evaluator)
+    
     with fast_append(3):
-        res = eval_jaxpr(jaspr, eqn_evaluator = eqn_evaluator)(*(args))
+        res = compile_jaxpr(jaspr, simulation_eqn_compiler)(*args, runtime = runtime)
     
     if len(jaspr.outvars) == 2:
         return res[0]
     else:
         return res[:-1]
     
+# This class bundles the state of a simulation, which is accessed by the 
+# instructions created in simulation_eqn_compiler. Since the instructions are
+# cached per Jaspr, the state is not bound during the compilation but passed as
+# the runtime object.
+class SimulationRuntime:
+    
+    def __init__(self, simulator, rng, terminal_sampling, eqn_evaluator):
+        self.simulator = simulator
+        self.rng = rng
+        self.terminal_sampling = terminal_sampling
+        # The equation evaluator of the (non-compiled) interpreter. This is used
+        # for the terminal sampling primitives, which require custom evaluation
+        # of their sub-Jaxprs.
+        self.eqn_evaluator = eqn_evaluator
+
+
+# This function describes how the Jaspr equations are compiled for simulation
+# (see qrisp.jasp.interpreter_tools.compiled_interpreter). Returns None for all
+# equations, which can be handled by the default compilation.
+def simulation_eqn_compiler(eqn):
+    
+    if eqn.primitive.name == "pjit":
+        
+        function_name = eqn.params["name"]
+        
+        translation_dic = {"expectation_value_eval_function" : "ev",
+                           "sampling_eval_function" : "array",
+                           "dict_sampling_eval_function" : "dict"}
+        
+        if function_name in translation_dic:
+            
+            from qrisp.jasp.interpreter_tools import (
+                terminal_sampling_evaluator,
+                ContextDict,
+            )
+            from qrisp.jasp.interpreter_tools.compiled_interpreter import lower_pjit
+            
+            pjit_function = lower_pjit(eqn, simulation_eqn_compiler)
+            
+            def sampling_function(runtime, *invalues):
+                
+                if not runtime.terminal_sampling:
+                    return pjit_function(runtime, *invalues)
+                
+                context_dic = ContextDict(
+                    {
+                        var : value
+                        for var, value in zip(eqn.invars, invalues)
+                        if not isinstance(var, Literal)
+                    }
+                )
+                evaluator = terminal_sampling_evaluator(
+                    translation_dic[function_name], runtime.rng
+                )
+                evaluator(eqn, context_dic, eqn_evaluator = runtime.eqn_evaluator)
+                return [context_dic[var] for var in eqn.outvars]
+            
+            return sampling_function
+        
+        # We simulate the inverse Gidney mcx via the non-hybrid version because
+        # the hybrid version prevents the simulator from fusing gates, which
+        # slows down the simulation
+        if function_name == "gidney_mcx_inv":
+            
+            from qrisp.alg_primitives.mcx_algs.circuit_library import gidney_qc
+            
+            def gidney_mcx_inv_function(runtime, *invalues):
+                invalues[-1].append(gidney_qc.inverse().to_gate(), list(invalues[:-1]))
+                return [invalues[-1]]
+            
+            return gidney_mcx_inv_function
+    
+    elif eqn.primitive.name == "jasp.quantum_kernel":
+        
+        def quantum_kernel_function(runtime):
+            return [BufferedQuantumState(runtime.simulator, runtime.rng)]
+        
+        return quantum_kernel_function
+    
+    return None
+
+
 @lru_cache(maxsize = int(1E5))
 def compile_cl_func(jaxpr, function_name):
     return jax.jit(eval_jaxpr(jaxpr)), [True]
@@ -0,0 +1,226 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+from collections import OrderedDict
+
+from jax.api_util import shaped_abstractify
+from jax.core import Tracer
+from jax.tree_util import tree_flatten
+
+from qrisp.jasp.jasp_expression import make_jaspr
+
+# This module contains the cache for the Jaspr objects traced by the evaluation
+# tools (jaspify, terminal_sampling, stimulate, count_ops and qjit). Calling a 
+# decorated function traces the function into a Jaspr, which is subsequently
+# simulated/analyzed. Since the Jaspr only depends on the abstract signature of the
+# arguments, repeated calls (for instance within a classical parameter scan) can
+# reuse the Jaspr of a previous call.
+# The cache is keyed on the traced function, the abstract values of the arguments,
+# the values of the arguments that can not be abstracted and the garbage collection
+# mode. It uses a least recently used eviction strategy, bounded by the amount
+# of cached Jasprs.
+
+
+class JasprCache:
+    def __init__(self, maxsize):
+        # The maximum amount of cached Jasprs
+        self.maxsize = maxsize
+
+        self.jasprs = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            res = self.jasprs[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.jasprs.move_to_end(key)
+        self.hits += 1
+        return res
+
+    def insert(self, key, res):
+        self.jasprs[key] = res
+        self.jasprs.move_to_end(key)
+        self.evict()
+
+    # Evict the least recently used Jasprs
+    def evict(self):
+        while len(self.jasprs) > self.maxsize:
+            self.jasprs.popitem(last = False)
+
+    def clear(self):
+        self.jasprs.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+jaspr_cache = JasprCache(maxsize = 128)
+
+
+def set_jaspr_cache_size(maxsize):
+    """
+    Sets the maximum amount of Jasprs stored in the trace cache of the Jasp
+    evaluation tools.
+
+    Functions decorated with :ref:`jaspify <jaspify>`,
+    :ref:`terminal_sampling <terminal_sampling>`, :ref:`stimulate <stimulate>`,
+    :ref:`count_ops <count_ops>` or ``qjit`` are traced into a Jaspr on every call.
+    The Jaspr only depends on the abstract signature (i.e. shape and dtype) of the
+    arguments, so repeated calls with the same signature reuse the previously
+    traced Jaspr. If the cache is full, the least recently used Jaspr is evicted.
+
+    .. note::
+
+        Similar to ``jax.jit``, the cache assumes that the traced function is
+        pure. Modifying global variables, which are read by the function,
+        between calls is not reflected in the cached Jaspr. Call
+        :func:`clear_jaspr_cache <qrisp.jasp.clear_jaspr_cache>` in this case.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum amount of cached Jasprs. A value of 0 disables the cache.
+        The default is 128.
+
+    Examples
+    --------
+
+    >>> from qrisp import QuantumFloat, h, measure
+    >>> from qrisp.jasp import jaspify, clear_jaspr_cache, get_jaspr_cache_info
+    >>> clear_jaspr_cache()
+    >>> @jaspify
+    ... def main(i):
+    ...     qf = QuantumFloat(4)
+    ...     h(qf[i])
+    ...     return measure(qf)
+    >>> results = [main(i) for i in range(4)]
+    >>> get_jaspr_cache_info()
+    {'hits': 3, 'misses': 1, 'cached_jasprs': 1, 'maxsize': 128}
+
+    """
+    jaspr_cache.maxsize = maxsize
+    jaspr_cache.evict()
+
+
+def clear_jaspr_cache():
+    """
+    Clears the trace cache of the Jasp evaluation tools and resets its statistics.
+    """
+    jaspr_cache.clear()
+
+
+def get_jaspr_cache_info():
+    """
+    Returns the statistics of the trace cache of the Jasp evaluation tools.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the amount of cache hits and misses, the amount
+        of cached Jasprs and the maximum size of the cache.
+
+    """
+    return {
+        "hits": jaspr_cache.hits,
+        "misses": jaspr_cache.misses,
+        "cached_jasprs": len(jaspr_cache.jasprs),
+        "maxsize": jaspr_cache.maxsize,
+    }
+
+
+# Returns the cache key of a call signature. Arguments that can be traced are
+# represented by their abstract value. The remaining (static) arguments are
+# represented by their value. If the arguments contain tracers or unhashable
+# static values, None is returned, i.e. the call is not cached.
+def signature_key(function, args, garbage_collection, flatten_output):
+    leaves, in_tree = tree_flatten(args)
+
+    signature = []
+    for leaf in leaves:
+        if isinstance(leaf, Tracer):
+            return None
+        try:
+            signature.append(shaped_abstractify(leaf))
+        except TypeError:
+            try:
+                hash(leaf)
+            except TypeError:
+                return None
+            signature.append((type(leaf), leaf))
+
+    return (function, garbage_collection, flatten_output, in_tree, tuple(signature))
+
+
+def get_jaspr(function, args, garbage_collection = "auto", flatten_output = False):
+    """
+    Traces the given function into a Jaspr for the given arguments. If a function
+    has been traced for the same signature before, the cached Jaspr is returned.
+
+    Parameters
+    ----------
+    function : callable
+        The function to trace.
+    args : tuple
+        The arguments to trace the function with.
+    garbage_collection : str or bool, optional
+        The garbage collection mode of the tracing process. The default is "auto".
+    flatten_output : bool, optional
+        If set to True, the result of the function is flattened into a list and
+        the tree definition of the result is returned in addition to the Jaspr.
+        The default is False.
+
+    Returns
+    -------
+    Jaspr or tuple
+        The traced Jaspr. If flatten_output is True, a tuple (Jaspr, PyTreeDef) is
+        returned.
+
+    """
+    key = signature_key(function, args, garbage_collection, flatten_output)
+
+    if key is not None and jaspr_cache.maxsize > 0:
+        res = jaspr_cache.get(key)
+        if res is not None:
+            return res
+    else:
+        key = None
+
+    if flatten_output:
+        out_trees = []
+
+        def tracing_function(*args):
+            res = function(*args)
+            flattened_values, out_tree = tree_flatten(res)
+            out_trees.append(out_tree)
+            return flattened_values
+
+        jaspr = make_jaspr(
+            tracing_function, garbage_collection = garbage_collection
+        )(*args)
+        res = (jaspr, out_trees[-1])
+    else:
+        res = make_jaspr(function, garbage_collection = garbage_collection)(*args)
+
+    if key is not None:
+        jaspr_cache.insert(key, res)
+
+    return res
@@ -94,18 +94,9 @@ def count_ops(function):
     
     def ops_counter(*args):
         
-        from qrisp.jasp import make_jaspr
+        from qrisp.jasp.evaluation_tools.jaspr_cache import get_jaspr
         
-        if not hasattr(function, "jaspr_dict"):
-            function.jaspr_dict = {}
-        
-        args = list(args)
-        
-        signature = tuple([type(arg) for arg in args])
-        if not signature in function.jaspr_dict:
-            function.jaspr_dict[signature] = make_jaspr(function)(*args)
-        
-        return function.jaspr_dict[signature].count_ops(*args)
+        return get_jaspr(function, args).count_ops(*args)
     
     return ops_counter
 
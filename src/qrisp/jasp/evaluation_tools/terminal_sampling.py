@@ -21,11 +21,11 @@ import numpy as np
 import jax.numpy as jnp
 
 from qrisp.jasp.tracing_logic import qache
-from qrisp.jasp.jasp_expression import make_jaspr
+from qrisp.jasp.evaluation_tools.jaspr_cache import get_jaspr
 from qrisp.jasp.interpreter_tools import extract_invalues, insert_outvalues, eval_jaxpr
 from qrisp.jasp.evaluation_tools.buffered_quantum_state import BufferedQuantumState
 
-def terminal_sampling(func = None, shots = 0):
+def terminal_sampling(func = None, shots = 0, rng = None):
     """
     The ``terminal_sampling`` decorator performs a hybrid simulation and afterwards
     samples from the resulting quantum state.
@@ -53,6 +53,10 @@ def terminal_sampling(func = None, shots = 0):
     shots : int, optional
         An integer specifying the amount of shots. The default is None, which 
         will result in probabilities being returned.
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The seed or random number generator for drawing the samples. If a seed is
+        given, every call of the sampling function yields the same results. The
+        default is None, which uses the global numpy random state.
 
     Returns
     -------
@@ -131,7 +135,7 @@ def terminal_sampling(func = None, shots = 0):
         func = None
     
     if func is None:
-        return lambda x : terminal_sampling(x, shots)
+        return lambda x : terminal_sampling(x, shots, rng)
     
     def tracing_function(*args):
         from qrisp.jasp.program_control import expectation_value
@@ -139,7 +143,7 @@ def terminal_sampling(func = None, shots = 0):
     
     def return_function(*args):
         from qrisp.jasp import simulate_jaspr
-        jaspr = make_jaspr(tracing_function, garbage_collection = True)(*args)
-        return simulate_jaspr(jaspr, *args, terminal_sampling = True)
+        jaspr = get_jaspr(tracing_function, args, garbage_collection = True)
+        return simulate_jaspr(jaspr, *args, terminal_sampling = True, rng = rng)
     
     return return_function
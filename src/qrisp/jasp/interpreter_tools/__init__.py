@@ -19,3 +19,4 @@
 from qrisp.jasp.interpreter_tools.dynamic_list import *
 from qrisp.jasp.interpreter_tools.abstract_interpreter import *
 from qrisp.jasp.interpreter_tools.interpreters import *
+from qrisp.jasp.interpreter_tools.compiled_interpreter import *
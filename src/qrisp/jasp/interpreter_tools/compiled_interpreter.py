@@ -0,0 +1,513 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+from functools import lru_cache
+
+import jax
+import jax.numpy as jnp
+from jax.core import ClosedJaxpr, Jaxpr, Literal, DropVar, jaxpr_as_fun, join_effects
+
+# This module contains the compiled interpreter for Jaxprs. Instead of walking the
+# equations of a Jaxpr and looking up the values of the variables in a dictionary
+# (as eval_jaxpr does), the Jaxpr is lowered once into a list of instructions.
+# Each instruction is a pre-bound function together with the indices ("slots")
+# of its input and output values in a flat list, which holds the values during
+# the evaluation.
+
+# Equations are lowered as follows:
+
+# 1. An equation compiler (given by the user of the interpreter) can provide a
+#    custom implementation for an equation (for instance the creation of a new
+#    simulator state for the quantum_kernel primitive).
+# 2. Purely classical equations are collected into blocks. Each block is
+#    evaluated eagerly until it has been executed jit_threshold times. From then
+#    on, the block is compiled via jax.jit, such that the whole block requires
+#    only a single dispatch.
+# 3. Control flow (while, cond, scan) and pjit equations containing quantum
+#    operations are lowered recursively into compiled sub-Jaxprs.
+# 4. The remaining quantum primitives call their implementation directly.
+
+# The lowering is cached per (Jaxpr, equation compiler), so repeated evaluations
+# of the same Jaxpr (for instance loop bodies or cached Jasprs) skip the lowering.
+
+# The amount of executions of a classical block after which it is compiled
+jit_threshold = 32
+
+
+class CompiledJaxpr:
+    
+    def __init__(self, jaxpr, eqn_compiler = None, jit_classical = True):
+        
+        self.jaxpr = jaxpr
+        
+        # The values of literals are stored in the slot template. The first slot
+        # receives the outputs of dropped variables.
+        self.slot_template = [None]
+        slot_dic = {}
+        
+        def get_slot(var):
+            if isinstance(var, Literal):
+                self.slot_template.append(wrap_value(var.val))
+                return len(self.slot_template) - 1
+            if isinstance(var, DropVar):
+                return 0
+            if var not in slot_dic:
+                slot_dic[var] = len(self.slot_template)
+                self.slot_template.append(None)
+            return slot_dic[var]
+        
+        self.in_slots = [get_slot(var) for var in jaxpr.constvars + jaxpr.invars]
+        
+        eqns = remove_dead_eqns(jaxpr)
+        
+        # Determine the lowering of each equation. Custom lowerings of the
+        # equation compiler take precedence.
+        lowerings = []
+        for eqn in eqns:
+            custom_lowering = None
+            if eqn_compiler is not None:
+                custom_lowering = eqn_compiler(eqn)
+            if custom_lowering is not None:
+                lowerings.append(custom_lowering)
+            elif not jit_classical:
+                lowerings.append(lower_primitive(eqn))
+            elif is_classical_eqn(eqn):
+                lowerings.append("classical")
+            else:
+                lowerings.append(default_lowering(eqn, eqn_compiler))
+        
+        blocks = collect_classical_blocks(eqns, lowerings)
+        
+        # Determine the variables that are read outside of each block
+        read_vars = set(var for var in jaxpr.outvars if not isinstance(var, Literal))
+        for eqn, lowering in zip(eqns, lowerings):
+            if lowering != "classical":
+                read_vars.update(
+                    var for var in eqn.invars if not isinstance(var, Literal)
+                )
+        for block_eqns in blocks.values():
+            block_outvars = set(var for eqn in block_eqns for var in eqn.outvars)
+            for eqn in block_eqns:
+                read_vars.update(
+                    var
+                    for var in eqn.invars
+                    if not isinstance(var, Literal) and var not in block_outvars
+                )
+        
+        self.instructions = []
+        for i in range(len(eqns)):
+            
+            if i in blocks:
+                block_jaxpr = create_block_jaxpr(blocks[i], read_vars)
+                function = ClassicalBlock(block_jaxpr)
+                invars = block_jaxpr.invars
+                outvars = block_jaxpr.outvars
+            elif lowerings[i] == "classical":
+                # This equation is part of a block, which is evaluated at the
+                # position of its first equation
+                continue
+            else:
+                function = lowerings[i]
+                invars = eqns[i].invars
+                outvars = eqns[i].outvars
+            
+            self.instructions.append((function, 
+                                      tuple(get_slot(var) for var in invars), 
+                                      tuple(get_slot(var) for var in outvars)))
+        
+        self.out_slots = [get_slot(var) for var in jaxpr.outvars]
+    
+    def run(self, runtime, args):
+        
+        slots = list(self.slot_template)
+        
+        for i, value in zip(self.in_slots, args):
+            slots[i] = value
+        
+        for function, in_slots, out_slots in self.instructions:
+            outvalues = function(runtime, *[slots[i] for i in in_slots])
+            for i, value in zip(out_slots, outvalues):
+                slots[i] = value
+        
+        return [slots[i] for i in self.out_slots]
+
+
+def compile_jaxpr(jaxpr, eqn_compiler = None):
+    """
+    Lowers a Jaxpr into a function that evaluates a list of pre-bound instructions.
+    
+    In contrast to :meth:`eval_jaxpr <qrisp.jasp.eval_jaxpr>`, the variables are
+    not looked up in a dictionary but are stored in a flat list, which is indexed
+    by slots determined during the lowering. Purely classical equations are
+    combined into blocks, which are compiled via ``jax.jit`` once they have been
+    executed repeatedly. The lowering is cached, such that compiling the same
+    Jaxpr twice returns the same function.
+
+    Parameters
+    ----------
+    jaxpr : jax.core.Jaxpr or jax.core.ClosedJaxpr or Jaspr
+        The Jaxpr to compile.
+    eqn_compiler : callable, optional
+        A function receiving an equation and returning either None (for the default
+        lowering) or a function ``f(runtime, *invalues)`` returning the list of
+        outvalues of the equation. The ``runtime`` object is passed to the compiled
+        function at call time. The default is None.
+
+    Returns
+    -------
+    callable
+        A function ``f(*args, runtime = None)`` evaluating the Jaxpr. Similar to
+        ``eval_jaxpr``, a single result is returned as is and multiple results as
+        a tuple.
+
+    """
+    
+    jaxpr, consts = split_consts(jaxpr)
+    
+    compiled_jaxpr = lower_jaxpr(jaxpr, eqn_compiler)
+    
+    def compiled_function(*args, runtime = None):
+        
+        args = consts + [wrap_value(arg) for arg in args]
+        
+        if len(args) != len(compiled_jaxpr.in_slots):
+            raise Exception("Tried to evaluate jaxpr with insufficient arguments")
+        
+        res = compiled_jaxpr.run(runtime, args)
+        
+        if len(res) == 1:
+            return res[0]
+        else:
+            return tuple(res)
+    
+    return compiled_function
+
+
+@lru_cache(maxsize = int(1E5))
+def lower_jaxpr(jaxpr, eqn_compiler = None, jit_classical = True):
+    return CompiledJaxpr(jaxpr, eqn_compiler, jit_classical)
+
+
+# Returns the (open) Jaxpr and the list of constants of the given Jaxpr
+def split_consts(jaxpr):
+    from qrisp.jasp import Jaspr
+    
+    if isinstance(jaxpr, ClosedJaxpr):
+        return jaxpr.jaxpr, list(jaxpr.consts)
+    elif isinstance(jaxpr, Jaspr):
+        return jaxpr, list(jaxpr.consts)
+    else:
+        return jaxpr, []
+
+
+# Python scalars are represented as arrays (like in the ContextDict of eval_jaxpr)
+def wrap_value(value):
+    if type(value) == int:
+        return jnp.array(value, dtype = jnp.dtype("int64"))
+    elif type(value) == float:
+        return jnp.array(value, dtype = jnp.dtype("float64"))
+    else:
+        return value
+
+
+# Lowers a sub-Jaxpr (of a control flow or pjit equation) into a function
+# receiving the runtime and the list of arguments
+def lower_sub_jaxpr(jaxpr, eqn_compiler):
+    
+    jaxpr, consts = split_consts(jaxpr)
+    compiled_jaxpr = lower_jaxpr(jaxpr, eqn_compiler)
+    
+    if not len(consts):
+        return compiled_jaxpr.run
+    
+    def sub_jaxpr_function(runtime, args):
+        return compiled_jaxpr.run(runtime, consts + list(args))
+    
+    return sub_jaxpr_function
+
+
+def default_lowering(eqn, eqn_compiler):
+    
+    primitive_name = eqn.primitive.name
+    
+    if primitive_name == "pjit":
+        return lower_pjit(eqn, eqn_compiler)
+    elif primitive_name == "while":
+        return lower_while_loop(eqn, eqn_compiler)
+    elif primitive_name == "cond":
+        return lower_cond(eqn, eqn_compiler)
+    elif primitive_name == "scan":
+        return lower_scan(eqn, eqn_compiler)
+    else:
+        return lower_primitive(eqn)
+
+
+def lower_primitive(eqn):
+    
+    from qrisp.jasp.primitives import QuantumPrimitive
+    
+    primitive = eqn.primitive
+    params = eqn.params
+    
+    # Quantum primitives are evaluated on concrete values, so we can skip
+    # the tracing machinery of bind and call the implementation directly.
+    if isinstance(primitive, QuantumPrimitive):
+        bind = primitive.impl
+    else:
+        bind = primitive.bind
+    
+    if primitive.multiple_results:
+        def primitive_function(runtime, *invalues):
+            return [wrap_value(value) for value in bind(*invalues, **params)]
+    else:
+        def primitive_function(runtime, *invalues):
+            return [wrap_value(bind(*invalues, **params))]
+    
+    return primitive_function
+
+
+def lower_pjit(eqn, eqn_compiler):
+    
+    sub_jaxpr_function = lower_sub_jaxpr(eqn.params["jaxpr"], eqn_compiler)
+    
+    def pjit_function(runtime, *invalues):
+        return sub_jaxpr_function(runtime, invalues)
+    
+    return pjit_function
+
+
+def lower_while_loop(eqn, eqn_compiler):
+    
+    cond_nconsts = eqn.params["cond_nconsts"]
+    body_nconsts = eqn.params["body_nconsts"]
+    
+    cond_function = lower_sub_jaxpr(eqn.params["cond_jaxpr"], eqn_compiler)
+    body_function = lower_sub_jaxpr(eqn.params["body_jaxpr"], eqn_compiler)
+    
+    def while_loop_function(runtime, *invalues):
+        
+        cond_consts = list(invalues[:cond_nconsts])
+        body_consts = list(invalues[cond_nconsts:cond_nconsts + body_nconsts])
+        carry = list(invalues[cond_nconsts + body_nconsts:])
+        
+        while cond_function(runtime, cond_consts + carry)[0]:
+            carry = body_function(runtime, body_consts + carry)
+        
+        return carry
+    
+    return while_loop_function
+
+
+def lower_cond(eqn, eqn_compiler):
+    
+    branch_functions = [
+        lower_sub_jaxpr(branch, eqn_compiler) for branch in eqn.params["branches"]
+    ]
+    
+    def cond_function(runtime, index, *invalues):
+        return branch_functions[int(index)](runtime, invalues)
+    
+    return cond_function
+
+
+def lower_scan(eqn, eqn_compiler):
+    
+    body_function = lower_sub_jaxpr(eqn.params["jaxpr"], eqn_compiler)
+    
+    length = eqn.params["length"]
+    reverse = eqn.params["reverse"]
+    const_amount = eqn.params["num_consts"]
+    carry_amount = eqn.params["num_carry"]
+    
+    def scan_function(runtime, *invalues):
+        
+        consts = list(invalues[:const_amount])
+        carry = list(invalues[const_amount:const_amount + carry_amount])
+        xs = invalues[const_amount + carry_amount:]
+        
+        ys = []
+        
+        indices = range(length)
+        if reverse:
+            indices = reversed(indices)
+        
+        for i in indices:
+            res = body_function(runtime, consts + carry + [x[i] for x in xs])
+            carry = res[:carry_amount]
+            ys.append(res[carry_amount:])
+        
+        if reverse:
+            ys = ys[::-1]
+        
+        y_amount = len(eqn.outvars) - carry_amount
+        
+        return carry + [jnp.stack([y[j] for y in ys]) for j in range(y_amount)]
+    
+    return scan_function
+
+
+class ClassicalBlock:
+    
+    def __init__(self, jaxpr):
+        self.jaxpr = jaxpr
+        self.executions = 0
+        self.jitted_function = None
+        self.eager_function = lower_jaxpr(jaxpr, jit_classical = False).run
+    
+    def __call__(self, runtime, *invalues):
+        
+        if self.jitted_function is not None:
+            return self.jitted_function(*invalues)
+        
+        self.executions += 1
+        if self.executions >= jit_threshold:
+            self.jitted_function = jax.jit(jaxpr_as_fun(ClosedJaxpr(self.jaxpr, [])))
+        
+        return self.eager_function(runtime, invalues)
+
+
+# Collects the classical equations into blocks. A classical equation is added
+# to the current block, if it doesn't depend on the result of an equation, which
+# is evaluated after the start of the block. Since the block is evaluated at the
+# position of its first equation, this ensures that all inputs are available.
+# Equations with side effects are not moved across other equations.
+# Returns a dictionary mapping the index of the first equation of a block to
+# the list of equations of the block.
+def collect_classical_blocks(eqns, lowerings):
+    
+    blocks = {}
+    block_start = None
+    later_vars = set()
+    interrupted = False
+    
+    for i in range(len(eqns)):
+        eqn = eqns[i]
+        
+        if lowerings[i] == "classical":
+            
+            if block_start is not None:
+                if eqn.effects and interrupted:
+                    block_start = None
+                for var in eqn.invars:
+                    if not isinstance(var, Literal) and var in later_vars:
+                        block_start = None
+                        break
+            
+            if block_start is None:
+                block_start = i
+                blocks[i] = []
+                later_vars = set()
+                interrupted = False
+            
+            blocks[block_start].append(eqn)
+        
+        elif block_start is not None:
+            later_vars.update(eqn.outvars)
+            interrupted = True
+    
+    return blocks
+
+
+# Creates a Jaxpr from a block of classical equations. The outputs of the Jaxpr
+# are the variables of the block, which are read outside of the block.
+def create_block_jaxpr(block_eqns, read_vars):
+    
+    invars = []
+    defined_vars = set()
+    
+    for eqn in block_eqns:
+        for var in eqn.invars:
+            if isinstance(var, Literal) or var in defined_vars or var in invars:
+                continue
+            invars.append(var)
+        defined_vars.update(eqn.outvars)
+    
+    outvars = [
+        var
+        for eqn in block_eqns
+        for var in eqn.outvars
+        if not isinstance(var, DropVar) and var in read_vars
+    ]
+    
+    effects = join_effects(*[eqn.effects for eqn in block_eqns])
+    
+    return Jaxpr([], invars, outvars, block_eqns, effects)
+
+
+# Determines whether an equation (and all of its sub-Jaxprs) only acts on classical
+# values. Such equations can be compiled using jax.jit.
+def is_classical_eqn(eqn):
+    
+    from qrisp.jasp.primitives import QuantumPrimitive
+    
+    if isinstance(eqn.primitive, QuantumPrimitive):
+        return False
+    
+    for var in eqn.invars + eqn.outvars:
+        if is_quantum_aval(var.aval):
+            return False
+    
+    for jaxpr in sub_jaxprs(eqn):
+        if not is_classical_jaxpr(split_consts(jaxpr)[0]):
+            return False
+    
+    return True
+
+
+@lru_cache(maxsize = int(1E5))
+def is_classical_jaxpr(jaxpr):
+    for eqn in jaxpr.eqns:
+        if not is_classical_eqn(eqn):
+            return False
+    return True
+
+
+def is_quantum_aval(aval):
+    from qrisp.jasp.primitives import (
+        AbstractQuantumCircuit,
+        AbstractQubitArray,
+        AbstractQubit,
+    )
+    return isinstance(aval, (AbstractQuantumCircuit, AbstractQubitArray, AbstractQubit))
+
+
+# Returns the Jaxprs contained in the parameters of an equation
+def sub_jaxprs(eqn):
+    res = []
+    for param in eqn.params.values():
+        if isinstance(param, (tuple, list)):
+            res.extend(x for x in param if isinstance(x, (Jaxpr, ClosedJaxpr)))
+        elif isinstance(param, (Jaxpr, ClosedJaxpr)):
+            res.append(param)
+    return res
+
+
+# Removes the classical equations whose results are not used
+def remove_dead_eqns(jaxpr):
+    
+    live_vars = set(var for var in jaxpr.outvars if not isinstance(var, Literal))
+    
+    res = []
+    for eqn in jaxpr.eqns[::-1]:
+        is_dead = all(var not in live_vars for var in eqn.outvars)
+        if not eqn.effects and is_dead and is_classical_eqn(eqn):
+            continue
+        live_vars.update(var for var in eqn.invars if not isinstance(var, Literal))
+        res.append(eqn)
+    
+    return res[::-1]
@@ -17,7 +17,6 @@
 """
 
 from functools import lru_cache
-from random import shuffle
 
 import numpy as np
 
@@ -26,6 +25,7 @@ import jax
 
 from qrisp.jasp.interpreter_tools.abstract_interpreter import eval_jaxpr, extract_invalues, insert_outvalues, exec_eqn
 from qrisp.jasp.interpreter_tools.interpreters.control_flow_interpretation import evaluate_while_loop
+from qrisp.simulator.rng_management import get_rng
 
 # The following function implements the behavior of the jaspify simulator for terminal sampling
 # To understand the function consider the result of tracing a simple sampling task
@@ -140,7 +140,7 @@ from qrisp.jasp.interpreter_tools.interpreters.control_flow_interpretation impor
 #     ] a b
 #   in (c,) }
 
-def terminal_sampling_evaluator(sampling_res_type):
+def terminal_sampling_evaluator(sampling_res_type, rng = None):
     
     def sampling_eqn_evaluator(eqn, context_dic, eqn_evaluator = exec_eqn):
         
@@ -210,7 +210,7 @@ def terminal_sampling_evaluator(sampling_res_type):
                     # if shots is an int. If shots is None, count int instead is a
                     # float representing the probability.
                     
-                    meas_res_dic.update(quantum_state.multi_measure(qubits, shots))
+                    meas_res_dic.update(quantum_state.multi_measure(qubits, shots, rng))
         
                     if shots is None:
                         # Round to prevent floating point errors of the simulation                    
@@ -231,97 +231,29 @@ def terminal_sampling_evaluator(sampling_res_type):
                 # Splitting means turning the int "1001001" into "100" and "1001".
                 if function_name == "sampling_helper_2":
                     
-                    if sampling_res_type == "ev":
-                        sampling_res = jnp.zeros(len(eqn.outvars))
-                    elif sampling_res_type == "array":
-                        sampling_res = []
-                        sampling_res_dict = {}
-                    elif sampling_res_type == "dict":
-                        sampling_res = {}
-                        
-                    # Compile the decoder
-                    decoder = decoder_compiler(eqn.params["jaxpr"], eqn_evaluator)
+                    # If the measurement results fit into int64, the decoding is
+                    # performed on the whole array of outcomes at once.
+                    # Otherwise we fall back to decoding Python ints one by one.
+                    sampling_res = None
+                    if sum(return_signature) <= 63 and len(meas_res_dic):
+                        sampling_res = vectorized_decoding(eqn.params["jaxpr"], 
+                                                           invalues, 
+                                                           return_signature, 
+                                                           meas_res_dic, 
+                                                           sampling_res_type, 
+                                                           len(eqn.outvars), 
+                                                           shots, 
+                                                           rng)
                     
-                    # Iterate through the sampled values
-                    for k, v in meas_res_dic.items():
-                        
-                        # We now evaluate the function that was previously traced
-                        # to perform the decoding. The first few arguments of this
-                        # function are the integers to be decoded.
-                        
-                        # We therefore use the traced Jaspr to perform the decoding
-                        # by modifying the input values.
-                        new_invalues = list(invalues)
-                        
-                        j = 0
-                        for i in range(len(return_signature)):
-                            # Split the integers into intervals ranging from 
-                            # j to j + return_signature[i]
-                            new_invalues[len(invalues)-len(return_signature)+i] = (k & ((2**(return_signature[i])-1) << j))>>j
-                            j += return_signature[i]
-                        
-                        # Evaluate the decoder
-                        #outvalues = eval_jaxpr(eqn.params["jaxpr"], eqn_evaluator = eqn_evaluator)(*new_invalues)
-                        
-                        outvalues = decoder(*new_invalues)
-                        
-                        
-                        # We now build the key for the result dic
-                        # For that we turn the jax types into the corresponding
-                        # Python types.
-                        if not isinstance(outvalues, tuple):
-                            if sampling_res_type == "ev":
-                                sampling_res += outvalues*v
-                            elif sampling_res_type == "array":
-                                #sampling_res.extend(v*[outvalues[0]])
-                                key = outvalues[0]
-                                if key.size == 1:
-                                    sampling_res_dict[key.item()] = v
-                                else:
-                                    sampling_res_dict[tuple(np.array(key))] = v
-                                    #sampling_res.extend(v*[key])
-                            elif sampling_res_type == "dict":
-                                key = outvalues
-                                if not type(v) in [int, float]:
-                                    if v.dtype in [np.float64, np.float32]:
-                                        v = float(v.item())
-                                    elif v.dtype in [np.int32, np.int64]:
-                                        v = int(v.item())
-                                    else:
-                                        raise
-                                sampling_res[key.item()] = v
-                            
-                        # If the user given function returned more than one
-                        # value, the key is a tuple to be build up
-                        else:
-                            if sampling_res_type == "ev":
-                                sampling_res += jnp.array(outvalues)*v
-                            elif sampling_res_type == "array":
-                                sampling_res.extend(v*[outvalues])
-                            elif sampling_res_type == "dict":
-                                if not type(v) in [int, float]:
-                                    if v.dtype in [np.float64, np.float32]:
-                                        v = float(v.item())
-                                    elif v.dtype in [np.int32, np.int64]:
-                                        v = int(v.item())
-                                    else:
-                                        raise
-                                sampling_res[tuple(x.item() for x in outvalues)] = v
-                                
-                    if sampling_res_type == "array":
-                        keys = np.array(list(sampling_res_dict.keys()))
-                        counts = np.array(list(sampling_res_dict.values()))
-                        sampling_res = np.repeat(keys, counts, axis=0)
-                        np.random.shuffle(sampling_res)
-                        
-                    elif sampling_res_type == "ev":
-                        sampling_res = sampling_res/shots
-                        if sampling_res.shape[0] == 1:
-                            sampling_res = sampling_res[0]
-                    elif sampling_res_type == "dict":
-                        # Sort the counts such the most probable values come first
-                        sampling_res = dict(sorted(sampling_res.items(), key=lambda item: item[0]))
-                        sampling_res = dict(sorted(sampling_res.items(), key=lambda item: -item[1]))
+                    if sampling_res is None:
+                        sampling_res = iterative_decoding(eqn.params["jaxpr"], 
+                                                          invalues, 
+                                                          return_signature, 
+                                                          meas_res_dic, 
+                                                          sampling_res_type, 
+                                                          len(eqn.outvars), 
+                                                          shots, 
+                                                          rng)
                         
                     decoded_meas_res.append(sampling_res)
             
@@ -342,6 +274,265 @@ def terminal_sampling_evaluator(sampling_res_type):
     return sampling_eqn_evaluator
 
 
+# The decoding is purely classical, so the decoders are compiled with the default
+# equation evaluator. This way the compiled decoders only depend on the Jaxpr and
+# can be reused by subsequent simulations of the same (cached) Jaspr.
 @lru_cache(maxsize = int(1E5))
-def decoder_compiler(jaxpr, eqn_evaluator):
-    return jax.jit(eval_jaxpr(jaxpr, eqn_evaluator = eqn_evaluator))
\ No newline at end of file
+def decoder_compiler(jaxpr):
+    return jax.jit(eval_jaxpr(jaxpr))
+
+
+# This function decodes the measurement results by evaluating the decoder
+# for each distinct outcome individually. It is used if the measurement results
+# can not be represented by int64 (i.e. more than 63 qubits are measured).
+def iterative_decoding(
+    jaxpr,
+    invalues,
+    return_signature,
+    meas_res_dic,
+    sampling_res_type,
+    outvar_amount,
+    shots,
+    rng,
+):
+    
+    if sampling_res_type == "ev":
+        sampling_res = jnp.zeros(outvar_amount)
+    elif sampling_res_type == "array":
+        sampling_res = []
+        sampling_res_dict = {}
+    elif sampling_res_type == "dict":
+        sampling_res = {}
+        
+    # Compile the decoder
+    decoder = decoder_compiler(jaxpr)
+    
+    # Iterate through the sampled values
+    for k, v in meas_res_dic.items():
+        
+        # We now evaluate the function that was previously traced
+        # to perform the decoding. The first few arguments of this
+        # function are the integers to be decoded.
+        
+        # We therefore use the traced Jaspr to perform the decoding
+        # by modifying the input values.
+        new_invalues = list(invalues)
+        
+        j = 0
+        for i in range(len(return_signature)):
+            # Split the integers into intervals ranging from 
+            # j to j + return_signature[i]
+            mask = (2**(return_signature[i])-1) << j
+            new_invalues[len(invalues)-len(return_signature)+i] = (k & mask)>>j
+            j += return_signature[i]
+        
+        # Evaluate the decoder
+        outvalues = decoder(*new_invalues)
+        
+        # We now build the key for the result dic
+        # For that we turn the jax types into the corresponding
+        # Python types.
+        if not isinstance(outvalues, tuple):
+            if sampling_res_type == "ev":
+                sampling_res += outvalues*v
+            elif sampling_res_type == "array":
+                key = outvalues[0]
+                if key.size == 1:
+                    sampling_res_dict[key.item()] = v
+                else:
+                    sampling_res_dict[tuple(np.array(key))] = v
+            elif sampling_res_type == "dict":
+                key = outvalues
+                if not type(v) in [int, float]:
+                    if v.dtype in [np.float64, np.float32]:
+                        v = float(v.item())
+                    elif v.dtype in [np.int32, np.int64]:
+                        v = int(v.item())
+                    else:
+                        raise
+                sampling_res[key.item()] = v
+            
+        # If the user given function returned more than one
+        # value, the key is a tuple to be build up
+        else:
+            if sampling_res_type == "ev":
+                sampling_res += jnp.array(outvalues)*v
+            elif sampling_res_type == "array":
+                sampling_res.extend(v*[outvalues])
+            elif sampling_res_type == "dict":
+                if not type(v) in [int, float]:
+                    if v.dtype in [np.float64, np.float32]:
+                        v = float(v.item())
+                    elif v.dtype in [np.int32, np.int64]:
+                        v = int(v.item())
+                    else:
+                        raise
+                sampling_res[tuple(x.item() for x in outvalues)] = v
+                
+    if sampling_res_type == "array":
+        keys = np.array(list(sampling_res_dict.keys()))
+        counts = np.array(list(sampling_res_dict.values()))
+        sampling_res = np.repeat(keys, counts, axis=0)
+        get_rng(rng).shuffle(sampling_res)
+        
+    elif sampling_res_type == "ev":
+        sampling_res = sampling_res/shots
+        if sampling_res.shape[0] == 1:
+            sampling_res = sampling_res[0]
+    elif sampling_res_type == "dict":
+        sampling_res = sort_sampling_dict(sampling_res)
+        
+    return sampling_res
+
+
+# This function decodes the measurement results by evaluating a vectorized
+# version of the decoder on the array of all distinct outcomes. The outcomes
+# are split into the measurement results of the individual QuantumVariables
+# via shifts and masks and the results are accumulated using array reductions.
+# Returns None if the decoded values can not be processed by array operations,
+# in which case the caller falls back to iterative_decoding.
+def vectorized_decoding(
+    jaxpr,
+    invalues,
+    return_signature,
+    meas_res_dic,
+    sampling_res_type,
+    outvar_amount,
+    shots,
+    rng,
+):
+    
+    # The first few arguments of the decoder are constants (for instance the
+    # exponent of a QuantumFloat). The remaining arguments are the integers
+    # to be decoded.
+    consts = tuple(invalues[:len(invalues)-len(return_signature)])
+    
+    # The decoder of the array sampling function receives the result array
+    # (of size shots) and the index of the current iteration (which is 0 because
+    # only the first iteration is performed) as the last arguments before the
+    # measurement integers. Only the first row of the result array is therefore
+    # required.
+    if sampling_res_type == "array":
+        consts = consts[:-2] + (consts[-2][:1], consts[-1])
+    
+    outcomes = np.fromiter(
+        meas_res_dic.keys(), dtype = np.int64, count = len(meas_res_dic)
+    )
+    weights = np.array(list(meas_res_dic.values()))
+    
+    # Split the integers into intervals ranging from 
+    # j to j + return_signature[i]
+    meas_ints = []
+    j = 0
+    for i in range(len(return_signature)):
+        meas_ints.append((outcomes >> j) & ((1 << return_signature[i]) - 1))
+        j += return_signature[i]
+    
+    decoder = vectorized_decoder_compiler(
+        jaxpr, len(return_signature), sampling_res_type == "array"
+    )
+    outvalues = evaluate_in_chunks(decoder, consts, meas_ints)
+    
+    if sampling_res_type == "ev":
+        # The expectation value is the weighted sum over the decoded values
+        if isinstance(outvalues, tuple):
+            expectation_values = np.array(
+                [np.tensordot(weights, x, axes = 1) for x in outvalues]
+            )
+        else:
+            expectation_values = np.tensordot(weights, outvalues, axes = 1)
+        sampling_res = jnp.zeros(outvar_amount) + expectation_values
+        
+        sampling_res = sampling_res/shots
+        if sampling_res.shape[0] == 1:
+            sampling_res = sampling_res[0]
+            
+    elif sampling_res_type == "array":
+        if isinstance(outvalues, tuple):
+            return None
+        sampling_res = np.repeat(outvalues, weights, axis = 0)
+        get_rng(rng).shuffle(sampling_res)
+        
+    elif sampling_res_type == "dict":
+        if not isinstance(outvalues, tuple):
+            outvalues = (outvalues,)
+            tuple_keys = False
+        else:
+            tuple_keys = True
+        
+        # Keys of a dictionary have to be scalars
+        if any(x.ndim != 1 for x in outvalues):
+            return None
+        
+        # Different outcomes might be decoded to the same value so we
+        # accumulate the weights of coinciding keys
+        group_indices = np.zeros(len(outcomes), dtype = np.int64)
+        for x in outvalues:
+            unique_values, inverse = np.unique(x, return_inverse = True)
+            group_indices = group_indices*len(unique_values) + inverse.ravel()
+            group_indices = np.unique(group_indices, return_inverse = True)[1].ravel()
+        
+        unique_groups, first_indices, inverse = np.unique(
+            group_indices, return_index = True, return_inverse = True
+        )
+        group_weights = np.bincount(
+            inverse.ravel(), weights = weights, minlength = len(unique_groups)
+        )
+        
+        if weights.dtype.kind in "iu":
+            group_weights = np.rint(group_weights).astype(np.int64)
+        
+        # Turn the numpy types into the corresponding Python types
+        keys = [x[first_indices].tolist() for x in outvalues]
+        if tuple_keys:
+            keys = list(zip(*keys))
+        else:
+            keys = keys[0]
+            
+        sampling_res = sort_sampling_dict(dict(zip(keys, group_weights.tolist())))
+    
+    return sampling_res
+
+
+# Evaluates the vectorized decoder on the measurement integers. To bound the
+# memory consumption and the amount of compilations, the evaluation is performed
+# in chunks of fixed size.
+def evaluate_in_chunks(decoder, consts, meas_ints, max_chunk_size = 2**16):
+    
+    outcome_amount = len(meas_ints[0])
+    chunk_size = min(max_chunk_size, 1 << (outcome_amount-1).bit_length())
+    
+    results = []
+    for i in range(0, outcome_amount, chunk_size):
+        chunk = [x[i:i+chunk_size] for x in meas_ints]
+        valid_amount = len(chunk[0])
+        if valid_amount < chunk_size:
+            chunk = [np.pad(x, (0, chunk_size-valid_amount)) for x in chunk]
+        res = decoder(consts, *chunk)
+        res = jax.tree_util.tree_map(lambda x : np.asarray(x)[:valid_amount], res)
+        results.append(res)
+    
+    return jax.tree_util.tree_map(lambda *x : np.concatenate(x), *results)
+
+
+# Sort the counts such the most probable values come first
+def sort_sampling_dict(sampling_res):
+    sampling_res = dict(sorted(sampling_res.items(), key=lambda item: item[0]))
+    return dict(sorted(sampling_res.items(), key=lambda item: -item[1]))
+
+
+@lru_cache(maxsize = int(1E5))
+def vectorized_decoder_compiler(jaxpr, meas_int_amount, select_first):
+    
+    decoder = eval_jaxpr(jaxpr)
+    
+    def vectorized_decoder(consts, *meas_ints):
+        res = decoder(*consts, *meas_ints)
+        # The decoder of the array sampling function returns the result
+        # array with the decoded value inserted at index 0
+        if select_first:
+            res = res[0]
+        return res
+    
+    in_axes = (None,) + (0,)*meas_int_amount
+    return jax.jit(jax.vmap(vectorized_decoder, in_axes = in_axes))
@@ -116,9 +116,6 @@ def get_depth_dic(qc, transpile_qc=True, depth_indicator=lambda x: 1):
     if len(qc.qubits) == 0:
         return {}
 
-    if transpile_qc:
-        qc = qc.transpile()
-
     # Assign each bit in the circuit a unique integer
     # to index into op_stack.
     bit_indices = {bit: idx for idx, bit in enumerate(qc.qubits + qc.clbits)}
@@ -142,29 +139,121 @@ def get_depth_dic(qc, transpile_qc=True, depth_indicator=lambda x: 1):
     # They are transpiler and simulator directives.
     # The max stack height is the circuit depth.
 
+    # If the circuit should be transpiled, Operations with a definition are not
+    # dissolved. Instead, their depth signature is applied, which yields the same
+    # result without creating the transpiled circuit.
+
     for instr in qc.data:
+        reg_ints = [bit_indices[reg] for reg in instr.qubits + instr.clbits]
+
+        if transpile_qc and instr.op.definition:
+            signature = get_depth_signature(instr.op, depth_indicator)
+            levels = apply_depth_signature(signature, [op_stack[i] for i in reg_ints])
+            for i, level in zip(reg_ints, levels):
+                op_stack[i] = level
+            continue
+
         if instr.op.name in ["qb_alloc", "qb_dealloc", "gphase"]:
             continue
-        qargs = instr.qubits
-        cargs = instr.clbits
 
-        levels = []
-        reg_ints = []
-        # If count then add one to stack heights
+        # Add to the stacks of the qubits and
+        # cbits used in the gate.
+        max_level = max([op_stack[i] for i in reg_ints]) + depth_indicator(instr.op)
+
+        for i in reg_ints:
+            op_stack[i] = max_level
+
+    return {qc.qubits[i]: op_stack[i] for i in range(len(qc.qubits))}
+
+
+# The depth signature of an Operation with a definition describes how the
+# (transpiled) Operation changes the stack heights of the depth calculation above.
+# For each qubit/clbit of the Operation, the signature contains a tuple of
+# (input index, offset) pairs, such that the stack height after the Operation is
+# the maximum of the input stack heights plus the respective offsets. Since the
+# depth calculation consists only of maximizations and additions, this yields the
+# same depth as the transpiled Operation.
+
+# The signatures are computed recursively (using the signatures of the Operations
+# in the definition) and cached on the Operation for a few depth indicators. The
+# cache is tied to the definition circuit and its version (see
+# modification_tracking.py), since for instance binding parameters copies the
+# Operation but replaces the definition.
+def get_depth_signature(op, depth_indicator):
+    from qrisp.circuit.modification_tracking import circuit_version, version_is_current
+
+    definition = op.definition
+
+    cache = getattr(op, "depth_signatures", None)
+    if (
+        cache is None
+        or cache[0] is not definition
+        or not version_is_current(cache[1], definition)
+    ):
+        cache = (definition, circuit_version(definition), {})
+        op.depth_signatures = cache
+
+    try:
+        return cache[2][depth_indicator]
+    except KeyError:
+        pass
+
+    bit_indices = {
+        bit: idx for idx, bit in enumerate(definition.qubits + definition.clbits)
+    }
+
+    # For each bit, this list contains a dictionary, which maps the input indices to
+    # the offsets of the current stack height
+    states = [{i: 0} for i in range(len(definition.qubits + definition.clbits))]
+
+    for instr in definition.data:
+        reg_ints = [bit_indices[reg] for reg in instr.qubits + instr.clbits]
+
+        if instr.op.definition:
+            signature = get_depth_signature(instr.op, depth_indicator)
+            input_states = [states[i] for i in reg_ints]
+            for i, output in zip(reg_ints, signature):
+                state = {}
+                for j, offset in output:
+                    for k, input_offset in input_states[j].items():
+                        value = input_offset + offset
+                        if k not in state or value > state[k]:
+                            state[k] = value
+                states[i] = state
+            continue
+
+        if instr.op.name in ["qb_alloc", "qb_dealloc", "gphase"]:
+            continue
 
         gate_depth = depth_indicator(instr.op)
 
-        for ind, reg in enumerate(qargs + cargs):
-            # Add to the stacks of the qubits and
-            # cbits used in the gate.
-            reg_ints.append(bit_indices[reg])
-            levels.append(op_stack[reg_ints[ind]] + gate_depth)
+        state = {}
+        for i in reg_ints:
+            for k, offset in states[i].items():
+                if k not in state or offset > state[k]:
+                    state[k] = offset
 
-        max_level = max(levels)
-        for ind in reg_ints:
-            op_stack[ind] = max_level
+        state = {k: offset + gate_depth for k, offset in state.items()}
 
-    return {qc.qubits[i]: op_stack[i] for i in range(len(qc.qubits))}
+        # The dictionaries are never modified, so all bits can share the same one
+        for i in reg_ints:
+            states[i] = state
+
+    signature = [tuple(state.items()) for state in states]
+
+    # Limit the amount of cached signatures (for instance t_depth creates a new
+    # depth indicator for every call)
+    if len(cache[2]) >= 8:
+        cache[2].clear()
+    cache[2][depth_indicator] = signature
+
+    return signature
+
+
+# Returns the stack heights after applying an Operation with the given depth
+# signature to bits with the given stack heights
+def apply_depth_signature(signature, levels):
+    return [max([levels[j] + offset for j, offset in output]) for output in signature]
 
 
 def gate_wrap(*args, permeability=None, is_qfree=None, name=None, verify=False):
@@ -742,12 +831,27 @@ def multi_measurement(qv_list, shots=None, backend=None):
     for qa in recursive_qa_search(qv_list):
         temp.extend(list(qa.flatten()))
 
-    compiled_qc = qompiler(
-        qv_list[0].qs, intended_measurements=sum([qv.reg for qv in temp], [])
-    )
+    from qrisp.simulator.state_cache import state_cache_active, use_state_cache
+
+    if state_cache_active(backend):
+        # The final state of the whole session is simulated (and cached)
+        compiled_qc = qompiler(qv_list[0].qs)
+    else:
+        compiled_qc = qompiler(
+            qv_list[0].qs, intended_measurements=sum([qv.reg for qv in temp], [])
+        )
     # compiled_qc = qv_list[0].qs.copy()
+
+    # If the state cache is enabled, the measurement is evaluated on the
+    # (possibly cached) final state of the circuit
+    if use_state_cache(compiled_qc, backend):
+        measurement_free_qc = compiled_qc.transpile()
+    else:
+        measurement_free_qc = None
+
     # Add classical registers for the measurement results to be stored in
     cl_reg_list = []
+    mes_qubits = []
 
     for var in qv_list[::-1]:
         cl_reg = []
@@ -763,13 +867,19 @@ def multi_measurement(qv_list, shots=None, backend=None):
             cl_reg.append(compiled_qc.add_clbit())
 
         cl_reg_list.append(cl_reg)
+        mes_qubits.extend(qubits)
 
         # Add measurement instruction
         compiled_qc.measure(qubits, cl_reg)
 
     # counts = execute(qs_temp, backend, basis_gates = basis_gates,
     # noise_model = noise_model, shots = shots).result().get_counts()
-    counts = backend.run(compiled_qc, shots)
+    if measurement_free_qc is not None:
+        from qrisp.simulator import measure_quantum_state
+
+        counts = measure_quantum_state(measurement_free_qc, mes_qubits, shots)
+    else:
+        counts = backend.run(compiled_qc, shots)
     counts = {k: counts[k] for k in sorted(counts)}
     shots = sum(counts.values())
 
@@ -1300,17 +1410,100 @@ def check_if_fresh(qubits, qs, ignore_q_envs=True):
 
 
 def get_measurement_from_qc(qc, qubits, backend, shots=None):
-    # Add classical registers for the measurement results to be stored in
-    cl = []
-    for i in range(len(qubits)):
-        cl.append(qc.add_clbit())
+    return get_measurements_from_qcs([qc], [qubits], backend, [shots])[0]
+
+
+# Measures the qubits of each circuit of qc_list and returns the list of the
+# formatted counts. The circuits are submitted to the backend as a single batch
+# (see run_circuit_batch).
+def get_measurements_from_qcs(qc_list, qubits_list, backend, shots_list):
+    from qrisp.simulator.state_cache import use_state_cache
+
+    counts_list = [None] * len(qc_list)
+    batch = []
+    batch_indices = []
+
+    for i in range(len(qc_list)):
+        qc, qubits, shots = qc_list[i], qubits_list[i], shots_list[i]
+
+        # If the state cache is enabled, the measurement is evaluated on the
+        # (possibly cached) final state of the circuit
+        if use_state_cache(qc, backend):
+            from qrisp.simulator import measure_quantum_state
+
+            counts = measure_quantum_state(qc, qubits, shots)
+            counts_list[i] = format_measurement_counts(counts, len(qubits))
+            continue
+
+        # Add classical registers for the measurement results to be stored in
+        cl = []
+        for j in range(len(qubits)):
+            cl.append(qc.add_clbit())
+
+        # Add measurement instruction
+        for j in range(len(qubits)):
+            qc.measure(qubits[j], cl[j])
+
+        batch.append((qc, shots))
+        batch_indices.append(i)
+
+    # Execute circuits
+    if batch:
+        batch_counts = run_circuit_batch(backend, batch)
+
+        for i, counts in zip(batch_indices, batch_counts):
+            counts_list[i] = format_measurement_counts(counts, len(qubits_list[i]))
+
+    return counts_list
+
+
+# Binds the abstract parameters of precompiled_qc for each dictionary of
+# subs_dic_list and measures the qubits. The resulting circuits are executed as a
+# single batch.
+def get_parametric_measurements_from_qc(
+    precompiled_qc,
+    qubits,
+    subs_dic_list,
+    backend,
+    shots=None,
+    circuit_preprocessor=None,
+):
+    from qrisp.core.compilation import combine_single_qubit_gates
+
+    qc_list = []
+    for subs_dic in subs_dic_list:
+        qc = precompiled_qc.copy()
+
+        # Bind parameters
+        if subs_dic:
+            qc = qc.bind_parameters(subs_dic)
+            qc = combine_single_qubit_gates(qc)
+
+        # Execute user specified circuit_preprocessor
+        if circuit_preprocessor is not None:
+            qc = circuit_preprocessor(qc)
+
+        qc_list.append(qc.transpile())
+
+    return get_measurements_from_qcs(
+        qc_list, [qubits] * len(qc_list), backend, [shots] * len(qc_list)
+    )
+
+
+# Executes a list of (QuantumCircuit, shots) tuples on the backend and returns the
+# list of counts. Backends without a run_batch method (for instance user defined
+# backends) execute the circuits one after another.
+def run_circuit_batch(backend, batch):
+    if len(batch) > 1 and hasattr(backend, "run_batch"):
+        return backend.run_batch(batch)
+
+    return [backend.run(qc, shots) for qc, shots in batch]
 
-    # Add measurement instruction
-    for i in range(len(qubits)):
-        qc.measure(qubits[i], cl[i])
 
-    # Execute circuit
-    counts = backend.run(qc, shots)
+# Turns the bitstring counts returned by a backend into a dictionary of integers
+# considering only the first clbit_amount bits. If the counts are not normalized
+# (i.e. they represent shots), the normalized counts are returned.
+def format_measurement_counts(counts, clbit_amount):
 
     # Remove other measurements outcomes from counts dic
     new_counts_dic = {}
@@ -1321,7 +1514,7 @@ def get_measurement_from_qc(qc, qubits, backend, shots=None):
         # Remove possible whitespaces
         new_key = key.replace(" ", "")
         # Remove other measurements
-        new_key = new_key[: len(cl)]
+        new_key = new_key[: clbit_amount]
 
         new_key = int(new_key, base=2)
         try:
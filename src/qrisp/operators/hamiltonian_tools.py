@@ -26,7 +26,7 @@ def multi_hamiltonian_measurement(
         qarg,
         precision=0.01,
         backend=None,
-        shots=1000000,
+        shots=None,
         compile=True,
         compilation_kwargs={},
         subs_dic={},
@@ -45,12 +45,15 @@ def multi_hamiltonian_measurement(
     precision: float, optional
         The precision with which the expectation of the Hamiltonians is to be evaluated.
         The default is 0.01.
+        If set to 0, the expectation values are evaluated exactly (see
+        :meth:`QubitOperator.get_measurement
+        <qrisp.operators.qubit.QubitOperator.get_measurement>`).
     backend : BackendClient, optional
         The backend on which to evaluate the quantum circuit. The default can be
         specified in the file default_backend.py.
     shots : integer, optional
-        The maximum amount of shots to evaluate the expectation per Hamiltonian. 
-        The default is 100000.
+        Deprecated. This argument has no effect and will be removed in a later
+        release of Qrisp. The amount of shots is determined by the ``precision``.
     compile : bool, optional
         Boolean indicating if the .compile method of the underlying QuantumSession
         should be called before. The default is True.
@@ -70,21 +73,45 @@ def multi_hamiltonian_measurement(
     list[float]
         The expected value of the Hamiltonians.
 
+    Notes
+    -----
+    If the :func:`state cache <qrisp.simulator.enable_state_cache>` of the built-in
+    simulator is enabled, the circuit is simulated only once for all Hamiltonians.
+    On other backends, the measurement circuits of all Hamiltonians are submitted as
+    a single batch.
+
     """
 
-    expectations = []
-    n = len(hamiltonians)
-    for i in range(n):
-        expectations.append(hamiltonians[i].get_measurement(qarg,
+    from qrisp.operators.qubit.measurement import get_multi_measurement
+
+    if shots is not None:
+        import warnings
+
+        warnings.warn(
+            "DeprecationWarning: The shots argument has no effect and will no longer "
+            "be supported in a later release of Qrisp. The amount of shots is "
+            "determined by the precision."
+        )
+
+    # Fermionic Hamiltonians are measured via their Jordan-Wigner transform
+    qubit_hamiltonians = []
+    for hamiltonian in hamiltonians:
+        if hasattr(hamiltonian, "to_qubit_operator"):
+            hamiltonian = hamiltonian.to_qubit_operator()
+        qubit_hamiltonians.append(hamiltonian)
+
+    # The circuit is compiled only once and the measurement circuits of all
+    # Hamiltonians are executed as a single batch
+    expectations = get_multi_measurement(qubit_hamiltonians,
+                                qarg,
                                 precision=precision,
                                 backend=backend,
-                                shots=shots,
                                 compile=compile,
                                 compilation_kwargs=compilation_kwargs,
                                 subs_dic=subs_dic,
                                 precompiled_qc=precompiled_qc,
-                                _measurement=None if _measurements==None else _measurements[i]
-                                ))
+                                measurement_data_list=_measurements
+                                )
 
     return expectations
 
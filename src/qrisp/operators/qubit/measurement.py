@@ -47,6 +47,9 @@ def get_measurement(
     precision: float, optional
         The precision with which the expectation of the Hamiltonian is to be evaluated.
         The default is 0.01. The number of shots scales quadratically with the inverse precision.
+        If set to 0, the expectation value is evaluated exactly from a single
+        simulation of the state. This requires the default simulator and a circuit
+        without measurements.
     backend : :ref:`BackendClient`, optional
         The backend on which to evaluate the quantum circuit. The default can be
         specified in the file default_backend.py.
@@ -84,6 +87,55 @@ def get_measurement(
 
     """
 
+    return get_multi_measurement(
+        [hamiltonian],
+        qarg,
+        precision=precision,
+        backend=backend,
+        compile=compile,
+        compilation_kwargs=compilation_kwargs,
+        subs_dic=subs_dic,
+        precompiled_qc=precompiled_qc,
+        diagonalisation_method=diagonalisation_method,
+        measurement_data_list=[measurement_data],
+    )[0]
+
+
+def get_multi_measurement(
+    hamiltonians,
+    qarg,
+    precision=0.01,
+    backend=None,
+    compile=True,
+    compilation_kwargs={},
+    subs_dic={},
+    precompiled_qc=None,
+    diagonalisation_method="commuting_qw",
+    measurement_data_list=None
+    ):
+    r"""
+    This method returns the expected values of a list of Hamiltonians for the state
+    of a quantum argument. The circuit is compiled only once and the measurement
+    circuits of all Hamiltonians are submitted to the backend as a single batch.
+    For the remaining parameters, see :func:`get_measurement`.
+
+    Parameters
+    ----------
+    hamiltonians : list[QubitOperator]
+        The Hamiltonians to evaluate.
+    qarg : :ref:`QuantumVariable` or list[Qubit]
+        The quantum argument to evaluate the Hamiltonians on.
+    measurement_data_list : list[QubitOperatorMeasurement], optional
+        Cached data to accelerate the measurement procedure of each Hamiltonian.
+        Automatically generated by default.
+
+    Returns
+    -------
+    list[float]
+        The expected values of the Hamiltonians.
+
+    """
+
     from qrisp import QuantumSession, merge
     
     if isinstance(qarg,QuantumVariable):
@@ -118,11 +170,18 @@ def get_measurement(
     if len(qs.env_stack) != 0:
         raise Exception("Tried to get measurement within open environment")
 
-    hamiltonian = hamiltonian.hermitize()
-    hamiltonian = hamiltonian.eliminate_ladder_conjugates()
-    hamiltonian = hamiltonian.apply_threshold(0)
-    if len(hamiltonian.terms_dict) == 0:
-        return 0
+    if measurement_data_list is None:
+        measurement_data_list = [None]*len(hamiltonians)
+
+    processed_hamiltonians = []
+    for hamiltonian in hamiltonians:
+        hamiltonian = hamiltonian.hermitize()
+        hamiltonian = hamiltonian.eliminate_ladder_conjugates()
+        hamiltonian = hamiltonian.apply_threshold(0)
+        processed_hamiltonians.append(hamiltonian)
+
+    if all(len(hamiltonian.terms_dict) == 0 for hamiltonian in processed_hamiltonians):
+        return [0]*len(hamiltonians)
 
     # Copy circuit in over to prevent modification
     if precompiled_qc is None:        
@@ -145,10 +204,47 @@ def get_measurement(
 
     qc = qc.transpile()
     
-    if measurement_data is None:
-        measurement_data = QubitOperatorMeasurement(hamiltonian, diagonalisation_method = diagonalisation_method)
-
-    return measurement_data.get_measurement(qc, qubit_list, precision, backend)
+    from qrisp.misc import get_measurements_from_qcs
+    
+    results = [0]*len(hamiltonians)
+    
+    # Collect the measurement circuits of all Hamiltonians
+    qc_list = []
+    shots_list = []
+    batch_slices = []
+    for i in range(len(hamiltonians)):
+        
+        hamiltonian = processed_hamiltonians[i]
+        if len(hamiltonian.terms_dict) == 0:
+            continue
+        
+        measurement_data = measurement_data_list[i]
+        if measurement_data is None:
+            measurement_data = QubitOperatorMeasurement(
+                hamiltonian, diagonalisation_method = diagonalisation_method
+            )
+        
+        if precision == 0 and measurement_data.allows_exact_measurement(qc, backend):
+            results[i] = measurement_data.get_exact_measurement(qc, qubit_list)
+            continue
+        
+        temp_qc_list, temp_shots_list = measurement_data.get_measurement_circuits(
+            qc, qubit_list, precision
+        )
+        start = len(qc_list)
+        batch_slices.append((i, measurement_data, start, start + len(temp_qc_list)))
+        qc_list.extend(temp_qc_list)
+        shots_list.extend(temp_shots_list)
+    
+    # Execute the circuits as a single batch
+    counts_list = get_measurements_from_qcs(
+        qc_list, [list(qubit_list)]*len(qc_list), backend, shots_list
+    )
+    
+    for i, measurement_data, start, end in batch_slices:
+        results[i] = measurement_data.evaluate_results(counts_list[start:end])
+    
+    return results
     
 
 class QubitOperatorMeasurement:
@@ -187,15 +283,44 @@ class QubitOperatorMeasurement:
     
     def get_measurement(self, qc, qubit_list, precision, backend):
         
-        from qrisp.misc import get_measurement_from_qc
-        results = []
-        meas_ops = []
-        meas_coeffs = []
+        from qrisp.misc import get_measurements_from_qcs
+        
+        # For precision 0, the expectation value is evaluated exactly on the
+        # default simulator
+        if precision == 0 and self.allows_exact_measurement(qc, backend):
+            return self.get_exact_measurement(qc, qubit_list)
+        
+        qc_list, shots_list = self.get_measurement_circuits(qc, qubit_list, precision)
+        
+        # The circuits of all groups are executed as a single batch
+        results = get_measurements_from_qcs(
+            qc_list, [list(qubit_list)]*len(qc_list), backend, shots_list
+        )
+        
+        return self.evaluate_results(results)
+    
+    def allows_exact_measurement(self, qc, backend):
+        # Circuits without measurements or resets can be evaluated exactly on the
+        # default simulator
+        from qrisp.default_backend import DefaultBackend
+        
+        return isinstance(backend, DefaultBackend) and not contains_measurement(qc)
+    
+    def get_measurement_circuits(self, qc, qubit_list, precision):
+        # Returns the circuits measuring each group (i.e. qc followed by the change
+        # of basis of the group) together with the required amount of shots
+        
+        qc_list = []
+        shots_list = []
+        
+        if precision == 0:
+            raise Exception(
+                "Exact expectation values (precision = 0) can only be evaluated "
+                "for circuits without measurements on the default simulator"
+            )
         
         for i in range(len(self.measurement_operators)):
             
-            group = self.measurement_operators[i]
-            
             shots = int(self.shots_list[i]/precision**2)
             
             qubits = [qubit_list[j] for j in range(self.change_of_basis_gates[i].num_qubits)]
@@ -203,8 +328,69 @@ class QubitOperatorMeasurement:
             curr = qc.copy()
             curr.append(self.change_of_basis_gates[i], qubits)
             
-            res = get_measurement_from_qc(curr, list(qubit_list), backend, shots)
-            results.append(res)
+            qc_list.append(curr)
+            shots_list.append(shots)
+        
+        return qc_list, shots_list
+    
+    def get_exact_measurement(self, qc, qubit_list):
+        # The state is simulated only once. For each group, the change of basis is
+        # applied to a copy of the final QuantumState and the exact probabilities
+        # of the outcomes are evaluated.
+        
+        from qrisp.simulator import simulate_quantum_state
+        
+        quantum_state, qubit_to_index_dic = simulate_quantum_state(qc)
+        
+        mes_qubit_indices = [qubit_to_index_dic[qb] for qb in qubit_list]
+        
+        results = []
+        
+        for i in range(len(self.measurement_operators)):
+            
+            state = quantum_state.copy()
+            
+            for op, qubit_indices in self.get_change_of_basis_tape(i):
+                state.apply_operation(op, [mes_qubit_indices[j] for j in qubit_indices])
+            
+            outcome_list, prob_list = state.multi_measure(
+                mes_qubit_indices, return_res_states = False
+            )
+            
+            results.append(dict(zip(outcome_list, prob_list)))
+        
+        return self.evaluate_results(results)
+    
+    def get_change_of_basis_tape(self, i):
+        # Returns the elementary gates of the i-th change of basis together with
+        # the indices of the qubits (within the measured qubits) they act on
+        
+        if not hasattr(self, "change_of_basis_tapes"):
+            self.change_of_basis_tapes = {}
+        
+        if i not in self.change_of_basis_tapes:
+            
+            basis_qc = self.change_of_basis_gates[i].definition.transpile()
+            qubit_index_dic = {
+                basis_qc.qubits[j] : j for j in range(len(basis_qc.qubits))
+            }
+            
+            self.change_of_basis_tapes[i] = [
+                (instr.op, [qubit_index_dic[qb] for qb in instr.qubits])
+                for instr in basis_qc.data
+                if instr.op.name not in ["qb_alloc", "qb_dealloc", "barrier"]
+            ]
+        
+        return self.change_of_basis_tapes[i]
+    
+    def evaluate_results(self, results):
+        
+        meas_ops = []
+        meas_coeffs = []
+        
+        for i in range(len(self.measurement_operators)):
+            
+            group = self.measurement_operators[i]
             
             temp_meas_ops = []
             temp_coeff = []
@@ -376,4 +562,16 @@ def partition(values, num_qubits):
         return [np.array(partition[0], dtype=np.uint64)]
     else:
         return [np.array(part, dtype=np.uint64) for part in partition[1:]]
-    
\ No newline at end of file
+    
+
+
+# Determines whether a circuit contains measurements or resets (also within the
+# definitions of its operations)
+def contains_measurement(qc):
+    for instr in qc.data:
+        if instr.op.name in ["measure", "reset"]:
+            return True
+        definition = instr.op.definition
+        if definition is not None and contains_measurement(definition):
+            return True
+    return False
@@ -1514,6 +1514,9 @@ class QubitOperator(Hamiltonian):
         precision : float, optional
             The precision with which the expectation of the Hamiltonian is to be evaluated.
             The default is 0.01. The number of shots scales quadratically with the inverse precision.
+            If set to 0, the expectation value is evaluated exactly from a single
+            simulation of the state. This requires the default simulator and a circuit
+            without measurements.
         backend : :ref:`BackendClient`, optional
             The backend on which to evaluate the quantum circuit. The default can be
             specified in the file default_backend.py.
@@ -1617,6 +1620,9 @@ class QubitOperator(Hamiltonian):
         precision : float, optional
             The precision with which the expectation of the Hamiltonian is to be evaluated.
             The default is 0.01. The number of shots scales quadratically with the inverse precision.
+            If set to 0, the expectation value is evaluated exactly from a single
+            simulation of the state. This requires the default simulator and a circuit
+            without measurements (and is not supported in Jasp mode).
         diagonalisation_method : str, optional
             Specifies the method for grouping and diagonalizing the :ref:`QubitOperator`. 
             Available are ``commuting_qw``, i.e., the operator is grouped based on qubit-wise commutativity of terms, 
@@ -21,6 +21,7 @@ from builtins import id
 import matplotlib.pyplot as plt
 import networkx as nx
 import numpy as np
+from numba import njit
 
 from qrisp.circuit import QuantumCircuit, fast_append, Instruction, Qubit, QubitDealloc, QubitAlloc, ControlledOperation
 from qrisp.permeability.type_checker import is_permeable
@@ -396,7 +397,263 @@ class PermeabilityGraph(nx.DiGraph):
         res = self.copy()
         self.__class__ = PermeabilityGraph
         return res
+    
+    def fast_add_node(self, node):
+        # Faster version of adding a node
+        # dag.add_node(node)
+        self._succ[node] = {}
+        self._pred[node] = {}
+        self._node[node] = {}
+
+
+
+# This class is an array based representation of the Permeability DAG.
+# Contrary to the PermeabilityGraph, the nodes are represented by integers (their
+# position in the node_list attribute, which serves as a side table for the
+# UnqompNode objects) and the edges are stored in the compressed sparse row (CSR)
+# format. This allows the numba based algorithms of the compilation pipeline
+# (topological sorting, ancestor computation) to operate directly on the arrays
+# without any conversion.
+# The order of the nodes is the order of insertion during the construction,
+# which is a topological order.
+# The ArrayDAG is immutable after the construction and is therefore used for
+# the transformations that don't modify the DAG (parallelization, allocation
+# optimization, light cone reduction). The uncomputation algorithm operates on the
+# PermeabilityGraph.
+class ArrayDAG:
+    """
+    Array based representation of the Permeability DAG of a QuantumCircuit.
+
+    Parameters
+    ----------
+    qc : QuantumCircuit
+        The QuantumCircuit to turn into the DAG.
+    remove_artificials : bool, optional
+        If set to True, the artificial allocation nodes (i.e. allocation nodes of
+        qubits that are not allocated by the QuantumCircuit) are removed.
+        The default is False.
+
+    Attributes
+    ----------
+    node_list : list[UnqompNode]
+        The nodes of the DAG. The index of a node in this list is its node id.
+    indptr : numpy.ndarray
+        The CSR index pointer array of the edges (int32).
+    indices : numpy.ndarray
+        The CSR column array of the edges, i.e. the node ids of the successors (int32).
+    edge_types : numpy.ndarray
+        The types of the edges in the order of ``indices`` encoded as integers
+        (see ``ArrayDAG.edge_type_names``).
+
+    """
+
+    edge_type_names = ["neutral", "Z", "X", "anti_dependency"]
+    edge_type_codes = {name : i for i, name in enumerate(edge_type_names)}
+
+    def __init__(self, qc, remove_artificials = False):
+        
+        self.node_list = []
+        
+        # During the construction, the successors of each node are stored as a
+        # dictionary {successor id : edge id}
+        self.succ = []
+        
+        # Edge information in the order of insertion
+        self.edge_sources = []
+        self.edge_targets = []
+        self.edge_type_list = []
+        self.edge_qubit_list = []
+        
+        self.removed_nodes = []
+        
+        self.recent_node_dic = dag_from_qc(
+            self, qc, remove_artificials = remove_artificials
+        )
+        
+        self.finalize()
+    
+    def fast_add_node(self, node):
+        node.dag_index = len(self.node_list)
+        self.node_list.append(node)
+        self.succ.append({})
+    
+    def add_edge(self, in_node, out_node, edge_type, qubits = []):
+        
+        if in_node is out_node:
+            return
+        
+        succ = self.succ[in_node.dag_index]
+        
+        edge_id = succ.get(out_node.dag_index)
+        
+        if edge_id is None:
+            succ[out_node.dag_index] = len(self.edge_type_list)
+            self.edge_sources.append(in_node.dag_index)
+            self.edge_targets.append(out_node.dag_index)
+            self.edge_type_list.append(edge_type)
+            self.edge_qubit_list.append(list(qubits))
+        else:
+            self.edge_qubit_list[edge_id].extend(qubits)
+    
+    def remove_nodes_from(self, nodes):
+        self.removed_nodes.extend(nodes)
+    
+    # Turns the construction data into the CSR arrays
+    def finalize(self):
+        
+        node_amount = len(self.node_list)
+        
+        keep = np.ones(node_amount, dtype = np.bool_)
+        for node in self.removed_nodes:
+            keep[node.dag_index] = False
+        new_ids = (np.cumsum(keep) - 1).astype(np.int32)
+        
+        sources = np.array(self.edge_sources, dtype = np.int32)
+        targets = np.array(self.edge_targets, dtype = np.int32)
+        edge_types = np.array(
+            [self.edge_type_codes[t] for t in self.edge_type_list], dtype = np.int8
+        )
+        
+        # Remove the edges of removed nodes
+        edge_ids = np.nonzero(keep[sources] & keep[targets])[0]
+        sources = new_ids[sources[edge_ids]]
+        targets = new_ids[targets[edge_ids]]
+        
+        # Sort the edges by source and target
+        order = np.lexsort((targets, sources))
+        
+        self.node_list = [self.node_list[i] for i in np.nonzero(keep)[0]]
+        for i in range(len(self.node_list)):
+            self.node_list[i].dag_index = i
+        
+        self.indices = targets[order]
+        self.indptr = np.zeros(len(self.node_list) + 1, dtype = np.int32)
+        out_degrees = np.bincount(sources, minlength = len(self.node_list))
+        np.cumsum(out_degrees, out = self.indptr[1:])
+        self.edge_types = edge_types[edge_ids[order]]
+        
+        # Map the CSR edge positions to the edge ids of the construction
+        self.edge_ids = edge_ids[order]
+        
+        del self.succ
+        del self.removed_nodes
+        del self.edge_sources
+        del self.edge_targets
+        del self.edge_type_list
+    
+    def nodes(self):
+        return self.node_list
+    
+    def __len__(self):
+        return len(self.node_list)
+    
+    def successors(self, node):
+        """
+        Returns the successors of a node.
+
+        Parameters
+        ----------
+        node : UnqompNode
+            The node to be investigated.
+
+        Returns
+        -------
+        list[UnqompNode]
+            The list of successors.
+
+        """
+        # During the construction, the successors are stored in a dictionary
+        try:
+            return [self.node_list[i] for i in self.succ[node.dag_index]]
+        except AttributeError:
+            pass
+        
+        i = node.dag_index
+        successor_indices = self.indices[self.indptr[i]:self.indptr[i+1]]
+        return [self.node_list[j] for j in successor_indices]
+    
+    def get_edge_qubits(self, in_node, out_node):
+        """
+        Returns the list of qubits that a given edge is representing.
+
+        Parameters
+        ----------
+        in_node : UnqompNode
+            The starting node of the edge.
+        out_node : UnqompNode
+            The end node of the edge.
+
+        Returns
+        -------
+        list[Qubit]
+            The list of Qubits.
+
+        """
+        try:
+            edge_id = self.succ[in_node.dag_index][out_node.dag_index]
+            return self.edge_qubit_list[edge_id]
+        except AttributeError:
+            pass
+        
+        edge_id = self.edge_ids[self.edge_position(in_node, out_node)]
+        return self.edge_qubit_list[edge_id]
+    
+    def get_edge_type(self, in_node, out_node):
+        edge_type = self.edge_types[self.edge_position(in_node, out_node)]
+        return self.edge_type_names[edge_type]
+    
+    # Returns the position of an edge in the CSR arrays
+    def edge_position(self, in_node, out_node):
+        i = in_node.dag_index
+        start = self.indptr[i]
+        successors = self.indices[start:self.indptr[i+1]]
+        pos = np.searchsorted(successors, out_node.dag_index)
+        if pos == len(successors) or successors[pos] != out_node.dag_index:
+            raise Exception("Tried to retrieve non-existent edge")
+        return start + pos
+    
+    def ancestors(self, node):
+        """
+        Returns the ancestors of a node (i.e. all nodes with a path to the given node).
 
+        Parameters
+        ----------
+        node : UnqompNode
+            The node to be investigated.
+
+        Returns
+        -------
+        list[UnqompNode]
+            The ancestors in topological order.
+
+        """
+        ancestor_mask = compute_ancestor_rows(
+            self.indptr, self.indices, np.array([node.dag_index], dtype = np.int32)
+        )[0]
+        ancestor_mask[node.dag_index] = False
+        return [self.node_list[i] for i in np.nonzero(ancestor_mask)[0]]
+    
+    def to_qc(self):
+        """
+        Turns the ArrayDAG into a QuantumCircuit using the topological order of the
+        nodes.
+
+        Returns
+        -------
+        res_qc : QuantumCircuit
+            The QuantumCircuit.
+
+        """
+        res_qc = self.original_qc.clearcopy()
+        
+        with fast_append():
+            for node in self.node_list:
+                if node.instr:
+                    if isinstance(node, AllocNode) and node.artificial:
+                        continue
+                    res_qc.append(node.instr.op, node.instr.qubits, node.instr.clbits)
+                    
+        return res_qc
 
 
 def dag_from_qc(dag, qc, remove_artificials = False):
@@ -406,8 +663,8 @@ def dag_from_qc(dag, qc, remove_artificials = False):
 
     Parameters
     ----------
-    dag : PermeabilityGraph
-        The empty PermeabilityGraph instance to operate on.
+    dag : PermeabilityGraph or ArrayDAG
+        The empty PermeabilityGraph (or ArrayDAG) instance to operate on.
     qc : QuantumCircuit
         The QuantumCircuit to turn into the PermeabilityGraph.
 
@@ -457,11 +714,7 @@ def dag_from_qc(dag, qc, remove_artificials = False):
                 else:
                     alloc_node.instr = instr
                 
-                # Faster version of adding a node
-                # dag.add_node(node)
-                dag._succ[alloc_node] = {}
-                dag._pred[alloc_node] = {}
-                dag._node[alloc_node] = {}
+                dag.fast_add_node(alloc_node)
                 
                 # Set the value layer attribute to 0
                 alloc_node.value_layer = 0
@@ -501,11 +754,7 @@ def dag_from_qc(dag, qc, remove_artificials = False):
         # circuit as sorting index.
         node.qc_index = i
 
-        # Faster version of adding a node
-        # dag.add_node(node)
-        dag._succ[node] = {}
-        dag._pred[node] = {}
-        dag._node[node] = {}
+        dag.fast_add_node(node)
         
         # To connect the edges, we iterate over each qubit
         for j in range(len(instr.qubits)):
@@ -536,10 +785,7 @@ def dag_from_qc(dag, qc, remove_artificials = False):
                     
                     # Create the TerminatorNode
                     terminator = TerminatorNode(qb)
-                    # dag.add_node(terminator)
-                    dag._succ[terminator] = {}
-                    dag._pred[terminator] = {}
-                    dag._node[terminator] = {}
+                    dag.fast_add_node(terminator)
                     
                     
                     # We now insert the anti-depedency edges from all streak members
@@ -693,3 +939,96 @@ def visualize_dag(G, layout_seed = None):
     plt.show()
     
 
+
+# Computes the predecessor arrays of a DAG given in CSR format (i.e. the CSR
+# representation of the transposed adjacency matrix).
+@njit(cache = True)
+def transpose_csr(indptr, indices):
+    
+    node_amount = len(indptr) - 1
+    
+    pred_indptr = np.zeros(node_amount + 1, dtype = np.int32)
+    for i in range(len(indices)):
+        pred_indptr[indices[i] + 1] += 1
+    for i in range(node_amount):
+        pred_indptr[i+1] += pred_indptr[i]
+    
+    pred_indices = np.zeros(len(indices), dtype = np.int32)
+    fill = pred_indptr[:-1].copy()
+    for i in range(node_amount):
+        for j in range(indptr[i], indptr[i+1]):
+            pred_indices[fill[indices[j]]] = i
+            fill[indices[j]] += 1
+    
+    return pred_indptr, pred_indices
+
+
+# Computes the ancestors of the given nodes of a DAG in CSR format. Returns a boolean
+# array of shape (len(nodes), node_amount), where row i is True at the ancestors of
+# nodes[i] (including nodes[i] itself).
+# The ancestors are determined by a depth first search on the predecessors, which
+# requires O(len(nodes) * (node_amount + edge_amount)) operations.
+@njit(cache = True)
+def compute_ancestor_rows(indptr, indices, nodes):
+    
+    node_amount = len(indptr) - 1
+    
+    pred_indptr, pred_indices = transpose_csr(indptr, indices)
+    
+    ancestors = np.zeros((len(nodes), node_amount), dtype = np.bool_)
+    stack = np.zeros(node_amount, dtype = np.int32)
+    
+    for k in range(len(nodes)):
+        row = ancestors[k]
+        row[nodes[k]] = True
+        stack[0] = nodes[k]
+        stack_size = 1
+        
+        while stack_size:
+            stack_size -= 1
+            current = stack[stack_size]
+            for j in range(pred_indptr[current], pred_indptr[current+1]):
+                pred = pred_indices[j]
+                if not row[pred]:
+                    row[pred] = True
+                    stack[stack_size] = pred
+                    stack_size += 1
+    
+    return ancestors
+
+
+# Performs a topological sort of a DAG given in CSR format using Kahn's algorithm
+# with a first-in-first-out queue. The nodes without predecessors are processed in
+# the order of their ids, which yields the same order as networkx.topological_sort
+# if the successors are sorted.
+@njit(cache = True)
+def csr_topological_sort(indptr, indices):
+    
+    node_amount = len(indptr) - 1
+    
+    in_degree = np.zeros(node_amount, dtype = np.int32)
+    for i in range(len(indices)):
+        in_degree[indices[i]] += 1
+    
+    queue = np.zeros(node_amount, dtype = np.int32)
+    queue_end = 0
+    for i in range(node_amount):
+        if in_degree[i] == 0:
+            queue[queue_end] = i
+            queue_end += 1
+    
+    queue_start = 0
+    while queue_start < queue_end:
+        node = queue[queue_start]
+        queue_start += 1
+        for j in range(indptr[node], indptr[node+1]):
+            child = indices[j]
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                queue[queue_end] = child
+                queue_end += 1
+    
+    if queue_end != node_amount:
+        raise Exception("Tried to topologically sort cyclic graph")
+    
+    return queue
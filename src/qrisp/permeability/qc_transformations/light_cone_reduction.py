@@ -15,7 +15,6 @@
 * SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
 ********************************************************************************/
 """
-import networkx as nx
 
 from qrisp.permeability.qc_transformations.memory_management import topological_sort
 # This function reorders the circuit such that the intended measurements can be executed
@@ -38,9 +37,9 @@ def lightcone_reduction(qc, intended_measurements):
         qc.measure(qb)
 
     # Generate dag representation
-    from qrisp.permeability import PermeabilityGraph, TerminatorNode
+    from qrisp.permeability import ArrayDAG, TerminatorNode
     
-    G = PermeabilityGraph(qc, remove_artificials = True)
+    G = ArrayDAG(qc, remove_artificials = True)
 
     # Create result qc
     qc_new = qc.clearcopy()
@@ -75,7 +74,7 @@ def lightcone_reduction(qc, intended_measurements):
 
     redundant_qc.data = qc_new.data[i + 1 :]
 
-    G = PermeabilityGraph(redundant_qc, remove_artificials = True)
+    G = ArrayDAG(redundant_qc, remove_artificials = True)
 
     # #Now we need to make sure we don't remove deallocation gates from the data
     # #because this would inflate the qubit count of the compiled circuit
@@ -89,7 +88,7 @@ def lightcone_reduction(qc, intended_measurements):
             continue
         
         if node.instr.op.name == "qb_dealloc":
-            ancs = nx.ancestors(G, node)
+            ancs = G.ancestors(node)
             
             redundant_qc.data.remove(node.instr)
             # print(f"removed {node.instr}")
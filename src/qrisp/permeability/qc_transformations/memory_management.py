@@ -19,13 +19,13 @@
 import networkx as nx
 import numpy as np
 from numba import njit
-import psutil
+
+from qrisp.permeability.permeability_dag import transpose_csr, csr_topological_sort
 
 def optimize_allocations(qc):
-    from qrisp.permeability import PermeabilityGraph, TerminatorNode
+    from qrisp.permeability import ArrayDAG, TerminatorNode
 
-    # G = dag_from_qc(qc, remove_init_nodes=True)
-    G = PermeabilityGraph(qc, remove_artificials = True)
+    G = ArrayDAG(qc, remove_artificials = True)
     qc_new = qc.clearcopy()
 
     dealloc_identifier = lambda x: x.op.name == "qb_dealloc"
@@ -104,7 +104,7 @@ def topological_sort(G, prefer=None, delay=None, sub_sort=nx.topological_sort):
 
     Parameters
     ----------
-    G : nx.DiGraph
+    G : ArrayDAG or nx.DiGraph
         The Unqomp DAG.
     prefer : function, optional
         Function which returns True, when presented with an Instruction, that should be
@@ -146,90 +146,127 @@ def topological_sort(G, prefer=None, delay=None, sub_sort=nx.topological_sort):
     if len(prefered_nodes) == 0:
         return node_list
     
-    sprs_mat = nx.to_scipy_sparse_array(G, format="csr")
+    from qrisp.permeability import ArrayDAG
+    
+    # The ArrayDAG already provides the CSR arrays
+    if isinstance(G, ArrayDAG):
+        indptr, indices = G.indptr, G.indices
+    else:
+        sprs_mat = nx.to_scipy_sparse_array(G, format="csr")
+        indptr = sprs_mat.indptr.astype(np.int32)
+        indices = sprs_mat.indices.astype(np.int32)
     
     res = toposort_helper(
-                    sprs_mat.indptr.astype(np.int32),
-                    sprs_mat.indices.astype(np.int32),
+                    indptr,
+                    indices,
                     len(G),
                     np.array(delay_nodes, dtype = np.int32), 
                     np.array(prefered_nodes, dtype = np.int32))
     
     return [node_list[i] for i in res]
 
-memory = psutil.virtual_memory().total
-
-def toposort_helper(indptr, indices, node_amount, delay_nodes, prefered_nodes):
-    
-    if memory/4 < node_amount**2:
-        return toposort_helper_sparse(indptr, indices, node_amount, delay_nodes, prefered_nodes)
-    else:
-        return toposort_helper_dense(indptr, indices, node_amount, delay_nodes, prefered_nodes)
-
-
+# Determines the topological order (as an array of node indices) based on the CSR
+# representation of the DAG. The prefered nodes are processed in the order of
+# least required delay nodes, i.e. all remaining ancestors of the prefered node
+# are inserted into the result.
+# The runtime is O(n*m + n**2 + edge_amount*min(n, m)/64 + node_amount*log(node_amount))
+# where n is the amount of prefered nodes and m the amount of delay nodes.
 @njit(cache = True)
-def toposort_helper_dense(indptr, indices, node_amount, delay_nodes, prefered_nodes):
-    # This array returns a graph that reflects all ancestor relations
-    # i.e. ancestor_graph[42] is True at all ancestors of node 42
-    ancestor_graph = compute_all_ancestors_dense(indptr, indices, node_amount)
+def toposort_helper(indptr, indices, node_amount, delay_nodes, prefered_nodes):
     
     n = prefered_nodes.size
     m = delay_nodes.size
     
-    # This array will contain the ancestor relations between the
-    # prefered/delay nodes
-    dependency_matrix = np.zeros((n, m), dtype = np.int8)
-
-    # Fill with information from ancestor_graph    
-    for i in range(n):
-        for j in range(m):
-            if ancestor_graph[prefered_nodes[i], delay_nodes[j]]:
-                dependency_matrix[i, j] = 1
-
+    # The predecessors of each node
+    pred_indptr, pred_indices = transpose_csr(indptr, indices)
+    
     # This array will contain the result
     res = np.zeros(node_amount, dtype = np.int32)
     
     # This array array tracks which nodes have not yet been processed.
     # It is initialized to all True because no nodes have been processed yet.
-    remaining_nodes = np.ones(node_amount, dtype = np.int8)
+    remaining_nodes = np.ones(node_amount, dtype = np.bool_)
     
     # This integer will contain the amount of nodes that have been processed
     node_counter = 0
     
     if m != 0:
+        
+        # This array will contain the ancestor relations between the
+        # prefered/delay nodes, i.e. dependency_matrix[i, j] is 1 if delay_nodes[j]
+        # is an ancestor of prefered_nodes[i].
+        # To compute it, we propagate bitsets through the DAG. These bitsets
+        # represent the smaller one of the two node sets.
+        topo_order = csr_topological_sort(indptr, indices)
+        if m <= n:
+            # Propagate the delay nodes to their descendants
+            dependency_matrix = propagate_marker_bits(
+                pred_indptr, pred_indices, 
+                topo_order, 
+                delay_nodes, prefered_nodes)
+        else:
+            # Propagate the prefered nodes to their ancestors
+            dependency_matrix = propagate_marker_bits(
+                indptr, indices, 
+                topo_order[::-1], 
+                prefered_nodes, delay_nodes).T.copy()
+        
+        # For each prefer nodes we compute how many delay nodes are required.
+        required_delay_nodes = np.sum(dependency_matrix, axis = 1)
+        
+        stack = np.zeros(node_amount, dtype = np.int32)
+        
         for i in range(n):
-            # For each prefer nodes we compute how many delay nodes are required.
-            required_delay_nodes = np.sum(dependency_matrix, axis = 1)
             
             # We determine the prefer node that requires the least delay nodes
             min_node_index = np.argmin(required_delay_nodes)
             prefer_node = prefered_nodes[min_node_index]
             
             # We determine the ancestor nodes of this node that have 
-            # not been processed yet
-            to_be_processed = ancestor_graph[prefer_node,:] & remaining_nodes
-            
-            ancestor_indices = np.nonzero(to_be_processed)[0]
+            # not been processed yet. Since the processed nodes are closed under
+            # taking ancestors, the search can stop at processed nodes.
+            start = node_counter
+            if remaining_nodes[prefer_node]:
+                remaining_nodes[prefer_node] = False
+                res[node_counter] = prefer_node
+                node_counter += 1
+                stack[0] = prefer_node
+                stack_size = 1
+                
+                while stack_size:
+                    stack_size -= 1
+                    current = stack[stack_size]
+                    for j in range(pred_indptr[current], pred_indptr[current+1]):
+                        pred = pred_indices[j]
+                        if remaining_nodes[pred]:
+                            # Mark the nodes as processed
+                            remaining_nodes[pred] = False
+                            res[node_counter] = pred
+                            node_counter += 1
+                            stack[stack_size] = pred
+                            stack_size += 1
             
             # We insert the nodes in the result array.
             # We can assume that order of the nodes induces by their numbering
             # is already a topological ordering. Therefore inserting them in
             # order is also a topological sub sort.
-            res[node_counter:node_counter+len(ancestor_indices)] = ancestor_indices
-            node_counter += len(ancestor_indices)
-            
-            # Mark the nodes as processed
-            remaining_nodes[ancestor_indices] = 0
-            
+            res[start:node_counter].sort()
             
             # Update the depedency matrix: All delay nodes that have been processed
             # don't need to be considered again for all following iterations,
-            # we therefore remove them from the other columns
-            dependency_matrix = np.clip(dependency_matrix - dependency_matrix[min_node_index, :], 0, 1)
+            # we therefore remove them from the other rows
+            processed_row = dependency_matrix[min_node_index]
+            for j in range(m):
+                if processed_row[j]:
+                    for k in range(n):
+                        if dependency_matrix[k, j]:
+                            dependency_matrix[k, j] = 0
+                            required_delay_nodes[k] -= 1
             
-            # Finaly we set all nodes in the processed column to 1 so this column
+            # Finaly we set all nodes in the processed row to 1 so this row
             # is not processed again.
             dependency_matrix[min_node_index, :] = 1
+            required_delay_nodes[min_node_index] = m
 
     # Insert the remaining nodes
     res[node_counter:] = np.nonzero(remaining_nodes)[0]
@@ -238,151 +275,88 @@ def toposort_helper_dense(indptr, indices, node_amount, delay_nodes, prefered_no
     return res
 
 
-@njit(cache=True)
-def compute_all_ancestors_dense(indptr, indices, node_amount):
-    # Initialize ancestor sets for all nodes
-    ancestors = np.zeros((node_amount, node_amount), dtype=np.bool_)
+# Propagates bitsets through a DAG. The DAG is given by the CSR arrays adj_indptr
+# and adj_indices, where adj_indices contains the nodes, from which the bitset of
+# a node is pulled, and order is a traversal order, that processes these nodes
+# first. Each bitset contains one bit per marker node, which is set if the
+# marker node can be reached.
+# Returns an int8 array of shape (len(targets), len(markers)), where row i
+# contains the bits of targets[i].
+# Since a bitset is only required until all of its consumers have been processed,
+# the bitsets are stored in a pool of recycled slots, such that the required
+# memory only scales with the width of the DAG.
+@njit(cache = True)
+def propagate_marker_bits(adj_indptr, adj_indices, order, markers, targets):
     
-    # Topological sort
-    in_degree = np.zeros(node_amount, dtype=np.int64)
-    for i in range(node_amount):
-        for j in range(indptr[i], indptr[i+1]):
-            in_degree[indices[j]] += 1
+    node_amount = len(adj_indptr) - 1
+    words = (len(markers) + 63) // 64
     
-    queue = [i for i in range(node_amount) if in_degree[i] == 0]
+    marker_index = np.full(node_amount, -1, dtype = np.int64)
+    for k in range(len(markers)):
+        marker_index[markers[k]] = k
     
-    while queue:
-        node = queue.pop(0)
-        ancestors[node, node] = True  # A node is its own ancestor
-        
-        for i in range(indptr[node], indptr[node+1]):
-            child = indices[i]
-            # Add current node and its ancestors to child's ancestors
-            ancestors[child, :] |= ancestors[node, :]
-            in_degree[child] -= 1
-            if in_degree[child] == 0:
-                queue.append(child)
+    target_index = np.full(node_amount, -1, dtype = np.int64)
+    for k in range(len(targets)):
+        target_index[targets[k]] = k
     
-    return ancestors
-
-@njit(cache=True)
-def compute_all_ancestors_sparse(indptr, indices, node_amount, prefered_nodes):
-    # Initialize ancestor sets for all nodes using a list of sets
-    ancestors = [np.zeros(1, dtype = np.int8) for i in np.arange(node_amount, dtype = np.int32)]
+    # Count how often each bitset is pulled
+    consumers = np.zeros(node_amount, dtype = np.int64)
+    for k in range(len(adj_indices)):
+        consumers[adj_indices[k]] += 1
     
-    # Topological sort
-    in_degree = np.zeros(node_amount, dtype=np.int64)
-    
-    for i in range(node_amount):
-        for j in range(indptr[i], indptr[i+1]):
-            in_degree[indices[j]] += 1
-
-    queue = []
-    for i in range(node_amount):
-        if in_degree[i] == 0:
-            queue.append(i)
-            ancestors[i] = np.zeros(node_amount, dtype = np.int8)
-            ancestors[i][i] = 1
+    # Determine the amount of simultaneously required bitsets
+    remaining_consumers = consumers.copy()
+    live = 0
+    max_live = 0
+    for i in order:
+        live += 1
+        max_live = max(max_live, live)
+        for k in range(adj_indptr[i], adj_indptr[i+1]):
+            c = adj_indices[k]
+            remaining_consumers[c] -= 1
+            if remaining_consumers[c] == 0:
+                live -= 1
+        if consumers[i] == 0:
+            live -= 1
     
+    pool = np.zeros((max_live, words), dtype = np.uint64)
+    free_slots = np.arange(max_live)
+    free_amount = max_live
+    slot = np.full(node_amount, -1, dtype = np.int64)
     
-    keep_result = np.zeros(node_amount, dtype = np.int32)
+    res = np.zeros((len(targets), len(markers)), dtype = np.int8)
     
-    for i in range(len(prefered_nodes)):
-        keep_result[prefered_nodes[i]] = 1
-    
-    while queue:
-        node = queue.pop(0)
+    for i in order:
+        
+        free_amount -= 1
+        s = free_slots[free_amount]
+        slot[i] = s
+        pool[s, :] = 0
         
-        curr_anc = ancestors[node]
+        if marker_index[i] != -1:
+            k = marker_index[i]
+            pool[s, k >> 6] |= np.uint64(1) << np.uint64(k & 63)
         
-        for i in range(indptr[node], indptr[node+1]):
-            child = indices[i]
-            if len(ancestors[child]) != node_amount:
-                ancestors[child] = np.zeros(node_amount, dtype = np.int8)
-                ancestors[child][child] = 1
+        for k in range(adj_indptr[i], adj_indptr[i+1]):
+            c = adj_indices[k]
+            t = slot[c]
+            for w in range(words):
+                pool[s, w] |= pool[t, w]
             
-            in_degree[child] -= 1
-            if in_degree[child] == 0:
-                queue.append(child)
+            # Recycle the slot if the bitset is not required anymore
+            consumers[c] -= 1
+            if consumers[c] == 0:
+                free_slots[free_amount] = t
+                free_amount += 1
         
-        for i in range(indptr[node], indptr[node+1]):
-            child = indices[i]
-            # Add current node and its ancestors to child's ancestors
-            ancestors[child] = curr_anc | ancestors[child]
+        if target_index[i] != -1:
+            row = res[target_index[i]]
+            for k in range(len(markers)):
+                if (pool[s, k >> 6] >> np.uint64(k & 63)) & np.uint64(1):
+                    row[k] = 1
         
-        # Delete the non-needed values
-        if not keep_result[node]:
-            ancestors[node] = np.zeros(1, dtype = np.int8)
-    
-    return ancestors
-
-
-@njit(cache = True)
-def toposort_helper_sparse(indptr, indices, node_amount, delay_nodes, prefered_nodes):
-    # This array returns a graph that reflects all ancestor relations
-    # i.e. ancestor_graph[42] is True at all ancestors of node 42
-    ancestor_graph = compute_all_ancestors_sparse(indptr, indices, node_amount, prefered_nodes)
-    
-    n = prefered_nodes.size
-    m = delay_nodes.size
-    
-    # This array will contain the ancestor relations between the
-    # prefered/delay nodes
-    dependency_matrix = np.zeros((n, m), dtype = np.int8)
-
-    # Fill with information from ancestor_graph    
-    for i in range(n):
-        for j in range(m):
-            if ancestor_graph[prefered_nodes[i]][delay_nodes[j]]:
-                dependency_matrix[i, j] = 1
-
-    # This array will contain the result
-    res = np.zeros(node_amount, dtype = np.int32)
-    
-    # This array array tracks which nodes have not yet been processed.
-    # It is initialized to all True because no nodes have been processed yet.
-    remaining_nodes = np.ones(node_amount, dtype = np.int8)
+        if consumers[i] == 0:
+            free_slots[free_amount] = s
+            free_amount += 1
     
-    # This integer will contain the amount of nodes that have been processed
-    node_counter = 0
-    
-    if m != 0:
-        for i in range(n):
-            # For each prefer nodes we compute how many delay nodes are required.
-            required_delay_nodes = np.sum(dependency_matrix, axis = 1)
-            
-            # We determine the prefer node that requires the least delay nodes
-            min_node_index = np.argmin(required_delay_nodes)
-            prefer_node = prefered_nodes[min_node_index]
-            
-            # We determine the ancestor nodes of this node that have 
-            # not been processed yet
-            to_be_processed = ancestor_graph[prefer_node] & remaining_nodes
-            
-            ancestor_indices = np.nonzero(to_be_processed)[0]
-            
-            # We insert the nodes in the result array.
-            # We can assume that order of the nodes induces by their numbering
-            # is already a topological ordering. Therefore inserting them in
-            # order is also a topological sub sort.
-            res[node_counter:node_counter+len(ancestor_indices)] = ancestor_indices
-            node_counter += len(ancestor_indices)
-            
-            # Mark the nodes as processed
-            remaining_nodes[ancestor_indices] = 0
-            
-            
-            # Update the depedency matrix: All delay nodes that have been processed
-            # don't need to be considered again for all following iterations,
-            # we therefore remove them from the other columns
-            dependency_matrix = np.clip(dependency_matrix - dependency_matrix[min_node_index, :], 0, 1)
-            
-            # Finaly we set all nodes in the processed column to 1 so this column
-            # is not processed again.
-            dependency_matrix[min_node_index, :] = 1
-
-    # Insert the remaining nodes
-    res[node_counter:] = np.nonzero(remaining_nodes)[0]
-    
-    # return the result
-    return res
\ No newline at end of file
+    return res
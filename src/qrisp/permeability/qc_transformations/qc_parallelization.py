@@ -21,71 +21,22 @@
 # trivial and non-trivial commutation relations based on the dag representation of
 # unqomp.
 
-import networkx as nx
 import numpy as np
 from numba import njit
 
-from qrisp.permeability import PermeabilityGraph, TerminatorNode
+from qrisp.permeability import ArrayDAG, TerminatorNode
 
-# The following code aims to represent quantum circuits as an array of integers.
-# The idea is here that in a 6 qubit quantum circuit, a gate that is executed 
-# on the qubits 1 and 3 is represented by the number 001010 = 5 (ie. the digits
-# with significance 2**1 and 2**3 are set to 1).
+# The following code aims to represent quantum circuits as arrays of integers.
+# The idea is here that each gate is represented by the indices of the qubits it is
+# executed on, i.e. in a 6 qubit quantum circuit, a gate that is executed on the
+# qubits 1 and 3 is represented by [1, 3].
 # This construction might remove some of the information (ie. gate type or qubit order)
 # but allows efficient processing since, the quantum circuit can be given to numba
-# as a numpy array.
-
-# Unfortunately, numpy integers can only represent 64 bit numbers. This means,
-# that this technique could only handle quantum circuits with up to 64 qubits.
-# We therefore SPLIT the number in the following way:
-# The qubits from 0 to 63 represented by a numpy int,
-# the qubits from 64 to 127 are represented by another numpy int,
-# the qubits from 128 to 255 are represented by another numpy int,
-# etc.
-# We therefore represent the quantum circuit with a two-index numpy array
-# where the first index indicates which gate is described and the second index
-# indicates what qubit range is meant.
-
-
-# This function receives the indices of the qubits of a gate and turns them into
-# the list according to the above construction. The parameter k indicates 
-# how many integers the result should contain.
-def split_integer(digit_list, k):
-    
-    digit_list.sort()
-    
-    if k <= 0:
-        raise ValueError("Parameter k must be greater than zero")
-
-    result = [0]*k
-    i = 0
-    for d in digit_list:
-        while d//64 > i:
-            i += 1
-        result[i] |= (1<<(d%64))
-        if result[i] >= 1<<64:
-            raise
-            
-    return result
+# as numpy arrays.
 
-# This function receives a list of qubits and a quantum circuit and turns it into
-# a list according to the above construction
-def qb_set_to_int(qubits, index_dict):
-    qb_indices = [index_dict[qb] for qb in qubits]
-    return split_integer(qb_indices, int(np.ceil(len(index_dict)/64)))
-
-# This function reverses the split_integer function (usefull for debugging)
-def reverse_split(split_int, num_qubits):
-    
-    res = []
-    for i in range(num_qubits):
-        if not i%64:
-            current_partial_int = split_int.pop(0)
-        
-        if (current_partial_int) & (1<<(i%64)):
-            res.append(i)
-            
-    return res
+# We represent the quantum circuit in the compressed sparse row (CSR) format, i.e.
+# as two arrays qubit_indptr and qubit_indices, where the qubits of the i-th gate
+# are given by qubit_indices[qubit_indptr[i]:qubit_indptr[i+1]] (in ascending order).
 
 # This function performs the parallelization. As described above, the idea is to
 # build up the DAG from the quantum circuit and determine a linearization, which
@@ -100,16 +51,14 @@ def parallelize_qc(qc, depth_indicator = None):
     if depth_indicator is None:
         depth_indicator = lambda x : 1
 
-    dag = PermeabilityGraph(qc, remove_artificials=True)
-    # dag = dag_from_qc(qc, True)
-
-    sprs_mat = nx.to_scipy_sparse_array(dag, format="csr")
+    dag = ArrayDAG(qc, remove_artificials=True)
 
-    node_list = list(dag.nodes())
+    node_list = dag.node_list
     
-    # This list will contain the participating qubits of each gate in the above
+    # These lists will contain the participating qubits of each gate in the above
     # discussed representation
-    qubit_ints = []
+    qubit_indptr = [0]
+    qubit_indices = []
     
     # This list will contain the depth of each gate, which can be specified via
     # the depth indicator function.
@@ -119,19 +68,19 @@ def parallelize_qc(qc, depth_indicator = None):
     
     for n in node_list:
         if not isinstance(n, TerminatorNode):
-            qubit_ints.append(qb_set_to_int(n.instr.qubits, index_dict))
+            qubit_indices.extend(sorted([index_dict[qb] for qb in n.instr.qubits]))
             depth_indicators.append(depth_indicator(n.instr.op))
         else:
-            qubit_ints.append(qb_set_to_int([n.qubit], index_dict))
+            qubit_indices.append(index_dict[n.qubit])
             depth_indicators.append(0)
-            
+        qubit_indptr.append(len(qubit_indices))
     
-    # Convert to array
-    qubit_ints = np.array(qubit_ints, dtype = np.uint64)
-
     # Execute topological sort
     res = depth_sensitive_topological_sort_jitted(
-        sprs_mat.indices, sprs_mat.indptr, qubit_ints, num_qubits=qc.num_qubits(), depth_indicators = np.array(depth_indicators)
+        dag.indices, dag.indptr, 
+        np.array(qubit_indptr, dtype = np.int64), 
+        np.array(qubit_indices, dtype = np.int64), 
+        num_qubits=qc.num_qubits(), depth_indicators = np.array(depth_indicators)
     )
 
     # Build new circuit
@@ -147,7 +96,9 @@ def parallelize_qc(qc, depth_indicator = None):
 
 # Kahns Algorithm based on
 # https://www.geeksforgeeks.org/topological-sorting-indegree-based-solution/
-def depth_sensitive_topological_sort(indices, indptr, int_qc, num_qubits, depth_indicators):
+def depth_sensitive_topological_sort(
+    indices, indptr, qubit_indptr, qubit_indices, num_qubits, depth_indicators
+):
     # Create a vector to store indegrees of all
     # vertices. Initialize all indegrees as 0.
     n = len(indptr) - 1
@@ -186,17 +137,15 @@ def depth_sensitive_topological_sort(indices, indptr, int_qc, num_qubits, depth_
         for i in range(len(queue)):
             node = queue[i]
 
-            qubits = int_qc[node]
+            qubits = qubit_indices[qubit_indptr[node] : qubit_indptr[node + 1]]
 
-            depth_list = []
-            for j in range(num_qubits):
-                if int(qubits[j//64]) & (1 << (j%64)):
-                    depth_list.append(depths[j])
+            max_depth = depths[qubits[0]]
+            for j in qubits:
+                if depths[j] > max_depth:
+                    max_depth = depths[j]
             
             # If multiple gates have the same max depth, the faster ones should
             # be executed first, because they might block other gates
-            depth_array = np.array(depth_list)
-            node_costs[i] = np.max(depth_array) + depth_indicators[node]/10**8
             
             # Multiple possible heuristics
             # node_costs[i] = np.max(depth_array) + depth_indicators[node]/10**8 - np.min(depth_array)/10**12
@@ -207,7 +156,11 @@ def depth_sensitive_topological_sort(indices, indptr, int_qc, num_qubits, depth_
             a = 10
             b = 1
             
-            node_costs[i] = depth_indicators[node]*a*max_time + b*np.sum((np.max(depth_array) + depth_indicators[node]) - depth_array)
+            depth_sum = 0
+            for j in qubits:
+                depth_sum += (max_depth + depth_indicators[node]) - depths[j]
+            
+            node_costs[i] = depth_indicators[node]*a*max_time + b*depth_sum
             
         u = queue.pop(np.argmin(node_costs))
 
@@ -215,15 +168,15 @@ def depth_sensitive_topological_sort(indices, indptr, int_qc, num_qubits, depth_
 
         # Update depths array
         max_depth = 0
+        
+        qubits = qubit_indices[qubit_indptr[u] : qubit_indptr[u + 1]]
 
-        for i in range(num_qubits):
-            if int_qc[u, i//64] & 1 << (i%64):
-                if depths[i] > max_depth:
-                    max_depth = depths[i]
+        for i in qubits:
+            if depths[i] > max_depth:
+                max_depth = depths[i]
 
-        for i in range(num_qubits):
-            if int_qc[u, i//64] & 1 << (i%64):
-                depths[i] = max_depth + depth_indicators[u]
+        for i in qubits:
+            depths[i] = max_depth + depth_indicators[u]
 
         # Update in degree array
         for i in indices[indptr[u] : indptr[u + 1]]:
@@ -27,3 +27,16 @@ from qrisp.simulator.circuit_reordering import *
 from qrisp.simulator.quantum_state import QuantumState, TensorFactor
 from qrisp.simulator.simulator import *
 from qrisp.simulator.unitary_management import *
+from qrisp.simulator.parametric_simulation import ParametricSimulation
+from qrisp.simulator.rng_management import get_rng, spawn_rngs
+from qrisp.simulator.clifford_simulator import (
+    CliffordTableau,
+    PauliFrames,
+    sample_clifford_circuit,
+    run_clifford,
+)
+from qrisp.simulator.state_cache import (
+    enable_state_cache,
+    disable_state_cache,
+    get_state_cache_info,
+)
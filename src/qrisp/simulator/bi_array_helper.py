@@ -23,7 +23,7 @@
 
 import numpy as np
 from numba import uint64, uint32, int64, int32, njit, prange, vectorize
-from qrisp.simulator.numerics_config import float_tresh, cutoff_ratio
+from qrisp.simulator import numerics_config
 from scipy.sparse import coo_array
 
 # It can happen that the coo-matrix multiplication puts two data entries
@@ -334,7 +334,7 @@ def bi_array_moveaxis(data_array, index_perm, f_index_array):
 
 
 @njit(parallel = True, cache = True)
-def dense_measurement_brute(input_array, mes_amount, outcome_index):
+def dense_measurement_brute(input_array, mes_amount, outcome_index, cutoff_ratio):
     
     n = int(np.log2(len(input_array)))
     mes_amount = int(mes_amount)
@@ -368,7 +368,7 @@ def dense_measurement_brute(input_array, mes_amount, outcome_index):
 
 
 @njit(nogil=True, cache=True)
-def dense_measurement_smart(input_array, mes_amount, outcome_index):
+def dense_measurement_smart(input_array, mes_amount, outcome_index, float_tresh):
     
     p = np.abs(np.vdot(input_array, input_array) )
     
@@ -383,14 +383,21 @@ def dense_measurement_smart(input_array, mes_amount, outcome_index):
     p_list = []
     outcome_index_list = []
     
-    a, b, c = dense_measurement_smart(input_array[:N//2], mes_amount - 1, outcome_index)
+    a, b, c = dense_measurement_smart(
+        input_array[:N//2], mes_amount - 1, outcome_index, float_tresh
+    )
     
     if c[0] != -1:
         new_arrays.extend(a)
         p_list.extend(b)
         outcome_index_list.extend(c)
     
-    a, b, c = dense_measurement_smart(input_array[N//2:], mes_amount - 1, outcome_index + 2**(mes_amount-1))
+    a, b, c = dense_measurement_smart(
+        input_array[N//2:],
+        mes_amount - 1,
+        outcome_index + 2**(mes_amount-1),
+        float_tresh,
+    )
     
     if c[0] != -1:
         new_arrays.extend(a)
@@ -518,7 +525,7 @@ def coo_sparse_matrix_mult_inner(A_row, A_col, A_data, B_row, B_col, B_data, A_s
     abs_R = np.abs(R)
     max_abs = np.max(R.ravel())
     
-    I, J = np.nonzero(abs_R > (cutoff_ratio * max_abs))
+    I, J = np.nonzero(abs_R > (numerics_config.cutoff_ratio * max_abs))
     
     res_row = A_row[unique_marker_a[I]]
     res_col = B_col[unique_marker_b[J]]
@@ -27,7 +27,7 @@ from scipy.sparse import (
 )
 
 import qrisp.simulator.bi_array_helper as hlp
-from qrisp.simulator.numerics_config import float_tresh, sparsification_rate, cutoff_ratio
+from qrisp.simulator import numerics_config
 
 try:
     # sparse_dot_mkl seems to be only faster in situations, where the shape of the
@@ -659,7 +659,7 @@ class SparseBiArray(BiArray):
             
             p = np.abs(np.vdot(temp_data, temp_data))
             
-            if p < float_tresh:
+            if p < numerics_config.float_tresh:
                 continue
             
             p_list.append(p)
@@ -1045,10 +1045,11 @@ class DenseBiArray(BiArray):
             self.reshape(original_shape_self)
             other.reshape(original_shape_other)
             
-            if np.random.random(1)[0] < sparsification_rate and res.size > 2**14:
+            sparsify = np.random.random(1)[0] < numerics_config.sparsification_rate
+            if sparsify and res.size > 2**14:
                 temp = np.abs(res.data.ravel())
                 max_abs = np.max(temp)
-                filter_arr = temp > max_abs*cutoff_ratio
+                filter_arr = temp > max_abs*numerics_config.cutoff_ratio
                 res.data = res.data * filter_arr
                 res.data = res.data.reshape(res_shape)
                 res.sparsity = np.sum(filter_arr)/res.size
@@ -1081,9 +1082,13 @@ class DenseBiArray(BiArray):
         np_array = self.to_array()
 
         if len(indices) > 10:
-            new_arrays, p_list, outcome_index_list = hlp.dense_measurement_brute(np_array, len(indices), 0)
+            new_arrays, p_list, outcome_index_list = hlp.dense_measurement_brute(
+                np_array, len(indices), 0, numerics_config.cutoff_ratio
+            )
         else:
-            new_arrays, p_list, outcome_index_list = hlp.dense_measurement_smart(np_array, len(indices), 0)
+            new_arrays, p_list, outcome_index_list = hlp.dense_measurement_smart(
+                np_array, len(indices), 0, numerics_config.float_tresh
+            )
             
             
         new_bi_arrays = []
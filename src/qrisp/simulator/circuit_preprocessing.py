@@ -107,6 +107,12 @@ class GroupedInstruction:
                     pass
 
             temp_qc.append(self.instr_list[self.indices[i]])
+            
+            # Log the abstract parameters (this is not performed by the append method
+            # in fast append mode)
+            op = self.instr_list[self.indices[i]].op
+            temp_qc.abstract_params.update(op.abstract_params)
+            
         # Create instruction
         self.instruction = Instruction(temp_qc.to_op(), temp_qc.qubits, temp_qc.clbits)
 
@@ -0,0 +1,786 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+from collections import Counter
+
+import numpy as np
+
+from qrisp.simulator.rng_management import get_rng
+
+# This file implements a simulator for Clifford circuits based on the tableau
+# formalism of Aaronson and Gottesman (https://arxiv.org/abs/quant-ph/0406196).
+# The tableau consists of the Pauli strings of the n destabilizers and the n
+# stabilizers of the state. Each Pauli string (i.e. each row) is stored as two
+# bit-packed arrays of uint64 words (X part and Z part) plus a sign bit.
+# Gates on qubit i act on bit i of every row, which can be processed for all
+# rows at once with a few bitwise NumPy operations. The row multiplications
+# required for measurements process 64 qubits per word operation.
+
+# Furthermore, circuits can be sampled for many shots at once by propagating
+# Pauli frames (see sample_clifford_circuit).
+
+
+one = np.uint64(1)
+
+# Amount of set bits for every possible byte value
+popcount_table = np.array([bin(i).count("1") for i in range(256)], dtype = np.int64)
+
+# Native popcount (available from NumPy 2.0)
+bitwise_count = getattr(np, "bitwise_count", None)
+
+# Returns the amount of set bits along the last axis of an array of uint64 words
+def popcount(words):
+    
+    if bitwise_count is not None:
+        return bitwise_count(words).sum(axis = -1, dtype = np.int64)
+    
+    # For small arrays, a lookup of the bytes is the fastest option
+    if words.size < 256:
+        words = np.ascontiguousarray(words)
+        return popcount_table[words.view(np.uint8)].sum(axis = -1)
+    
+    # For larger arrays, the bits are counted in parallel within the words
+    mask_2 = np.uint64(0x3333333333333333)
+    words = words - ((words >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    words = (words & mask_2) + ((words >> np.uint64(2)) & mask_2)
+    words = (words + (words >> np.uint64(4))) & np.uint64(0x0f0f0f0f0f0f0f0f)
+    words = (words * np.uint64(0x0101010101010101)) >> np.uint64(56)
+    return words.sum(axis = -1, dtype = np.int64)
+
+
+# Returns the exponent k (up to multiples of 4) of the phase i**k that appears
+# when the Pauli strings (x_1, z_1) and (x_2, z_2) (represented as products of
+# X, Y and Z without any phases) are multiplied (in this order).
+# This is the sum over the function g of Aaronson and Gottesman, which 
+# evaluates to +1 for the pairs (X,Y), (Y,Z), (Z,X) and to -1 for (Y,X), (Z,Y),
+# (X,Z). The arguments can be arrays of rows, which are processed elementwise.
+def product_phase(x_1, z_1, x_2, z_2):
+    plus = (
+        (x_1 & ~z_1 & x_2 & z_2) | (x_1 & z_1 & ~x_2 & z_2) | (~x_1 & z_1 & x_2 & ~z_2)
+    )
+    minus = (
+        (x_1 & z_1 & x_2 & ~z_2) | (~x_1 & z_1 & x_2 & z_2) | (x_1 & ~z_1 & ~x_2 & z_2)
+    )
+    return popcount(plus) - popcount(minus)
+
+
+# Returns random uint64 words. Uses the bytes method, which is supported by
+# numpy.random.Generator and the global numpy random state.
+def random_words(rng, shape):
+    size = int(np.prod(shape))
+    return np.frombuffer(rng.bytes(8*size), dtype = np.uint64).reshape(shape).copy()
+
+
+# Operations which don't have any effect on the simulation
+ignored_operations = {"qb_alloc", "qb_dealloc", "barrier", "gphase", "id"}
+
+# Operations, which the simulators implement as methods
+native_operations = {"x", "y", "z", "h", "s", "s_dg", "cx", "cz", "swap"}
+
+# Cache for the conjugation tables (see clifford_table)
+clifford_table_cache = {}
+
+
+def clifford_table(op):
+    """
+    Determines how a Clifford gate acts on Pauli strings under conjugation.
+    
+    The local Pauli strings on the qubits of the gate are indexed by integers,
+    where bit j describes the X part of qubit j and bit k+j the Z part (k is the
+    amount of qubits of the gate). X and Z part both set describes a Y.
+
+    Parameters
+    ----------
+    op : Operation
+        The (at most two qubit) operation to analyze.
+
+    Raises
+    ------
+    Exception
+        The operation is not a Clifford operation.
+
+    Returns
+    -------
+    new_paulis : numpy.ndarray
+        The index of the Pauli string U P U^dagger for every Pauli string P.
+    sign_flips : numpy.ndarray
+        The sign of U P U^dagger for every Pauli string P (1 for negative).
+
+    """
+    
+    key = (op.name, op.num_qubits, tuple(op.params), getattr(op, "ctrl_state", None))
+    
+    if key in clifford_table_cache:
+        return clifford_table_cache[key]
+    
+    k = op.num_qubits
+    
+    if k > 2:
+        raise Exception(
+            f"Clifford conjugation table of the {k} qubit operation {op.name} can't "
+            "be determined"
+        )
+    
+    try:
+        unitary = np.array(op.get_unitary(), dtype = np.complex128)
+    except Exception:
+        raise Exception(f"Operation {op.name} is not a Clifford operation")
+    
+    single_qubit_paulis = [np.eye(2), 
+                           np.array([[0, 1], [1, 0]]),
+                           np.array([[1, 0], [0, -1]]),
+                           np.array([[0, -1j], [1j, 0]])]
+    
+    # Build the matrices of the Pauli strings (qubit 0 is the most significant
+    # qubit of the unitary)
+    pauli_strings = []
+    for i in range(4**k):
+        matrix = np.eye(1)
+        for j in range(k):
+            pauli_index = ((i >> j) & 1) + 2*((i >> (k + j)) & 1)
+            matrix = np.kron(matrix, single_qubit_paulis[pauli_index])
+        pauli_strings.append(matrix)
+    
+    new_paulis = np.zeros(4**k, dtype = np.uint64)
+    sign_flips = np.zeros(4**k, dtype = np.uint64)
+    
+    for i in range(4**k):
+        conjugated_pauli = unitary @ pauli_strings[i] @ unitary.conj().T
+        for j in range(4**k):
+            overlap = np.trace(pauli_strings[j] @ conjugated_pauli)/2**k
+            if np.abs(np.abs(overlap) - 1) < 1E-5:
+                break
+        else:
+            raise Exception(f"Operation {op.name} is not a Clifford operation")
+        
+        if np.abs(overlap.imag) > 1E-5:
+            raise Exception(f"Operation {op.name} is not a Clifford operation")
+        
+        new_paulis[i] = j
+        sign_flips[i] = overlap.real < 0
+    
+    # Parametrized gates can fill the cache with many (numerically different)
+    # angles
+    if len(clifford_table_cache) > 4096:
+        clifford_table_cache.clear()
+    
+    clifford_table_cache[key] = new_paulis, sign_flips
+    
+    return new_paulis, sign_flips
+
+
+# Applies an operation to a CliffordTableau or PauliFrames object. 
+# Gates, which are implemented as methods, are dispatched directly, composite
+# gates are decomposed and every other gate is applied using its conjugation
+# table.
+def apply_clifford_operation(simulator, op, qubits):
+    
+    if op.name in ignored_operations:
+        return
+    
+    if op.name in native_operations and (op.definition is None or op.name == "swap"):
+        getattr(simulator, op.name)(*qubits)
+    elif op.definition is None:
+        simulator.apply_table(clifford_table(op), qubits)
+    else:
+        definition = op.definition
+        qubit_indices = {definition.qubits[i] : qubits[i] for i in range(len(qubits))}
+        for instr in definition.data:
+            apply_clifford_operation(
+                simulator, instr.op, [qubit_indices[qb] for qb in instr.qubits]
+            )
+
+
+class CliffordTableau:
+    """
+    This class describes the state of a quantum system, which has been prepared
+    by Clifford operations, using a bit-packed stabilizer tableau.
+    
+    The Pauli strings of the destabilizers and stabilizers are stored as rows of
+    NumPy uint64 words, such that gates are applied with a few vectorized bitwise
+    operations and measurements only require vectorized row multiplications.
+    The simulator supports every (at most two qubit) Clifford gate, composite
+    gates that decompose into Clifford gates, measurements and resets. Qubits
+    can be added at any time.
+
+    Parameters
+    ----------
+    n : int, optional
+        The amount of qubits in the |0> state to start with. The default is 0.
+        
+    Examples
+    --------
+    
+    We prepare a GHZ state and measure it:
+        
+    >>> from qrisp.circuit import HGate, CXGate
+    >>> from qrisp.simulator import CliffordTableau
+    >>> tableau = CliffordTableau(3)
+    >>> tableau.apply_operation(HGate(), [0])
+    >>> tableau.apply_operation(CXGate(), [0, 1])
+    >>> tableau.apply_operation(CXGate(), [0, 2])
+    >>> tableau.get_stabilizers()
+    ['+XXX', '+ZZI', '+ZIZ']
+    >>> res = tableau.measure(0)
+    >>> [tableau.measure(i) for i in range(3)] == 3*[res]
+    True
+
+    """
+    
+    def __init__(self, n = 0):
+        
+        self.n = 0
+        self.capacity = 0
+        
+        # The rows 0 to capacity-1 contain the destabilizers, the rows 
+        # capacity to 2*capacity-1 the stabilizers. Rows of qubits that haven't
+        # been added yet are zero (i.e. identity), which is why they are not
+        # affected by any gate.
+        self.x_table = np.zeros((0, 1), dtype = np.uint64, order = "F")
+        self.z_table = np.zeros((0, 1), dtype = np.uint64, order = "F")
+        self.signs = np.zeros(0, dtype = np.uint64)
+        
+        self.reserve(n)
+        for i in range(n):
+            self.add_qubit()
+    
+    # Enlarges the storage of the tableau to the given amount of qubits
+    def reserve(self, capacity):
+        
+        if capacity <= self.capacity:
+            return
+        
+        words = max(1, (capacity + 63)//64)
+        n = self.n
+        old_capacity = self.capacity
+        old_words = self.x_table.shape[1]
+        
+        # The tables are stored in column major order, such that the words
+        # containing the bits of a qubit (which are processed by the gates)
+        # are contiguous in memory
+        x_table = np.zeros((2*capacity, words), dtype = np.uint64, order = "F")
+        z_table = np.zeros((2*capacity, words), dtype = np.uint64, order = "F")
+        signs = np.zeros(2*capacity, dtype = np.uint64)
+        
+        for new_table, old_table in [(x_table, self.x_table), (z_table, self.z_table)]:
+            new_table[:n, :old_words] = old_table[:n]
+            new_table[capacity:capacity + n, :old_words] = (
+                old_table[old_capacity:old_capacity + n]
+            )
+        
+        signs[:n] = self.signs[:n]
+        signs[capacity:capacity + n] = self.signs[old_capacity:old_capacity + n]
+        
+        self.x_table, self.z_table, self.signs = x_table, z_table, signs
+        self.capacity = capacity
+    
+    def add_qubit(self):
+        """
+        Adds a qubit in the |0> state.
+
+        Returns
+        -------
+        int
+            The index of the new qubit.
+
+        """
+        if self.n == self.capacity:
+            self.reserve(max(2*self.capacity, 8))
+        
+        i = self.n
+        self.x_table[i, i >> 6] = one << np.uint64(i & 63)
+        self.z_table[self.capacity + i, i >> 6] = one << np.uint64(i & 63)
+        self.n += 1
+        
+        return i
+    
+    def copy(self):
+        res = CliffordTableau()
+        res.n = self.n
+        res.capacity = self.capacity
+        res.x_table = self.x_table.copy(order = "F")
+        res.z_table = self.z_table.copy(order = "F")
+        res.signs = self.signs.copy()
+        return res
+    
+    # Returns the bits of qubit i of all rows
+    def column(self, table, i):
+        return (table[:, i >> 6] >> np.uint64(i & 63)) & one
+    
+    # Flips bit i of all rows, where flips is 1
+    def flip_column(self, table, i, flips):
+        table[:, i >> 6] ^= flips << np.uint64(i & 63)
+    
+    def x(self, i):
+        self.signs ^= self.column(self.z_table, i)
+    
+    def y(self, i):
+        self.signs ^= self.column(self.x_table, i) ^ self.column(self.z_table, i)
+        
+    def z(self, i):
+        self.signs ^= self.column(self.x_table, i)
+    
+    def h(self, i):
+        x_i = self.column(self.x_table, i)
+        z_i = self.column(self.z_table, i)
+        self.signs ^= x_i & z_i
+        self.flip_column(self.x_table, i, x_i ^ z_i)
+        self.flip_column(self.z_table, i, x_i ^ z_i)
+    
+    def s(self, i):
+        x_i = self.column(self.x_table, i)
+        self.signs ^= x_i & self.column(self.z_table, i)
+        self.flip_column(self.z_table, i, x_i)
+    
+    def s_dg(self, i):
+        x_i = self.column(self.x_table, i)
+        self.signs ^= x_i & ~self.column(self.z_table, i) & one
+        self.flip_column(self.z_table, i, x_i)
+    
+    def cx(self, i, j):
+        x_i = self.column(self.x_table, i)
+        z_j = self.column(self.z_table, j)
+        x_j = self.column(self.x_table, j)
+        z_i = self.column(self.z_table, i)
+        self.signs ^= x_i & z_j & ~(x_j ^ z_i) & one
+        self.flip_column(self.x_table, j, x_i)
+        self.flip_column(self.z_table, i, z_j)
+    
+    def cz(self, i, j):
+        x_i = self.column(self.x_table, i)
+        x_j = self.column(self.x_table, j)
+        z_i = self.column(self.z_table, i)
+        z_j = self.column(self.z_table, j)
+        self.signs ^= x_i & x_j & (z_i ^ z_j)
+        self.flip_column(self.z_table, i, x_j)
+        self.flip_column(self.z_table, j, x_i)
+    
+    def swap(self, i, j):
+        for table in [self.x_table, self.z_table]:
+            diff = self.column(table, i) ^ self.column(table, j)
+            self.flip_column(table, i, diff)
+            self.flip_column(table, j, diff)
+    
+    # Applies a gate described by a conjugation table (see clifford_table)
+    def apply_table(self, table, qubits):
+        new_paulis, sign_flips = table
+        k = len(qubits)
+        
+        columns = [self.column(self.x_table, i) for i in qubits]
+        columns += [self.column(self.z_table, i) for i in qubits]
+        
+        index = np.zeros(len(self.signs), dtype = np.uint64)
+        for j in range(2*k):
+            index |= columns[j] << np.uint64(j)
+        index = index.astype(np.intp)
+        
+        new_index = new_paulis[index]
+        self.signs ^= sign_flips[index]
+        
+        for j in range(2*k):
+            table = self.x_table if j < k else self.z_table
+            new_column = (new_index >> np.uint64(j)) & one
+            self.flip_column(table, qubits[j % k], columns[j] ^ new_column)
+    
+    def apply_operation(self, op, qubits):
+        """
+        Applies a Clifford operation.
+
+        Parameters
+        ----------
+        op : Operation
+            The operation to apply.
+        qubits : list[int]
+            The indices of the qubits to apply the operation on.
+
+        Raises
+        ------
+        Exception
+            The operation is not a Clifford operation.
+
+        """
+        apply_clifford_operation(self, op, qubits)
+    
+    # Multiplies the given rows by the row p (i.e. row = row_p * row)
+    def multiply_rows(self, rows, p):
+        
+        if not len(rows):
+            return
+        
+        x_p, z_p = self.x_table[p], self.z_table[p]
+        x_rows, z_rows = self.x_table[rows], self.z_table[rows]
+        
+        phase = 2*self.signs[rows].astype(np.int64) + 2*int(self.signs[p])
+        phase += product_phase(x_p, z_p, x_rows, z_rows)
+        
+        self.signs[rows] = ((phase % 4) >> 1).astype(np.uint64)
+        self.x_table[rows] = x_rows ^ x_p
+        self.z_table[rows] = z_rows ^ z_p
+    
+    # Returns the sign bit of the product of the given (commuting) rows.
+    # The k-th factor contributes the phase of the multiplication of the 
+    # product of the previous factors with itself. The (phaseless) products of 
+    # the previous factors are the cumulative XOR of the rows, such that all 
+    # contributions are evaluated with a single vectorized call.
+    def product_sign(self, rows):
+        
+        if not len(rows):
+            return False
+        
+        x_rows, z_rows = self.x_table[rows], self.z_table[rows]
+        
+        x_products = np.bitwise_xor.accumulate(x_rows[:-1], axis = 0)
+        z_products = np.bitwise_xor.accumulate(z_rows[:-1], axis = 0)
+        
+        phase = 2*int(np.sum(self.signs[rows]))
+        phases = product_phase(x_products, z_products, x_rows[1:], z_rows[1:])
+        phase += int(np.sum(phases))
+        
+        return bool((phase % 4) >> 1)
+    
+    def measure(self, i, rng = None):
+        """
+        Performs a measurement of qubit i in the computational basis.
+
+        Parameters
+        ----------
+        i : int
+            The index of the qubit to measure.
+        rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+            The random number generator for non-deterministic outcomes. The 
+            default is None.
+
+        Returns
+        -------
+        bool
+            The measurement outcome.
+
+        """
+        
+        x_i = self.column(self.x_table, i)
+        
+        stabilizer_hits = np.flatnonzero(x_i[self.capacity:self.capacity + self.n])
+        
+        if len(stabilizer_hits):
+            # The outcome is random. The stabilizer p anticommutes with Z_i,
+            # so every other row anticommuting with Z_i is multiplied by p.
+            p = self.capacity + stabilizer_hits[0]
+            rows = np.flatnonzero(x_i)
+            self.multiply_rows(rows[rows != p], p)
+            
+            # Replace the destabilizer by the stabilizer p and the stabilizer
+            # by +/- Z_i
+            d = p - self.capacity
+            self.x_table[d] = self.x_table[p]
+            self.z_table[d] = self.z_table[p]
+            self.signs[d] = self.signs[p]
+            
+            outcome = bool(get_rng(rng).random() < 0.5)
+            
+            self.x_table[p] = 0
+            self.z_table[p] = 0
+            self.z_table[p, i >> 6] = one << np.uint64(i & 63)
+            self.signs[p] = outcome
+            
+            return outcome
+        else:
+            # The outcome is deterministic. +/- Z_i is the product of the 
+            # stabilizers corresponding to the destabilizers that anticommute
+            # with Z_i.
+            return self.product_sign(self.capacity + np.flatnonzero(x_i[:self.n]))
+    
+    def reset(self, i, rng = None):
+        """
+        Resets qubit i to the |0> state.
+
+        Parameters
+        ----------
+        i : int
+            The index of the qubit to reset.
+        rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+            The random number generator for the measurement of the qubit. The 
+            default is None.
+
+        """
+        if self.measure(i, rng):
+            self.x(i)
+    
+    def get_stabilizers(self):
+        """
+        Returns the stabilizers of the state as strings.
+
+        Returns
+        -------
+        list[str]
+            The stabilizers, where the character at position j describes the 
+            Pauli operator acting on qubit j.
+
+        """
+        res = []
+        for i in range(self.capacity, self.capacity + self.n):
+            pauli_string = "-" if self.signs[i] else "+"
+            for j in range(self.n):
+                x_j = (int(self.x_table[i, j >> 6]) >> (j & 63)) & 1
+                z_j = (int(self.z_table[i, j >> 6]) >> (j & 63)) & 1
+                pauli_string += "IXZY"[x_j + 2*z_j]
+            res.append(pauli_string)
+        return res
+
+
+class PauliFrames:
+    """
+    This class describes a batch of Pauli frames, i.e. Pauli operators (up to
+    a sign), that track the deviation of many shots from a reference sample.
+    The bits of the shots are packed into uint64 words, such that a gate is 
+    applied to 64 shots per word operation.
+
+    Parameters
+    ----------
+    n : int
+        The amount of qubits.
+    shots : int
+        The amount of frames.
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The random number generator for the randomization of the frames. The
+        default is None.
+
+    """
+    
+    def __init__(self, n, shots, rng = None):
+        self.rng = get_rng(rng)
+        self.shots = shots
+        self.words = max(1, (shots + 63)//64)
+        self.x_frames = np.zeros((n, self.words), dtype = np.uint64)
+        # A Z operator on a qubit in the |0> state has no effect, so the Z part 
+        # of the frames can be randomized. This randomization is what yields 
+        # the outcome distribution of the later measurements.
+        self.z_frames = random_words(self.rng, (n, self.words))
+    
+    def x(self, i):
+        pass
+    
+    def y(self, i):
+        pass
+    
+    def z(self, i):
+        pass
+    
+    def h(self, i):
+        x_frame, z_frame = self.x_frames[i], self.z_frames[i]
+        self.x_frames[i], self.z_frames[i] = z_frame.copy(), x_frame.copy()
+    
+    def s(self, i):
+        self.z_frames[i] ^= self.x_frames[i]
+    
+    def s_dg(self, i):
+        self.z_frames[i] ^= self.x_frames[i]
+    
+    def cx(self, i, j):
+        self.x_frames[j] ^= self.x_frames[i]
+        self.z_frames[i] ^= self.z_frames[j]
+    
+    def cz(self, i, j):
+        self.z_frames[i] ^= self.x_frames[j]
+        self.z_frames[j] ^= self.x_frames[i]
+    
+    def swap(self, i, j):
+        self.x_frames[[i, j]] = self.x_frames[[j, i]]
+        self.z_frames[[i, j]] = self.z_frames[[j, i]]
+    
+    # Applies a gate described by a conjugation table (see clifford_table).
+    # Up to signs, the conjugation is a linear map on the bits of the Pauli
+    # strings, which is determined by the images of the single bit strings.
+    def apply_table(self, table, qubits):
+        new_paulis, sign_flips = table
+        k = len(qubits)
+        
+        old_bits = [self.x_frames[i].copy() for i in qubits]
+        old_bits += [self.z_frames[i].copy() for i in qubits]
+        new_bits = [np.zeros(self.words, dtype = np.uint64) for j in range(2*k)]
+        
+        for i in range(2*k):
+            image = int(new_paulis[1 << i])
+            for j in range(2*k):
+                if (image >> j) & 1:
+                    new_bits[j] ^= old_bits[i]
+        
+        for j in range(k):
+            self.x_frames[qubits[j]] = new_bits[j]
+            self.z_frames[qubits[j]] = new_bits[k + j]
+    
+    def apply_operation(self, op, qubits):
+        apply_clifford_operation(self, op, qubits)
+    
+    # Returns the flips of a Z-measurement of qubit i relative to the reference
+    # sample and randomizes the Z part of the frame (the post-measurement state
+    # is invariant under Z)
+    def measure(self, i):
+        res = self.x_frames[i].copy()
+        self.z_frames[i] = random_words(self.rng, self.words)
+        return res
+    
+    def reset(self, i):
+        self.x_frames[i] = 0
+        self.z_frames[i] = random_words(self.rng, self.words)
+
+
+def sample_clifford_circuit(qc, shots, rng = None):
+    """
+    Samples a Clifford circuit for many shots at once.
+    
+    A single reference sample is determined with a ``CliffordTableau``.
+    The remaining shots are described by Pauli frames, which are propagated 
+    through the circuit with bitwise operations on 64 shots per word.
+
+    Parameters
+    ----------
+    qc : QuantumCircuit
+        The circuit to sample. It may only contain Clifford gates, measurements
+        and resets.
+    shots : int
+        The amount of shots.
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The random number generator. The default is None.
+
+    Raises
+    ------
+    Exception
+        The circuit contains a non-Clifford operation.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean array of shape ``(shots, len(qc.clbits))`` containing the 
+        values of the classical bits for every shot.
+        
+    Examples
+    --------
+    
+    We sample a Bell pair:
+        
+    >>> from qrisp import QuantumCircuit
+    >>> from qrisp.simulator import sample_clifford_circuit
+    >>> qc = QuantumCircuit(2, 2)
+    >>> qc.h(0)
+    >>> qc.cx(0, 1)
+    >>> qc.measure([0, 1], [0, 1])
+    >>> samples = sample_clifford_circuit(qc, 1000)
+    >>> bool((samples[:, 0] == samples[:, 1]).all())
+    True
+
+    """
+    from qrisp.circuit import fast_append
+    from qrisp.simulator.circuit_preprocessing import count_measurements_and_treat_alloc
+    from qrisp.simulator.simulator import generate_instruction_tape
+    
+    rng = get_rng(rng)
+    
+    with fast_append(2):
+        qc = qc.transpile()
+        count_measurements_and_treat_alloc(qc, insert_reset = False)
+        tape = generate_instruction_tape(qc)
+    
+    n = len(qc.qubits)
+    tableau = CliffordTableau(n)
+    frames = PauliFrames(n, shots, rng)
+    
+    records = np.zeros((len(qc.clbits), frames.words), dtype = np.uint64)
+    
+    for op, qubit_indices, clbit_indices in tape:
+        if op.name == "measure":
+            reference = tableau.measure(qubit_indices[0], rng)
+            records[clbit_indices[0]] = frames.measure(qubit_indices[0])
+            if reference:
+                records[clbit_indices[0]] ^= ~np.uint64(0)
+        elif op.name == "reset":
+            tableau.reset(qubit_indices[0], rng)
+            frames.reset(qubit_indices[0])
+        elif len(clbit_indices):
+            raise Exception(
+                f"Don't know how to sample operation {op.name} with the Clifford "
+                "simulator"
+            )
+        else:
+            tableau.apply_operation(op, qubit_indices)
+            frames.apply_operation(op, qubit_indices)
+    
+    bits = np.unpackbits(
+        records.astype("<u8").view(np.uint8), axis = 1, bitorder = "little"
+    )
+    
+    return bits[:, :shots].T.astype(bool)
+
+
+def run_clifford(qc, shots = None, token = "", rng = None):
+    """
+    Samples a Clifford circuit and returns the counts of the outcomes.
+
+    Parameters
+    ----------
+    qc : QuantumCircuit
+        The circuit to sample. It may only contain Clifford gates, measurements
+        and resets.
+    shots : int, optional
+        The amount of shots. The default is None, which performs 100000 shots.
+    token : str, optional
+        Unused. The default is "".
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The random number generator. The default is None.
+
+    Returns
+    -------
+    dict
+        The counts of the outcomes. The keys are bitstrings (reversed in order to
+        ensure qiskit compatibility).
+    
+    Examples
+    --------
+    
+    >>> from qrisp import QuantumCircuit
+    >>> from qrisp.simulator import run_clifford
+    >>> qc = QuantumCircuit(2, 2)
+    >>> qc.x(0)
+    >>> qc.cx(0, 1)
+    >>> qc.measure([0, 1], [0, 1])
+    >>> run_clifford(qc, 1000)
+    {'11': 1000}
+
+    """
+    
+    if shots is None:
+        shots = 100000
+    
+    if len(qc.data) == 0 or len(qc.clbits) == 0:
+        return {"": shots}
+    if shots == 0:
+        return {}
+    
+    samples = sample_clifford_circuit(qc, shots, rng)
+    
+    # Count the (packed) samples. Hashing the rows as bytes objects is much 
+    # faster than sorting them (as np.unique(..., axis = 0) would).
+    packed_samples = np.packbits(samples, axis = 1)
+    counts = Counter(row.tobytes() for row in packed_samples)
+    
+    res = {}
+    for outcome, count in counts.items():
+        bits = np.unpackbits(np.frombuffer(outcome, dtype = np.uint8))[:len(qc.clbits)]
+        res["".join("1" if b else "0" for b in bits[::-1])] = count
+    
+    return res
@@ -22,6 +22,105 @@ import numpy as xp
 
 # import cupy as xp
 
+# The numerical precision of the simulator can be set with the set_precision function
+# (see below). The following variables are updated accordingly. Modules of the
+# simulator should therefore access them as attributes of this module (instead of
+# importing them), such that changes of the precision are honoured.
+
+# Precision of the simulation
+precision = "complex64"
+
+# Data type of the statevector and the unitaries
+dtype = xp.complex64
+
+# Probabilities/amplitudes below this threshold are treated as zero
 float_tresh = 1e-5
+
+# Amplitudes that are smaller than cutoff_ratio times the largest amplitude are
+# removed during sparsification and measurements
 cutoff_ratio = 5e-4
+
 sparsification_rate = 0.1
+
+# Amount of significant decimals to which the measurement probabilities are rounded
+# in order to remove floating point artifacts
+probability_decimals = 5
+
+precision_settings = {
+    "complex64": {
+        "dtype": xp.complex64,
+        "float_tresh": 1e-5,
+        "cutoff_ratio": 5e-4,
+        "probability_decimals": 5,
+    },
+    "complex128": {
+        "dtype": xp.complex128,
+        "float_tresh": 1e-12,
+        "cutoff_ratio": 1e-9,
+        "probability_decimals": 12,
+    },
+}
+
+
+def set_precision(new_precision):
+    r"""
+    Sets the numerical precision of the built-in simulator.
+
+    The precision determines the data type of the statevector and the unitaries
+    together with the thresholds that are used to treat small amplitudes as zero.
+    The single precision mode (``complex64``) is faster and requires less memory.
+    The double precision mode (``complex128``) should be used if floating point
+    errors accumulate, for instance for deep Trotter circuits.
+
+    Unitaries, which have been cached on Operation objects with a lower precision,
+    are recomputed when they are used again.
+
+    Parameters
+    ----------
+    new_precision : str
+        Either ``"complex64"`` or ``"complex128"``.
+
+    Raises
+    ------
+    Exception
+        Unknown precision.
+
+    Examples
+    --------
+
+    >>> from qrisp import QuantumFloat, h
+    >>> from qrisp.simulator.numerics_config import set_precision
+    >>> set_precision("complex128")
+    >>> qf = QuantumFloat(3)
+    >>> h(qf)
+    >>> print(qf)
+    {0: 0.125, 1: 0.125, 2: 0.125, 3: 0.125, 4: 0.125, 5: 0.125, 6: 0.125, 7: 0.125}
+    >>> set_precision("complex64")
+
+    """
+
+    global precision, dtype, float_tresh, cutoff_ratio, probability_decimals
+
+    if new_precision not in precision_settings:
+        raise Exception(
+            f"Unknown precision {new_precision} (available: "
+            + ", ".join(precision_settings.keys())
+            + ")"
+        )
+
+    settings = precision_settings[new_precision]
+
+    precision = new_precision
+    dtype = settings["dtype"]
+    float_tresh = settings["float_tresh"]
+    cutoff_ratio = settings["cutoff_ratio"]
+    probability_decimals = settings["probability_decimals"]
+
+
+# Checks whether a unitary, which has been cached on an Operation, can be reused with
+# the current precision, i.e. whether it has been computed with at least the current
+# precision. Symbolic unitaries don't depend on the precision.
+def is_current_unitary(unitary):
+    if unitary.dtype == xp.dtype("O"):
+        return True
+    return unitary.dtype.itemsize >= xp.dtype(dtype).itemsize
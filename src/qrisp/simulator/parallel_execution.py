@@ -0,0 +1,319 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+import copy
+import multiprocessing
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    wait,
+    FIRST_COMPLETED,
+)
+
+import numpy as np
+
+from qrisp.simulator.quantum_state import QuantumState
+
+# This module contains the scheduler for the parallel execution of independent
+# tensor factors. The QuantumState keeps disjoint TensorFactors for blocks of
+# qubits, which are not entangled. The instruction tape is therefore partitioned
+# into segments. Each segment contains the instructions acting on a block of qubits
+# until an entangling instruction joins this block with another block. The
+# instruction that joins the blocks starts a new segment, which depends on the
+# segments of the joined blocks. Segments whose dependencies are finished are
+# executed concurrently.
+
+# The amount of workers. The parallel execution is opt-in: By default (1 worker),
+# the tape is executed sequentially. Set this to a larger value (for instance
+# os.cpu_count()) to enable the scheduler.
+max_workers = 1
+
+# The type of the workers (if max_workers > 1). Can be either "thread" or
+# "process". Most of the numerical kernels of the simulator release the GIL, so the
+# thread pool is suitable for most situations. The process pool circumvents the GIL
+# completely but has to transfer the tensor factors between the processes.
+executor_type = "thread"
+
+# Tapes with a total workload (measured in updated amplitudes) below this threshold
+# are executed sequentially, because the scheduling overhead would dominate.
+parallelization_threshold = 2**18
+
+# Arrays with more elements than this threshold are transferred to the process pool
+# via shared memory buffers instead of being pickled.
+shared_memory_threshold = 2**16
+
+
+class TapeSegment:
+    def __init__(self, qubits, parents):
+        # The qubits of the block this segment acts on
+        self.qubits = qubits
+
+        # The segments that need to be finished before this segment can be executed
+        self.parents = parents
+        self.children = []
+        for parent in parents:
+            parent.children.append(self)
+
+        self.instructions = []
+
+        # The estimated workload of the segment
+        self.cost = 0
+
+
+# Partitions the instruction tape into segments of independent qubit blocks.
+# The qubit blocks are tracked with a union-find structure. Qubits that are already
+# described by a common TensorFactor of the given quantum state are treated as one
+# block.
+def partition_tape(tape, quantum_state):
+
+    uf_parent = list(range(quantum_state.n))
+
+    def find(i):
+        while uf_parent[i] != i:
+            uf_parent[i] = uf_parent[uf_parent[i]]
+            i = uf_parent[i]
+        return i
+
+    for tf in set(quantum_state.tensor_factors):
+        for qb in tf.qubits[1:]:
+            uf_parent[find(qb)] = find(tf.qubits[0])
+
+    block_qubits = {}
+    for i in range(quantum_state.n):
+        block_qubits.setdefault(find(i), []).append(i)
+
+    current_segments = {}
+    segments = []
+
+    for instr in tape:
+        qubit_indices = instr[1]
+
+        roots = list(set(find(qb) for qb in qubit_indices))
+
+        if len(roots) == 1 and roots[0] in current_segments:
+            segment = current_segments[roots[0]]
+        else:
+            parents = [current_segments.pop(r) for r in roots if r in current_segments]
+
+            new_root = roots[0]
+            qubits = block_qubits.pop(new_root)
+            for r in roots[1:]:
+                uf_parent[r] = new_root
+                qubits = qubits + block_qubits.pop(r)
+            block_qubits[new_root] = qubits
+
+            segment = TapeSegment(qubits, parents)
+            current_segments[new_root] = segment
+            segments.append(segment)
+
+        segment.instructions.append(instr)
+        segment.cost += 2 ** len(segment.qubits)
+
+    return segments
+
+
+# Executes a list of instructions on the quantum state
+def execute_instructions(quantum_state, instructions):
+    for op, qubit_indices, clbit_indices in instructions:
+        if op.name == "disentangle":
+            quantum_state.disentangle(qubit_indices[0], warning=op.warning)
+        else:
+            quantum_state.apply_operation(op, qubit_indices)
+
+
+# Executes the instruction tape on the quantum state. If the tape contains
+# independent segments with a sufficient workload, they are executed concurrently.
+# The progress bar (if given) is updated by 2**op.num_qubits for every instruction.
+def execute_tape(quantum_state, tape, progress_bar=None):
+
+    if max_workers is None or max_workers <= 1 or len(tape) < 2:
+        return execute_sequentially(quantum_state, tape, progress_bar)
+
+    segments = partition_tape(tape, quantum_state)
+
+    total_cost = sum(seg.cost for seg in segments)
+    if len(segments) < 2 or total_cost < parallelization_threshold:
+        return execute_sequentially(quantum_state, tape, progress_bar)
+
+    if executor_type == "thread":
+        submit = lambda pool, seg: pool.submit(
+            execute_instructions, quantum_state, seg.instructions
+        )
+    elif executor_type == "process":
+        submit = lambda pool, seg: pool.submit(
+            execute_segment_in_process,
+            export_factors(quantum_state, seg.qubits),
+            quantum_state.n,
+            seg.instructions,
+        )
+    else:
+        raise Exception(f"Unknown executor type {executor_type}")
+
+    pool = get_executor(executor_type, max_workers)
+
+    pending_parents = {seg: len(seg.parents) for seg in segments}
+    running = {}
+
+    for seg in segments:
+        if not seg.parents:
+            running[submit(pool, seg)] = seg
+
+    while running:
+        done, not_done = wait(running.keys(), return_when=FIRST_COMPLETED)
+
+        for future in done:
+            seg = running.pop(future)
+            res = future.result()
+
+            if executor_type == "process":
+                import_factors(quantum_state, res)
+
+            if progress_bar is not None:
+                progress_bar.update(
+                    sum(2 ** instr[0].num_qubits for instr in seg.instructions)
+                )
+
+            for child in seg.children:
+                pending_parents[child] -= 1
+                if pending_parents[child] == 0:
+                    running[submit(pool, child)] = child
+
+    return quantum_state
+
+
+def execute_sequentially(quantum_state, tape, progress_bar=None):
+    if progress_bar is None:
+        execute_instructions(quantum_state, tape)
+        return quantum_state
+
+    for instr in tape:
+        if progress_bar is not None:
+            progress_bar.update(2 ** instr[0].num_qubits)
+        execute_instructions(quantum_state, [instr])
+    return quantum_state
+
+
+# Applies the function to every element of the list of arguments. The elements are
+# processed concurrently in a thread pool, which is separate from the pool of the
+# tape executor, since the workers themselves submit tape segments to that pool
+# (sharing the pool could exhaust it with workers waiting for their segments).
+def execute_batch(function, arguments):
+
+    if max_workers is None or max_workers <= 1 or len(arguments) < 2:
+        return [function(arg) for arg in arguments]
+
+    pool = get_executor("batch", max_workers)
+
+    return list(pool.map(function, arguments))
+
+
+executor_cache = {}
+
+
+def get_executor(executor_type, max_workers):
+
+    key = (executor_type, max_workers)
+
+    if key not in executor_cache:
+        if executor_type in ["thread", "batch"]:
+            executor_cache[key] = ThreadPoolExecutor(max_workers=max_workers)
+        else:
+            # The worker processes are spawned instead of forked, since forking
+            # the (multithreaded) JAX runtime can deadlock the workers.
+            executor_cache[key] = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+
+    return executor_cache[key]
+
+
+# Helper functions for the process pool. The TensorFactors of the segment are
+# extracted from the quantum state and transferred to the worker process, which
+# executes the instructions and transfers the resulting factors back. Large arrays
+# are transferred via shared memory buffers.
+def export_factors(quantum_state, qubits):
+
+    factors = list(set(quantum_state.tensor_factors[qb] for qb in qubits))
+
+    res = []
+    for tf in factors:
+        tf.tensor_array.catch_up()
+        tensor_array = copy.copy(tf.tensor_array)
+
+        for attr in ["data", "nz_indices"]:
+            array = getattr(tensor_array, attr, None)
+            if isinstance(array, np.ndarray) and array.size > shared_memory_threshold:
+                setattr(tensor_array, attr, SharedArray(array))
+
+        res.append((list(tf.qubits), tensor_array))
+
+    return res
+
+
+def import_factors(quantum_state, exported_factors):
+
+    from qrisp.simulator.tensor_factor import TensorFactor
+
+    for qubits, tensor_array in exported_factors:
+        for attr in ["data", "nz_indices"]:
+            array = getattr(tensor_array, attr, None)
+            if isinstance(array, SharedArray):
+                setattr(tensor_array, attr, array.load())
+
+        tf = TensorFactor(qubits, tensor_array)
+        for qb in qubits:
+            quantum_state.tensor_factors[qb] = tf
+
+
+def execute_segment_in_process(exported_factors, n, instructions):
+
+    quantum_state = QuantumState(n)
+    import_factors(quantum_state, exported_factors)
+
+    qubits = sum([qubits for qubits, tensor_array in exported_factors], [])
+
+    execute_instructions(quantum_state, instructions)
+
+    return export_factors(quantum_state, qubits)
+
+
+# Describes a numpy array, which has been copied into a shared memory buffer.
+# The buffer is released after the array has been loaded by the receiving process.
+class SharedArray:
+    def __init__(self, array):
+        from multiprocessing.shared_memory import SharedMemory
+
+        array = np.ascontiguousarray(array)
+
+        shm = SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[:] = array
+
+        self.name = shm.name
+        self.shape = array.shape
+        self.dtype = array.dtype
+        shm.close()
+
+    def load(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(name=self.name)
+        res = np.array(np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf))
+        shm.close()
+        shm.unlink()
+
+        return res
@@ -0,0 +1,346 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+import numpy as np
+
+from qrisp.circuit import fast_append
+from qrisp.simulator import numerics_config
+from qrisp.simulator.quantum_state import QuantumState
+from qrisp.simulator.parallel_execution import execute_tape
+from qrisp.simulator.simulator import (
+    prepare_simulation_circuit,
+    generate_instruction_tape,
+    build_counts,
+)
+
+
+class ParametricSimulation:
+    r"""
+    This class describes a simulation of a QuantumCircuit containing abstract
+    parameters, which is supposed to be evaluated for many different parameter values.
+    This is the typical situation for variational algorithms like QAOA or VQE.
+
+    The preprocessing steps of the simulator (transpilation, grouping of the gates,
+    reordering and insertion of the measurements) are performed only once on the
+    symbolic circuit. For each evaluation, only the groups that contain abstract
+    parameters are bound, i.e. the unitaries of the parameter free groups are
+    computed once and reused for all evaluations.
+
+    Parameters
+    ----------
+    qc : QuantumCircuit
+        The (compiled) QuantumCircuit containing measurements and abstract parameters.
+    insert_reset : bool, optional
+        If set to True, deallocated qubits will be reset. The default is True.
+
+    Examples
+    --------
+
+    We create a QuantumCircuit with an abstract parameter and evaluate it for several
+    values:
+
+    >>> import numpy as np
+    >>> from sympy import Symbol
+    >>> from qrisp import QuantumCircuit
+    >>> from qrisp.simulator import ParametricSimulation
+    >>> phi = Symbol("phi")
+    >>> qc = QuantumCircuit(2, 2)
+    >>> qc.h(0)
+    >>> qc.rz(phi, 0)
+    >>> qc.h(0)
+    >>> qc.cx(0, 1)
+    >>> qc.measure([0, 1], [0, 1])
+    >>> sim = ParametricSimulation(qc)
+    >>> sim.run({phi : 0})
+    {'00': 1.0}
+    >>> sim.run({phi : np.pi})
+    {'11': 1.0}
+
+    """
+
+    def __init__(self, qc, insert_reset=True):
+
+        self.abstract_params = set(qc.abstract_params)
+
+        with fast_append(2):
+            qc, mes_list, measurement_amount = prepare_simulation_circuit(
+                qc.copy(), insert_reset=insert_reset
+            )
+
+        self.qubit_amount = len(qc.qubits)
+        self.clbit_amount = len(mes_list)
+
+        qubit_to_index_dic = {qc.qubits[i]: i for i in range(len(qc.qubits))}
+        clbit_to_index_dic = {qc.clbits[i]: i for i in range(len(qc.clbits))}
+
+        self.tape = generate_instruction_tape(
+            qc, qubit_to_index_dic, clbit_to_index_dic
+        )
+
+        # Determine the indices of the tape entries, which need to be bound
+        # for every evaluation
+        self.parametric_indices = [
+            i for i in range(len(self.tape)) if len(self.tape[i][0].abstract_params)
+        ]
+
+        mes_list.sort(key=lambda x: -clbit_to_index_dic[x.clbits[0]])
+        self.mes_qubit_indices = [
+            qubit_to_index_dic[instr.qubits[0]] for instr in mes_list
+        ][::-1]
+
+    def bind_tape(self, subs_dic):
+        """
+        Returns a copy of the instruction tape, where the abstract parameters of the
+        operations are bound to the values specified in ``subs_dic``.
+
+        Parameters
+        ----------
+        subs_dic : dict
+            A dictionary containing the abstract parameters as keys.
+
+        Returns
+        -------
+        list
+            The instruction tape with bound parameters.
+
+        """
+
+        missing_parameters = self.abstract_params - set(subs_dic.keys())
+        if missing_parameters:
+            raise Exception(
+                "Need parameter specification for abstract parameters "
+                + str(missing_parameters)
+            )
+
+        tape = list(self.tape)
+        for i in self.parametric_indices:
+            op, qubit_indices, clbit_indices = tape[i]
+            tape[i] = (op.bind_parameters(subs_dic), qubit_indices, clbit_indices)
+
+        return tape
+
+    def run(self, subs_dic, shots=None):
+        """
+        Evaluates the circuit for the given parameter values.
+
+        Parameters
+        ----------
+        subs_dic : dict
+            A dictionary containing the abstract parameters as keys.
+        shots : int, optional
+            The amount of shots. The default is None, which returns the exact
+            probabilities.
+
+        Returns
+        -------
+        dict
+            A dictionary of bitstrings and their measured counts/probabilities.
+
+        """
+
+        if shots == 0:
+            return {}
+
+        if self.clbit_amount == 0:
+            return {"": shots}
+
+        tape = self.bind_tape(subs_dic)
+
+        quantum_state = QuantumState(self.qubit_amount)
+
+        execute_tape(quantum_state, tape)
+
+        outcome_list, cl_prob = quantum_state.multi_measure(
+            self.mes_qubit_indices, return_res_states=False
+        )
+
+        return build_counts(outcome_list, cl_prob, shots, self.clbit_amount)
+
+    def run_batch(self, subs_dic_list, shots=None):
+        """
+        Evaluates the circuit for a list of parameter values.
+
+        For moderate qubit counts, the statevectors of all parameter values are
+        stacked into a single array with a leading batch axis and evolved through the
+        shared gate sequence in one pass. Parameter free gates are applied to the
+        whole stack with a single matrix multiplication, gates containing abstract
+        parameters are applied as a batched matrix multiplication.
+
+        Parameters
+        ----------
+        subs_dic_list : list[dict]
+            A list of dictionaries containing the abstract parameters as keys.
+        shots : int, optional
+            The amount of shots. The default is None, which returns the exact
+            probabilities.
+
+        Returns
+        -------
+        list[dict]
+            The results of the evaluations in the order of ``subs_dic_list``.
+
+        """
+
+        if shots == 0 or self.clbit_amount == 0 or self.qubit_amount > max_batch_qubits:
+            return [self.run(subs_dic, shots) for subs_dic in subs_dic_list]
+
+        # Determine how many statevectors fit into a single stack
+        chunk_size = max(1, max_batch_amplitudes >> self.qubit_amount)
+
+        res_list = []
+        for i in range(0, len(subs_dic_list), chunk_size):
+            res_list.extend(self.run_stacked(subs_dic_list[i : i + chunk_size], shots))
+
+        return res_list
+
+    def run_stacked(self, subs_dic_list, shots=None):
+
+        n = self.qubit_amount
+        batch_size = len(subs_dic_list)
+
+        bound_tapes = [self.bind_tape(subs_dic) for subs_dic in subs_dic_list]
+
+        # The statevector stack is represented as an array of shape
+        # (batch_size, 2, ..., 2) where axis i + 1 represents qubit i
+        state = np.zeros((batch_size, 2**n), dtype=numerics_config.dtype)
+        state[:, 0] = 1
+        state = state.reshape([batch_size] + n * [2])
+
+        parametric_indices = set(self.parametric_indices)
+
+        for i in range(len(self.tape)):
+            op, qubit_indices, clbit_indices = self.tape[i]
+
+            # Disentangling doesn't change the measurement statistics of the (dense)
+            # statevector.
+            if op.name == "disentangle":
+                continue
+
+            if i in parametric_indices:
+                unitary = np.stack(
+                    [bound_tape[i][0].get_unitary() for bound_tape in bound_tapes]
+                )
+            else:
+                unitary = op.get_unitary()
+
+            state = apply_stacked_unitary(state, unitary, qubit_indices)
+
+        # Compute the probabilities of the measured qubits. The first qubit of
+        # mes_qubit_indices corresponds to the least significant bit of the outcome.
+        mes_axes = [qb + 1 for qb in self.mes_qubit_indices[::-1]]
+        remaining_axes = [j for j in range(1, n + 1) if j not in mes_axes]
+
+        prob_array = np.abs(state) ** 2
+        prob_array = np.sum(prob_array, axis=tuple(remaining_axes))
+
+        # The summation preserves the ascending order of the measured axes
+        kept_axes = sorted(mes_axes)
+        prob_array = np.transpose(
+            prob_array, [0] + [kept_axes.index(ax) + 1 for ax in mes_axes]
+        )
+        prob_array = prob_array.reshape((batch_size, 2 ** len(mes_axes)))
+
+        res_list = []
+        for j in range(batch_size):
+            outcome_list = np.nonzero(prob_array[j])[0]
+            cl_prob = prob_array[j][outcome_list]
+            res_list.append(
+                build_counts(outcome_list, cl_prob, shots, self.clbit_amount)
+            )
+
+        return res_list
+
+
+# Limits for the stacked statevector simulation of ParametricSimulation.run_batch
+max_batch_qubits = 24
+max_batch_amplitudes = 2**24
+
+
+# Applies the unitary (or a stack of unitaries with a leading batch axis) to the
+# statevector stack. The first qubit of qubit_indices corresponds to the most
+# significant bit of the unitaries row index.
+def apply_stacked_unitary(state, unitary, qubit_indices):
+
+    batch_size = state.shape[0]
+    k = len(qubit_indices)
+
+    target_axes = [qb + 1 for qb in qubit_indices]
+    state = np.moveaxis(state, target_axes, range(1, k + 1))
+    moved_shape = state.shape
+
+    state = state.reshape((batch_size, 2**k, -1))
+    state = np.matmul(unitary.astype(state.dtype), state)
+    state = state.reshape(moved_shape)
+
+    return np.moveaxis(state, range(1, k + 1), target_axes)
+
+
+# These functions are used by the get_measurement methods, if the measurement is
+# performed on the default simulator with a precompiled circuit and a substitution
+# dictionary. The ParametricSimulation is cached on the precompiled circuit, such
+# that repeated calls (for instance from an optimizer) only perform the state
+# evolution. The cached simulations store the version of the circuit (see
+# modification_tracking.py) and are rebuilt if the circuit has been modified.
+def get_parametric_simulation(precompiled_qc, qubits):
+    from qrisp.circuit.modification_tracking import circuit_version, version_is_current
+
+    key = tuple(qubits)
+
+    try:
+        cache = precompiled_qc.parametric_simulation_cache
+    except AttributeError:
+        cache = precompiled_qc.parametric_simulation_cache = {}
+
+    if key in cache:
+        version, simulation = cache[key]
+        if version_is_current(version, precompiled_qc):
+            return simulation
+
+    version = circuit_version(precompiled_qc)
+
+    qc = precompiled_qc.copy()
+
+    # Add classical registers for the measurement results to be stored in
+    cl = [qc.add_clbit() for i in range(len(qubits))]
+
+    # Add measurement instruction
+    for i in range(len(qubits)):
+        qc.measure(qubits[i], cl[i])
+
+    simulation = ParametricSimulation(qc)
+    cache[key] = (version, simulation)
+
+    return simulation
+
+
+def get_parametric_measurement(precompiled_qc, qubits, subs_dic, shots=None):
+    from qrisp.misc.utility import format_measurement_counts
+
+    counts = get_parametric_simulation(precompiled_qc, qubits).run(subs_dic, shots)
+
+    return format_measurement_counts(counts, len(qubits))
+
+
+def get_parametric_measurement_batch(precompiled_qc, qubits, subs_dic_list, shots=None):
+    from qrisp.misc.utility import format_measurement_counts
+
+    counts_list = get_parametric_simulation(precompiled_qc, qubits).run_batch(
+        subs_dic_list, shots
+    )
+
+    return [format_measurement_counts(counts, len(qubits)) for counts in counts_list]
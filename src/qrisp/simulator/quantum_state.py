@@ -18,9 +18,11 @@
 
 from itertools import product
 
+from qrisp.simulator import numerics_config
 from qrisp.simulator.numerics_config import xp
 from qrisp.simulator.tensor_factor import TensorFactor, multi_entangle
 from qrisp.simulator.bi_array_helper import permute_axes, invert_permutation
+from qrisp.simulator.rng_management import get_rng
 import numpy as np
 
 from qrisp.misc.utility import bin_rep
@@ -128,8 +130,9 @@ class QuantumState:
 
         return res
 
-    # Method to perform a measurement on this quantum state
-    def measure(self, i, keep_res=True):
+    # Method to perform a measurement on this quantum state. The outcome is drawn
+    # using the random number generator rng (see rng_management.py)
+    def measure(self, i, keep_res=True, rng=None):
         # Determine the TensorFactor to be measured
         tensor_factor = self.tensor_factors[i]
 
@@ -148,7 +151,7 @@ class QuantumState:
             outcome_tensor = outcome_tensor_f_0
             meas_res = False
         else:
-            rnd = np.random.random(1)
+            rnd = get_rng(rng).random()
             if rnd < p_0:
                 outcome_tensor = outcome_tensor_f_0
                 meas_res = False
@@ -170,7 +173,7 @@ class QuantumState:
             # This sets the measured qubit to the |1> state (described by the
             # array [0,1] instead of [1,0] which descibes the |0> state)
             outcome_state.tensor_factors[i] = TensorFactor(
-                [i], xp.array([0, 1], dtype=xp.complex64)
+                [i], xp.array([0, 1], dtype=numerics_config.dtype)
             )
         else:
             outcome_state.tensor_factors[i] = TensorFactor([i])
@@ -186,7 +189,9 @@ class QuantumState:
             involved_factors.append(self.tensor_factors[mes_qubits[i]])
             involved_factors_dic[mes_qubits[i]] = self.tensor_factors[mes_qubits[i]]
             
-        involved_factors = list(set(involved_factors))
+        # Remove duplicates (in a deterministic order, such that the order of the
+        # outcomes doesn't depend on the memory layout)
+        involved_factors = list(dict.fromkeys(involved_factors))
         
         # involved_factors.sort(key = lambda x : len(x.qubits))
         
@@ -0,0 +1,98 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+import numpy as np
+
+# This module contains the helper functions for the random number generators of the
+# simulator. Every function of the simulator that draws random numbers (sampling of
+# shots, mid-circuit measurements, resets) accepts an rng argument, which can be
+# None (the global numpy random state is used), an integer seed, a
+# numpy.random.SeedSequence or a numpy.random.Generator.
+
+
+def get_rng(rng=None):
+    """
+    Returns the random number generator described by ``rng``.
+
+    Parameters
+    ----------
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The seed or the generator. The default is None, which returns the global
+        numpy random state (i.e. ``np.random.seed`` is respected).
+
+    Returns
+    -------
+    numpy.random.Generator or module
+        The random number generator. If ``rng`` is None, the ``numpy.random``
+        module itself is returned, which only provides the legacy sampling
+        functions (for instance ``random``, ``choice`` and ``multinomial``) but
+        not the methods that are exclusive to ``numpy.random.Generator`` (like
+        ``integers``).
+
+    """
+    if rng is None or rng is np.random:
+        return np.random
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def spawn_rngs(rng, amount):
+    """
+    Returns a list of statistically independent random number generators derived
+    from ``rng`` via ``SeedSequence.spawn``.
+
+    This can be used to distribute the shots of a simulation over several workers
+    (for instance the processes of a process pool) without correlated random
+    streams. For a given seed, the generated streams are reproducible.
+
+    Parameters
+    ----------
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator
+        The seed or the generator to derive the generators from. If None, fresh
+        entropy is used.
+    amount : int
+        The amount of generators.
+
+    Returns
+    -------
+    list[numpy.random.Generator]
+        The independent random number generators.
+
+    Examples
+    --------
+
+    We sample a circuit in four independent batches:
+
+    >>> from qrisp import QuantumCircuit
+    >>> from qrisp.simulator import run, spawn_rngs
+    >>> qc = QuantumCircuit(2, 2)
+    >>> qc.h(0)
+    >>> qc.cx(0, 1)
+    >>> qc.measure([0, 1], [0, 1])
+    >>> batches = [run(qc, 250, rng = rng) for rng in spawn_rngs(1234, 4)]
+    >>> sum(sum(counts.values()) for counts in batches)
+    1000
+
+    """
+    if isinstance(rng, np.random.Generator):
+        return rng.spawn(amount)
+    if not isinstance(rng, np.random.SeedSequence):
+        rng = np.random.SeedSequence(rng)
+    return [np.random.default_rng(seed_seq) for seed_seq in rng.spawn(amount)]
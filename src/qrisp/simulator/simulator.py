@@ -20,7 +20,6 @@ import threading
 import sys
 import numpy as np
 from tqdm import tqdm
-from numba import njit
 
 from qrisp.circuit import (
     QuantumCircuit,
@@ -34,11 +33,114 @@ from qrisp.simulator.circuit_preprocessing import (
     insert_multiverse_measurements
 )
 
+from qrisp.simulator import numerics_config
 from qrisp.simulator.quantum_state import QuantumState
+from qrisp.simulator.parallel_execution import execute_tape, execute_batch
+from qrisp.simulator.rng_management import get_rng
+
+
+# Controls the progress bar of the simulator. If set to True, no progress bar is
+# displayed and the simulation loops skip the progress bookkeeping entirely. If set
+# to None, the progress bar is only displayed if the standard output is a terminal.
+quiet_mode = None
+
+
+def set_quiet_mode(quiet):
+    """
+    Enables or disables the progress bar of the built-in simulator.
+
+    Parameters
+    ----------
+    quiet : bool or None
+        If set to True, no progress bar is displayed. If set to False, the progress
+        bar is always displayed. If set to None (default), the progress bar is
+        displayed only if the standard output is an interactive terminal.
+
+    Examples
+    --------
+
+    We simulate many small circuits without the progress bar:
+
+    >>> from qrisp import QuantumFloat, h
+    >>> from qrisp.simulator import set_quiet_mode
+    >>> set_quiet_mode(True)
+    >>> qf = QuantumFloat(2)
+    >>> h(qf)
+    >>> print(qf)
+    {0: 0.25, 1: 0.25, 2: 0.25, 3: 0.25}
+
+    """
+    global quiet_mode
+    quiet_mode = quiet
+
+
+# Returns a progress bar for the simulation or None if the progress bar
+# should not be displayed
+def create_progress_bar(desc, delay=0.2):
+
+    if quiet_mode is None:
+        try:
+            quiet = not sys.stdout.isatty()
+        except (AttributeError, ValueError):
+            quiet = True
+    else:
+        quiet = quiet_mode
+
+    if quiet:
+        return None
+
+    progress_bar = tqdm(
+        desc=desc,
+        bar_format="{desc} |{bar}| [{percentage:3.0f}%]",
+        ncols=85,
+        leave=False,
+        delay=delay,
+        position=0,
+        smoothing=1,
+        file=sys.stdout
+    )
+
+    progress_bar.display()
+
+    return progress_bar
+
+
+def close_progress_bar(progress_bar):
+
+    if progress_bar is None:
+        return
+
+    LINE_CLEAR = "\x1b[2K"
+    progress_bar.close()
+    print("\r" + 85*" ", end=LINE_CLEAR + "\r")
+
+
+# This function lowers a (preprocessed) QuantumCircuit into an instruction tape.
+# The tape is a list of tuples (op, qubit_indices, clbit_indices), where the
+# indices are integers referring to the position of the qubits/clbits in the
+# circuit. Resolving the Qubit objects via qc.qubits.index would be O(n) per
+# operand, which for large circuits becomes a significant share of the runtime
+# of the simulator main loops. Using a dictionary, the lowering is performed
+# once in O(operands).
+def generate_instruction_tape(qc, qubit_to_index_dic=None, clbit_to_index_dic=None):
+    
+    if qubit_to_index_dic is None:
+        qubit_to_index_dic = {qc.qubits[i]: i for i in range(len(qc.qubits))}
+    
+    if clbit_to_index_dic is None:
+        clbit_to_index_dic = {qc.clbits[i]: i for i in range(len(qc.clbits))}
+    
+    tape = []
+    for instr in qc.data:
+        tape.append((instr.op,
+                     [qubit_to_index_dic[qb] for qb in instr.qubits],
+                     [clbit_to_index_dic[cb] for cb in instr.clbits]))
+    
+    return tape
 
 # This functions determines the quantum state after executing a quantum circuit
 # and afterwards extracts the probability of measuring certain bit strings
-def run(qc, shots, token="", iqs=None, insert_reset=True):
+def run(qc, shots, token="", iqs=None, insert_reset=True, rng=None):
     
     if len(qc.data) == 0:
         return {"": shots}
@@ -46,195 +148,255 @@ def run(qc, shots, token="", iqs=None, insert_reset=True):
         return {}
     
     
-    progress_bar = tqdm(
-        desc=f"Simulating {len(qc.qubits)} qubits..",
-        bar_format="{desc} |{bar}| [{percentage:3.0f}%]",
-        ncols=85,
-        leave=False,
-        delay=0.1,
-        position=0,
-        smoothing=1,
-        file=sys.stdout
+    progress_bar = create_progress_bar(
+        f"Simulating {len(qc.qubits)} qubits..", delay=0.1
     )
-    
-    LINE_CLEAR = "\x1b[2K"
-    progress_bar.display()
 
     # This command enables fast appending. Fast appending means that the .append method
     # of the QuantumCircuit class checks much less validity conditions and is also less
     # tolerant regarding inputs.
     with fast_append(2):
 
-        qc = qc.transpile()
-
-        # Count the amount of measurements (we can stop the simulation after all
-        # measurements are performed)
-        measurement_amount = count_measurements_and_treat_alloc(
+        tape, qubit_amount, mes_qubit_indices = lower_simulation_circuit(
             qc, insert_reset=insert_reset
         )
 
-        # Apply circuit preprocessing more
-        qc = circuit_preprocessor(qc)
-
-        measurement_counter = 0
-
-        for i in range(len(qc.data)):
-            if qc.data[i].op.name == "measure":
-                measurement_counter += 1
-            if measurement_counter == measurement_amount:
-                break
-
-        qc.data = qc.data[: i + 1]
-
-        # Counter to track how many measurements have been performed
-        measurement_counter = 0
-
-        # Main loop - this loop successively executes operations onto the impure
-        # quantum state object
-        
-        mes_list = []
-        
-        # if len(qc.qubits) < 30 or True:
-            # qc, mes_list = extract_measurements(qc)
-        
-        qc, new_mes_list = insert_multiverse_measurements(qc)
-        
-        mes_list = mes_list + new_mes_list
-            
         if iqs is None:
             # Create impure quantum state object. This object tracks multiple decoherent
             # quantum states that can appear when applying a non-unitary operation
             # iqs = ImpureQuantumState(len(qc.qubits), clbit_amount=len(qc.clbits))
-            iqs = QuantumState(len(qc.qubits))
+            iqs = QuantumState(qubit_amount)
         
-        mes_qubit_indices = []
-        mes_clbit_indices = []
-        
-        total_flops = 0
-        for i in range(len(qc.data)):
-            total_flops += 2 ** qc.data[i].op.num_qubits
-        
-        progress_bar.total = total_flops
-        for i in range(len(qc.data)):
-            # Set alias for the instruction of this operation
-            instr = qc.data[i]
-            progress_bar.update(2**instr.op.num_qubits)
-            # Gather the indices of the qubits from the circuits (i.e. integers instead
-            # of the identifier strings)
-            qubit_indices = [qc.qubits.index(qb) for qb in instr.qubits]
+        if progress_bar is not None:
+            progress_bar.total = sum(2 ** instr[0].num_qubits for instr in tape)
 
-            # Perform instructions
+        # Perform instructions. If enabled, independent blocks of qubits are
+        # processed concurrently (see parallel_execution.py).
 
-            # Disentangling describes an operation, which mean that the superposition of
-            # two states can be safely treated as two decoherent states. This is
-            # advantageous because it might be possible that the amplitude of one
-            # state is 0, which means that we halfed the workload. Even if both states
-            # have non-zero amplitude, this still yields an improvement because
-            # computing two decoherent states is more easily parallelized than the
-            # combined coherent state
-            if instr.op.name == "disentangle":
-                # iqs.reset(qubit_indices[0], True)
-                iqs.disentangle(qubit_indices[0], warning = instr.op.warning)
+        # Disentangling describes an operation, which mean that the superposition of
+        # two states can be safely treated as two decoherent states. This is
+        # advantageous because it might be possible that the amplitude of one
+        # state is 0, which means that we halfed the workload. Even if both states
+        # have non-zero amplitude, this still yields an improvement because
+        # computing two decoherent states is more easily parallelized than the
+        # combined coherent state
+        execute_tape(iqs, tape, progress_bar)
+
+        if len(mes_qubit_indices):
+            outcome_list, cl_prob = iqs.multi_measure(
+                mes_qubit_indices, return_res_states = False
+            )
 
-            # If the operation is unitary, we apply this unitary on to the required
-            # qubit indices
+        close_progress_bar(progress_bar)
+
+        return build_counts(outcome_list, cl_prob, shots, len(mes_qubit_indices), rng)
+
+
+def run_batch(batch, token="", rng=None):
+    """
+    Simulates a batch of circuits. The preprocessing of the circuits is performed
+    sequentially, while the instruction tapes of the circuits are executed
+    concurrently in a worker pool (if the parallel execution has been enabled via
+    ``qrisp.simulator.parallel_execution.max_workers``). The samples are drawn in
+    the order of the batch, such that the results agree with consecutive calls of
+    ``run`` sharing the same random number generator.
+
+    Parameters
+    ----------
+    batch : list[tuple[QuantumCircuit, int]]
+        A list of circuits and the corresponding amount of shots.
+    token : str, optional
+        Unused. The default is "".
+    rng : int, numpy.random.SeedSequence or numpy.random.Generator, optional
+        The random number generator used for sampling. The default is None.
+
+    Returns
+    -------
+    list[dict]
+        The measurement results of the circuits in the order of the batch.
+
+    Examples
+    --------
+
+    >>> from qrisp import QuantumCircuit
+    >>> from qrisp.simulator import run_batch
+    >>> qc_0 = QuantumCircuit(1, 1)
+    >>> qc_0.measure(0, 0)
+    >>> qc_1 = QuantumCircuit(1, 1)
+    >>> qc_1.x(0)
+    >>> qc_1.measure(0, 0)
+    >>> run_batch([(qc_0, 100), (qc_1, 200)])
+    [{'0': 100}, {'1': 200}]
+
+    """
+
+    rng = get_rng(rng)
+
+    # The lowering of the circuits modifies global state (fast_append) and is
+    # therefore performed before the workers are started
+    tasks = []
+    with fast_append(2):
+        for qc, shots in batch:
+            if len(qc.data) == 0 or shots == 0:
+                tasks.append(None)
             else:
+                tasks.append(lower_simulation_circuit(qc))
 
-                iqs.apply_operation(instr.op, qubit_indices)
+    simulation_results = execute_batch(
+        simulate_tape, [task for task in tasks if task is not None]
+    )[::-1]
 
-            # If all measurements have been performed, break
-            if measurement_counter == measurement_amount:
-                break
+    res = []
+    for (qc, shots), task in zip(batch, tasks):
+        if len(qc.data) == 0:
+            res.append({"": shots})
+        elif shots == 0:
+            res.append({})
+        else:
+            outcome_list, cl_prob = simulation_results.pop()
+            res.append(build_counts(outcome_list, cl_prob, shots, len(task[2]), rng))
 
+    return res
 
-        mes_list.sort(key = lambda x : -qc.clbits.index(x.clbits[0]))
-        
-        for instr in mes_list:
-            mes_qubit_indices.append(qc.qubits.index(instr.qubits[0]))
-            
-        if len(mes_qubit_indices):
-            outcome_list, cl_prob = iqs.multi_measure(mes_qubit_indices[::-1], return_res_states = False)
-            mes_qubit_indices = []
-
-        progress_bar.close()
-        print("\r" + 85*" ", end=LINE_CLEAR + "\r")
-
-        # Prepare result dictionary
-        # The iqs object contains the outcome bitstrings in the attribute .outcome_list
-        # and the probablities in .cl_prob. In order to ensure qiskit compatibility, we
-        # reverse the bitstrings
-        cl_prob = np.round(cl_prob, int(-np.log10(np.max(cl_prob)))+5)
-        norm = np.sum(cl_prob)
-        cl_prob = cl_prob/norm
-        
-        res = {}
-        #If shots >= 1000000, no samples will be drawn and the distribution will
-        #be returned instead
-        if shots is None:
-            
-            for j in range(len(outcome_list)):
-                
-                outcome_str = bin(outcome_list[j])[2:].zfill(len(mes_list))
-                
-                p = float(cl_prob[j])
-                
-                if p == 0:
-                    continue
-                
-                try:
-                    res[outcome_str] += p
-                except KeyError:
-                    res[outcome_str] = p
 
-        #Generate samples
-        else:
-            from numpy.random import choice
-            # p_array = np.array(list(prob_dict.values()))
+# Executes an instruction tape (as returned by lower_simulation_circuit) on a new
+# QuantumState and returns the outcomes and probabilities of the measured qubits
+def simulate_tape(task):
+
+    tape, qubit_amount, mes_qubit_indices = task
+
+    quantum_state = QuantumState(qubit_amount)
+    execute_tape(quantum_state, tape)
+
+    return quantum_state.multi_measure(mes_qubit_indices, return_res_states = False)
+
+
+# This function performs the preprocessing of the simulation and lowers the
+# preprocessed circuit into an instruction tape (see generate_instruction_tape).
+# Returns the tape, the amount of qubits and the indices of the measured qubits in
+# the order expected by build_counts.
+def lower_simulation_circuit(qc, insert_reset=True):
+
+    qc, mes_list, measurement_amount = prepare_simulation_circuit(
+        qc, insert_reset=insert_reset
+    )
+
+    # Lower the circuit into the instruction tape, i.e. gather the indices of
+    # the qubits from the circuit (integers instead of Qubit objects)
+    qubit_to_index_dic = {qc.qubits[i]: i for i in range(len(qc.qubits))}
+    clbit_to_index_dic = {qc.clbits[i]: i for i in range(len(qc.clbits))}
+    tape = generate_instruction_tape(qc, qubit_to_index_dic, clbit_to_index_dic)
+
+    mes_list.sort(key = lambda x : -clbit_to_index_dic[x.clbits[0]])
+
+    mes_qubit_indices = [qubit_to_index_dic[instr.qubits[0]] for instr in mes_list]
+
+    return tape, len(qc.qubits), mes_qubit_indices[::-1]
+
+
+# This function performs the preprocessing steps of the simulation that only depend
+# on the structure of the circuit, i.e. transpilation, treatment of allocation gates,
+# grouping/reordering and the insertion of the "multiverse" measurements.
+# Returns the preprocessed circuit, the list of measurements that are evaluated
+# at the end of the simulation and the amount of measurements in the original circuit.
+def prepare_simulation_circuit(qc, insert_reset=True):
+
+    qc = qc.transpile()
+
+    # Count the amount of measurements (we can stop the simulation after all
+    # measurements are performed)
+    measurement_amount = count_measurements_and_treat_alloc(
+        qc, insert_reset=insert_reset
+    )
+
+    # Apply circuit preprocessing more
+    qc = circuit_preprocessor(qc)
+
+    measurement_counter = 0
+
+    for i in range(len(qc.data)):
+        if qc.data[i].op.name == "measure":
+            measurement_counter += 1
+        if measurement_counter == measurement_amount:
+            break
+
+    qc.data = qc.data[: i + 1]
+
+    # if len(qc.qubits) < 30 or True:
+        # qc, mes_list = extract_measurements(qc)
+
+    qc, mes_list = insert_multiverse_measurements(qc)
+
+    return qc, mes_list, measurement_amount
+
+
+# This function turns the outcome list and the probabilities returned by
+# QuantumState.multi_measure into the result dictionary. The keys are bitstrings
+# (reversed in order to ensure qiskit compatibility). If shots is None, the
+# probabilities are returned, otherwise samples are drawn using the random number
+# generator rng (see sample_counts).
+def build_counts(outcome_list, cl_prob, shots, clbit_amount, rng=None):
+
+    cl_prob = np.round(
+        cl_prob,
+        int(-np.log10(np.max(cl_prob))) + numerics_config.probability_decimals
+    )
+    norm = np.sum(cl_prob)
+    cl_prob = cl_prob/norm
+    
+    res = {}
+    #If shots >= 1000000, no samples will be drawn and the distribution will
+    #be returned instead
+    if shots is None:
+        
+        for j in range(len(outcome_list)):
             
-            # samples = choice(len(p_array), shots, p=p_array)
+            outcome_str = bin(outcome_list[j])[2:].zfill(clbit_amount)
             
-            samples = choice(len(cl_prob), shots, p=cl_prob)
+            p = float(cl_prob[j])
             
-            temp = gen_res_dict(samples)
+            if p == 0:
+                continue
             
-            for k, v in temp.items():
-                outcome_str = bin(outcome_list[k])[2:].zfill(len(mes_list))
-                res[outcome_str] = int(v)
+            try:
+                res[outcome_str] += p
+            except KeyError:
+                res[outcome_str] = p
+
+    #Generate samples
+    else:
+        indices, counts = sample_counts(cl_prob, shots, rng)
         
-        return res
+        for k, v in zip(indices, counts):
+            outcome_str = bin(outcome_list[k])[2:].zfill(clbit_amount)
+            res[outcome_str] = int(v)
+    
+    return res
+
 
-@njit
-def gen_res_dict(samples):
+# Draws the given amount of shots from the probability distribution probs and returns
+# the indices of the outcomes, which have been sampled at least once, together with
+# their counts.
+# Instead of sampling every shot individually (and building a histogram over the
+# outcome indices), the counts are drawn from a single multinomial distribution,
+# which only requires O(len(probs)) operations independent of the amount of shots.
+# For the possible values of rng, see rng_management.py.
+def sample_counts(probs, shots, rng=None):
     
-    hist = np.histogram(samples, np.arange(np.max(samples)+2))[0]
+    rng = get_rng(rng)
     
-    temp = {}
+    probs = np.asarray(probs, dtype=np.float64)
+    probs = probs/np.sum(probs)
     
-    for i in range(len(hist)):
-        
-        if hist[i] != 0:
-            temp[i] = hist[i]
-            
-    return temp
+    counts = rng.multinomial(int(shots), probs)
+    indices = np.nonzero(counts)[0]
+    
+    return indices, counts[indices]
 
 
 def statevector_sim(qc):
     
-    progress_bar = tqdm(
-        desc=f"Simulating {len(qc.qubits)} qubits..",
-        bar_format="{desc} |{bar}| [{percentage:3.0f}%]",
-        ncols=85,
-        # ascii = " >#",
-        leave=False,
-        delay=0.2,
-        position=0,
-        smoothing=1,
-        file=sys.stdout
-        # colour = "green"
-    )
-    
-    LINE_CLEAR = "\x1b[2K"
-    progress_bar.display()
+    progress_bar = create_progress_bar(f"Simulating {len(qc.qubits)} qubits..")
     # This command enables fast appending. Fast appending means that the .append method
     # of the QuantumCircuit class checks much less validity conditions and is also less
     # tolerant regarding inputs.
@@ -260,40 +422,29 @@ def statevector_sim(qc):
         qc = group_qc(qc)
 
         if len(qc.data) == 0:
-            res = np.zeros(2 ** len(qc.qubits), dtype=np.complex64)
+            res = np.zeros(2 ** len(qc.qubits), dtype=numerics_config.dtype)
             res[0] = 1
             
-            progress_bar.close()
-            print(LINE_CLEAR, end="\r")
+            close_progress_bar(progress_bar)
             
             return res
 
         qs = QuantumState(len(qc.qubits))
 
-        total_flops = 0
-        for i in range(len(qc.data)):
-            total_flops += 2 ** qc.data[i].op.num_qubits
+        # Gather the indices of the qubits from the circuits (i.e. integers instead
+        # of the Qubit objects)
+        tape = generate_instruction_tape(qc)
 
-        progress_bar.total = total_flops
+        if progress_bar is not None:
+            progress_bar.total = sum(2 ** instr[0].num_qubits for instr in tape)
 
         # Main loop - this loop successively executes operations onto the impure
         # quantum state object
-        for i in range(len(qc.data)):
-            # Set alias for the instruction of this operation
-            instr = qc.data[i]
-
-            progress_bar.update(2**instr.op.num_qubits)
-            # Gather the indices of the qubits from the circuits (i.e. integers instead
-            # of the identifier strings)
-            qubit_indices = [qc.qubits.index(qb) for qb in instr.qubits]
-
-            # Perform instructions
-            qs.apply_operation(instr.op, qubit_indices)
+        execute_tape(qs, tape, progress_bar)
 
         res = qs.eval().tensor_array.to_array()
 
-        progress_bar.close()
-        print("\r" + 85*" ", end=LINE_CLEAR + "\r")
+        close_progress_bar(progress_bar)
 
         # Deactivate the fast append mode
         QuantumCircuit.fast_append = False
@@ -301,10 +452,82 @@ def statevector_sim(qc):
         return res
 
 
-def single_shot_sim(qc, quantum_state=None):
+# This function simulates a circuit without measurements and returns the resulting
+# QuantumState object together with a dictionary, which translates the Qubit
+# objects of the circuit into the qubit indices of the QuantumState.
+# If the state cache is enabled (see state_cache.py), the QuantumState is
+# retrieved from the cache if possible. The returned QuantumState should therefore
+# not be modified.
+def simulate_quantum_state(qc):
+
+    from qrisp.simulator import state_cache
+
+    cache = state_cache.state_cache
+
+    if cache is not None:
+        key = state_cache.circuit_key(qc)
+        if key is None:
+            cache = None
+
+    if cache is not None:
+        quantum_state = cache.get(key)
+        if quantum_state is not None:
+            return quantum_state, {qc.qubits[i]: i for i in range(len(qc.qubits))}
+
+    with fast_append(2):
+
+        qc = qc.transpile()
+
+        measurement_amount = count_measurements_and_treat_alloc(qc, insert_reset=True)
+
+        contains_reset = any(instr.op.name == "reset" for instr in qc.data)
+        if measurement_amount != 0 or contains_reset:
+            raise Exception(
+                "Tried to determine the quantum state of a circuit containing a "
+                "measurement"
+            )
+
+        qubit_to_index_dic = {qc.qubits[i]: i for i in range(len(qc.qubits))}
+
+        qc = group_qc(qc)
+
+        quantum_state = QuantumState(len(qc.qubits))
+
+        tape = generate_instruction_tape(qc, qubit_to_index_dic)
+
+        execute_tape(quantum_state, tape)
+
+    if cache is not None:
+        cache.insert(key, quantum_state)
+
+    return quantum_state, qubit_to_index_dic
+
+
+# Evaluates the measurement of the given qubits on the final state of a circuit
+# without measurements. Returns the counts in the same format as run.
+def measure_quantum_state(qc, qubits, shots=None):
+
+    if shots == 0:
+        return {}
+
+    if len(qubits) == 0:
+        return {"": shots}
+
+    quantum_state, qubit_to_index_dic = simulate_quantum_state(qc)
+
+    outcome_list, cl_prob = quantum_state.multi_measure(
+        [qubit_to_index_dic[qb] for qb in qubits], return_res_states=False
+    )
+
+    return build_counts(outcome_list, cl_prob, shots, len(qubits))
+
+
+def single_shot_sim(qc, quantum_state=None, rng=None):
     if len(qc.data) == 0:
         return "", quantum_state
 
+    rng = get_rng(rng)
+
     # This command enables fast appending. Fast appending means that the .append method
     # of the QuantumCircuit class checks much less validity conditions and is also less
     # tolerant regarding inputs.
@@ -326,8 +549,6 @@ def single_shot_sim(qc, quantum_state=None):
 
         result_str = len(qc.clbits) * ["0"]
 
-        import random
-
         if len(qc.data):
             # Wrapper to pre-calculate the unitaries from the preprocessed circuit in
             # parallel with the main thread
@@ -344,36 +565,29 @@ def single_shot_sim(qc, quantum_state=None):
             )
             pre_calc_thr.start()
 
+        # Gather the indices of the qubits from the circuits (i.e. integers instead
+        # of the Qubit objects)
+        tape = generate_instruction_tape(qc)
+
         # Main loop - this loop successively executes operations onto the impure
         # quantum state object
-        for i in range(len(qc.data)):
+        for i in range(len(tape)):
             pre_calc_thr.join()
 
-            if i < len(qc.data) - 1:
+            if i < len(tape) - 1:
                 pre_calc_thr = threading.Thread(
-                    target=pre_calc_unitaries, args=(qc.data[i + 1].op,)
+                    target=pre_calc_unitaries, args=(tape[i + 1][0],)
                 )
                 pre_calc_thr.start()
 
             # Set alias for the instruction of this operation
-            instr = qc.data[i]
-
-            # Gather the indices of the qubits from the circuits (i.e. integers instead
-            # of the identifier strings)
-            qubit_indices = [qc.qubits.index(qb) for qb in instr.qubits]
+            op, qubit_indices, clbit_indices = tape[i]
 
             # Perform instructions
-            if instr.op.name == "reset":
-                quantum_state.measure(qubit_indices[0])
-
-                p_0, state_0, p_1, state_1 = quantum_state.last_mes_outcome
-
-                rng = random.random()
-
-                if rng < p_0:
-                    quantum_state = state_0
-                else:
-                    quantum_state = state_1
+            if op.name == "reset":
+                meas_res, quantum_state = quantum_state.measure(
+                    qubit_indices[0], keep_res=False, rng=rng
+                )
 
             # Disentangling describes an operation, which mean that the superposition of
             # two states can be safely treated as two decoherent states. This is
@@ -383,33 +597,32 @@ def single_shot_sim(qc, quantum_state=None):
             # decoherent states is more easily parallelized than the combined coherent
             # state.
 
-            elif instr.op.name == "measure":
-                quantum_state.measure(qubit_indices[0])
-
-                p_0, state_0, p_1, state_1 = quantum_state.last_mes_outcome
-
-                rng = random.random()
+            elif op.name == "measure":
+                meas_res, quantum_state = quantum_state.measure(
+                    qubit_indices[0], keep_res=True, rng=rng
+                )
 
-                if rng < p_0:
-                    quantum_state = state_0
-                else:
-                    quantum_state = state_1
-                    result_str[qc.clbits.index(instr.clbits[0])] = "1"
+                if meas_res:
+                    result_str[clbit_indices[0]] = "1"
 
-            elif instr.op.name[:4] == "c_if":
-                if result_str[qc.clbits.index(instr.clbits[0])] == "1":
-                    quantum_state.apply_operation(instr.op, qubit_indices)
+            elif op.name[:4] == "c_if":
+                if result_str[clbit_indices[0]] == "1":
+                    quantum_state.apply_operation(op, qubit_indices)
             # If the operation is unitary, we apply this unitary on to the required qubit
             # indices
             else:
-                quantum_state.apply_operation(instr.op, qubit_indices)
+                quantum_state.apply_operation(op, qubit_indices)
 
         return "".join(result_str)[::-1], quantum_state
 
-def advance_quantum_state(qc, quantum_state, deallocated_qubits, qubit_to_index_dic):
+def advance_quantum_state(
+    qc, quantum_state, deallocated_qubits, qubit_to_index_dic, rng=None
+):
     if len(qc.data) == 0:
         return quantum_state
 
+    rng = get_rng(rng)
+
     allocated_qubits = len(qc.qubits)
     max_req_qubits = allocated_qubits
     allocation_amount = 0
@@ -425,20 +638,10 @@ def advance_quantum_state(qc, quantum_state, deallocated_qubits, qubit_to_index_
             if allocated_qubits > max_req_qubits:
                 max_req_qubits += 1
             
-    progress_bar = tqdm(
-        desc=f"Simulating {max_req_qubits-allocation_amount} qubits..",
-        bar_format="{desc} |{bar}| [{percentage:3.0f}%]",
-        ncols=85,
-        leave=False,
-        delay=0.2,
-        position=0,
-        smoothing=1,
-        file=sys.stdout
+    progress_bar = create_progress_bar(
+        f"Simulating {max_req_qubits-allocation_amount} qubits.."
     )
     
-    LINE_CLEAR = "\x1b[2K"
-    progress_bar.display()
-    
             
     # This command enables fast appending. Fast appending means that the .append method
     # of the QuantumCircuit class checks much less validity conditions and is also less
@@ -450,39 +653,26 @@ def advance_quantum_state(qc, quantum_state, deallocated_qubits, qubit_to_index_
         count_measurements_and_treat_alloc(qc, insert_reset=True)
         qc = group_qc(qc)
 
-        import random
         # Main loop - this loop successively executes operations onto the impure
         # quantum state object
         
-        progress_bar.total = len(qc.data)
+        if progress_bar is not None:
+            progress_bar.total = len(qc.data)
         
-        # qubit_to_index_dic = {}
-        # for i in range(len(qc.qubits)):
-        #     qubit_to_index_dic[qc.qubits[i]] = i
+        # Gather the indices of the qubits from the circuits (i.e. integers instead
+        # of the Qubit objects)
+        tape = generate_instruction_tape(qc, qubit_to_index_dic)
         
-        for i in range(len(qc.data)):
-
-            # Set alias for the instruction of this operation
-            instr = qc.data[i]
+        for op, qubit_indices, clbit_indices in tape:
             
-            progress_bar.update(1)
-
-            # Gather the indices of the qubits from the circuits (i.e. integers instead
-            # of the identifier strings)
-            qubit_indices = [qubit_to_index_dic[qb] for qb in instr.qubits]
+            if progress_bar is not None:
+                progress_bar.update(1)
 
             # Perform instructions
-            if instr.op.name == "reset":
-                quantum_state.measure(qubit_indices[0])
-
-                p_0, state_0, p_1, state_1 = quantum_state.last_mes_outcome
-
-                rng = random.random()
-
-                if rng < p_0:
-                    quantum_state = state_0
-                else:
-                    quantum_state = state_1
+            if op.name == "reset":
+                meas_res, quantum_state = quantum_state.measure(
+                    qubit_indices[0], keep_res=False, rng=rng
+                )
 
             # Disentangling describes an operation, which mean that the superposition of
             # two states can be safely treated as two decoherent states. This is
@@ -491,16 +681,15 @@ def advance_quantum_state(qc, quantum_state, deallocated_qubits, qubit_to_index_
             # non-zero amplitude, this still yields an improvement because computing two
             # decoherent states is more easily parallelized than the combined coherent
             # state.
-            if instr.op.name == "disentangle":
+            elif op.name == "disentangle":
                 # iqs.reset(qubit_indices[0], True)
-                quantum_state.disentangle(qubit_indices[0], warning = instr.op.warning)
+                quantum_state.disentangle(qubit_indices[0], warning = op.warning)
 
             # If the operation is unitary, we apply this unitary on to the required qubit
             # indices
             else:
-                quantum_state.apply_operation(instr.op, qubit_indices)
+                quantum_state.apply_operation(op, qubit_indices)
 
-        progress_bar.close()
-        print("\r" + 85*" ", end=LINE_CLEAR + "\r")
+        close_progress_bar(progress_bar)
 
         return quantum_state
\ No newline at end of file
@@ -0,0 +1,199 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+from collections import OrderedDict
+
+# This module contains the cache for simulated quantum states. If the cache is
+# enabled, the final QuantumState of a (measurement free) circuit is stored, such
+# that subsequent measurements of the same circuit (for instance of different
+# QuantumVariables of the same QuantumSession or of multiple Hamiltonians) can be
+# answered without repeating the simulation.
+# The cache is keyed on the structure of the (parameter bound) circuit and uses
+# a least recently used eviction strategy, bounded by the memory of the cached
+# states.
+
+
+class StateCache:
+    def __init__(self, max_memory):
+        # The maximum amount of bytes occupied by the cached states
+        self.max_memory = max_memory
+        self.memory = 0
+
+        self.states = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        try:
+            quantum_state, memory = self.states[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.states.move_to_end(key)
+        self.hits += 1
+        return quantum_state
+
+    def insert(self, key, quantum_state):
+        memory = state_memory(quantum_state)
+
+        if memory > self.max_memory:
+            return
+
+        if key in self.states:
+            self.memory -= self.states.pop(key)[1]
+
+        self.states[key] = (quantum_state, memory)
+        self.memory += memory
+
+        # Evict the least recently used states
+        while self.memory > self.max_memory:
+            evicted_state, evicted_memory = self.states.popitem(last=False)[1]
+            self.memory -= evicted_memory
+
+    def clear(self):
+        self.states.clear()
+        self.memory = 0
+        self.hits = 0
+        self.misses = 0
+
+
+# Returns the amount of bytes occupied by the arrays of a QuantumState
+def state_memory(quantum_state):
+    res = 0
+    for tf in set(quantum_state.tensor_factors):
+        tensor_array = tf.tensor_array
+        tensor_array.catch_up()
+        for attr in ["data", "nz_indices"]:
+            array = getattr(tensor_array, attr, None)
+            if array is not None:
+                res += array.nbytes
+    return res
+
+
+# The state cache (None if the cache is disabled)
+state_cache = None
+
+
+def enable_state_cache(max_memory=2**30):
+    """
+    Enables the cache for simulated quantum states of the built-in simulator.
+
+    If the cache is enabled, the final state of a (parameter bound) circuit is
+    stored after the simulation. Subsequent measurements of the same circuit,
+    for instance of different QuantumVariables of the same QuantumSession or
+    expectation values of several Hamiltonians, are evaluated on the cached
+    state instead of repeating the simulation. If the cached states exceed the
+    memory limit, the least recently used states are evicted.
+
+    Parameters
+    ----------
+    max_memory : int, optional
+        The maximum amount of bytes occupied by the cached states. The default is
+        ``2**30`` (1 GB).
+
+    Examples
+    --------
+
+    >>> from qrisp import QuantumFloat, h, cx
+    >>> from qrisp.simulator import enable_state_cache, disable_state_cache
+    >>> from qrisp.simulator import get_state_cache_info
+    >>> enable_state_cache()
+    >>> a = QuantumFloat(3)
+    >>> b = QuantumFloat(3)
+    >>> h(a)
+    >>> cx(a, b)
+    >>> print(a)
+    {0: 0.125, 1: 0.125, 2: 0.125, 3: 0.125, 4: 0.125, 5: 0.125, 6: 0.125, 7: 0.125}
+    >>> print(b)
+    {0: 0.125, 1: 0.125, 2: 0.125, 3: 0.125, 4: 0.125, 5: 0.125, 6: 0.125, 7: 0.125}
+    >>> get_state_cache_info()
+    {'hits': 1, 'misses': 1, 'cached_states': 1, 'memory': 96}
+    >>> disable_state_cache()
+
+    """
+    global state_cache
+    state_cache = StateCache(max_memory)
+
+
+def disable_state_cache():
+    """
+    Disables (and clears) the cache for simulated quantum states.
+    """
+    global state_cache
+    state_cache = None
+
+
+def get_state_cache_info():
+    """
+    Returns the statistics of the cache for simulated quantum states.
+
+    Returns
+    -------
+    dict
+        A dictionary containing the amount of cache hits and misses, the amount of
+        cached states and the memory they occupy (in bytes). If the cache is
+        disabled, None is returned.
+
+    """
+    if state_cache is None:
+        return None
+
+    return {
+        "hits": state_cache.hits,
+        "misses": state_cache.misses,
+        "cached_states": len(state_cache.states),
+        "memory": state_cache.memory,
+    }
+
+
+# Returns the key of a circuit for the state cache. The key is the structure of the
+# circuit, which is compared on every lookup, such that circuits with colliding
+# hashes are never confused. Returns None if the circuit can not be cached (for
+# instance because it contains unhashable parameters).
+def circuit_key(qc):
+    from qrisp.circuit.circuit_structure import circuit_structure
+
+    try:
+        return circuit_structure(qc)
+    except TypeError:
+        return None
+
+
+# Determines whether the state cache is used for measurements on the given backend
+def state_cache_active(backend):
+    if state_cache is None:
+        return False
+
+    from qrisp.default_backend import DefaultBackend
+
+    return isinstance(backend, DefaultBackend)
+
+
+# Determines whether the state cache can be used to measure the given circuit on the
+# given backend.
+def use_state_cache(qc, backend):
+    if not state_cache_active(backend):
+        return False
+
+    for instr in qc.data:
+        if instr.op.name in ["measure", "reset"]:
+            return False
+
+    return True
@@ -19,7 +19,8 @@
 # -*- coding: utf-8 -*-
 
 from qrisp.simulator.bi_arrays import DenseBiArray, SparseBiArray, tensordot, BiArray
-from qrisp.simulator.numerics_config import float_tresh, xp
+from qrisp.simulator import numerics_config
+from qrisp.simulator.numerics_config import xp
 
 # tensordot = xp.tensordot
 
@@ -31,7 +32,6 @@ from qrisp.simulator.numerics_config import float_tresh, xp
 class TensorFactor:
     
     index_init = xp.zeros(1, dtype = xp.int64)
-    data_init = xp.ones(1, dtype = xp.complex64)
     
     def __init__(self, qubits, init_tensor_array=None):
         # This list contains a list of integers, which describe the current permutation
@@ -46,7 +46,10 @@ class TensorFactor:
 
         if init_tensor_array is None:
             
-            self.tensor_array = SparseBiArray((self.index_init, self.data_init), shape = (2**self.n,))
+            data_init = xp.ones(1, dtype = numerics_config.dtype)
+            self.tensor_array = SparseBiArray(
+                (self.index_init, data_init), shape = (2**self.n,)
+            )
 
         else:
             self.tensor_array = init_tensor_array
@@ -74,8 +77,13 @@ class TensorFactor:
         # the most out of the sparse matrix representation
         import numpy as np
 
-        if matrix.size >= 2**6 and matrix.dtype != np.dtype("O"):
-                matrix = matrix * (np.abs(matrix) > float_tresh)
+        if matrix.dtype != np.dtype("O"):
+            # Convert the matrix to the precision of the simulation
+            if matrix.dtype != numerics_config.dtype:
+                matrix = matrix.astype(numerics_config.dtype)
+
+            if matrix.size >= 2**6:
+                matrix = matrix * (np.abs(matrix) > numerics_config.float_tresh)
 
         # Convert matrix to BiArray
         matrix = DenseBiArray(matrix)
@@ -140,7 +148,7 @@ class TensorFactor:
         new_qubit_list.pop(0)
 
         # This treats the case that both measurement probabilities are non-zero
-        if p_0 > float_tresh and p_1 > float_tresh:
+        if p_0 > numerics_config.float_tresh and p_1 > numerics_config.float_tresh:
             # Normalize the new statevector arrays
             normalization = 1 / (p_0**0.5)
             lower_half.data *= normalization
@@ -155,7 +163,7 @@ class TensorFactor:
             tensor_factor_1 = TensorFactor(list(new_qubit_list), upper_half)
 
         # This treats the cases that one of the outcomes has 0 probability
-        elif p_0 < float_tresh:
+        elif p_0 < numerics_config.float_tresh:
             p_0 = 0
             p_1 = 1
             tensor_factor_0 = None
@@ -24,8 +24,11 @@ from numba import njit
 
 from qrisp import fast_append, ControlledOperation
 from qrisp.simulator.bi_arrays import BiArray, DenseBiArray, SparseBiArray, tensordot
+from qrisp.simulator import numerics_config
 
 
+# The Pauli matrices are exactly representable in single precision. Other unitaries
+# are generated with the precision specified in numerics_config.
 np_dtype = np.complex64
 
 id_matrix = np.eye(2, dtype=np_dtype)
@@ -42,8 +45,8 @@ def u3matrix(theta, phi, lam, global_phase, use_sympy = False):
     if not use_sympy:
         module = numpy
         I = 1j
-        res = numpy.empty(shape=(2, 2), dtype=np_dtype)
-        exp_gphase = module.exp(I * global_phase, dtype = np_dtype)
+        res = numpy.empty(shape=(2, 2), dtype=numerics_config.dtype)
+        exp_gphase = module.exp(I * global_phase, dtype = numerics_config.dtype)
     else:
         module = sympy
         I = sympy.I
@@ -74,13 +77,17 @@ def controlled_unitary(controlled_gate):
     m = controlled_gate.base_operation.num_qubits
     try:
         temp = controlled_gate.base_operation.unitary_array
+        if not numerics_config.is_current_unitary(temp):
+            raise AttributeError
     except AttributeError:
         temp = (
             controlled_gate.base_operation.unitary_array
         ) = controlled_gate.base_operation.get_unitary()
 
     n = controlled_gate.num_qubits
-    res = np.eye(2**n, dtype=temp.dtype)
+    # The result has at least the precision of the simulator, such that it is not
+    # recalculated on every call if the base operation has a lower precision
+    res = np.eye(2**n, dtype=np.promote_types(temp.dtype, numerics_config.dtype))
     control_state = int(controlled_gate.ctrl_state, 2)
     
     res[(control_state)*(2**m) : (control_state+1)*(2**m), (control_state)*(2**m) : (control_state+1)*(2**m)] = temp
@@ -294,7 +301,7 @@ def __calc_circuit_unitary(qc):
 
     # If the circuit is empty, return the identity matrix
     if len(qc.data) == 0:
-        return np.eye(2**n, dtype = np_dtype)
+        return np.eye(2**n, dtype = numerics_config.dtype)
 
     # If the circuit contains only a single insturction,
     # calculate this instructions unitary and embedd it
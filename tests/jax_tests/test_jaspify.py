@@ -73,3 +73,149 @@ def test_jasp_simulation():
 
 
     assert main(4) == 9
+
+
+def test_jaspr_cache():
+    
+    import jax.numpy as jnp
+    from qrisp import QuantumFloat, h, x, measure
+    from qrisp.jasp import jaspify, terminal_sampling, count_ops
+    
+    @jaspify
+    def main(i):
+        qf = QuantumFloat(4)
+        x(qf[i])
+        return measure(qf), i
+    
+    # Calls with the same signature reuse the traced Jaspr
+    for i in range(4):
+        assert main(i) == (2**i, i)
+    
+    # Calls with a different signature are traced again
+    assert main(jnp.int32(2)) == (4, 2)
+    
+    @terminal_sampling
+    def sampling_main(i):
+        qf = QuantumFloat(4)
+        h(qf[i])
+        return qf
+    
+    for i in range(4):
+        assert sampling_main(i) == {0 : 0.5, 2**i : 0.5}
+    
+    @count_ops
+    def ops_main(i):
+        qf = QuantumFloat(4)
+        h(qf[i])
+        return measure(qf)
+    
+    assert ops_main(1) == ops_main(2) == {"h" : 1, "measure" : 4}
+
+
+def test_compiled_interpreter():
+    
+    import jax
+    import jax.numpy as jnp
+    from jax import make_jaxpr
+    from qrisp import QuantumFloat, QuantumBool, h, x, cx, measure, reset, control
+    from qrisp.jasp import compile_jaxpr, eval_jaxpr, make_jaspr, jrange, simulate_jaspr
+    
+    # Classical control flow is evaluated like eval_jaxpr does
+    def classical_function(n, y):
+        
+        def body_fun(i, carry):
+            return carry + jnp.sin(i*y)
+        
+        res = jax.lax.fori_loop(0, n, body_fun, 0.)
+        res = jax.lax.cond(n > 5, lambda r : r*2, lambda r : r - 1, res)
+        carry, ys = jax.lax.scan(lambda c, x : (c + x, c*x), 1., jnp.arange(4.))
+        
+        return res, carry, ys
+    
+    jaxpr = make_jaxpr(classical_function)(1, 1.)
+    
+    for n in [3, 10]:
+        compiled_res = compile_jaxpr(jaxpr)(n, 0.5)
+        eval_res = eval_jaxpr(jaxpr)(n, 0.5)
+        for a, b in zip(compiled_res, eval_res):
+            assert jnp.allclose(a, b)
+    
+    # Hybrid loops (the classical blocks of the loop body are compiled after
+    # a few iterations)
+    def main(n):
+        qf = QuantumFloat(4)
+        for i in jrange(n):
+            qbl = QuantumBool()
+            h(qbl)
+            cx(qbl[0], qf[i % 4])
+            b = measure(qbl)
+            with control(b):
+                x(qf[i % 4])
+            reset(qbl)
+            qbl.delete()
+        return measure(qf)
+    
+    jaspr = make_jaspr(main)(1)
+    
+    for n in [1, 2, 3, 100]:
+        assert simulate_jaspr(jaspr, n) == 0
+    
+    def main(n):
+        qf = QuantumFloat(6)
+        for i in jrange(n):
+            x(qf[i])
+        return measure(qf) + n
+    
+    jaspr = make_jaspr(main)(1)
+    for n in range(7):
+        assert simulate_jaspr(jaspr, n) == 2**n - 1 + n
+
+
+def test_qubit_recycling():
+    
+    from qrisp import QuantumFloat, QuantumBool, h, x, cx, measure
+    from qrisp.circuit import QubitAlloc, QubitDealloc, HGate, XGate, CXGate
+    from qrisp.jasp import jaspify, jrange
+    from qrisp.jasp.evaluation_tools.buffered_quantum_state import BufferedQuantumState
+    
+    # Deallocated simulator indices are reused, such that the state size is
+    # bounded by the peak amount of live qubits
+    state = BufferedQuantumState(rng = 0)
+    
+    qb_0 = state.add_qubit()
+    state.append(QubitAlloc(), [qb_0])
+    state.append(HGate(), [qb_0])
+    
+    for i in range(100):
+        qb_1 = state.add_qubit()
+        state.append(QubitAlloc(), [qb_1])
+        state.append(CXGate(), [qb_0, qb_1])
+        state.append(CXGate(), [qb_0, qb_1])
+        state.append(QubitDealloc(), [qb_1])
+        
+        qb_2 = state.add_qubit()
+        state.append(QubitAlloc(), [qb_2])
+        state.append(XGate(), [qb_2])
+        # Reset the qubit to |0> through a measurement
+        state.reset([qb_2])
+        state.append(QubitDealloc(), [qb_2])
+    
+    assert state.qubit_counter == 2
+    assert state.quantum_state.n == 2
+    assert state.multi_measure([qb_0], None) == {0 : 0.5, 1 : 0.5}
+    
+    # Recycled qubits start in the |0> state, even if they were deallocated
+    # in a non-zero state
+    @jaspify
+    def main(n):
+        qf = QuantumFloat(2)
+        h(qf[0])
+        for i in jrange(n):
+            qbl = QuantumBool()
+            cx(qbl[0], qf[1])
+            x(qbl)
+            qbl.delete()
+        return measure(qf)
+    
+    for n in [1, 5, 20]:
+        assert main(n) in [0, 1]
@@ -56,3 +56,59 @@ def test_stim_simulation():
     for i in range(3):
         for j in range(3):
             assert main(i, j) in [(0.0, 0.0, False), (2**i, 2**j, True)]
+
+def test_clifford_gates_simulation():
+    
+    import numpy as np
+    
+    @stimulate
+    def main():
+        qf = QuantumFloat(4)
+        h(qf[0])
+        swap(qf[0], qf[3])
+        # Two SX gates yield an X gate
+        sx(qf[1])
+        sx(qf[1])
+        # Gates with Clifford unitaries are supported
+        rz(np.pi/2, qf[2])
+        s_dg(qf[2])
+        mcx([qf[3]], qf[2], ctrl_state = 0)
+        return measure(qf)
+    
+    assert {int(main()) for i in range(20)} == {6, 10}
+    
+    # Ancilla churn with resets and deallocations on many qubits
+    @stimulate(rng = 3)
+    def main(n):
+        qf = QuantumFloat(n)
+        h(qf[0])
+        for i in jrange(n - 1):
+            cx(qf[i], qf[i + 1])
+        
+        for i in jrange(n - 1):
+            anc = QuantumBool()
+            cx(qf[i], anc[0])
+            cx(qf[i + 1], anc[0])
+            # The parity of neighbouring qubits of the GHZ state is even
+            with control(measure(anc)):
+                x(qf[0])
+            reset(anc)
+            anc.delete()
+        
+        return measure(qf[0]), measure(qf[n - 1]), measure(qf[n//2])
+    
+    res = main(300)
+    assert res[0] == res[1] == res[2]
+    assert main(300) == res
+    
+    @stimulate
+    def main():
+        qf = QuantumFloat(2)
+        t(qf[0])
+        return measure(qf)
+    
+    try:
+        main()
+        assert False
+    except Exception as e:
+        assert "not a Clifford operation" in str(e)
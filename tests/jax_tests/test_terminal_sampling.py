@@ -73,3 +73,105 @@ def test_terminal_sampling():
         return qf
 
     main()
+
+
+def test_seeded_simulation():
+    
+    import numpy as np
+    from qrisp import QuantumFloat, QuantumBool, h, x, measure, control
+    from qrisp.jasp import terminal_sampling, jaspify
+    from qrisp.simulator import spawn_rngs
+    
+    @terminal_sampling(shots = 1000, rng = 5)
+    def main():
+        qf = QuantumFloat(4)
+        h(qf)
+        return qf
+    
+    # A seeded sampling function yields the same results for every call
+    res = main()
+    assert main() == res
+    assert sum(res.values()) == 1000
+    
+    def hybrid():
+        qf = QuantumFloat(4)
+        h(qf)
+        qbl = QuantumBool()
+        h(qbl)
+        with control(measure(qbl)):
+            x(qf[0])
+        return measure(qf)
+    
+    results = [jaspify(hybrid, rng = i)() for i in range(10)]
+    assert results == [jaspify(hybrid, rng = i)() for i in range(10)]
+    assert len(set(int(res) for res in results)) > 1
+    
+    # A shared generator advances its stream
+    rng = np.random.default_rng(0)
+    sim = jaspify(hybrid, rng = rng)
+    results = [sim() for i in range(10)]
+    
+    rng = np.random.default_rng(0)
+    sim = jaspify(hybrid, rng = rng)
+    assert results == [sim() for i in range(10)]
+    
+    # Spawned generators yield independent, reproducible streams
+    results = [jaspify(hybrid, rng = rng)() for rng in spawn_rngs(1, 10)]
+    assert results == [jaspify(hybrid, rng = rng)() for rng in spawn_rngs(1, 10)]
+
+
+def test_terminal_sampling_decoding():
+    
+    import numpy as np
+    from qrisp import QuantumFloat, h, x
+    from qrisp.jasp import terminal_sampling, jaspify, sample, expectation_value
+    
+    def state_prep():
+        qf = QuantumFloat(10, -3)
+        h(qf)
+        return qf
+    
+    # Every outcome is decoded
+    res = terminal_sampling(state_prep)()
+    assert len(res) == 2**10
+    assert res == {i/8 : 2**-10 for i in range(2**10)}
+    
+    @jaspify(terminal_sampling = True)
+    def main():
+        return expectation_value(state_prep, 1000)()
+    
+    assert abs(main() - (2**10-1)/16) < 6
+    
+    # Outcomes which are decoded to the same value are accumulated
+    def parity(x):
+        return x*8 % 2
+    
+    @jaspify(terminal_sampling = True)
+    def main():
+        return sample(state_prep, 100, post_processor = parity)()
+    
+    res = main()
+    assert len(res) == 100
+    assert set(np.unique(res)) == {0, 1}
+    
+    @jaspify(terminal_sampling = True)
+    def main():
+        return expectation_value(
+            state_prep, 100, return_dict = True, post_processor = parity
+        )()
+    
+    res = main()
+    assert set(res.keys()) == {0, 1}
+    assert sum(res.values()) == 100
+    
+    # More than 63 measured qubits
+    def state_prep():
+        a = QuantumFloat(40)
+        b = QuantumFloat(30)
+        x(a[39])
+        x(b[0])
+        h(b[29])
+        return a, b
+    
+    assert terminal_sampling(state_prep)() == {(2**39, 1) : 0.5, (2**39, 2**29+1) : 0.5}
+    assert sum(terminal_sampling(state_prep, shots = 10)().values()) == 10
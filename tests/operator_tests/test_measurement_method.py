@@ -88,4 +88,105 @@ def test_measurement_method(sample_size=100, seed=42, exhaustive = False):
     
     
     
-    
\ No newline at end of file
+    
+
+def test_exact_measurement(sample_size=50, seed=42):
+    
+    # For precision 0, the expectation value is evaluated exactly from a single
+    # simulation of the state on the default simulator
+    non_sampling_backend = VirtualBackend(
+        lambda qasm_string, shots, token : run(
+            QuantumCircuit.from_qasm_str(qasm_string), None, ""
+        )
+    )
+    
+    random.seed(seed)
+    operator_list = [lambda x: 1, X, Y, Z, A, C, P0, P1]
+    
+    qv = QuantumVariable(4)
+    h(qv[0])
+    cx(qv[0], qv[1])
+    ry(0.7, qv[2])
+    cx(qv[2], qv[3])
+    rz(0.4, qv[3])
+    h(qv[3])
+    
+    # Additional qubit, which is not part of the measured qubits
+    qf = QuantumFloat(2)
+    x(qf[0])
+    cx(qf[0], qv[1])
+    
+    H = 0
+    for _ in range(sample_size):
+        combination = [random.choice(operator_list) for _ in range(4)]
+        term = 1
+        for i in range(4):
+            term = term * combination[i](i)
+        if term is 1:
+            continue
+        
+        H += random.random()*term
+        
+        for method in ["commuting_qw", "commuting"]:
+            
+            exact_ev = term.get_measurement(
+                qv, precision = 0, diagonalisation_method = method
+            )
+            expected_ev = term.get_measurement(
+                qv,
+                precision = 0.0005,
+                diagonalisation_method = method,
+                backend = non_sampling_backend,
+            )
+            
+            assert abs(exact_ev - expected_ev) < 1E-3
+    
+    exact_ev = H.get_measurement(qv, precision = 0)
+    expected_ev = H.get_measurement(
+        qv, precision = 0.0005, backend = non_sampling_backend
+    )
+    assert abs(exact_ev - expected_ev) < 1E-2
+    
+    # Measurements within the definitions of operations are detected
+    from qrisp.default_backend import def_backend
+    from qrisp.operators.qubit.measurement import QubitOperatorMeasurement
+    
+    measurement_qc = QuantumCircuit(1, 1)
+    measurement_qc.measure(0, 0)
+    qc = QuantumCircuit(1, 1)
+    qc.append(measurement_qc.to_op(), qc.qubits, qc.clbits)
+    
+    measurement_data = QubitOperatorMeasurement(Z(0))
+    assert measurement_data.allows_exact_measurement(QuantumCircuit(1), def_backend)
+    assert not measurement_data.allows_exact_measurement(qc, def_backend)
+    
+    # Other backends require a non-zero precision
+    try:
+        Z(0).get_measurement(qv, precision = 0, backend = non_sampling_backend)
+    except Exception:
+        pass
+    else:
+        assert False
+
+
+def test_multi_hamiltonian_measurement():
+    
+    import warnings
+    from qrisp.operators.hamiltonian_tools import multi_hamiltonian_measurement
+    
+    qv = QuantumVariable(3)
+    h(qv[0])
+    cx(qv[0], qv[1])
+    ry(0.3, qv[2])
+    
+    hamiltonians = [Z(0)*Z(1) + X(2), 0.5*X(0)*X(1) - Z(2)]
+    expectations = multi_hamiltonian_measurement(hamiltonians, qv, precision = 0)
+    for i in range(len(hamiltonians)):
+        expected_ev = hamiltonians[i].get_measurement(qv, precision = 0)
+        assert abs(expectations[i] - expected_ev) < 1E-5
+    
+    # The shots argument is deprecated
+    with warnings.catch_warnings(record = True) as w:
+        warnings.simplefilter("always")
+        multi_hamiltonian_measurement(hamiltonians, qv, precision = 0, shots = 1000)
+    assert "DeprecationWarning" in str(w[0].message)
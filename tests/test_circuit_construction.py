@@ -0,0 +1,175 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+
+def test_circuit_membership_index():
+    from qrisp import QuantumCircuit, Qubit, Clbit
+    
+    qc = QuantumCircuit(3, 1)
+    qc.cx(0, 1)
+    
+    # Qubits that are added later can be used
+    qb = qc.add_qubit(Qubit("a"))
+    qc.cx(qc.qubits[2], qb)
+    
+    # Qubits with matching identifiers are translated
+    qc.x(Qubit("a"))
+    assert qc.data[-1].qubits[0] is qb
+    
+    # Duplicate identifiers are detected
+    duplicates = [
+        (Qubit("a"), qc.add_qubit),
+        (Clbit(qc.clbits[0].identifier), qc.add_clbit),
+    ]
+    for bit, add_bit in duplicates:
+        try:
+            add_bit(bit)
+        except Exception:
+            pass
+        else:
+            assert False
+    
+    # Direct assignment and in-place modification of the qubit list
+    removed_qubit = qc.qubits.pop(0)
+    try:
+        qc.x(removed_qubit)
+    except Exception:
+        pass
+    else:
+        assert False
+    
+    qc.qubits = [removed_qubit] + qc.qubits
+    qc.x(removed_qubit)
+    qc.add_qubit(Qubit("b"))
+    
+    qc.qubits.extend([Qubit("c")])
+    qc.x(qc.qubits[-1])
+    
+    replaced_qubit = qc.qubits[2]
+    qc.qubits[2] = Qubit("new")
+    try:
+        qc.x(replaced_qubit)
+    except Exception:
+        pass
+    else:
+        assert False
+    qc.x(qc.qubits[2])
+    qc.qubits[2] = replaced_qubit
+    
+    # Classical bits
+    cb = qc.add_clbit()
+    qc.measure(qb, cb)
+    try:
+        qc.measure(qb, Clbit("d"))
+    except Exception:
+        pass
+    else:
+        assert False
+    
+    assert len(qc.qubits) == 6
+    assert qc.copy().qubits == qc.qubits
+    
+    # Quantum session merging and qubit deallocation
+    from qrisp import QuantumVariable, cx, x
+    
+    qv_0 = QuantumVariable(2)
+    qv_1 = QuantumVariable(2)
+    x(qv_1)
+    cx(qv_1[0], qv_0[0])
+    qv_1.uncompute()
+    assert qv_0.get_measurement() == {"10": 1.0}
+    
+    qv_2 = QuantumVariable(1)
+    qv_0.qs.clear_qubits(qv_0.reg)
+    try:
+        qv_2.qs.clear_qubits(qv_0.reg)
+    except Exception:
+        pass
+    else:
+        assert False
+    
+    # Renamed qubits
+    qv_3 = QuantumVariable(2)
+    qv_3.extend(1)
+    for qb in [qv_3[-1], qv_3[0]]:
+        try:
+            qv_3.qs.add_qubit(Qubit(qb.identifier))
+        except Exception:
+            pass
+        else:
+            assert False
+    
+    qv_4 = QuantumVariable(2, name = qv_3.name)
+    cx(qv_4[0], qv_3[0])
+    for qb in qv_3.reg + qv_4.reg:
+        try:
+            qv_3.qs.add_qubit(Qubit(qb.identifier))
+        except Exception:
+            pass
+        else:
+            assert False
+
+
+def test_circuit_hashing():
+    from qrisp import Instruction, QuantumCircuit, QuantumFloat
+    
+    def build_circuit():
+        a = QuantumFloat(3)
+        b = QuantumFloat(3)
+        c = a * b
+        qc = QuantumCircuit(c.qs.num_qubits())
+        qc.append(c.qs.compile().to_gate(), qc.qubits)
+        qc.cx(0, 1)
+        qc.rz(0.5, 2)
+        return qc
+    
+    qc_0 = build_circuit()
+    qc_1 = build_circuit()
+    
+    # Structurally identical circuits have equal hashes
+    assert hash(qc_0) == hash(qc_1)
+    assert hash(qc_0) == hash(qc_0.copy())
+    
+    # Modifications of the circuit are detected
+    qc_0.x(0)
+    assert hash(qc_0) != hash(qc_1)
+    qc_1.x(0)
+    assert hash(qc_0) == hash(qc_1)
+    
+    # Replacing an instruction is detected
+    instr = qc_0.data[1]
+    qc_0.data[1] = Instruction(instr.op, instr.qubits[::-1])
+    assert hash(qc_0) != hash(qc_1)
+    qc_0.data[1] = instr
+    assert hash(qc_0) == hash(qc_1)
+    
+    qc_0.data.pop(-1)
+    assert hash(qc_0) != hash(qc_1)
+    qc_0.x(0)
+    assert hash(qc_0) == hash(qc_1)
+    
+    qc_0.qubits.insert(0, qc_0.qubits.pop(-1))
+    assert hash(qc_0) != hash(qc_1)
+    qc_0.qubits.insert(len(qc_0.qubits) - 1, qc_0.qubits.pop(0))
+    assert hash(qc_0) == hash(qc_1)
+    
+    # Repeated hashing of an unmodified circuit reuses the memoized hash
+    hash_state = qc_1.hash_state
+    assert hash(qc_1) == hash(qc_1)
+    assert qc_1.hash_state is hash_state
@@ -37,4 +37,75 @@ def test_depth_computation():
     qc.rx(2*np.pi*3/2**4, 1)
     
     
-    assert qc.t_depth(epsilon = 2**-5) == 16
\ No newline at end of file
+    assert qc.t_depth(epsilon = 2**-5) == 16    
+    
+def test_depth_signatures():
+    
+    from sympy import Symbol
+    from qrisp import QuantumCircuit, QuantumFloat, QuantumBool, h, mcx, control, t
+    from qrisp.misc import get_depth_dic
+    from qrisp.misc.utility import cnot_depth_indicator
+    from qrisp.core.compilation import update_depth_dic
+    
+    a = QuantumFloat(4)
+    b = QuantumFloat(4)
+    c = QuantumBool()
+    h(a)
+    d = a*b
+    with control(c):
+        b += 3
+    mcx(a, c, method = "gray")
+    t(a[0])
+    
+    qs = a.qs
+    transpiled_qc = qs.transpile()
+    
+    depth_indicators = [lambda x : 1, 
+                        cnot_depth_indicator, 
+                        lambda op : {"cx" : 3, "t" : 2, "h" : 0}.get(op.name, 1)]
+    
+    for indicator in depth_indicators:
+        # The depth signatures yield the same depth as the transpiled circuit
+        reference_depth_dic = get_depth_dic(
+            transpiled_qc, transpile_qc = False, depth_indicator = indicator
+        )
+        assert get_depth_dic(qs, depth_indicator = indicator) == reference_depth_dic
+        
+        depth_dic = {b : 0 for b in qs.qubits + qs.clbits}
+        for instr in qs.data:
+            update_depth_dic(instr, depth_dic, depth_indicator = indicator)
+        assert {qb : depth_dic[qb] for qb in qs.qubits} == reference_depth_dic
+        
+        reference_depth = transpiled_qc.depth(
+            depth_indicator = indicator, transpile = False
+        )
+        assert qs.depth(depth_indicator = indicator) == reference_depth
+    
+    assert qs.t_depth() == transpiled_qc.t_depth()
+    
+    # Binding parameters yields a new definition and therefore new signatures
+    phi = Symbol("phi")
+    inner_qc = QuantumCircuit(2)
+    inner_qc.rz(phi, 0)
+    inner_qc.cx(0, 1)
+    inner_qc.rz(phi, 1)
+    abstract_gate = inner_qc.to_gate()
+    
+    depth_indicator = lambda op : 5 if (op.name == "rz" and op.params[0] != 0) else 1
+    
+    qc = QuantumCircuit(2)
+    qc.append(abstract_gate, [0, 1])
+    qc.depth(depth_indicator = depth_indicator)
+    
+    qc = QuantumCircuit(2)
+    qc.append(abstract_gate.bind_parameters({phi : 0}), [0, 1])
+    assert qc.depth(depth_indicator = depth_indicator) == 3
+    
+    # Modifying a definition invalidates its signatures
+    qc = QuantumCircuit(2)
+    qc.append(abstract_gate, [0, 1])
+    assert qc.depth() == 3
+    abstract_gate.definition.cx(0, 1)
+    assert qc.depth() == 4
+    abstract_gate.definition.data.pop(0)
+    assert qc.depth() == 3
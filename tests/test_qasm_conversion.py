@@ -0,0 +1,165 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+
+def test_qasm_roundtrip():
+    import numpy as np
+    from qrisp import QuantumCircuit
+    from qrisp.circuit.standard_operations import HGate, PGate, RZGate, XGate
+    
+    composite_qc = QuantumCircuit(2)
+    composite_qc.h(0)
+    composite_qc.cx(0, 1)
+    composite_qc.rz(1e-7, 1)
+    composite_gate = composite_qc.to_gate("composite")
+    
+    qc = QuantumCircuit(4)
+    qc.rxx(0.2, 0, 1)
+    qc.append(XGate().control(2, ctrl_state="01"), qc.qubits[:3])
+    qc.s_dg(0)
+    qc.sx_dg(1)
+    qc.append(composite_gate, [0, 2])
+    qc.append(composite_gate, [1, 2])
+    qc.append(composite_gate.inverse(), [3, 2])
+    qc.append(HGate().control(2, ctrl_state="10"), [0, 1, 3])
+    qc.append(PGate(0.3).control(1, ctrl_state="0"), [3, 0])
+    qc.append(RZGate(0.2).control(3, ctrl_state="010"), qc.qubits)
+    qc.mcx([0, 1, 2], 3)
+    qc.u3(1, 2, 3, 0)
+    qc.cp(0.5, 1, 2)
+    qc.swap(0, 3)
+    qc.rzz(0.4, 2, 3)
+    qc.t_dg(2)
+    qc.cy(2, 3)
+    
+    for qasm_str in [qc.to_qasm2(), qc.to_qasm3()]:
+        # The composite gate is only declared once
+        assert qasm_str.count("gate composite ") == 1
+    
+    parsed_qc = QuantumCircuit.from_qasm_str(qc.to_qasm2())
+    assert len(parsed_qc.qubits) == 4
+    assert np.abs(parsed_qc.get_unitary() - qc.get_unitary()).max() < 1e-5
+    
+
+def test_qasm_parser():
+    import numpy as np
+    from qrisp import QuantumCircuit
+    
+    qasm_str = """
+    OPENQASM 2.0;
+    include "qelib1.inc";
+    // Gate declaration with parameters
+    gate mygate(a, b) x, y { rz(a/2) x; cx x,y; ry(-b*pi^2) y; }
+    qreg q[2];
+    qreg r[1];
+    creg c[2];
+    h q;
+    mygate(pi, 1.5e-1) q[0], r[0];
+    mygate(pi, 0.15) q[1], r[0];
+    cx q, r;
+    u2(0.5, sin(0.2)) q[1];
+    barrier q, r;
+    measure q -> c;
+    if(c==2) x r[0];
+    """
+    
+    qc = QuantumCircuit.from_qasm_str(qasm_str)
+    
+    assert [qb.identifier for qb in qc.qubits] == ["q.0", "q.1", "r"]
+    assert [cb.identifier for cb in qc.clbits] == ["c.0", "c.1"]
+    assert [instr.op.name for instr in qc.data] == [
+        "h", "h", "mygate", "mygate", "cx", "cx", "u3", "barrier", "measure",
+        "measure", "c_if_x",
+    ]
+    
+    # Identical gate calls share the definition
+    assert qc.data[2].op is qc.data[3].op
+    
+    reference_qc = QuantumCircuit(2)
+    reference_qc.rz(np.pi / 2, 0)
+    reference_qc.cx(0, 1)
+    reference_qc.ry(-0.15 * np.pi**2, 1)
+    assert np.abs(
+        qc.data[2].op.definition.get_unitary() - reference_qc.get_unitary()
+    ).max() < 1e-5
+    
+    assert qc.data[-1].clbits == qc.clbits
+    assert qc.data[-1].op.ctrl_state == "01"
+    
+    invalid_strs = [
+        "qreg q[2]; h q[2];",
+        "qreg q[2]; cx q[0], q[0];",
+        "qreg q[1]; foo q[0];",
+    ]
+    for invalid_str in invalid_strs:
+        try:
+            QuantumCircuit.from_qasm_str("OPENQASM 2.0;" + invalid_str)
+        except Exception:
+            pass
+        else:
+            assert False
+
+
+def test_qasm_conditions_and_parameters():
+    from sympy import Symbol
+    from qrisp import QuantumCircuit, QuantumFloat, control, h, measure, rz, x
+    from qrisp.jasp import make_jaspr
+    
+    def main():
+        qf = QuantumFloat(2)
+        h(qf)
+        bl = measure(qf[0])
+        
+        with control(bl):
+            rz(0.5, qf[1])
+            x(qf[1])
+    
+    qc = make_jaspr(main)().to_qc()
+    
+    qasm_str = qc.to_qasm2()
+    assert qasm_str.count("if(cb_0==1) ") == 2
+    assert QuantumCircuit.from_qasm_str(qasm_str).to_qasm2() == qasm_str
+    
+    assert "if (cb_0[0]) {" in qc.to_qasm3()
+    
+    # Abstract parameters can only be represented in OpenQASM 3
+    qc = QuantumCircuit(1)
+    qc.rz(2 * Symbol("phi"), 0)
+    qasm_str = qc.to_qasm2()
+    assert "OPENQASM 3.0;" in qasm_str
+    assert "input float[64] phi;" in qasm_str
+    assert "rz(2*phi)" in qasm_str
+    
+    # Errors of the emitter are not hidden by the fallback to OpenQASM 3
+    from qrisp import Operation
+    qc = QuantumCircuit(1)
+    qc.append(Operation("custom_op", 1), 0)
+    try:
+        qc.to_qasm2()
+    except Exception as e:
+        assert "Could not convert operation custom_op" in str(e)
+    else:
+        assert False
+    
+    import warnings
+    with warnings.catch_warnings(record = True) as w:
+        warnings.simplefilter("always")
+        QuantumCircuit(1).to_qasm2(formatted = True)
+    assert "DeprecationWarning" in str(w[0].message)
+
@@ -90,4 +90,113 @@ def test_qiskit_backend_client():
 
     print(test_qiskit_backend.run(qc, 2000))
     # status = test_qiskit_backend.ping()
-    assert str(test_qiskit_backend.run(qc, 2000)) == "{'1': 2000}"
\ No newline at end of file
+    assert str(test_qiskit_backend.run(qc, 2000)) == "{'1': 2000}"
+
+def test_virtual_backend_circuit_run_func():
+    
+    from qrisp import QuantumFloat
+    
+    received_circuits = []
+    
+    def circuit_run_func(qc, shots = None, token = ""):
+        if shots is None:
+            shots = 1000
+        received_circuits.append(qc)
+        return {"1" + "0"*(len(qc.clbits)-1) : shots}
+    
+    qc = QuantumCircuit(3, 3)
+    qc.x(2)
+    qc.measure(qc.qubits, qc.clbits)
+    
+    # In-process backends receive the QuantumCircuit object
+    test_virtual_backend = VirtualBackend(circuit_run_func = circuit_run_func)
+    assert test_virtual_backend.run(qc, 100) == {"100" : 100}
+    assert received_circuits[-1] is qc
+    assert test_virtual_backend.run_circuit(qc, 100) == {"100" : 100}
+    
+    qf = QuantumFloat(3)
+    qf[:] = 4
+    assert qf.get_measurement(backend = test_virtual_backend) == {4 : 1.0}
+    
+    # Backends without circuit_run_func receive QASM
+    received_qasm = []
+    def run_func(qasm_str, shots = None, token = ""):
+        received_qasm.append(qasm_str)
+        return {"100" : shots}
+    
+    test_virtual_backend = VirtualBackend(run_func)
+    assert test_virtual_backend.run(qc, 100) == {"100" : 100}
+    assert received_qasm[-1] == qc.qasm()
+    
+    # The QASM wrapper used for server backends reconstructs the circuit
+    from qrisp.interface.virtual_backend import create_qasm_run_func
+    assert create_qasm_run_func(circuit_run_func)(qc.qasm(), 100) == {"100" : 100}
+    assert received_circuits[-1].qasm() == qc.qasm()
+
+
+def test_backend_batch_execution():
+    
+    from qrisp import QuantumFloat, QuantumVariable, h, ry
+    from qrisp.default_backend import def_backend
+    from qrisp.operators import X, Z
+    from qrisp.operators.hamiltonian_tools import multi_hamiltonian_measurement
+    
+    # Backend that simulates the circuits and records the batches
+    batch_sizes = []
+    
+    def circuit_run_func(qc, shots = None, token = ""):
+        return def_backend.run(qc, shots)
+    
+    class RecordingBackend(VirtualBackend):
+        def run_batch(self, batch, token = ""):
+            batch_sizes.append(len(batch))
+            return super().run_batch(batch, token)
+    
+    recording_backend = RecordingBackend(circuit_run_func = circuit_run_func)
+    
+    qc_list = []
+    for i in range(3):
+        qc = QuantumCircuit(2, 2)
+        for j in range(i):
+            qc.x(j)
+        qc.measure(qc.qubits, qc.clbits)
+        qc_list.append(qc)
+    
+    batch = [(qc, 100) for qc in qc_list]
+    expected_results = [{"00" : 100}, {"01" : 100}, {"11" : 100}]
+    assert recording_backend.run_batch(batch) == expected_results
+    assert def_backend.run_batch(batch) == expected_results
+    
+    # The measurement circuits of all groups are submitted as a single batch
+    batch_sizes.clear()
+    qv = QuantumVariable(2)
+    h(qv[0])
+    ry(0.3, qv[1])
+    H = Z(0)*Z(1) + X(0) + X(1)
+    
+    exact_value = H.get_measurement(qv)
+    sampled_value = H.get_measurement(qv, backend = recording_backend, precision = 0.01)
+    assert abs(exact_value - sampled_value) < 0.05
+    assert batch_sizes == [2]
+    
+    # The Hamiltonians of a multi measurement are submitted as a single batch
+    batch_sizes.clear()
+    hamiltonians = [Z(0)*Z(1) + X(0), X(1), 0*Z(0)]
+    exact_values = multi_hamiltonian_measurement(hamiltonians, qv)
+    sampled_values = multi_hamiltonian_measurement(
+        hamiltonians, qv, backend = recording_backend
+    )
+    for i in range(len(hamiltonians)):
+        assert abs(exact_values[i] - sampled_values[i]) < 0.05
+    assert batch_sizes == [3]
+    
+    # Parametrized circuits are submitted as a single batch
+    from sympy import Symbol
+    batch_sizes.clear()
+    phi = Symbol("phi")
+    qf = QuantumFloat(1)
+    ry(phi, qf)
+    subs_dic_list = [{phi : 0}, {phi : np.pi}]
+    res = qf.get_measurement_batch(subs_dic_list, backend = recording_backend)
+    assert res == [{0 : 1.0}, {1 : 1.0}]
+    assert batch_sizes == [2]
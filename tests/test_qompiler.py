@@ -35,3 +35,185 @@ def test_qompiler():
     x(qv_list[-1])
     qc = qs.compile()
     assert len(qc.qubits) == 1
+
+
+def test_array_dag():
+    import networkx as nx
+    import numpy as np
+    from qrisp import QuantumFloat, QuantumCircuit, transpile
+    from qrisp.core.compilation import cancel_inverses
+    from qrisp.permeability import PermeabilityGraph, ArrayDAG
+    
+    a = QuantumFloat(4)
+    b = QuantumFloat(4)
+    a[:] = 3
+    c = a * b
+    qc = transpile(c.qs.copy())
+    
+    for remove_artificials in [False, True]:
+        G = PermeabilityGraph(qc, remove_artificials = remove_artificials)
+        dag = ArrayDAG(qc, remove_artificials = remove_artificials)
+        
+        # The CSR arrays agree with the networkx export
+        sprs_mat = nx.to_scipy_sparse_array(G, format="csr")
+        nx_nodes = list(G.nodes())
+        assert [n.instr for n in nx_nodes] == [n.instr for n in dag.nodes()]
+        assert np.array_equal(sprs_mat.indptr, dag.indptr)
+        assert np.array_equal(sprs_mat.indices, dag.indices)
+        
+        nx_indices = {nx_nodes[i] : i for i in range(len(nx_nodes))}
+        for i in range(0, len(dag), 50):
+            node = dag.nodes()[i]
+            ancestors = [n.dag_index for n in dag.ancestors(node)]
+            nx_node = nx_nodes[i]
+            assert ancestors == sorted(nx_indices[n] for n in nx.ancestors(G, nx_node))
+            for succ in dag.successors(node):
+                nx_succ = nx_nodes[succ.dag_index]
+                edge = (nx_node, nx_succ)
+                assert dag.get_edge_type(node, succ) == G.get_edge_type(*edge)
+                assert dag.get_edge_qubits(node, succ) == G.get_edge_qubits(*edge)
+    
+    # Test inverse cancellation
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.t(2)
+    qc.cx(0, 1)
+    qc.t_dg(2)
+    qc.x(1)
+    
+    assert [instr.op.name for instr in cancel_inverses(qc).data] == ["h", "x"]
+
+
+def test_qompiler_allocation():
+    from qrisp import QuantumFloat, QuantumBool, cx, mcx
+    
+    a = QuantumFloat(5)
+    b = QuantumFloat(5)
+    a[:] = 13
+    
+    # Many short lived ancillae, which should be recycled
+    for k in range(1, 5):
+        for i in range(5):
+            anc = QuantumBool()
+            mcx([a[i], a[(i + k) % 5]], anc)
+            cx(anc, b[i])
+            mcx([a[i], a[(i + k) % 5]], anc)
+            anc.delete()
+    
+    qc = a.qs.compile()
+    assert qc.num_qubits() == 11
+    
+    # Compilation is deterministic
+    assert str(qc) == str(a.qs.compile())
+    
+    a_bits = [(13 >> i) & 1 for i in range(5)]
+    b_bits = [0] * 5
+    for k in range(1, 5):
+        for i in range(5):
+            b_bits[i] ^= a_bits[i] & a_bits[(i + k) % 5]
+    
+    assert b.get_measurement() == {sum(b_bits[i] << i for i in range(5)) : 1.0}
+
+
+def test_compile_cache():
+    
+    from qrisp import QuantumVariable, h, cx, mcx, x, rz
+    from qrisp import enable_compile_cache, disable_compile_cache
+    from qrisp.circuit import Instruction, RZGate
+    
+    def prepare():
+        a = QuantumVariable(4, name = "a")
+        b = QuantumVariable(2, name = "b")
+        h(a)
+        mcx(a, b[0])
+        cx(b[0], b[1])
+        rz(0.5, b[1])
+        return a, b
+    
+    a, b = prepare()
+    uncached_str = str(a.qs.compile(workspace = 1))
+    uncached_mes = b.get_measurement()
+    
+    try:
+        enable_compile_cache()
+        a.qs.compile(workspace = 1)
+        
+        # Cache hits return an independent copy acting on the qubits of the session
+        qc = a.qs.compile(workspace = 1)
+        assert str(qc) == uncached_str
+        assert b.get_measurement() == uncached_mes
+        qc.x(0)
+        [instr.op for instr in qc.data if instr.op.name == "rz"][0].params[0] = 0.25
+        assert str(a.qs.compile(workspace = 1)) == uncached_str
+        
+        # Structurally identical sessions share the cached result
+        a, b = prepare()
+        qc = a.qs.compile(workspace = 1)
+        assert str(qc) == uncached_str
+        assert qc.qubits[:6] == a.reg + b.reg
+        
+        # Modifications of the session invalidate the cached result
+        a.qs.data[-1] = Instruction(RZGate(0.25), a.qs.data[-1].qubits)
+        qc = a.qs.compile(workspace = 1)
+        rz_params = [instr.op.params for instr in qc.data if instr.op.name == "rz"]
+        assert rz_params == [[0.25]]
+        x(a[0])
+        assert a.qs.compile(workspace = 1).count_ops()["x"] == 1
+    finally:
+        disable_compile_cache()
+
+
+def test_transpile_templates():
+    
+    from qrisp import QuantumCircuit, transpile
+    
+    # Reference implementation dissolving every definition separately
+    def reference_transpile(qc, level, predicate = lambda op : True):
+        res = []
+        def dissolve(qc, qubits, clbits, i):
+            for instr in qc.data:
+                instr_qubits = [qubits[qc.qubits.index(qb)] for qb in instr.qubits]
+                instr_clbits = [clbits[qc.clbits.index(cb)] for cb in instr.clbits]
+                if instr.op.definition and i < level and predicate(instr.op):
+                    dissolve(instr.op.definition, instr_qubits, instr_clbits, i + 1)
+                else:
+                    res.append((instr.op.name, instr_qubits, instr_clbits))
+        dissolve(qc, qc.qubits, qc.clbits, 0)
+        return res
+    
+    def instruction_list(qc):
+        return [(instr.op.name, instr.qubits, instr.clbits) for instr in qc.data]
+    
+    inner_qc = QuantumCircuit(2)
+    inner_qc.h(0)
+    inner_qc.cx(0, 1)
+    inner_gate = inner_qc.to_gate("inner")
+    
+    middle_qc = QuantumCircuit(3)
+    middle_qc.append(inner_gate, [2, 0])
+    middle_qc.t(1)
+    middle_qc.append(inner_gate, [1, 2])
+    middle_gate = middle_qc.to_gate("middle")
+    
+    outer_qc = QuantumCircuit(4)
+    outer_qc.append(middle_gate, [3, 1, 0])
+    outer_qc.append(inner_gate, [0, 1])
+    outer_qc.append(middle_gate.inverse(), [0, 2, 3])
+    outer_gate = outer_qc.to_gate("outer")
+    
+    # The same gates (and therefore definitions) appear multiple times
+    qc = QuantumCircuit(6, 1)
+    for i in range(3):
+        qc.append(outer_gate, qc.qubits[i:i+4])
+        qc.append(middle_gate, [qc.qubits[5], qc.qubits[i], qc.qubits[i+1]])
+    qc.measure(2, 0)
+    
+    for level in [1, 2, 3, 10]:
+        transpiled_qc = transpile(qc, level)
+        assert instruction_list(transpiled_qc) == reference_transpile(qc, level)
+    
+    predicate = lambda op : op.name != "middle"
+    transpiled_qc = transpile(qc, transpile_predicate = predicate)
+    assert instruction_list(transpiled_qc) == reference_transpile(qc, 10, predicate)
+    assert "middle" in [instr.op.name for instr in transpiled_qc.data]
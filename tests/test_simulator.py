@@ -0,0 +1,531 @@
+"""
+\********************************************************************************
+* Copyright (c) 2025 the Qrisp authors
+*
+* This program and the accompanying materials are made available under the
+* terms of the Eclipse Public License 2.0 which is available at
+* http://www.eclipse.org/legal/epl-2.0.
+*
+* This Source Code may also be made available under the following Secondary
+* Licenses when the conditions for such availability set forth in the Eclipse
+* Public License, v. 2.0 are satisfied: GNU General Public License, version 2
+* with the GNU Classpath Exception which is
+* available at https://www.gnu.org/software/classpath/license.html.
+*
+* SPDX-License-Identifier: EPL-2.0 OR GPL-2.0 WITH Classpath-exception-2.0
+********************************************************************************/
+"""
+
+
+import numpy as np
+
+def test_instruction_tape():
+    
+    from qrisp import QuantumCircuit
+    from qrisp.simulator.simulator import generate_instruction_tape
+    
+    qc = QuantumCircuit(4, 2)
+    qc.h(3)
+    qc.cx(3, 0)
+    qc.measure(0, 1)
+    qc.measure(2, 0)
+    
+    tape = generate_instruction_tape(qc)
+    
+    assert [op.name for op, qubits, clbits in tape] == ["h", "cx", "measure", "measure"]
+    assert [qubits for op, qubits, clbits in tape] == [[3], [3, 0], [0], [2]]
+    assert [clbits for op, qubits, clbits in tape] == [[], [], [1], [0]]
+    
+    # The clbit order should be respected by the simulator
+    qc = QuantumCircuit(3, 3)
+    qc.x(0)
+    qc.h(1)
+    qc.cx(1, 2)
+    qc.measure([0, 1, 2], [2, 0, 1])
+    
+    res = qc.run(shots = None)
+    
+    assert set(res.keys()) == {"100", "111"}
+    assert abs(res["100"] - 0.5) < 1E-5
+    
+    from qrisp.simulator import statevector_sim
+    
+    qc = QuantumCircuit(2)
+    qc.h(0)
+    qc.cx(0, 1)
+    
+    sv = statevector_sim(qc)
+    assert np.allclose(sv, np.array([1, 0, 0, 1])/2**0.5)
+
+
+def test_parametric_simulation():
+    
+    from sympy import symbols
+    from qrisp import QuantumVariable, QuantumCircuit, h, rz, cx, p, rx
+    from qrisp.simulator import ParametricSimulation
+    
+    a, b = symbols("a b")
+    
+    qv = QuantumVariable(4)
+    h(qv)
+    for i in range(3):
+        cx(qv[i], qv[i+1])
+        rz(a*(i+1), qv[i+1])
+        cx(qv[i], qv[i+1])
+    rx(b, qv)
+    p(2*a, qv[0])
+    
+    qc = qv.qs.compile()
+    
+    measured_qc = qc.copy()
+    measured_qc.measure(qv.reg, [measured_qc.add_clbit() for i in range(4)])
+    sim = ParametricSimulation(measured_qc)
+    
+    for subs_dic in [{a : 0.3, b : 1.2}, {a : -2., b : 0.1}, {a : 0.3, b : 1.2}]:
+        
+        res_0 = sim.run(subs_dic)
+        res_1 = measured_qc.bind_parameters(subs_dic).run()
+        
+        assert set(res_0.keys()) == set(res_1.keys())
+        for k in res_0.keys():
+            assert abs(res_0[k] - res_1[k]) < 1E-4
+        
+        # Test the integration into get_measurement
+        res_2 = qv.get_measurement(subs_dic = subs_dic, precompiled_qc = qc)
+        res_3 = qv.get_measurement(
+            subs_dic = subs_dic,
+            precompiled_qc = qc,
+            circuit_preprocessor = lambda x : x,
+        )
+        
+        for k in res_3.keys():
+            assert abs(res_2[k] - res_3[k]) < 1E-4
+    
+    assert sum(sim.run({a : 0.3, b : 1.2}, shots = 1000).values()) == 1000
+    
+    # The cached simulation is rebuilt if the precompiled circuit is modified
+    from qrisp import QuantumFloat
+    qf = QuantumFloat(2)
+    rx(a, qf[0])
+    qc = qf.qs.compile()
+    assert qf.get_measurement(subs_dic = {a : np.pi}, precompiled_qc = qc) == {1: 1.0}
+    qc.x(qf[1])
+    assert qf.get_measurement(subs_dic = {a : np.pi}, precompiled_qc = qc) == {3: 1.0}
+
+
+def test_measurement_batch():
+    
+    from sympy import Symbol
+    from qrisp import QuantumVariable, QuantumFloat, QuantumArray, h, ry, cx, rz
+    from qrisp.simulator import ParametricSimulation
+    
+    a = Symbol("a")
+    b = Symbol("b")
+    
+    qv = QuantumVariable(4)
+    h(qv[0])
+    ry(a, qv[1])
+    cx(qv[0], qv[2])
+    cx(qv[1], qv[0])
+    rz(b, qv[2])
+    h(qv[2])
+    cx(qv[2], qv[3])
+    ry(a*b, qv[3])
+    
+    subs_dic_list = [{a : 0.7, b : 0.2}, {a : -1.3, b : 2.}, {a : 0., b : 0.}]
+    
+    qc = qv.qs.compile()
+    
+    # Compare the stacked statevector evolution with the sequential evaluation
+    measured_qc = qc.copy()
+    measured_qc.measure(qv.reg, [measured_qc.add_clbit() for i in range(4)])
+    sim = ParametricSimulation(measured_qc)
+    
+    for res_0, subs_dic in zip(sim.run_batch(subs_dic_list), subs_dic_list):
+        res_1 = sim.run(subs_dic)
+        for k in set(res_0.keys()) | set(res_1.keys()):
+            assert abs(res_0.get(k, 0) - res_1.get(k, 0)) < 1E-4
+    
+    # Test the QuantumVariable interface
+    res_list = qv.get_measurement_batch(subs_dic_list, precompiled_qc = qc)
+    
+    assert len(res_list) == len(subs_dic_list)
+    for res_0, subs_dic in zip(res_list, subs_dic_list):
+        res_1 = qv.get_measurement(
+            subs_dic = subs_dic,
+            precompiled_qc = qc,
+            circuit_preprocessor = lambda x : x,
+        )
+        for k in set(res_0.keys()) | set(res_1.keys()):
+            assert abs(res_0.get(k, 0) - res_1.get(k, 0)) < 1E-4
+    
+    # Test the QuantumArray interface
+    qa = QuantumArray(QuantumFloat(2), shape = 2)
+    h(qa[0])
+    ry(a, qa[1][0])
+    cx(qa[0][1], qa[1][1])
+    rz(b, qa[1][1])
+    
+    res_list = qa.get_measurement_batch(subs_dic_list)
+    
+    for res_0, subs_dic in zip(res_list, subs_dic_list):
+        res_1 = qa.get_measurement(subs_dic = subs_dic)
+        for k in set(res_0.keys()) | set(res_1.keys()):
+            assert abs(res_0.get(k, 0) - res_1.get(k, 0)) < 1E-4
+
+
+def test_parallel_execution():
+    
+    import numpy as np
+    from qrisp import QuantumCircuit
+    import qrisp.simulator.parallel_execution as pe
+    from qrisp.simulator.parallel_execution import partition_tape
+    from qrisp.simulator import QuantumState
+    
+    # Create a circuit consisting of three independent blocks, two of which
+    # are joined at the end
+    rng = np.random.default_rng(0)
+    qc = QuantumCircuit(9, 9)
+    for d in range(2):
+        for b in range(3):
+            for i in range(3):
+                qc.rx(rng.random(), 3*b + i)
+            qc.cx(3*b, 3*b + 1)
+            qc.cx(3*b + 1, 3*b + 2)
+    qc.cx(2, 3)
+    qc.measure(range(9), range(9))
+    
+    tape = [(None, qubits, []) for qubits in [[0, 1], [2], [3], [1, 2], [0]]]
+    segments = partition_tape(tape, QuantumState(4))
+    
+    assert [seg.qubits for seg in segments] == [[0, 1], [2], [3], [0, 1, 2]]
+    assert segments[3].parents == [segments[0], segments[1]]
+    assert len(segments[3].instructions) == 2
+    
+    settings = (pe.max_workers, pe.executor_type, pe.parallelization_threshold)
+    get_executor = pe.get_executor
+    
+    # The parallel execution is opt-in, i.e. by default no worker pool is used
+    def unexpected_executor(*args):
+        raise Exception("Unexpected worker pool")
+    
+    try:
+        pe.get_executor = unexpected_executor
+        pe.parallelization_threshold = 0
+        res_0 = qc.run()
+        pe.get_executor = get_executor
+        
+        pe.max_workers = 3
+        for executor_type in ["thread", "process"]:
+            pe.executor_type = executor_type
+            res_1 = qc.run()
+            
+            assert set(res_0.keys()) == set(res_1.keys())
+            for k in res_0.keys():
+                assert abs(res_0[k] - res_1[k]) < 1E-6
+    finally:
+        pe.get_executor = get_executor
+        pe.max_workers, pe.executor_type, pe.parallelization_threshold = settings
+
+
+def test_simulator_precision():
+    
+    import pytest
+    import numpy as np
+    from qrisp import QuantumFloat, QuantumVariable, h, rx, cx
+    from qrisp.simulator import numerics_config
+    
+    qv = QuantumVariable(3)
+    rx(0.1, qv[0])
+    cx(qv[0], qv[1])
+    h(qv[2])
+    
+    # Cache the unitaries with single precision
+    qv.get_measurement()
+    
+    try:
+        numerics_config.set_precision("complex128")
+        
+        for instr in qv.qs.data:
+            if instr.op.name in ["rx", "cx", "h"]:
+                assert instr.op.get_unitary().dtype == np.complex128
+        
+        sv = qv.qs.compile().statevector_array()
+        assert sv.dtype == np.complex128
+        assert abs(np.linalg.norm(sv) - 1) < 1E-12
+        
+        res = qv.get_measurement()
+        p = np.sin(0.05)**2
+        assert abs(res["000"] - (1-p)/2) < 1E-12
+        assert abs(res["111"] - p/2) < 1E-12
+        
+        qf = QuantumFloat(3)
+        h(qf)
+        assert qf.get_measurement() == {i : 0.125 for i in range(8)}
+        
+    finally:
+        numerics_config.set_precision("complex64")
+    
+    sv = qv.qs.compile().statevector_array()
+    assert sv.dtype == np.complex64
+    
+    with pytest.raises(Exception, match = "Unknown precision"):
+        numerics_config.set_precision("complex256")
+
+
+def test_quiet_mode(capsys):
+    
+    from qrisp import QuantumCircuit
+    from qrisp.simulator import run, set_quiet_mode, statevector_sim
+    import qrisp.simulator.simulator as sim_module
+    
+    qc = QuantumCircuit(3, 3)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.cx(1, 2)
+    qc.measure([0, 1, 2], [0, 1, 2])
+    
+    try:
+        for quiet in [True, None]:
+            set_quiet_mode(quiet)
+            capsys.readouterr()
+            
+            assert run(qc, None) == {"000": 0.5, "111": 0.5}
+            assert len(statevector_sim(qc.clearcopy())) == 8
+            
+            # The captured stdout is not a terminal, so the automatic mode is quiet
+            assert capsys.readouterr().out == ""
+        
+        set_quiet_mode(False)
+        assert run(qc, None) == {"000": 0.5, "111": 0.5}
+        assert sim_module.quiet_mode is False
+    finally:
+        set_quiet_mode(None)
+
+
+def test_state_cache():
+    
+    from qrisp import QuantumFloat, h, cx, ry, x, multi_measurement
+    from qrisp.circuit import Instruction, RYGate
+    from qrisp.operators import X, Z
+    from qrisp.operators.hamiltonian_tools import multi_hamiltonian_measurement
+    from qrisp.simulator import enable_state_cache, disable_state_cache
+    
+    a = QuantumFloat(2)
+    b = QuantumFloat(2)
+    h(b[0])
+    ry(0, a[0])
+    cx(b[0], a[1])
+    
+    hamiltonians = [Z(0)*Z(1) + X(0), Z(1)]
+    expected_mes = multi_measurement([a, b])
+    expected_evs = multi_hamiltonian_measurement(hamiltonians, b, precision = 0)
+    
+    try:
+        enable_state_cache()
+        
+        # Results retrieved from the cached state agree with the simulation
+        for i in range(2):
+            assert multi_measurement([a, b]) == expected_mes
+            assert b.get_measurement() == {0: 0.5, 1: 0.5}
+            evs = multi_hamiltonian_measurement(hamiltonians, b, precision = 0)
+            assert np.allclose(evs, expected_evs)
+        
+        # Modifications of the circuit invalidate the cached state
+        i = [instr.op.name for instr in a.qs.data].index("ry")
+        a.qs.data[i] = Instruction(RYGate(np.pi), a.qs.data[i].qubits)
+        assert a.get_measurement() == {1: 0.5, 3: 0.5}
+        x(a[0])
+        assert a.get_measurement() == {0: 0.5, 2: 0.5}
+    finally:
+        disable_state_cache()
+
+
+def test_multinomial_sampling():
+    
+    import numpy as np
+    from qrisp import QuantumCircuit
+    from qrisp.simulator import run, sample_counts
+    
+    probs = np.array([0.5, 0, 0.25, 0.25])
+    indices, counts = sample_counts(probs, 10000, np.random.default_rng(0))
+    assert list(indices) == [0, 2, 3]
+    assert np.sum(counts) == 10000
+    assert abs(counts[0]/10000 - 0.5) < 0.05
+    
+    qc = QuantumCircuit(4, 4)
+    qc.h([0, 1, 2])
+    qc.cx(2, 3)
+    qc.measure([0, 1, 2, 3], [0, 1, 2, 3])
+    
+    # Seeded generators yield reproducible results
+    res_0 = run(qc, 1000, rng = np.random.default_rng(1))
+    res_1 = run(qc, 1000, rng = np.random.default_rng(1))
+    assert res_0 == res_1
+    assert sum(res_0.values()) == 1000
+    assert set(res_0.keys()) <= set(run(qc, None).keys())
+    
+    np.random.seed(2)
+    res_0 = run(qc, 1000)
+    np.random.seed(2)
+    assert res_0 == run(qc, 1000)
+
+
+def test_rng_plumbing():
+    
+    import numpy as np
+    from qrisp import QuantumCircuit
+    from qrisp.simulator import single_shot_sim, spawn_rngs, get_rng
+    
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    qc.reset(0)
+    qc.h(1)
+    
+    results = [single_shot_sim(qc.copy(), rng = i)[0] for i in range(20)]
+    assert results == [single_shot_sim(qc.copy(), rng = i)[0] for i in range(20)]
+    assert set(results) == {"00", "11"}
+    
+    assert get_rng(None) is np.random
+    rng = np.random.default_rng(0)
+    assert get_rng(rng) is rng
+    
+    # Spawned generators are reproducible and independent
+    samples = [rng.random(10) for rng in spawn_rngs(7, 4)]
+    respawned_samples = [rng.random(10) for rng in spawn_rngs(7, 4)]
+    assert all(np.all(a == b) for a, b in zip(samples, respawned_samples))
+    assert len(set(tuple(s) for s in samples)) == 4
+
+
+def test_run_batch():
+    
+    import numpy as np
+    from qrisp import QuantumCircuit
+    import qrisp.simulator.parallel_execution as pe
+    from qrisp.simulator import run, run_batch
+    
+    qc_list = []
+    for k in range(4):
+        qc = QuantumCircuit(5, 5)
+        for i in range(5):
+            qc.ry(0.3*(i + k), i)
+        for i in range(4):
+            qc.cx(i, i + 1)
+        qc.measure(qc.qubits, qc.clbits)
+        qc_list.append(qc)
+    
+    batch = [(qc, 1000) for qc in qc_list] + [(QuantumCircuit(1), 5), (qc_list[0], 0)]
+    
+    rng = np.random.default_rng(3)
+    sequential_results = [run(qc, shots, rng = rng) for qc, shots in batch]
+    
+    max_workers = pe.max_workers
+    
+    try:
+        for pe.max_workers in [1, 3]:
+            rng = np.random.default_rng(3)
+            assert run_batch(batch, rng = rng) == sequential_results
+        
+        # Exact probabilities
+        res = run_batch([(qc, None) for qc in qc_list])
+        for i in range(len(qc_list)):
+            assert res[i] == run(qc_list[i], None)
+    finally:
+        pe.max_workers = max_workers
+
+
+def test_clifford_simulator():
+    
+    from qrisp import QuantumCircuit, QuantumVariable, h, cx
+    from qrisp.circuit.standard_operations import (XGate, YGate, ZGate, HGate, SGate, 
+                                                   SXGate, SXDGGate, RZGate, RXGate, 
+                                                   RYGate, CXGate, CYGate, CZGate, 
+                                                   SwapGate, CPGate, RZZGate, MCXGate)
+    from qrisp.simulator import run, run_clifford, CliffordTableau
+    from qrisp.simulator.clifford_simulator import clifford_table
+    from qrisp.interface import CliffordBackend
+    
+    rng = np.random.default_rng(1)
+    
+    single_qubit_gates = [XGate, YGate, ZGate, HGate, SGate, lambda : SGate().inverse(),
+                          SXGate, SXDGGate, lambda : RZGate(np.pi/2), 
+                          lambda : RXGate(np.pi), lambda : RYGate(-np.pi/2)]
+    two_qubit_gates = [CXGate, CYGate, CZGate, SwapGate, lambda : CPGate(np.pi), 
+                       lambda : RZZGate(np.pi/2), lambda : MCXGate(1, ctrl_state = 0)]
+    
+    def random_gate(n):
+        if rng.random() < 0.6:
+            gate = single_qubit_gates[rng.integers(len(single_qubit_gates))]
+            return gate(), [int(rng.integers(n))]
+        else:
+            gate = two_qubit_gates[rng.integers(len(two_qubit_gates))]
+            return gate(), [int(i) for i in rng.choice(n, 2, replace = False)]
+    
+    # The gates implemented as methods agree with the conjugation tables
+    for i in range(20):
+        tableau_0 = CliffordTableau(4)
+        tableau_1 = CliffordTableau(4)
+        for j in range(30):
+            op, qubits = random_gate(4)
+            tableau_0.apply_operation(op, qubits)
+            if op.definition is None:
+                tableau_1.apply_table(clifford_table(op), qubits)
+            else:
+                tableau_1.apply_operation(op, qubits)
+        assert tableau_0.get_stabilizers() == tableau_1.get_stabilizers()
+    
+    # Compare the sampled distributions (including mid-circuit measurements 
+    # and resets) with the exact distribution of the statevector simulator
+    for i in range(20):
+        n = int(rng.integers(2, 5))
+        qc = QuantumCircuit(n, n + 1)
+        for j in range(20):
+            op, qubits = random_gate(n)
+            qc.append(op, [qc.qubits[k] for k in qubits])
+            if j == 10 and i % 2:
+                qc.measure(qc.qubits[0], qc.clbits[n])
+                qc.reset(qc.qubits[0])
+        if not i % 2:
+            qc.measure(qc.qubits[0], qc.clbits[n])
+        qc.measure(qc.qubits[:n], qc.clbits[:n])
+        
+        exact = run(qc, None)
+        sampled = run_clifford(qc, 10000, rng = i)
+        assert set(exact.keys()) == set(sampled.keys())
+        for key in exact:
+            assert abs(exact[key] - sampled[key]/10000) < 0.04
+    
+    # Qubits beyond the first word (added one at a time)
+    tableau = CliffordTableau()
+    for i in range(131):
+        tableau.add_qubit()
+    tableau.apply_operation(HGate(), [130])
+    tableau.apply_operation(CXGate(), [130, 0])
+    tableau.apply_operation(CXGate(), [0, 64])
+    tableau.apply_operation(SGate(), [64])
+    tableau.apply_operation(SwapGate(), [64, 63])
+    tableau.apply_operation(CXGate(), [63, 100])
+    res = tableau.measure(130)
+    assert [tableau.measure(i) for i in [0, 63, 100]] == 3*[res]
+    assert not any(tableau.measure(i) for i in range(1, 63))
+    assert not tableau.measure(64)
+    
+    # Non-Clifford gates raise an error
+    qc = QuantumCircuit(1, 1)
+    qc.t(0)
+    qc.measure(0, 0)
+    try:
+        run_clifford(qc, 10)
+        assert False
+    except Exception as e:
+        assert "not a Clifford operation" in str(e)
+    
+    # Sampling of a GHZ state with 1000 qubits using the backend
+    qv = QuantumVariable(1000)
+    h(qv[0])
+    for i in range(1, 1000):
+        cx(qv[0], qv[i])
+    res = qv.get_measurement(backend = CliffordBackend(rng = 1), shots = 1000)
+    assert set(res.keys()) == {"0"*1000, "1"*1000}